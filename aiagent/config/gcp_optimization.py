@@ -24,6 +24,10 @@ import threading
 import queue
 import json
 
+from utils.concurrency_controller import get_adaptive_limit
+from utils.metrics import get_metrics_registry
+from utils.system_sampler import get_system_snapshot
+
 
 @dataclass
 class GCPResourceLimits:
@@ -62,30 +66,25 @@ class GCPOptimizer:
             'last_gc_time': time.time()
         }
         
+        # 메트릭 노출 (큐 길이/배치 크기는 조회 시점 값)
+        registry = get_metrics_registry()
+        registry.gauge("gcp_alert_queue_depth", "GCP 최적화 경고 큐 대기 수").labels().set_function(self.alert_queue.qsize)
+        registry.gauge("gcp_batch_size", "GCP 최적화 현재 배치 크기").labels().set_function(lambda: self.current_batch_size)
+        registry.mapping("gcp_optimizer", "GCP 최적화 최근 시스템 지표", self._metric_values)
+        self.request_seconds = registry.histogram("gcp_request_seconds", "GCP 최적화 기록 요청 시간")
+        
         self.logger.info("🔧 GCP e2-small 최적화 관리자 초기화")
     
+    def _batch_limit(self):
+        """배치 크기용 적응형 한도 (record_request_time 관측값과 메모리/CPU 여유로 조정)"""
+        return get_adaptive_limit(
+            "gcp_batch", min_limit=self.limits.BATCH_SIZE_MIN, max_limit=self.limits.BATCH_SIZE_MAX
+        )
+    
     def get_optimal_batch_size(self) -> int:
-        """현재 시스템 상태에 따른 최적 배치 크기 계산"""
+        """현재 최적 배치 크기 (적응형 한도 조회, 대기 없음)"""
         try:
-            memory_percent = psutil.virtual_memory().percent
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # 메모리 기반 조정
-            if memory_percent > 85:
-                self.current_batch_size = max(1, self.current_batch_size - 1)
-            elif memory_percent < 60:
-                self.current_batch_size = min(self.limits.BATCH_SIZE_MAX, self.current_batch_size + 1)
-            
-            # CPU 기반 조정
-            if cpu_percent > 75:
-                self.current_batch_size = max(1, self.current_batch_size - 1)
-            
-            # 제한 범위 내로 조정
-            self.current_batch_size = max(
-                self.limits.BATCH_SIZE_MIN,
-                min(self.limits.BATCH_SIZE_MAX, self.current_batch_size)
-            )
-            
+            self.current_batch_size = self._batch_limit().limit
             return self.current_batch_size
             
         except Exception as e:
@@ -93,10 +92,11 @@ class GCPOptimizer:
             return 2  # 기본값
     
     def should_pause_processing(self) -> bool:
-        """처리 일시 중지 여부 결정"""
+        """처리 일시 중지 여부 결정 (샘플러 스냅샷 EWMA 기준, 대기 없음)"""
         try:
-            memory_percent = psutil.virtual_memory().percent
-            cpu_percent = psutil.cpu_percent(interval=0.5)
+            snapshot = get_system_snapshot()
+            memory_percent = snapshot.memory_percent
+            cpu_percent = snapshot.cpu_percent
             
             # 메모리 임계치 초과
             if memory_percent > 90:
@@ -245,9 +245,10 @@ class GCPOptimizer:
         """시스템 모니터링 루프"""
         while self.monitoring_active:
             try:
-                # 시스템 상태 수집
-                memory_info = psutil.virtual_memory()
-                cpu_percent = psutil.cpu_percent(interval=1)
+                # 시스템 상태 수집 (샘플러 스냅샷)
+                snapshot = get_system_snapshot()
+                memory_percent = snapshot.memory_percent
+                cpu_percent = snapshot.cpu_percent
                 
                 # 성능 지표 업데이트
                 self.metrics['cpu_usage_history'].append({
@@ -260,10 +261,10 @@ class GCPOptimizer:
                     self.metrics['cpu_usage_history'] = self.metrics['cpu_usage_history'][-30:]
                 
                 # 경고 조건 확인
-                if memory_info.percent > 85:
+                if memory_percent > 85:
                     self.alert_queue.put({
                         'type': 'memory_warning',
-                        'value': memory_info.percent,
+                        'value': memory_percent,
                         'timestamp': datetime.now()
                     })
                 
@@ -275,7 +276,7 @@ class GCPOptimizer:
                     })
                 
                 # 자동 최적화 실행
-                if memory_info.percent > 75:
+                if memory_percent > 75:
                     self.optimize_memory_usage()
                 
                 # 모니터링 주기 (15초)
@@ -289,7 +290,7 @@ class GCPOptimizer:
         """성능 보고서 생성"""
         try:
             current_memory = psutil.virtual_memory()
-            current_cpu = psutil.cpu_percent(interval=1)
+            current_cpu = get_system_snapshot().cpu_percent
             
             # 평균 계산
             avg_memory = 0
@@ -339,11 +340,12 @@ class GCPOptimizer:
         recommendations = []
         
         try:
-            memory_info = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=0.5)
+            snapshot = get_system_snapshot()
+            memory_percent = snapshot.memory_percent
+            cpu_percent = snapshot.cpu_percent
             
             # 메모리 권장사항
-            if memory_info.percent > 80:
+            if memory_percent > 80:
                 recommendations.append("메모리 사용률이 높습니다. 배치 크기를 줄이거나 처리 속도를 늦추세요.")
             
             # CPU 권장사항
@@ -351,7 +353,7 @@ class GCPOptimizer:
                 recommendations.append("CPU 사용률이 높습니다. 동시 처리 수를 줄이세요.")
             
             # 배치 크기 권장사항
-            if self.current_batch_size > 3 and memory_info.percent > 70:
+            if self.current_batch_size > 3 and memory_percent > 70:
                 recommendations.append(f"현재 배치 크기({self.current_batch_size})가 클 수 있습니다. 2-3으로 줄이세요.")
             
             # 일반 권장사항
@@ -363,9 +365,20 @@ class GCPOptimizer:
         
         return recommendations
     
+    def _metric_values(self) -> Dict[str, float]:
+        """최근 CPU/메모리 사용률과 성공률 (메트릭 노출용)"""
+        values = {'success_rate': self.metrics['success_rate']}
+        if self.metrics['cpu_usage_history']:
+            values['cpu_percent'] = self.metrics['cpu_usage_history'][-1]['cpu_percent']
+        if self.metrics['memory_usage_history']:
+            values['memory_percent'] = self.metrics['memory_usage_history'][-1]['memory_percent']
+        return values
+    
     def record_request_time(self, request_time: float):
         """요청 시간 기록"""
         self.metrics['request_times'].append(request_time)
+        self.request_seconds.observe(request_time)
+        self._batch_limit().record(request_time)
         
         # 최근 100개 요청만 유지
         if len(self.metrics['request_times']) > 100:
@@ -2,18 +2,26 @@
 # -*- coding: utf-8 -*-
 """
 AI 에이전트 시스템 - 기본 에이전트 클래스
+- BaseAgent: 동기 process_task 구현 에이전트 (Homepage/Contact/Validation/Optimizer)
+- AsyncAgent: 비동기 process_task/execute_task (재시도 대기도 asyncio.sleep)
+- SyncAgentAdapter: 기존 동기 에이전트를 AsyncAgent로 감싸는 어댑터
 """
 
 import time
+import random
+import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
 
 from ..utils.gemini_client import GeminiClient
 from ..metrics.performance import PerformanceTracker, PerformanceMetric
+from utils.metrics import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +41,9 @@ class AgentTask:
     data: Dict[str, Any]
     priority: int = 1
     max_retries: int = 3
-    timeout_seconds: float = 60.0
+    timeout_seconds: Optional[float] = 60.0  # 시도별 타임아웃 (None이면 제한 없음)
     created_at: datetime = None
+    agent_name: str = ""
     
     def __post_init__(self):
         if self.created_at is None:
@@ -54,6 +63,19 @@ class AgentResult:
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+def retry_backoff_delay(attempt: int, base: float = 1.0, cap: float = 10.0) -> float:
+    """
+    재시도 대기 시간 (지수 백오프 + jitter)
+    상한 min(cap, base * 2^attempt)의 절반은 고정, 나머지 절반은 무작위로 분산해
+    동시에 실패한 작업들이 같은 시점에 재시도하지 않도록 함
+    """
+    ceiling = min(cap, base * (2 ** attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
 
 class BaseAgent(ABC):
     """기본 에이전트 클래스"""
@@ -63,7 +85,7 @@ class BaseAgent(ABC):
         self.config = config or {}
         self.status = AgentStatus.IDLE
         self.gemini_client = GeminiClient()
-        self.performance_tracker = PerformanceTracker()
+        self.performance_tracker = PerformanceTracker(registry=get_metrics_registry())
         self.logger = logging.getLogger(f"{__name__}.{name}")
         
         # 에이전트별 설정
@@ -84,7 +106,10 @@ class BaseAgent(ABC):
         pass
     
     def execute_task(self, task: AgentTask) -> AgentResult:
-        """작업 실행 (재시도 로직 포함)"""
+        """
+        작업 실행 (재시도 로직 포함, 동기)
+        이벤트 루프 안에서는 as_async_agent(agent).execute_task를 사용
+        """
         self.logger.info(f"작업 시작: {task.task_id}")
         self.status = AgentStatus.WORKING
         
@@ -141,7 +166,7 @@ class BaseAgent(ABC):
                     )
                 
                 # 재시도 전 대기
-                time.sleep(min(2 ** attempt, 10))  # 지수 백오프
+                time.sleep(retry_backoff_delay(attempt))  # 지수 백오프 + jitter
         
         # 모든 재시도 실패
         self.status = AgentStatus.ERROR
@@ -220,4 +245,149 @@ class BaseAgent(ABC):
         return f"Agent({self.name}, status={self.status.value})"
     
     def __repr__(self):
-        return f"Agent(name='{self.name}', status='{self.status.value}', config={self.config})" 
\ No newline at end of file
+        return f"Agent(name='{self.name}', status='{self.status.value}', config={self.config})" 
+
+class AsyncAgent(ABC):
+    """
+    비동기 에이전트
+    재시도 대기가 asyncio.sleep이라 여러 작업이 하나의 이벤트 루프를 공유해도 서로 막지 않음
+    """
+    
+    def __init__(self, name: str, config: Dict[str, Any] = None,
+                 performance_tracker: Optional[PerformanceTracker] = None):
+        self.name = name
+        self.config = config or {}
+        self.status = AgentStatus.IDLE
+        self.performance_tracker = performance_tracker or PerformanceTracker(registry=get_metrics_registry())
+        self.logger = logging.getLogger(f"{__name__}.{name}")
+        
+        # 재시도 대기 설정
+        self.backoff_base = self.config.get('backoff_base', 1.0)
+        self.backoff_cap = self.config.get('backoff_cap', 10.0)
+    
+    @abstractmethod
+    async def process_task(self, task: AgentTask) -> AgentResult:
+        """작업 처리 (구현 필요)"""
+        pass
+    
+    async def execute_task(self, task: AgentTask) -> AgentResult:
+        """
+        작업 실행 (재시도 로직 포함)
+        시도별 타임아웃은 task.timeout_seconds, 시도 횟수는 result.metadata['attempts']에 기록
+        """
+        self.logger.info(f"작업 시작: {task.task_id}")
+        self.status = AgentStatus.WORKING
+        
+        metric = PerformanceMetric(
+            agent_name=self.name,
+            task_type=task.task_type,
+            start_time=datetime.now()
+        )
+        start_time = time.time()
+        result = None
+        
+        for attempt in range(task.max_retries + 1):
+            try:
+                if task.timeout_seconds:
+                    result = await asyncio.wait_for(self.process_task(task), timeout=task.timeout_seconds)
+                else:
+                    result = await self.process_task(task)
+                
+                if result.success:
+                    self.logger.info(f"작업 완료: {task.task_id} (시도: {attempt + 1})")
+                    break
+                self.logger.warning(f"작업 실패: {task.task_id} (시도: {attempt + 1}) - {result.error_message}")
+                
+            except asyncio.TimeoutError:
+                result = AgentResult(
+                    task_id=task.task_id,
+                    success=False,
+                    data={},
+                    error_message=f"작업 타임아웃: {task.timeout_seconds}초"
+                )
+                self.logger.warning(f"작업 타임아웃: {task.task_id} (시도: {attempt + 1})")
+                
+            except asyncio.CancelledError:
+                self.status = AgentStatus.IDLE
+                raise
+                
+            except Exception as e:
+                result = AgentResult(
+                    task_id=task.task_id,
+                    success=False,
+                    data={},
+                    error_message=f"작업 처리 중 오류: {str(e)}"
+                )
+                self.logger.error(result.error_message)
+            
+            if attempt < task.max_retries:
+                # 재시도 전 대기 (이벤트 루프 비차단)
+                await asyncio.sleep(retry_backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+        
+        result.processing_time = time.time() - start_time
+        result.metadata['attempts'] = attempt + 1
+        
+        metric.end_time = datetime.now()
+        metric.success = result.success
+        metric.confidence_score = result.confidence_score
+        metric.error_message = result.error_message
+        metric.metadata = result.metadata
+        self.performance_tracker.add_metric(metric)
+        
+        self.status = AgentStatus.COMPLETED if result.success else AgentStatus.ERROR
+        return result
+    
+    def get_performance_stats(self) -> Dict[str, Any]:
+        """성능 통계 반환"""
+        return self.performance_tracker.get_agent_stats(self.name)
+    
+    def __str__(self):
+        return f"AsyncAgent({self.name}, status={self.status.value})"
+
+class SyncAgentAdapter(AsyncAgent):
+    """
+    동기 에이전트(BaseAgent) 어댑터
+    process_task는 스레드 풀에서 실행하고, 재시도 대기는 스레드를 점유하지 않음
+    타임아웃으로 포기한 시도의 스레드는 계속 실행되므로, 동기 에이전트(스레드 안전하지 않음)의
+    process_task는 에이전트별 잠금으로 한 번에 하나만 실행 (재시도는 이전 스레드 종료 후 시작)
+    """
+    
+    def __init__(self, agent: BaseAgent, executor: Optional[Executor] = None):
+        self.agent = agent
+        self.executor = executor
+        # 실행기별 어댑터가 여러 개여도 같은 에이전트는 잠금 공유
+        self._process_lock = agent.__dict__.setdefault('_process_lock', threading.Lock())
+        super().__init__(agent.name, agent.config, performance_tracker=agent.performance_tracker)
+    
+    @property
+    def status(self) -> AgentStatus:
+        return self.agent.status
+    
+    @status.setter
+    def status(self, value: AgentStatus):
+        self.agent.status = value
+    
+    def _process_serialized(self, task: AgentTask) -> AgentResult:
+        with self._process_lock:
+            return self.agent.process_task(task)
+    
+    async def process_task(self, task: AgentTask) -> AgentResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._process_serialized, task)
+    
+    def __getattr__(self, name: str):
+        # 그 외 속성(get_system_prompt, 에이전트별 통계 등)은 원래 에이전트로 위임
+        if name == 'agent':
+            raise AttributeError(name)
+        return getattr(self.agent, name)
+
+def as_async_agent(agent, executor: Optional[Executor] = None) -> AsyncAgent:
+    """에이전트를 AsyncAgent로 변환 (동기 에이전트는 어댑터를 만들어 재사용)"""
+    if isinstance(agent, AsyncAgent):
+        return agent
+    
+    adapter = getattr(agent, '_async_adapter', None)
+    if adapter is None or (executor is not None and adapter.executor is not executor):
+        adapter = SyncAgentAdapter(agent, executor)
+        agent._async_adapter = adapter
+    return adapter
@@ -12,8 +12,8 @@ from datetime import datetime
 import json
 import uuid
 
-from .agent_base import BaseAgent, AgentTask, AgentResult, AgentStatus
-from .coordinator import AgentCoordinator
+from .agent_base import BaseAgent, AgentTask, AgentResult, AgentStatus, as_async_agent
+from .coordinator import AgentCoordinator, DagStep, FailurePolicy, TaskPriority
 from ..agents import AGENT_REGISTRY, create_agent
 from ..config.agent_config import AgentConfig, ConfigPresets
 from ..metrics.performance import PerformanceTracker
@@ -145,26 +145,42 @@ class AIAgentSystem:
         try:
             logger.info(f"크롤링 작업 시작: {task_id}")
             
-            # 1. 홈페이지 검색
-            homepage_result = await self._execute_homepage_search(task_id, organization_data)
-            
-            # 2. 연락처 추출
-            contact_result = await self._execute_contact_extraction(task_id, homepage_result)
-            
-            # 3. 데이터 검증
-            validation_result = await self._execute_data_validation(task_id, contact_result)
-            
-            # 4. 최적화 분석 (선택적)
-            optimization_result = await self._execute_optimization_analysis(task_id, {
-                'homepage_result': homepage_result,
-                'contact_result': contact_result,
-                'validation_result': validation_result
-            })
+            # 홈페이지 검색 → 연락처 추출 → 데이터 검증 체인과
+            # 최적화 분석(성능 메트릭만 사용)을 DAG로 병렬 실행
+            steps = [
+                DagStep(
+                    name='homepage_search',
+                    run=lambda results: self._execute_homepage_search(task_id, organization_data),
+                    priority=TaskPriority.HIGH.value,
+                    timeout=self._agent_timeout('homepage_agent')
+                ),
+                DagStep(
+                    name='contact_extraction',
+                    run=lambda results: self._execute_contact_extraction(task_id, results['homepage_search']),
+                    dependencies=['homepage_search'],
+                    priority=TaskPriority.HIGH.value,
+                    timeout=self._agent_timeout('contact_agent')
+                ),
+                DagStep(
+                    name='data_validation',
+                    run=lambda results: self._execute_data_validation(task_id, results['contact_extraction']),
+                    dependencies=['contact_extraction'],
+                    timeout=self._agent_timeout('validation_agent')
+                ),
+                DagStep(
+                    name='optimization_analysis',
+                    run=lambda results: self._execute_optimization_analysis(task_id, results),
+                    priority=TaskPriority.LOW.value,
+                    timeout=self._agent_timeout('optimizer_agent')
+                )
+            ]
+            run = await self.coordinator.run_dag(steps, failure_policy=FailurePolicy.FAIL_FAST)
             
-            # 5. 최종 결과 통합
+            # 최종 결과 통합
             final_result = self._integrate_results(
-                task_id, organization_data, homepage_result, 
-                contact_result, validation_result, optimization_result
+                task_id, organization_data, run.results['homepage_search'],
+                run.results['contact_extraction'], run.results['data_validation'],
+                run.results['optimization_analysis']
             )
             
             # 통계 업데이트
@@ -188,6 +204,11 @@ class AIAgentSystem:
                 'processing_time': (datetime.now() - start_time).total_seconds()
             }
     
+    def _agent_timeout(self, agent_name: str) -> Optional[float]:
+        """에이전트 설정의 작업 타임아웃"""
+        agent = self.agents.get(agent_name)
+        return getattr(agent, 'timeout_seconds', None) if agent else None
+    
     async def _execute_homepage_search(self, task_id: str, organization_data: Dict[str, Any]) -> Dict[str, Any]:
         """홈페이지 검색 실행"""
         if 'homepage_agent' not in self.agents:
@@ -201,7 +222,7 @@ class AIAgentSystem:
             data=organization_data
         )
         
-        result = await asyncio.to_thread(agent.process_task, task)
+        result = await as_async_agent(agent).execute_task(task)
         return result.to_dict()
     
     async def _execute_contact_extraction(self, task_id: str, homepage_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -227,7 +248,7 @@ class AIAgentSystem:
             }
         )
         
-        result = await asyncio.to_thread(agent.process_task, task)
+        result = await as_async_agent(agent).execute_task(task)
         return result.to_dict()
     
     async def _execute_data_validation(self, task_id: str, contact_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -246,7 +267,7 @@ class AIAgentSystem:
             }
         )
         
-        result = await asyncio.to_thread(agent.process_task, task)
+        result = await as_async_agent(agent).execute_task(task)
         return result.to_dict()
     
     async def _execute_optimization_analysis(self, task_id: str, all_results: Dict[str, Any]) -> Dict[str, Any]:
@@ -271,7 +292,7 @@ class AIAgentSystem:
             }
         )
         
-        result = await asyncio.to_thread(agent.process_task, task)
+        result = await as_async_agent(agent).execute_task(task)
         return result.to_dict()
     
     def _integrate_results(self, task_id: str, organization_data: Dict[str, Any],
@@ -440,7 +461,7 @@ class AIAgentSystem:
                 
                 # 타임아웃 설정 (5초)
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(agent.process_task, test_task),
+                    as_async_agent(agent).process_task(test_task),
                     timeout=5.0
                 )
                 
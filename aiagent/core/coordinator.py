@@ -7,14 +7,15 @@
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
+import time
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable, Set
 from datetime import datetime, timedelta
 from enum import Enum
 import json
 import uuid
 from dataclasses import dataclass, field
 
-from .agent_base import BaseAgent, AgentTask, AgentResult, AgentStatus
+from .agent_base import BaseAgent, AgentTask, AgentResult, AgentStatus, as_async_agent
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,45 @@ class TaskPriority(Enum):
     HIGH = 3
     URGENT = 4
 
+class FailurePolicy(Enum):
+    """작업 실패 시 처리 정책"""
+    FAIL_FAST = "fail_fast"              # 실행 중인 작업 모두 취소 후 즉시 실패
+    SKIP_DEPENDENTS = "skip_dependents"  # 실패 작업의 후속 작업만 건너뛰고 독립 분기는 계속
+    CONTINUE = "continue"                # 후속 작업도 실행 (실패한 의존 결과는 빠짐)
+
+class DagExecutionError(RuntimeError):
+    """FAIL_FAST 정책에서 작업 실패로 DAG 실행이 중단됨"""
+    
+    def __init__(self, step_name: str, error: str):
+        super().__init__(f"작업 실패로 실행 중단: {step_name} - {error}")
+        self.step_name = step_name
+        self.error = error
+
+@dataclass
+class DagStep:
+    """
+    DAG 실행 단위
+    run은 완료된 선행 작업(전이적 의존 포함)의 결과 딕셔너리 {이름: 결과}를 받는 코루틴 함수
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    dependencies: List[str] = field(default_factory=list)
+    priority: int = TaskPriority.MEDIUM.value
+    timeout: Optional[float] = None
+
+@dataclass
+class DagRun:
+    """DAG 실행 결과"""
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)
+    execution_time: float = 0.0
+    
+    @property
+    def success(self) -> bool:
+        return not (self.errors or self.skipped or self.cancelled)
+
 @dataclass
 class WorkflowTask:
     """워크플로우 작업"""
@@ -61,6 +101,7 @@ class Workflow:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    failure_policy: FailurePolicy = FailurePolicy.SKIP_DEPENDENTS
 
 class AgentCoordinator:
     """에이전트 조정자"""
@@ -70,7 +111,7 @@ class AgentCoordinator:
         에이전트 조정자 초기화
         
         Args:
-            max_concurrent_tasks: 최대 동시 작업 수
+            max_concurrent_tasks: 최대 동시 작업 수 (모든 워크플로우 공통)
         """
         self.coordinator_id = str(uuid.uuid4())
         self.max_concurrent_tasks = max_concurrent_tasks
@@ -79,6 +120,14 @@ class AgentCoordinator:
         self.task_queue: List[WorkflowTask] = []
         self.running_tasks: Dict[str, WorkflowTask] = {}
         
+        # 전역 동시 실행 제한 (이벤트 루프별로 생성)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # 실행 중인 DAG별 asyncio 작업 (취소 전파용)
+        self._dag_runs: Dict[str, Tuple[asyncio.AbstractEventLoop, Set[asyncio.Task]]] = {}
+        self._cancelled_runs: Set[str] = set()
+        
         # 통계
         self.stats = {
             'total_workflows': 0,
@@ -94,14 +143,16 @@ class AgentCoordinator:
         logger.info(f"에이전트 조정자 초기화 완료 (ID: {self.coordinator_id})")
     
     def create_workflow(self, name: str, tasks: List[Dict[str, Any]], 
-                       metadata: Dict[str, Any] = None) -> str:
+                       metadata: Dict[str, Any] = None,
+                       failure_policy: FailurePolicy = FailurePolicy.SKIP_DEPENDENTS) -> str:
         """
         워크플로우 생성
         
         Args:
             name: 워크플로우 이름
-            tasks: 작업 목록
+            tasks: 작업 목록 (dependencies는 선행 작업의 task_type)
             metadata: 메타데이터
+            failure_policy: 작업 실패 시 처리 정책
             
         Returns:
             str: 워크플로우 ID
@@ -128,7 +179,8 @@ class AgentCoordinator:
             workflow_id=workflow_id,
             name=name,
             tasks=workflow_tasks,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            failure_policy=failure_policy
         )
         
         self.active_workflows[workflow_id] = workflow
@@ -213,27 +265,33 @@ class AgentCoordinator:
             dependency_graph = self._build_dependency_graph(workflow.tasks)
             
             # 작업 실행
-            results = await self._execute_tasks(workflow, dependency_graph, agents)
+            run = await self._execute_tasks(workflow, dependency_graph, agents)
             
             # 워크플로우 완료
-            workflow.status = WorkflowStatus.COMPLETED
             workflow.completed_at = datetime.now()
-            
-            # 통계 업데이트
-            self.stats['successful_workflows'] += 1
             execution_time = (workflow.completed_at - workflow.started_at).total_seconds()
-            self._update_average_workflow_time(execution_time)
-            
-            # 완료된 워크플로우 이동
-            self.completed_workflows[workflow_id] = workflow
-            del self.active_workflows[workflow_id]
             
-            logger.info(f"워크플로우 실행 완료: {workflow.name} (처리시간: {execution_time:.2f}초)")
+            if run.cancelled and workflow.status == WorkflowStatus.CANCELLED:
+                status = 'cancelled'
+                logger.info(f"워크플로우 취소됨: {workflow.name} (처리시간: {execution_time:.2f}초)")
+            elif run.success:
+                status = 'completed'
+                workflow.status = WorkflowStatus.COMPLETED
+                self.stats['successful_workflows'] += 1
+                self._update_average_workflow_time(execution_time)
+                logger.info(f"워크플로우 실행 완료: {workflow.name} (처리시간: {execution_time:.2f}초)")
+            else:
+                status = 'failed'
+                workflow.status = WorkflowStatus.FAILED
+                self.stats['failed_workflows'] += 1
+                logger.warning(f"워크플로우 부분 실패: {workflow.name} - 실패 {len(run.errors)}개, 건너뜀 {len(run.skipped)}개")
             
             return {
                 'workflow_id': workflow_id,
-                'status': 'completed',
-                'results': results,
+                'status': status,
+                'results': run.results,
+                'errors': run.errors,
+                'skipped_tasks': run.skipped,
                 'execution_time': execution_time,
                 'task_count': len(workflow.tasks)
             }
@@ -251,9 +309,14 @@ class AgentCoordinator:
                 'error': str(e),
                 'execution_time': (workflow.completed_at - workflow.started_at).total_seconds() if workflow.started_at else 0
             }
+        
+        finally:
+            # 완료된 워크플로우 이동
+            if workflow_id in self.active_workflows:
+                self.completed_workflows[workflow_id] = self.active_workflows.pop(workflow_id)
     
     def _build_dependency_graph(self, tasks: List[WorkflowTask]) -> Dict[str, List[str]]:
-        """의존성 그래프 구축"""
+        """의존성 그래프 구축 (task_type 의존성 → task_id)"""
         graph = {}
         task_map = {task.task_type: task.task_id for task in tasks}
         
@@ -262,62 +325,270 @@ class AgentCoordinator:
             for dep in task.dependencies:
                 if dep in task_map:
                     dependencies.append(task_map[dep])
+                else:
+                    logger.warning(f"알 수 없는 의존 작업 무시: {task.task_type} → {dep}")
             graph[task.task_id] = dependencies
         
         return graph
     
     async def _execute_tasks(self, workflow: Workflow, dependency_graph: Dict[str, List[str]], 
-                           agents: Dict[str, BaseAgent]) -> Dict[str, Any]:
-        """작업 실행"""
+                           agents: Dict[str, BaseAgent]) -> DagRun:
+        """워크플로우 작업을 DAG로 실행"""
         task_map = {task.task_id: task for task in workflow.tasks}
-        completed_tasks = set()
-        results = {}
         
-        # 실행 가능한 작업 찾기
-        while len(completed_tasks) < len(workflow.tasks):
-            ready_tasks = []
-            
-            for task_id, dependencies in dependency_graph.items():
-                if task_id not in completed_tasks and all(dep in completed_tasks for dep in dependencies):
-                    ready_tasks.append(task_map[task_id])
-            
-            if not ready_tasks:
-                raise RuntimeError("순환 의존성 또는 해결할 수 없는 의존성이 있습니다.")
-            
-            # 우선순위 정렬
-            ready_tasks.sort(key=lambda t: t.priority.value, reverse=True)
-            
-            # 동시 실행 (최대 동시 작업 수 제한)
-            batch_size = min(len(ready_tasks), self.max_concurrent_tasks)
-            batch_tasks = ready_tasks[:batch_size]
+        def make_step(task: WorkflowTask) -> DagStep:
+            async def run(previous_results: Dict[str, Any]) -> AgentResult:
+                task.status = WorkflowStatus.RUNNING
+                self.running_tasks[task.task_id] = task
+                try:
+                    return await self._execute_single_task(task, agents, previous_results)
+                finally:
+                    self.running_tasks.pop(task.task_id, None)
             
-            # 작업 실행
-            batch_results = await asyncio.gather(
-                *[self._execute_single_task(task, agents, results) for task in batch_tasks],
-                return_exceptions=True
+            return DagStep(
+                name=task.task_id,
+                run=run,
+                dependencies=dependency_graph.get(task.task_id, []),
+                priority=task.priority.value,
+                timeout=task.timeout
             )
+        
+        def on_step_done(task_id: str, status: WorkflowStatus, outcome: Any):
+            task = task_map[task_id]
+            task.status = status
+            if status == WorkflowStatus.COMPLETED:
+                task.result = outcome
+            else:
+                task.error = outcome
+        
+        return await self.run_dag(
+            [make_step(task) for task in workflow.tasks],
+            failure_policy=workflow.failure_policy,
+            run_id=workflow.workflow_id,
+            on_step_done=on_step_done,
+            raise_on_failure=False
+        )
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 전역 세마포어"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    @staticmethod
+    def _validate_dag(steps: Dict[str, DagStep]) -> Dict[str, Set[str]]:
+        """의존성 검증 (없는 작업/순환) 후 작업별 전이적 선행 작업 집합 반환"""
+        for step in steps.values():
+            for dep in step.dependencies:
+                if dep not in steps:
+                    raise ValueError(f"존재하지 않는 의존 작업: {step.name} → {dep}")
+        
+        # 위상 정렬 (Kahn)
+        indegree = {name: len(set(step.dependencies)) for name, step in steps.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in steps}
+        for step in steps.values():
+            for dep in set(step.dependencies):
+                dependents[dep].append(step.name)
+        
+        order = [name for name, degree in indegree.items() if degree == 0]
+        for name in order:
+            for child in dependents[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    order.append(child)
+        
+        if len(order) != len(steps):
+            cyclic = sorted(name for name, degree in indegree.items() if degree > 0)
+            raise ValueError(f"순환 의존성이 있습니다: {cyclic}")
+        
+        ancestors: Dict[str, Set[str]] = {}
+        for name in order:
+            ancestors[name] = set()
+            for dep in steps[name].dependencies:
+                ancestors[name] |= ancestors[dep] | {dep}
+        return ancestors
+    
+    async def run_dag(self, steps: List[DagStep],
+                      failure_policy: FailurePolicy = FailurePolicy.FAIL_FAST,
+                      run_id: Optional[str] = None,
+                      on_step_done: Optional[Callable[[str, WorkflowStatus, Any], None]] = None,
+                      raise_on_failure: bool = True) -> DagRun:
+        """
+        DAG 실행기
+        각 작업은 선행 작업이 모두 끝나는 즉시 시작되며(웨이브 대기 없음),
+        동시 실행 수는 조정자 전역 세마포어로 제한
+        
+        Args:
+            steps: 실행할 작업 목록
+            failure_policy: 작업 실패 시 처리 정책
+            run_id: cancel_run으로 취소할 때 사용할 실행 ID
+            on_step_done: 작업 종료 콜백 (이름, 상태, 결과 또는 오류 메시지)
+            raise_on_failure: FAIL_FAST 실패 시 DagExecutionError 발생 여부
+            
+        Returns:
+            DagRun: 작업별 결과/오류/건너뜀/취소 목록
+        """
+        step_map = {step.name: step for step in steps}
+        if len(step_map) != len(steps):
+            raise ValueError("작업 이름이 중복되었습니다.")
+        
+        ancestors = self._validate_dag(step_map)
+        dependents: Dict[str, List[str]] = {name: [] for name in step_map}
+        waiting = {name: set(step.dependencies) for name, step in step_map.items()}
+        for step in steps:
+            for dep in waiting[step.name]:
+                dependents[dep].append(step.name)
+        
+        run = DagRun()
+        run_id = run_id or str(uuid.uuid4())
+        semaphore = self._get_semaphore()
+        running: Dict[asyncio.Task, str] = {}
+        finished: Set[str] = set()
+        start_time = time.time()
+        
+        loop = asyncio.get_running_loop()
+        self._dag_runs[run_id] = (loop, set())
+        
+        def notify(name: str, status: WorkflowStatus, outcome: Any):
+            finished.add(name)
+            if on_step_done:
+                try:
+                    on_step_done(name, status, outcome)
+                except Exception as e:
+                    logger.warning(f"작업 종료 콜백 오류: {name} - {str(e)}")
+        
+        async def execute(step: DagStep) -> Any:
+            async with semaphore:
+                step_start = time.time()
+                previous = {dep: run.results[dep] for dep in ancestors[step.name] if dep in run.results}
+                try:
+                    if step.timeout:
+                        return await asyncio.wait_for(step.run(previous), timeout=step.timeout)
+                    return await step.run(previous)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"작업 타임아웃: {step.timeout}초")
+                finally:
+                    self._update_average_task_time(time.time() - step_start)
+        
+        def launch(names: List[str]):
+            # 우선순위 높은 작업부터 세마포어 대기열에 진입
+            for name in sorted(names, key=lambda n: step_map[n].priority, reverse=True):
+                handle = asyncio.create_task(execute(step_map[name]), name=f"dag:{name}")
+                running[handle] = name
+                self._dag_runs[run_id][1].add(handle)
+        
+        def release_dependents(name: str, failed: bool) -> List[str]:
+            ready = []
+            for child in dependents[name]:
+                if child in finished:
+                    continue
+                if failed and failure_policy == FailurePolicy.SKIP_DEPENDENTS:
+                    skip(child, name)
+                    continue
+                waiting[child].discard(name)
+                if not waiting[child]:
+                    ready.append(child)
+            return ready
+        
+        def skip(name: str, cause: str):
+            if name in finished:
+                return
+            run.skipped.append(name)
+            notify(name, WorkflowStatus.CANCELLED, f"선행 작업 실패로 건너뜀: {cause}")
+            for child in dependents[name]:
+                skip(child, cause)
+        
+        async def cancel_running():
+            for handle in running:
+                handle.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            for name in running.values():
+                run.cancelled.append(name)
+                notify(name, WorkflowStatus.CANCELLED, "작업 취소됨")
+            running.clear()
+        
+        def cancel_pending():
+            for name in step_map:
+                if name not in finished:
+                    run.cancelled.append(name)
+                    notify(name, WorkflowStatus.CANCELLED, "작업 취소됨")
+        
+        try:
+            launch([name for name, deps in waiting.items() if not deps])
             
-            # 결과 처리
-            for task, result in zip(batch_tasks, batch_results):
-                if isinstance(result, Exception):
-                    logger.error(f"작업 실행 실패: {task.task_id} - {str(result)}")
-                    task.status = WorkflowStatus.FAILED
-                    task.error = str(result)
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                ready: List[str] = []
+                
+                for handle in done:
+                    name = running.pop(handle)
+                    self._dag_runs[run_id][1].discard(handle)
+                    self.stats['total_tasks'] += 1
+                    
+                    if handle.cancelled():
+                        # 외부 취소 (cancel_run)
+                        run.cancelled.append(name)
+                        notify(name, WorkflowStatus.CANCELLED, "작업 취소됨")
+                        continue
+                    
+                    error = handle.exception()
+                    if error is None:
+                        run.results[name] = handle.result()
+                        self.stats['successful_tasks'] += 1
+                        notify(name, WorkflowStatus.COMPLETED, run.results[name])
+                        ready.extend(release_dependents(name, failed=False))
+                        continue
+                    
+                    message = str(error) or type(error).__name__
+                    logger.error(f"작업 실행 실패: {name} - {message}")
+                    run.errors[name] = message
                     self.stats['failed_tasks'] += 1
-                else:
-                    task.status = WorkflowStatus.COMPLETED
-                    task.result = result
-                    results[task.task_id] = result
-                    completed_tasks.add(task.task_id)
-                    self.stats['successful_tasks'] += 1
+                    notify(name, WorkflowStatus.FAILED, message)
+                    
+                    if failure_policy == FailurePolicy.FAIL_FAST:
+                        await cancel_running()
+                        cancel_pending()
+                        if raise_on_failure:
+                            raise DagExecutionError(name, message)
+                        return run
+                    
+                    ready.extend(release_dependents(name, failed=True))
+                
+                if run_id in self._cancelled_runs:
+                    await cancel_running()
+                    cancel_pending()
+                    break
                 
-                self.stats['total_tasks'] += 1
+                launch(ready)
+            
+            return run
+        
+        except asyncio.CancelledError:
+            # 호출자 취소 시 하위 작업까지 전파
+            await cancel_running()
+            raise
         
-        return results
+        finally:
+            run.execution_time = time.time() - start_time
+            self._dag_runs.pop(run_id, None)
+            self._cancelled_runs.discard(run_id)
+    
+    def cancel_run(self, run_id: str) -> bool:
+        """실행 중인 DAG 취소 (다른 스레드에서 호출 가능)"""
+        if run_id not in self._dag_runs:
+            return False
+        
+        loop, handles = self._dag_runs[run_id]
+        self._cancelled_runs.add(run_id)
+        for handle in list(handles):
+            loop.call_soon_threadsafe(handle.cancel)
+        return True
     
     async def _execute_single_task(self, task: WorkflowTask, agents: Dict[str, BaseAgent], 
                                  previous_results: Dict[str, Any]) -> AgentResult:
-        """단일 작업 실행"""
+        """단일 작업 실행 (타임아웃은 재시도를 포함한 작업 전체에 run_dag에서 적용)"""
         if task.agent_name not in agents:
             raise ValueError(f"에이전트를 찾을 수 없습니다: {task.agent_name}")
         
@@ -326,46 +597,22 @@ class AgentCoordinator:
         # 이전 결과를 현재 작업 데이터에 통합
         task_data = self._prepare_task_data(task, previous_results)
         
-        # 에이전트 작업 생성
+        # 에이전트 작업 생성 (재시도/백오프는 에이전트의 비동기 execute_task가 처리)
         agent_task = AgentTask(
             task_id=task.task_id,
             agent_name=task.agent_name,
             task_type=task.task_type,
-            data=task_data
+            data=task_data,
+            max_retries=task.max_retries,
+            timeout_seconds=None
         )
         
-        # 재시도 로직
-        for attempt in range(task.max_retries + 1):
-            try:
-                task.retry_count = attempt
-                
-                # 타임아웃 설정
-                result = await asyncio.wait_for(
-                    asyncio.to_thread(agent.process_task, agent_task),
-                    timeout=task.timeout
-                )
-                
-                if result.success:
-                    return result
-                else:
-                    logger.warning(f"작업 실패 (시도 {attempt + 1}/{task.max_retries + 1}): {task.task_id}")
-                    if attempt == task.max_retries:
-                        raise RuntimeError(f"작업 실패: {result.error_message}")
-                    
-            except asyncio.TimeoutError:
-                logger.warning(f"작업 타임아웃 (시도 {attempt + 1}/{task.max_retries + 1}): {task.task_id}")
-                if attempt == task.max_retries:
-                    raise RuntimeError(f"작업 타임아웃: {task.timeout}초")
-                    
-            except Exception as e:
-                logger.warning(f"작업 오류 (시도 {attempt + 1}/{task.max_retries + 1}): {task.task_id} - {str(e)}")
-                if attempt == task.max_retries:
-                    raise
-                
-            # 재시도 전 대기
-            await asyncio.sleep(min(2 ** attempt, 10))  # 지수 백오프
+        result = await as_async_agent(agent).execute_task(agent_task)
+        task.retry_count = result.metadata.get('attempts', 1) - 1
         
-        raise RuntimeError("모든 재시도 실패")
+        if not result.success:
+            raise RuntimeError(f"작업 실패: {result.error_message}")
+        return result
     
     def _prepare_task_data(self, task: WorkflowTask, previous_results: Dict[str, Any]) -> Dict[str, Any]:
         """작업 데이터 준비"""
@@ -434,9 +681,10 @@ class AgentCoordinator:
         workflow.status = WorkflowStatus.CANCELLED
         workflow.completed_at = datetime.now()
         
-        # 실행 중인 작업들 취소
+        # 실행 중인 작업들 취소 (대기 중인 작업은 시작되지 않음)
+        self.cancel_run(workflow_id)
         for task in workflow.tasks:
-            if task.status == WorkflowStatus.RUNNING:
+            if task.status in (WorkflowStatus.PENDING, WorkflowStatus.RUNNING):
                 task.status = WorkflowStatus.CANCELLED
         
         logger.info(f"워크플로우 취소: {workflow.name} (ID: {workflow_id})")
@@ -467,6 +715,13 @@ class AgentCoordinator:
             current_avg = self.stats['average_workflow_time']
             self.stats['average_workflow_time'] = ((current_avg * (total_workflows - 1)) + execution_time) / total_workflows
     
+    def _update_average_task_time(self, execution_time: float):
+        """평균 작업 시간 업데이트 (지수 이동 평균)"""
+        if self.stats['average_task_time'] == 0.0:
+            self.stats['average_task_time'] = execution_time
+        else:
+            self.stats['average_task_time'] = 0.9 * self.stats['average_task_time'] + 0.1 * execution_time
+    
     def cleanup_completed_workflows(self, max_age_hours: int = 24):
         """완료된 워크플로우 정리"""
         cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
@@ -51,6 +51,8 @@ import requests
 # 기존 시스템 모듈
 from database.database import ChurchCRMDatabase
 from database.models import Organization, CrawlingJob
+from utils.gemini_key_pool import get_gemini_key_pool
+from utils.system_sampler import get_system_snapshot
 
 
 # ==================== 설정 및 상수 ====================
@@ -518,18 +520,20 @@ class ResourceManager:
         self.logger.info(f"🔧 리소스 관리자 초기화: 최대 워커 {self.max_workers}개")
     
     def can_create_worker(self) -> bool:
-        """워커 생성 가능 여부 확인"""
+        """워커 생성 가능 여부 확인 (샘플러 스냅샷 EWMA 기준, 대기 없음)"""
         if self.current_workers >= self.max_workers:
             return False
         
+        snapshot = get_system_snapshot()
+        
         # 메모리 사용률 확인
-        memory_percent = psutil.virtual_memory().percent / 100
+        memory_percent = snapshot.memory_percent / 100
         if memory_percent > self.memory_threshold:
             self.logger.warning(f"⚠️ 메모리 사용률 높음: {memory_percent:.1%}")
             return False
         
         # CPU 사용률 확인
-        cpu_percent = psutil.cpu_percent(interval=1) / 100
+        cpu_percent = snapshot.cpu_percent / 100
         if cpu_percent > self.cpu_threshold:
             self.logger.warning(f"⚠️ CPU 사용률 높음: {cpu_percent:.1%}")
             return False
@@ -558,10 +562,11 @@ class ResourceManager:
     
     def get_system_stats(self) -> Dict[str, Any]:
         """시스템 상태 조회"""
+        snapshot = get_system_snapshot()
         return {
-            'cpu_percent': psutil.cpu_percent(interval=1),
-            'memory_percent': psutil.virtual_memory().percent,
-            'disk_percent': psutil.disk_usage('/').percent,
+            'cpu_percent': snapshot.cpu_percent,
+            'memory_percent': snapshot.memory_percent,
+            'disk_percent': snapshot.disk_percent,
             'current_workers': self.current_workers,
             'max_workers': self.max_workers,
             'gemini_requests_per_minute': self.gemini_requests_per_minute
@@ -633,13 +638,13 @@ class EnhancedAIAgentSystem:
     def _initialize_gemini(self):
         """Gemini AI 모델 초기화"""
         try:
-            api_key = os.getenv('GEMINI_API_KEY')
-            if not api_key:
+            key_pool = get_gemini_key_pool()
+            if not len(key_pool):
                 raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
             
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel(
+            model = key_pool.model(
                 "gemini-1.5-flash",
+                source="enhanced_agent",
                 generation_config=GEMINI_CONFIG
             )
             
@@ -24,6 +24,7 @@ import json
 # 기존 시스템 import
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from centercrawling import CenterCrawlingBot
+from utils.concurrency_controller import get_adaptive_limit
 from database.database import ChurchCRMDatabase
 from database.models import Organization, CrawlingJob
 
@@ -55,6 +56,9 @@ class IntegratedCrawlingBot(CenterCrawlingBot):
         """
         self.use_database = use_database
         self.integration_mode = integration_mode
+        # 기관 동시 처리용 잠금 (WebDriver는 1개라 기존 시스템 경로는 순서대로, 카운터는 원자적으로)
+        self._browser_lock = threading.Lock()
+        self._count_lock = threading.Lock()
         
         # 데이터베이스 연결
         if use_database:
@@ -119,7 +123,9 @@ class IntegratedCrawlingBot(CenterCrawlingBot):
                 self.logger.info("📋 크롤링할 기관이 없습니다.")
                 return self._get_crawling_summary()
             
-            self.logger.info(f"📊 총 {total_count}개 기관 크롤링 시작")
+            # 동시 처리 기관 수는 적응형 한도가 지연/오류율/메모리 여유로 조정 (max_workers는 상한)
+            limit = get_adaptive_limit("integration_organizations", max_limit=max_workers)
+            self.logger.info(f"📊 총 {total_count}개 기관 크롤링 시작 (동시 처리 한도: {limit.limit})")
             
             # 배치 처리
             processed_count = 0
@@ -132,7 +138,7 @@ class IntegratedCrawlingBot(CenterCrawlingBot):
                 self.logger.info(f"📦 배치 {batch_num} 처리 시작 ({len(batch)}개)")
                 
                 # 배치 처리
-                batch_results = self._process_organization_batch(batch)
+                batch_results = self._process_organization_batch(batch, limit)
                 
                 # 결과 집계
                 processed_count += len(batch)
@@ -146,12 +152,7 @@ class IntegratedCrawlingBot(CenterCrawlingBot):
                 if job_id:
                     self._update_crawling_job_progress(job_id, processed_count, total_count)
                 
-                # 리소스 관리
-                if self.ai_agent_system:
-                    stats = self.ai_agent_system.resource_manager.get_system_stats()
-                    if stats['memory_percent'] > 80:
-                        self.logger.warning("⚠️ 메모리 사용률 높음, 잠시 대기...")
-                        time.sleep(10)
+                # 리소스 관리: 메모리 여유가 부족하면 고정 대기 대신 적응형 한도가 동시 처리 수를 줄임
             
             # 크롤링 완료
             end_time = datetime.now()
@@ -216,29 +217,35 @@ class IntegratedCrawlingBot(CenterCrawlingBot):
             self.logger.error(f"❌ 크롤링 대상 조회 실패: {e}")
             return []
     
-    def _process_organization_batch(self, batch: List[Dict[str, Any]]) -> List[Optional[CrawlingResult]]:
-        """기관 배치 처리 - 하이브리드 모드"""
-        results = []
+    def _process_organization_batch(self, batch: List[Dict[str, Any]],
+                                    limit=None) -> List[Optional[CrawlingResult]]:
+        """기관 배치 처리 - 하이브리드 모드 (적응형 한도만큼 동시 처리, 결과 순서는 입력 순서)"""
+        limit = limit or get_adaptive_limit("integration_organizations")
         
-        for org_data in batch:
-            try:
-                result = self._process_single_organization_hybrid(org_data)
-                results.append(result)
-                
-                if result:
-                    self.success_count += 1
-                    self.logger.info(f"✅ 기관 처리 성공: {org_data['name']} (등급: {result.data_quality_grade})")
-                else:
-                    self.logger.warning(f"⚠️ 기관 처리 실패: {org_data['name']}")
-                
-                self.processed_count += 1
-                
-            except Exception as e:
-                self.logger.error(f"❌ 기관 처리 오류: {org_data['name']} - {e}")
-                results.append(None)
-                continue
+        def process(org_data: Dict[str, Any]) -> Optional[CrawlingResult]:
+            with limit.slot() as slot:
+                try:
+                    result = self._process_single_organization_hybrid(org_data)
+                    
+                    if result:
+                        with self._count_lock:
+                            self.success_count += 1
+                        self.logger.info(f"✅ 기관 처리 성공: {org_data['name']} (등급: {result.data_quality_grade})")
+                    else:
+                        self.logger.warning(f"⚠️ 기관 처리 실패: {org_data['name']}")
+                    
+                    with self._count_lock:
+                        self.processed_count += 1
+                    return result
+                    
+                except Exception as e:
+                    slot.mark("error")
+                    self.logger.error(f"❌ 기관 처리 오류: {org_data['name']} - {e}")
+                    return None
         
-        return results
+        # 스레드는 상한만큼 두고 실제 동시 실행 수는 슬롯이 제한
+        with ThreadPoolExecutor(max_workers=min(len(batch), limit.max_limit) or 1) as executor:
+            return list(executor.map(process, batch))
     
     def _process_single_organization_hybrid(self, org_data: Dict[str, Any]) -> Optional[CrawlingResult]:
         """단일 기관 하이브리드 처리"""
@@ -259,7 +266,8 @@ class IntegratedCrawlingBot(CenterCrawlingBot):
             
             # 2단계: 기존 시스템 사용 (fallback)
             if self.integration_mode in ['hybrid', 'legacy_only']:
-                legacy_result = self._process_with_legacy_system(org_data)
+                with self._browser_lock:
+                    legacy_result = self._process_with_legacy_system(org_data)
                 
                 if legacy_result:
                     self.logger.info(f"🔧 기존 시스템 성공: {name}")
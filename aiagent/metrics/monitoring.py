@@ -7,8 +7,6 @@ AI 에이전트 시스템 - 시스템 모니터링
 
 import asyncio
 import time
-import os
-import psutil
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable, Any
@@ -16,6 +14,9 @@ from dataclasses import dataclass, field
 from collections import defaultdict, deque
 import logging
 
+from utils.metrics import get_metrics_registry
+from utils.system_sampler import get_system_snapshot
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -125,6 +126,26 @@ class SystemMonitor:
         
         # 기본 알림 규칙 설정
         self._setup_default_alert_rules()
+        
+        # 메트릭 노출 (최근 건강 상태/작업 통계는 조회 시점 값)
+        registry = get_metrics_registry()
+        registry.mapping("aiagent_system_health", "에이전트 시스템 최근 건강 상태", self._health_metric_values)
+        registry.mapping("aiagent_task_stats", "에이전트 작업 통계", lambda: self.task_stats)
+        self.alerts_total = registry.counter("aiagent_alerts_total", "발생한 알림 수", ["rule", "severity"])
+    
+    def _health_metric_values(self) -> Dict[str, float]:
+        health = self.get_current_health()
+        if health is None:
+            return {}
+        return {
+            'cpu_usage': health.cpu_usage,
+            'memory_usage': health.memory_usage,
+            'disk_usage': health.disk_usage,
+            'active_agents': health.active_agents,
+            'pending_tasks': health.pending_tasks,
+            'error_count': health.error_count,
+            'response_time': health.response_time
+        }
     
     def _setup_default_alert_rules(self):
         """기본 알림 규칙 설정"""
@@ -242,28 +263,22 @@ class SystemMonitor:
                 logger.error(f"모니터링 중 오류 발생: {str(e)}")
     
     def _collect_system_health(self) -> SystemHealth:
-        """시스템 건강 상태 수집"""
-        # CPU 사용률
-        cpu_usage = psutil.cpu_percent(interval=1)
+        """시스템 건강 상태 수집 (백그라운드 샘플러 스냅샷, 대기 없음)"""
+        snapshot = get_system_snapshot()
         
-        # 메모리 사용률
-        memory = psutil.virtual_memory()
-        memory_usage = memory.percent
+        # CPU/메모리 사용률 (EWMA 평활)
+        cpu_usage = snapshot.cpu_percent
+        memory_usage = snapshot.memory_percent
         
-        # 디스크 사용률 (Windows 호환)
-        try:
-            disk = psutil.disk_usage('C:' if os.name == 'nt' else '/')
-            disk_usage = disk.percent
-        except:
-            disk_usage = 0.0
+        # 디스크 사용률 (Windows 호환 경로는 SYSTEM_SAMPLER_CONFIG)
+        disk_usage = snapshot.disk_percent
         
         # 네트워크 I/O
-        network_io = psutil.net_io_counters()
         network_data = {
-            'bytes_sent': network_io.bytes_sent,
-            'bytes_recv': network_io.bytes_recv,
-            'packets_sent': network_io.packets_sent,
-            'packets_recv': network_io.packets_recv
+            'bytes_sent': snapshot.net_bytes_sent,
+            'bytes_recv': snapshot.net_bytes_recv,
+            'packets_sent': snapshot.net_packets_sent,
+            'packets_recv': snapshot.net_packets_recv
         }
         
         # 에이전트 상태
@@ -317,6 +332,7 @@ class SystemMonitor:
         for rule in self.alert_rules:
             if rule.should_trigger(health):
                 message = rule.trigger(health)
+                self.alerts_total.labels(rule.name, rule.severity).inc()
                 
                 # 콜백 호출
                 for callback in self.alert_callbacks:
@@ -7,15 +7,21 @@ AI 에이전트 성능 측정 및 모니터링 시스템
 import time
 import json
 import logging
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
-import statistics
 import psutil
 import pandas as pd
 
+from utils.metrics import (
+    DEFAULT_QUANTILES,
+    MetricsRegistry,
+    merge_counts,
+    quantiles_from_counts,
+    summarize
+)
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -54,172 +60,202 @@ class PerformanceMetric:
         }
 
 class PerformanceTracker:
-    """성능 추적기"""
+    """
+    성능 추적기
+    집계는 utils.metrics 히스토그램/게이지(기록 O(1), 잠금 없음)로 하고,
+    원본 PerformanceMetric은 최근 목록/내보내기용으로 max_metrics개만 보관
+    """
     
-    def __init__(self, max_metrics: int = 10000):
+    def __init__(self, max_metrics: int = 1000, registry: Optional[MetricsRegistry] = None):
         """
         성능 추적기 초기화
         
         Args:
-            max_metrics: 저장할 최대 메트릭 수
+            max_metrics: 보관할 최대 원본 메트릭 수
+            registry: 메트릭 레지스트리 (없으면 추적기 전용 레지스트리)
         """
         self.max_metrics = max_metrics
         self.metrics: deque = deque(maxlen=max_metrics)
-        self.agent_stats: Dict[str, Dict] = defaultdict(lambda: {
-            'total_tasks': 0,
-            'successful_tasks': 0,
-            'failed_tasks': 0,
-            'average_duration': 0.0,
-            'average_confidence': 0.0,
-            'total_duration': 0.0,
-            'last_activity': None
-        })
-        self.lock = threading.Lock()
+        self.registry = registry or MetricsRegistry()
+        
+        self.durations = self.registry.histogram(
+            "aiagent_task_duration_seconds", "에이전트 작업 처리 시간",
+            ["agent", "task_type", "outcome"]
+        )
+        self.confidences = self.registry.histogram(
+            "aiagent_task_confidence", "에이전트 작업 신뢰도 점수", ["agent", "task_type"]
+        )
+        # 시간대별 트렌드 (1시간 슬롯 x 7일)
+        self.hourly = self.registry.histogram(
+            "aiagent_task_hourly_seconds", "시간대별 에이전트 작업 처리 시간", ["outcome"],
+            slot_seconds=3600, window_slots=24 * 7
+        )
+        self.last_activity = self.registry.gauge(
+            "aiagent_last_activity_timestamp_seconds", "에이전트 마지막 작업 시각", ["agent"]
+        )
         
         logger.info("성능 추적기 초기화 완료")
     
     def add_metric(self, metric: PerformanceMetric):
-        """메트릭 추가"""
-        with self.lock:
-            self.metrics.append(metric)
-            self._update_agent_stats(metric)
-    
-    def _update_agent_stats(self, metric: PerformanceMetric):
-        """에이전트 통계 업데이트"""
-        stats = self.agent_stats[metric.agent_name]
-        
-        stats['total_tasks'] += 1
-        stats['last_activity'] = metric.end_time or metric.start_time
-        
-        if metric.success:
-            stats['successful_tasks'] += 1
-        else:
-            stats['failed_tasks'] += 1
-        
-        if metric.duration > 0:
-            stats['total_duration'] += metric.duration
-            stats['average_duration'] = stats['total_duration'] / stats['total_tasks']
+        """메트릭 추가 (O(1))"""
+        outcome = "success" if metric.success else "failure"
+        duration = metric.duration
         
+        self.durations.labels(metric.agent_name, metric.task_type, outcome).observe(duration)
+        self.hourly.labels(outcome).observe(duration)
         if metric.confidence_score > 0:
-            # 누적 평균 계산
-            current_avg = stats['average_confidence']
-            total_tasks = stats['total_tasks']
-            stats['average_confidence'] = (current_avg * (total_tasks - 1) + metric.confidence_score) / total_tasks
+            self.confidences.labels(metric.agent_name, metric.task_type).observe(metric.confidence_score)
+        self.last_activity.labels(metric.agent_name).set((metric.end_time or metric.start_time).timestamp())
+        
+        self.metrics.append(metric)
+    
+    @staticmethod
+    def _aggregate(family, **match) -> Dict[str, Any]:
+        """라벨 조건에 맞는 시계열 합산 (구간별 개수, 개수, 합계, 최소/최대)"""
+        counts: Dict[int, int] = {}
+        total, value_sum = 0, 0.0
+        minimum, maximum = float("inf"), 0.0
+        for labels, histogram in family.children():
+            if any(labels.get(name) != value for name, value in match.items()):
+                continue
+            merge_counts(counts, histogram.bucket_counts())
+            total += histogram.count
+            value_sum += histogram.sum
+            if histogram.count:
+                low, high = histogram.extremes()
+                minimum, maximum = min(minimum, low), max(maximum, high)
+        return {
+            'counts': counts,
+            'total': total,
+            'sum': value_sum,
+            'min': minimum if total else 0.0,
+            'max': maximum
+        }
+    
+    def _label_values(self, family, name: str) -> List[str]:
+        return sorted({labels[name] for labels, _ in family.children()})
     
     def get_agent_stats(self, agent_name: str) -> Dict[str, Any]:
         """특정 에이전트 통계 반환"""
-        with self.lock:
-            stats = self.agent_stats.get(agent_name, {})
-            if stats:
-                stats = dict(stats)  # 복사본 반환
-                stats['success_rate'] = (
-                    stats['successful_tasks'] / stats['total_tasks'] 
-                    if stats['total_tasks'] > 0 else 0.0
-                )
-                stats['failure_rate'] = (
-                    stats['failed_tasks'] / stats['total_tasks'] 
-                    if stats['total_tasks'] > 0 else 0.0
-                )
-            return stats
+        success = self._aggregate(self.durations, agent=agent_name, outcome="success")
+        failure = self._aggregate(self.durations, agent=agent_name, outcome="failure")
+        total_tasks = success['total'] + failure['total']
+        if total_tasks == 0:
+            return {}
+        
+        confidence = self._aggregate(self.confidences, agent=agent_name)
+        durations = dict(success['counts'])
+        merge_counts(durations, failure['counts'])
+        total_duration = success['sum'] + failure['sum']
+        
+        return {
+            'total_tasks': total_tasks,
+            'successful_tasks': success['total'],
+            'failed_tasks': failure['total'],
+            'average_duration': total_duration / total_tasks,
+            'average_confidence': confidence['sum'] / confidence['total'] if confidence['total'] else 0.0,
+            'total_duration': total_duration,
+            'last_activity': datetime.fromtimestamp(self.last_activity.labels(agent_name).value),
+            'success_rate': success['total'] / total_tasks,
+            'failure_rate': failure['total'] / total_tasks,
+            'latency': summarize(durations, total_tasks, total_duration)
+        }
     
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """모든 에이전트 통계 반환"""
-        with self.lock:
-            all_stats = {}
-            for agent_name in self.agent_stats:
-                all_stats[agent_name] = self.get_agent_stats(agent_name)
-            return all_stats
+        return {
+            agent_name: self.get_agent_stats(agent_name)
+            for agent_name in self._label_values(self.last_activity, "agent")
+        }
     
     def get_recent_metrics(self, minutes: int = 60) -> List[PerformanceMetric]:
-        """최근 메트릭 반환"""
+        """최근 메트릭 반환 (보관 중인 원본 중 최근 것부터 역순 탐색)"""
         cutoff_time = datetime.now() - timedelta(minutes=minutes)
         
-        with self.lock:
-            recent_metrics = []
-            for metric in reversed(self.metrics):
-                if metric.start_time >= cutoff_time:
-                    recent_metrics.append(metric)
-                else:
-                    break
-            
-            return list(reversed(recent_metrics))
+        recent_metrics = []
+        for metric in reversed(list(self.metrics)):
+            if metric.start_time >= cutoff_time:
+                recent_metrics.append(metric)
+            else:
+                break
+        
+        return list(reversed(recent_metrics))
     
     def get_task_type_stats(self, task_type: str) -> Dict[str, Any]:
         """작업 유형별 통계"""
-        with self.lock:
-            matching_metrics = [m for m in self.metrics if m.task_type == task_type]
-            
-            if not matching_metrics:
-                return {}
-            
-            successful = [m for m in matching_metrics if m.success]
-            failed = [m for m in matching_metrics if not m.success]
-            
-            durations = [m.duration for m in matching_metrics if m.duration > 0]
-            confidences = [m.confidence_score for m in matching_metrics if m.confidence_score > 0]
-            
-            return {
-                'task_type': task_type,
-                'total_tasks': len(matching_metrics),
-                'successful_tasks': len(successful),
-                'failed_tasks': len(failed),
-                'success_rate': len(successful) / len(matching_metrics) if matching_metrics else 0.0,
-                'average_duration': statistics.mean(durations) if durations else 0.0,
-                'median_duration': statistics.median(durations) if durations else 0.0,
-                'min_duration': min(durations) if durations else 0.0,
-                'max_duration': max(durations) if durations else 0.0,
-                'average_confidence': statistics.mean(confidences) if confidences else 0.0,
-                'median_confidence': statistics.median(confidences) if confidences else 0.0
-            }
+        success = self._aggregate(self.durations, task_type=task_type, outcome="success")
+        failure = self._aggregate(self.durations, task_type=task_type, outcome="failure")
+        total_tasks = success['total'] + failure['total']
+        if total_tasks == 0:
+            return {}
+        
+        durations = dict(success['counts'])
+        merge_counts(durations, failure['counts'])
+        duration_quantiles = quantiles_from_counts(durations, DEFAULT_QUANTILES)
+        confidence = self._aggregate(self.confidences, task_type=task_type)
+        
+        return {
+            'task_type': task_type,
+            'total_tasks': total_tasks,
+            'successful_tasks': success['total'],
+            'failed_tasks': failure['total'],
+            'success_rate': success['total'] / total_tasks,
+            'average_duration': (success['sum'] + failure['sum']) / total_tasks,
+            'median_duration': duration_quantiles[0.5],
+            'p95_duration': duration_quantiles[0.95],
+            'p99_duration': duration_quantiles[0.99],
+            'min_duration': min(success['min'] if success['total'] else float("inf"),
+                                failure['min'] if failure['total'] else float("inf")),
+            'max_duration': max(success['max'], failure['max']),
+            'average_confidence': confidence['sum'] / confidence['total'] if confidence['total'] else 0.0,
+            'median_confidence': quantiles_from_counts(confidence['counts'], [0.5])[0.5]
+        }
     
     def generate_performance_report(self, format: str = "dict") -> Any:
         """성능 리포트 생성"""
-        with self.lock:
-            report_data = {
-                'generated_at': datetime.now().isoformat(),
-                'total_metrics': len(self.metrics),
-                'agent_stats': self.get_all_stats(),
-                'task_type_stats': {},
-                'system_overview': self._get_system_overview()
-            }
-            
-            # 작업 유형별 통계
-            task_types = set(m.task_type for m in self.metrics)
-            for task_type in task_types:
-                report_data['task_type_stats'][task_type] = self.get_task_type_stats(task_type)
-            
-            if format == "dict":
-                return report_data
-            elif format == "json":
-                return json.dumps(report_data, indent=2, ensure_ascii=False)
-            elif format == "dataframe":
-                return self._to_dataframe()
-            else:
-                raise ValueError(f"지원하지 않는 형식: {format}")
+        report_data = {
+            'generated_at': datetime.now().isoformat(),
+            'total_metrics': len(self.metrics),
+            'agent_stats': self.get_all_stats(),
+            'task_type_stats': {},
+            'system_overview': self._get_system_overview()
+        }
+        
+        # 작업 유형별 통계
+        for task_type in self._label_values(self.durations, "task_type"):
+            report_data['task_type_stats'][task_type] = self.get_task_type_stats(task_type)
+        
+        if format == "dict":
+            return report_data
+        elif format == "json":
+            return json.dumps(report_data, indent=2, ensure_ascii=False, default=str)
+        elif format == "dataframe":
+            return self._to_dataframe()
+        else:
+            raise ValueError(f"지원하지 않는 형식: {format}")
     
     def _get_system_overview(self) -> Dict[str, Any]:
         """시스템 개요"""
-        if not self.metrics:
+        success = self._aggregate(self.durations, outcome="success")
+        failure = self._aggregate(self.durations, outcome="failure")
+        total_tasks = success['total'] + failure['total']
+        if total_tasks == 0:
             return {}
         
-        recent_metrics = self.get_recent_metrics(60)  # 최근 1시간
-        
-        total_tasks = len(self.metrics)
-        successful_tasks = sum(1 for m in self.metrics if m.success)
-        
-        durations = [m.duration for m in self.metrics if m.duration > 0]
-        confidences = [m.confidence_score for m in self.metrics if m.confidence_score > 0]
+        confidence = self._aggregate(self.confidences)
         
         return {
             'total_tasks': total_tasks,
-            'successful_tasks': successful_tasks,
-            'failed_tasks': total_tasks - successful_tasks,
-            'overall_success_rate': successful_tasks / total_tasks if total_tasks > 0 else 0.0,
-            'recent_tasks_count': len(recent_metrics),
-            'average_duration': statistics.mean(durations) if durations else 0.0,
-            'average_confidence': statistics.mean(confidences) if confidences else 0.0,
-            'active_agents': len(self.agent_stats),
-            'unique_task_types': len(set(m.task_type for m in self.metrics))
+            'successful_tasks': success['total'],
+            'failed_tasks': failure['total'],
+            'overall_success_rate': success['total'] / total_tasks,
+            'recent_tasks_count': sum(
+                histogram.summary(window_seconds=3600)['count'] for _, histogram in self.hourly.children()
+            ),
+            'average_duration': (success['sum'] + failure['sum']) / total_tasks,
+            'average_confidence': confidence['sum'] / confidence['total'] if confidence['total'] else 0.0,
+            'active_agents': len(self._label_values(self.last_activity, "agent")),
+            'unique_task_types': len(self._label_values(self.durations, "task_type"))
         }
     
     def _to_dataframe(self) -> pd.DataFrame:
@@ -260,10 +296,10 @@ class PerformanceTracker:
     
     def clear_metrics(self):
         """메트릭 초기화"""
-        with self.lock:
-            self.metrics.clear()
-            self.agent_stats.clear()
-            logger.info("성능 메트릭 초기화 완료")
+        self.metrics.clear()
+        for family in (self.durations, self.confidences, self.hourly, self.last_activity):
+            family.clear()
+        logger.info("성능 메트릭 초기화 완료")
     
     def get_top_performing_agents(self, top_n: int = 5) -> List[Dict[str, Any]]:
         """성능 상위 에이전트 반환"""
@@ -282,43 +318,35 @@ class PerformanceTracker:
         ]
     
     def get_performance_trends(self, hours: int = 24) -> Dict[str, List]:
-        """성능 트렌드 데이터"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        """성능 트렌드 데이터 (1시간 슬롯, 최대 7일)"""
+        cutoff = time.time() - hours * 3600
         
-        with self.lock:
-            recent_metrics = [m for m in self.metrics if m.start_time >= cutoff_time]
-            
-            # 시간대별 그룹화 (1시간 단위)
-            hourly_data = defaultdict(lambda: {'success': 0, 'failure': 0, 'total_duration': 0.0, 'count': 0})
-            
-            for metric in recent_metrics:
-                hour_key = metric.start_time.strftime('%Y-%m-%d %H:00')
-                hourly_data[hour_key]['count'] += 1
-                hourly_data[hour_key]['total_duration'] += metric.duration
-                
-                if metric.success:
-                    hourly_data[hour_key]['success'] += 1
-                else:
-                    hourly_data[hour_key]['failure'] += 1
-            
-            # 결과 정리
-            times = sorted(hourly_data.keys())
-            success_rates = []
-            avg_durations = []
-            task_counts = []
-            
-            for time_key in times:
-                data = hourly_data[time_key]
-                success_rate = data['success'] / data['count'] if data['count'] > 0 else 0.0
-                avg_duration = data['total_duration'] / data['count'] if data['count'] > 0 else 0.0
-                
-                success_rates.append(success_rate)
-                avg_durations.append(avg_duration)
-                task_counts.append(data['count'])
-            
-            return {
-                'times': times,
-                'success_rates': success_rates,
-                'avg_durations': avg_durations,
-                'task_counts': task_counts
-            } 
\ No newline at end of file
+        hourly_data = defaultdict(lambda: {'success': 0, 'failure': 0, 'total_duration': 0.0, 'count': 0})
+        for labels, histogram in self.hourly.children():
+            for slot in histogram.slot_series():
+                if slot['start'] + 3600 <= cutoff:
+                    continue
+                data = hourly_data[slot['start']]
+                data[labels['outcome']] += slot['count']
+                data['count'] += slot['count']
+                data['total_duration'] += slot['sum']
+        
+        # 결과 정리
+        times = []
+        success_rates = []
+        avg_durations = []
+        task_counts = []
+        
+        for slot_start in sorted(hourly_data):
+            data = hourly_data[slot_start]
+            times.append(datetime.fromtimestamp(slot_start).strftime('%Y-%m-%d %H:00'))
+            success_rates.append(data['success'] / data['count'] if data['count'] > 0 else 0.0)
+            avg_durations.append(data['total_duration'] / data['count'] if data['count'] > 0 else 0.0)
+            task_counts.append(data['count'])
+        
+        return {
+            'times': times,
+            'success_rates': success_rates,
+            'avg_durations': avg_durations,
+            'task_counts': task_counts
+        }
@@ -11,6 +11,8 @@ from typing import Dict, List, Any, Optional
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from utils.gemini_key_pool import GeminiKeyPool, get_gemini_key_pool
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -27,15 +29,16 @@ class GeminiClient:
             api_key: Gemini API 키 (None이면 환경변수에서 가져옴)
             model_name: 사용할 모델 이름
         """
-        self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         self.model_name = model_name
         
-        if not self.api_key:
+        # 키를 직접 받으면 그 키만 쓰는 풀, 아니면 환경변수의 모든 키를 쓰는 공용 풀
+        self.key_pool = GeminiKeyPool([api_key]) if api_key else get_gemini_key_pool()
+        if not len(self.key_pool):
             raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다. 환경변수 또는 매개변수로 제공해주세요.")
+        self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         
-        # Gemini API 설정
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(self.model_name)
+        # Gemini 모델 (키별 독립 클라이언트로 호출)
+        self.model = self.key_pool.model(self.model_name, source="aiagent")
         
         # 요청 제한 설정
         self.max_requests_per_minute = 60
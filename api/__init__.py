@@ -6,9 +6,13 @@ FastAPI 엔드포인트들
 from .organization_api import router as organization_router
 from .enrichment_api import router as enrichment_router
 from .statistics_api import router as statistics_router
+from .dedup_api import router as dedup_router
+from .metrics_api import router as metrics_router
 
 __all__ = [
     'organization_router',
     'enrichment_router',
-    'statistics_router'
+    'statistics_router',
+    'dedup_router',
+    'metrics_router'
 ] 
\ No newline at end of file
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+중복 기관 검토 API 엔드포인트
+유사 중복 탐지 실행 및 병합 후보 클러스터 승인/반려
+"""
+
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Path
+from pydantic import BaseModel, Field
+
+from services.dedup_service import get_dedup_service
+from utils.logger_utils import LoggerUtils
+
+router = APIRouter(prefix="/api/dedup", tags=["중복 기관 검토"])
+logger = LoggerUtils.setup_logger(name="dedup_api", file_logging=False)
+
+# Pydantic 모델들
+class DedupRunModel(BaseModel):
+    """중복 탐지 실행 요청 모델"""
+    started_by: str = Field("API_USER", description="실행자")
+
+class ClusterReviewModel(BaseModel):
+    """클러스터 검토 요청 모델"""
+    reviewed_by: str = Field(..., description="검토자")
+    canonical_id: Optional[int] = Field(None, description="대표 기관 ID (승인 시, 미지정이면 자동 선정값)")
+
+@router.post("/run", summary="중복 탐지 실행")
+async def run_dedup(request: DedupRunModel):
+    """전체 활성 기관 대상 중복 탐지를 백그라운드로 시작"""
+    try:
+        result = get_dedup_service().start_detection(request.started_by)
+        logger.info(f"🔍 중복 탐지 실행 요청: {result}")
+        return result
+    except Exception as e:
+        logger.error(f"❌ 중복 탐지 실행 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"중복 탐지 실행 실패: {str(e)}")
+
+@router.get("/summary", summary="중복 탐지 현황")
+async def get_dedup_summary():
+    """최근 탐지 실행 상태와 상태별 클러스터 수"""
+    try:
+        return get_dedup_service().get_summary()
+    except Exception as e:
+        logger.error(f"❌ 중복 탐지 현황 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"현황 조회 실패: {str(e)}")
+
+@router.get("/clusters", summary="병합 후보 클러스터 목록")
+async def get_clusters(
+    status: str = Query("PENDING", description="상태 (PENDING/MERGED/REJECTED)"),
+    page: int = Query(1, description="페이지 번호", ge=1),
+    per_page: int = Query(20, description="페이지당 항목 수", ge=1, le=100)
+):
+    """점수 높은 순으로 병합 후보 클러스터와 소속 기관 정보를 조회"""
+    try:
+        return get_dedup_service().list_clusters(status.upper(), page, per_page)
+    except Exception as e:
+        logger.error(f"❌ 클러스터 목록 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"클러스터 목록 조회 실패: {str(e)}")
+
+@router.get("/clusters/{cluster_id}", summary="클러스터 상세")
+async def get_cluster(cluster_id: int = Path(..., description="클러스터 ID")):
+    """쌍별 유사도 상세를 포함한 클러스터 조회"""
+    cluster = get_dedup_service().get_cluster(cluster_id)
+    if not cluster:
+        raise HTTPException(status_code=404, detail="클러스터를 찾을 수 없습니다")
+    return cluster
+
+@router.post("/clusters/{cluster_id}/approve", summary="병합 승인")
+async def approve_cluster(request: ClusterReviewModel, cluster_id: int = Path(..., description="클러스터 ID")):
+    """대표 기관으로 병합 (빈 연락처 보완 + 나머지 기관 비활성화)"""
+    result = get_dedup_service().approve_cluster(cluster_id, request.reviewed_by, request.canonical_id)
+    if result.get("status") != "success":
+        raise HTTPException(status_code=400, detail=result.get("message"))
+    return result
+
+@router.post("/clusters/{cluster_id}/reject", summary="병합 반려")
+async def reject_cluster(request: ClusterReviewModel, cluster_id: int = Path(..., description="클러스터 ID")):
+    """중복이 아닌 것으로 반려"""
+    result = get_dedup_service().reject_cluster(cluster_id, request.reviewed_by)
+    if result.get("status") != "success":
+        raise HTTPException(status_code=400, detail=result.get("message"))
+    return result
@@ -9,15 +9,18 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Path
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Path, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import json
 import threading
 import os
 
-from services.contact_enrichment_service import ContactEnrichmentService, EnrichmentRequest
+from services.contact_enrichment_service import EnrichmentRequest, get_contact_enrichment_service
 from services.organization_service import OrganizationService
+from services.progress_bus import get_progress_bus
 from utils.logger_utils import LoggerUtils
+from utils.settings import PROGRESS_STREAM_CONFIG
 
 router = APIRouter(prefix="/api/enrichment", tags=["연락처 보강"])
 logger = LoggerUtils.setup_logger(name="enrichment_api", file_logging=False)
@@ -128,6 +131,71 @@ async def get_crawling_progress():
         logger.error(f"❌ 진행 상황 조회 실패: {e}")
         return {"status": "error", "message": str(e)}
 
+def _parse_topics(topics: Optional[str]) -> Optional[List[str]]:
+    """"crawl_job,enrichment" → 토픽 목록 (없으면 전체)"""
+    return [topic.strip() for topic in topics.split(",") if topic.strip()] if topics else None
+
+def _sse_message(event: Dict[str, Any]) -> str:
+    return f"id: {event['seq']}\nevent: {event['topic']}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+
+@router.get("/crawling-stream", summary="크롤링 진행 상황 스트림 (SSE)")
+async def stream_crawling_progress(
+    request: Request,
+    topics: Optional[str] = Query(None, description="구독 토픽 (쉼표 구분: crawl_job, enrichment / 없으면 전체)")
+):
+    """
+    진행 상황 푸시 스트림 (Server-Sent Events)
+    
+    - 연결 직후 토픽별 최신 상태(스냅샷)를 보내고, 이후 병합된 변경분만 전송
+    - crawling-progress / real-time-results 폴링 대체
+    """
+    bus = get_progress_bus()
+    topic_list = _parse_topics(topics)
+    subscription = bus.subscribe(topic_list)
+    heartbeat = PROGRESS_STREAM_CONFIG.get("heartbeat_seconds", 15.0)
+    
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            for event in bus.snapshot(topic_list):
+                yield _sse_message(event)
+            while not await request.is_disconnected():
+                batch = await subscription.next_batch(heartbeat)
+                if not batch:
+                    yield ": ping\n\n"
+                for event in batch:
+                    yield _sse_message(event)
+        finally:
+            subscription.close()
+    
+    # Content-Encoding 지정 → GZip 미들웨어가 스트림을 버퍼링하지 않음
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Content-Encoding": "identity"}
+    return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
+@router.websocket("/crawling-ws")
+async def crawling_progress_websocket(websocket: WebSocket, topics: Optional[str] = None):
+    """진행 상황 푸시 (WebSocket) - {"type": "snapshot" | "progress" | "ping", "events": [...]}"""
+    await websocket.accept()
+    bus = get_progress_bus()
+    topic_list = _parse_topics(topics)
+    subscription = bus.subscribe(topic_list)
+    heartbeat = PROGRESS_STREAM_CONFIG.get("heartbeat_seconds", 15.0)
+    
+    async def send(message_type: str, events: List[Dict[str, Any]]):
+        await websocket.send_text(json.dumps({"type": message_type, "events": events}, ensure_ascii=False, default=str))
+    
+    try:
+        await send("snapshot", bus.snapshot(topic_list))
+        while True:
+            batch = await subscription.next_batch(heartbeat)
+            await send("progress" if batch else "ping", batch)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.debug(f"진행 상황 WebSocket 종료: {e}")
+    finally:
+        subscription.close()
+
 @router.get("/crawling-results", summary="크롤링 결과 조회")
 async def get_crawling_results(
     limit: int = Query(10, ge=1, le=100, description="조회할 결과 수"),
@@ -246,7 +314,7 @@ async def enrich_single_organization(
     - **org_id**: 보강할 기관의 ID
     """
     try:
-        enrichment_service = ContactEnrichmentService()
+        enrichment_service = get_contact_enrichment_service()
         
         # 기관 정보 확인
         org_service = OrganizationService()
@@ -451,7 +519,7 @@ async def get_enrichment_history(org_id: int = Path(..., description="기관 ID"
     - **org_id**: 기관 ID
     """
     try:
-        enrichment_service = ContactEnrichmentService()
+        enrichment_service = get_contact_enrichment_service()
         history = enrichment_service.get_enrichment_history(org_id)
         
         return {
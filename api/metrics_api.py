@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메트릭 API 엔드포인트
+Prometheus 스크레이프용 /metrics (텍스트 포맷) + JSON 스냅샷, HTTP 요청 계측 미들웨어
+"""
+
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from utils.metrics import get_metrics_registry
+from utils.metrics_exporter import CONTENT_TYPE, render_prometheus
+
+router = APIRouter(tags=["메트릭"])
+
+METRICS = get_metrics_registry()
+HTTP_REQUEST_SECONDS = METRICS.histogram(
+    "http_request_seconds", "HTTP 요청 처리 시간", ["method", "route", "status"]
+)
+HTTP_REQUESTS_IN_PROGRESS = METRICS.gauge("http_requests_in_progress", "처리 중인 HTTP 요청 수")
+
+
+@router.get("/metrics", summary="Prometheus 메트릭", response_class=PlainTextResponse)
+async def get_metrics():
+    """프로세스 메트릭 레지스트리 전체 (Prometheus 텍스트 포맷 0.0.4)"""
+    return PlainTextResponse(render_prometheus(METRICS), media_type=CONTENT_TYPE)
+
+
+@router.get("/api/metrics/snapshot", summary="메트릭 JSON 스냅샷")
+async def get_metrics_snapshot(
+    window_seconds: Optional[float] = Query(None, description="최근 구간(초), 미지정이면 전체", gt=0)
+):
+    """히스토그램 요약(p50/p95/p99) 포함 JSON 스냅샷"""
+    return METRICS.snapshot(window_seconds)
+
+
+async def record_http_metrics(request: Request, call_next):
+    """요청 처리 시간을 라우트 템플릿 기준으로 기록 (경로 파라미터별로 시계열이 늘어나지 않음)"""
+    start = time.perf_counter()
+    status = 500
+    HTTP_REQUESTS_IN_PROGRESS.inc()
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_REQUESTS_IN_PROGRESS.dec()
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", None) or "unmatched"
+        HTTP_REQUEST_SECONDS.labels(request.method, route_path, str(status)).observe(time.perf_counter() - start)
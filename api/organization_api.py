@@ -254,9 +254,9 @@ async def get_organization_enrichment_history(org_id: int = Path(..., descriptio
     - **org_id**: 기관 ID
     """
     try:
-        from services.contact_enrichment_service import ContactEnrichmentService
+        from services.contact_enrichment_service import get_contact_enrichment_service
         
-        enrichment_service = ContactEnrichmentService()
+        enrichment_service = get_contact_enrichment_service()
         history = enrichment_service.get_enrichment_history(org_id)
         
         return {
@@ -24,10 +24,9 @@ from utils.settings import (
     GOVERNMENT_EMAIL_SUFFIXES,
     EDUCATION_EMAIL_SUFFIXES,
     BUSINESS_EMAIL_SUFFIXES,
-    RELIGIOUS_EMAIL_KEYWORDS,
-    format_phone_number,
-    extract_phone_area_code
+    RELIGIOUS_EMAIL_KEYWORDS
 )
+from utils.phone_normalizer import get_phone_normalizer
 
 # 로거 설정
 logger = LoggerUtils.setup_logger(name="statistics_api", file_logging=False)
@@ -43,43 +42,23 @@ class CRMStatisticsAnalyzer:
         self.db = get_database()
         self.org_service = OrganizationService()
     
+    @property
+    def analytics(self):
+        """pandas/NumPy 기반 분석기 (API 기동이 아닌 첫 통계 요청 시 import)"""
+        from utils.contact_analytics import get_contact_analytics
+        return get_contact_analytics()
+    
     def validate_korean_phone(self, phone: str) -> Dict[str, Any]:
         """한국 전화번호 유효성 검증"""
-        if not phone:
-            return {"is_valid": False, "reason": "번호 없음"}
-        
-        import re
-        digits = re.sub(r'[^\d]', '', phone)
-        
-        # 길이 체크
-        if len(digits) < 9 or len(digits) > 11:
-            return {"is_valid": False, "reason": "길이 오류"}
-        
-        # 지역코드 체크
-        area_code = extract_phone_area_code(phone)
-        if not area_code:
-            return {"is_valid": False, "reason": "지역코드 오류"}
-        
-        # 길이별 유효성 체크
-        expected_lengths = {
-            '02': [9, 10],  # 서울
-            '070': [11],    # 인터넷전화
-            '010': [11], '017': [11]  # 핸드폰
-        }
-        
-        if area_code in expected_lengths:
-            if len(digits) not in expected_lengths[area_code]:
-                return {"is_valid": False, "reason": "길이 불일치"}
-        else:
-            # 기타 지역번호는 10-11자리
-            if len(digits) not in [10, 11]:
-                return {"is_valid": False, "reason": "길이 불일치"}
+        result = get_phone_normalizer().normalize(phone)
+        if not result.is_valid:
+            return {"is_valid": False, "reason": result.reason}
         
         return {
             "is_valid": True,
-            "area_code": area_code,
-            "area_name": KOREAN_AREA_CODES.get(area_code, "알 수 없음"),
-            "formatted": format_phone_number(digits, area_code)
+            "area_code": result.area_code,
+            "area_name": result.area_name,
+            "formatted": result.formatted
         }
     
     def extract_email_domain(self, email: str) -> Optional[str]:
@@ -133,66 +112,32 @@ class CRMStatisticsAnalyzer:
                 "category_breakdown": {}
             }
             
-            # 기본 통계 조회 - PostgreSQL 방식
-            total_orgs_query = "SELECT COUNT(*) FROM organizations WHERE is_active = true"
-            total_orgs_result = self.db.execute_query(total_orgs_query, fetch_all=False)
-            total_orgs = total_orgs_result['count'] if total_orgs_result else 0
+            # 필요한 컬럼만 COPY 1회로 로드 후 컬럼 단위 집계
+            frame = self.analytics.load_organizations(self.db)
+            total_orgs = len(frame)
             
-            # 연락처별 보유 현황 - PostgreSQL 방식
-            contact_query = """
-                SELECT 
-                    COUNT(CASE WHEN phone IS NOT NULL AND phone != '' THEN 1 END) as phone_count,
-                    COUNT(CASE WHEN fax IS NOT NULL AND fax != '' THEN 1 END) as fax_count,
-                    COUNT(CASE WHEN email IS NOT NULL AND email != '' THEN 1 END) as email_count,
-                    COUNT(CASE WHEN homepage IS NOT NULL AND homepage != '' THEN 1 END) as homepage_count,
-                    COUNT(CASE WHEN phone IS NOT NULL AND phone != '' 
-                               AND fax IS NOT NULL AND fax != ''
-                               AND email IS NOT NULL AND email != '' THEN 1 END) as complete_count
-                FROM organizations WHERE is_active = true
-            """
-            
-            contact_result = self.db.execute_query(contact_query, fetch_all=False)
-            if contact_result:
-                phone_count = contact_result['phone_count']
-                fax_count = contact_result['fax_count']
-                email_count = contact_result['email_count']
-                homepage_count = contact_result['homepage_count']
-                complete_count = contact_result['complete_count']
-            else:
-                phone_count = fax_count = email_count = homepage_count = complete_count = 0
-            
-            # 카테고리별 분석 - PostgreSQL 방식
-            category_query = """
-                SELECT 
-                    category,
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN phone IS NOT NULL AND phone != '' THEN 1 END) as has_phone,
-                    COUNT(CASE WHEN fax IS NOT NULL AND fax != '' THEN 1 END) as has_fax,
-                    COUNT(CASE WHEN email IS NOT NULL AND email != '' THEN 1 END) as has_email,
-                    COUNT(CASE WHEN homepage IS NOT NULL AND homepage != '' THEN 1 END) as has_homepage
-                FROM organizations 
-                WHERE is_active = true 
-                GROUP BY category
-                ORDER BY total DESC
-            """
+            filled = self.analytics.filled_columns(frame, ["phone", "fax", "email", "homepage"])
+            complete = filled[["phone", "fax", "email"]].all(axis=1)
+            phone_count = int(filled["phone"].sum())
+            fax_count = int(filled["fax"].sum())
+            email_count = int(filled["email"].sum())
+            homepage_count = int(filled["homepage"].sum())
+            complete_count = int(complete.sum())
             
-            category_results = self.db.execute_query(category_query)
+            # 카테고리별 분석 (NULL 카테고리는 None 키)
             category_stats = {}
-            
-            for row in category_results:
-                category = row['category']
-                total = row['total']
-                has_phone = row['has_phone']
-                has_fax = row['has_fax']
-                has_email = row['has_email']
-                has_homepage = row['has_homepage']
+            category_counts = self.analytics.count_by_group(filled, frame["category"])
+            for category, row in category_counts.iterrows():
+                total = int(row["total"])
+                has_phone, has_fax = int(row["phone"]), int(row["fax"])
+                has_email, has_homepage = int(row["email"]), int(row["homepage"])
                 
-                category_stats[category] = {
+                category_stats[category or None] = {
                     "total": total,
-                    "phone_coverage": round((has_phone / total * 100), 1) if total > 0 else 0,
-                    "fax_coverage": round((has_fax / total * 100), 1) if total > 0 else 0,
-                    "email_coverage": round((has_email / total * 100), 1) if total > 0 else 0,
-                    "homepage_coverage": round((has_homepage / total * 100), 1) if total > 0 else 0,
+                    "phone_coverage": self.analytics.rate(has_phone, total),
+                    "fax_coverage": self.analytics.rate(has_fax, total),
+                    "email_coverage": self.analytics.rate(has_email, total),
+                    "homepage_coverage": self.analytics.rate(has_homepage, total),
                     "contact_counts": {
                         "phone": has_phone,
                         "fax": has_fax,
@@ -210,68 +155,25 @@ class CRMStatisticsAnalyzer:
             
             # 연락처 커버리지
             stats["contact_coverage"] = {
-                "phone": {
-                    "count": phone_count,
-                    "rate": round((phone_count / total_orgs * 100), 1) if total_orgs > 0 else 0
-                },
-                "fax": {
-                    "count": fax_count,
-                    "rate": round((fax_count / total_orgs * 100), 1) if total_orgs > 0 else 0
-                },
-                "email": {
-                    "count": email_count,
-                    "rate": round((email_count / total_orgs * 100), 1) if total_orgs > 0 else 0
-                },
-                "homepage": {
-                    "count": homepage_count,
-                    "rate": round((homepage_count / total_orgs * 100), 1) if total_orgs > 0 else 0
-                }
+                "phone": {"count": phone_count, "rate": self.analytics.rate(phone_count, total_orgs)},
+                "fax": {"count": fax_count, "rate": self.analytics.rate(fax_count, total_orgs)},
+                "email": {"count": email_count, "rate": self.analytics.rate(email_count, total_orgs)},
+                "homepage": {"count": homepage_count, "rate": self.analytics.rate(homepage_count, total_orgs)}
             }
             
-            # 품질 지표 분석
-            valid_phones = 0
-            valid_faxes = 0
-            phone_areas = Counter()
-            fax_areas = Counter()
-            email_domains = Counter()
-            
-            # 전화번호 품질 분석
-            phone_query = "SELECT phone FROM organizations WHERE phone IS NOT NULL AND phone != '' AND is_active = true"
-            phone_results = self.db.execute_query(phone_query)
-            
-            for row in phone_results:
-                phone = row['phone']
-                validation = self.validate_korean_phone(phone)
-                if validation["is_valid"]:
-                    valid_phones += 1
-                    phone_areas[validation["area_code"]] += 1
-            
-            # 팩스번호 품질 분석
-            fax_query = "SELECT fax FROM organizations WHERE fax IS NOT NULL AND fax != '' AND is_active = true"
-            fax_results = self.db.execute_query(fax_query)
-            
-            for row in fax_results:
-                fax = row['fax']
-                validation = self.validate_korean_phone(fax)
-                if validation["is_valid"]:
-                    valid_faxes += 1
-                    fax_areas[validation["area_code"]] += 1
-            
-            # 이메일 도메인 분석
-            email_query = "SELECT email FROM organizations WHERE email IS NOT NULL AND email != '' AND is_active = true"
-            email_results = self.db.execute_query(email_query)
-            
-            for row in email_results:
-                email = row['email']
-                domain = self.extract_email_domain(email)
-                if domain:
-                    email_domains[domain] += 1
+            # 전화/팩스 품질 분석 (컬럼 단위 유효성 검사)
+            phone_summary = self.analytics.phone_summary(frame["phone"])
+            fax_summary = self.analytics.phone_summary(frame["fax"])
+            valid_phones = phone_summary["valid_count"]
+            valid_faxes = fax_summary["valid_count"]
+            phone_areas = phone_summary["area_counts"]
+            fax_areas = fax_summary["area_counts"]
             
             # 품질 지표
             stats["quality_metrics"] = {
-                "phone_validity_rate": round((valid_phones / phone_count * 100), 1) if phone_count > 0 else 0,
-                "fax_validity_rate": round((valid_faxes / fax_count * 100), 1) if fax_count > 0 else 0,
-                "completeness_rate": round((complete_count / total_orgs * 100), 1) if total_orgs > 0 else 0,
+                "phone_validity_rate": self.analytics.rate(valid_phones, phone_count),
+                "fax_validity_rate": self.analytics.rate(valid_faxes, fax_count),
+                "completeness_rate": self.analytics.rate(complete_count, total_orgs),
                 "valid_phones": valid_phones,
                 "valid_faxes": valid_faxes
             }
@@ -291,15 +193,13 @@ class CRMStatisticsAnalyzer:
                 for area_code, count in all_areas.most_common(20)
             }
             
-            # 이메일 도메인 분석
-            email_categories = Counter()
-            for domain, count in email_domains.most_common(100):
-                category = self.categorize_email_domain(domain)
-                email_categories[category] += count
+            # 이메일 도메인 분석 (상위 100개 도메인 기준 카테고리 분류)
+            email_summary = self.analytics.email_summary(frame["email"], category_top_n=100)
+            email_domains = email_summary["domain_counts"]
             
             stats["email_analysis"] = {
                 "top_domains": dict(email_domains.most_common(20)),
-                "domain_categories": dict(email_categories),
+                "domain_categories": dict(email_summary["category_counts"]),
                 "total_unique_domains": len(email_domains)
             }
             
@@ -19,7 +19,8 @@ import traceback
 import psutil
 import threading
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing.util
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
@@ -46,6 +47,25 @@ import random
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from utils.politeness_scheduler import PolitenessScheduler
+from utils.search_client import SearchEngineGuard
+from utils.phone_normalizer import get_phone_normalizer
+from utils.gemini_key_pool import get_gemini_key_pool
+from utils.html_document import HtmlDocument
+from utils.prompt_compactor import compact_text
+from utils.metrics import get_metrics_registry
+from utils.metrics_exporter import start_worker_exporter
+from utils.system_sampler import get_system_snapshot
+from utils.concurrency_controller import get_adaptive_limit
+
+# 메트릭 (워커 프로세스는 METRICS_EXPORTER_PORT + 워커 번호로 단독 익스포터 노출)
+METRICS = get_metrics_registry()
+WEBDRIVERS_ACTIVE = METRICS.gauge("webdriver_active", "사용 중인 WebDriver 수", ["owner"])
+WEBDRIVERS_CREATED = METRICS.counter("webdriver_created_total", "생성한 WebDriver 수", ["owner"])
+FAX_ORGANIZATIONS_TOTAL = METRICS.counter(
+    "center_fax_organizations_total", "워커 팩스번호 검색 처리 기관 수", ["result"]
+)
+
 # 한국 지역번호 매핑 (하드코딩)
 KOREAN_AREA_CODES = {
     "02": "서울", 
@@ -147,6 +167,9 @@ class ImprovedCenterCrawlingBot:
             'memory_mb': 0,
             'memory_percent': 0
         }
+        METRICS.mapping("center_crawler_system", "센터 크롤러 시스템 리소스 (_monitor_system)",
+                        lambda: self.system_stats)
+        METRICS.mapping("center_crawler_progress", "센터 크롤러 진행 현황", self._progress_stats)
         
         # 🚀 멀티프로세싱 설정 (12개 워커로 최적화)
         # AMD Ryzen 5 3600 (6코어 12스레드) 환경에 최적화
@@ -156,9 +179,9 @@ class ImprovedCenterCrawlingBot:
         # 청크 크기를 12개 워커에 맞게 조정
         self.chunk_size = 8  # 더 큰 청크로 효율성 향상
         
-        # 요청 간격 설정 (초) - 12개 워커에 맞게 최적화
-        self.request_delay_min = 1.0  # 최소 1초
-        self.request_delay_max = 2.0  # 최대 2초
+        # 워커별 구글 요청 간격 설정 (초) - 12개 워커에 맞게 최적화
+        self.request_delay_min = 2.0  # 최소 2초
+        self.request_delay_max = 5.0  # 최대 5초
         
         # 에러 발생 시 대기 시간 (초) - 단축
         self.error_wait_time = 5
@@ -179,192 +202,67 @@ class ImprovedCenterCrawlingBot:
         self.logger.info(f"🚀 ImprovedCenterCrawlingBot 초기화 완료 (워커: {self.max_workers}개)")
     
     class AIModelManager:
-        """AI 모델 관리 클래스 - 4개의 Gemini API 키 지원"""
+        """AI 모델 관리 클래스 - Gemini 키 풀(키별 독립 클라이언트) 사용"""
         
         def __init__(self):
-            self.gemini_models = []
-            self.gemini_config = None
-            self.current_model_index = 0
+            self.gemini_config = AI_MODEL_CONFIG
+            self.key_pool = None
+            self.model = None
             self.setup_models()
         
         def setup_models(self):
-            """4개의 AI 모델 초기화"""
+            """키 풀 모델 초기화 (GEMINI_API_KEY ~ GEMINI_API_KEY_4, GEMINI_API_KEYS)"""
             try:
-                # 첫 번째 API 키
-                api_key_1 = os.getenv('GEMINI_API_KEY')
-                # 두 번째 API 키
-                api_key_2 = os.getenv('GEMINI_API_KEY_2')
-                # 세 번째 API 키
-                api_key_3 = os.getenv('GEMINI_API_KEY_3')
-                # 네 번째 API 키
-                api_key_4 = os.getenv('GEMINI_API_KEY_4')
-                
-                if not api_key_1 and not api_key_2 and not api_key_3 and not api_key_4:
+                self.key_pool = get_gemini_key_pool()
+                if not len(self.key_pool):
                     raise ValueError("GEMINI_API_KEY, GEMINI_API_KEY_2, GEMINI_API_KEY_3, 또는 GEMINI_API_KEY_4 환경 변수가 설정되지 않았습니다.")
                 
-                self.gemini_config = AI_MODEL_CONFIG
-                
-                # 첫 번째 모델 설정
-                if api_key_1:
-                    try:
-                        import google.generativeai as genai
-                        genai.configure(api_key=api_key_1)
-                        model_1 = genai.GenerativeModel(
-                            "gemini-2.0-flash-lite-001",
-                            generation_config=self.gemini_config
-                        )
-                        self.gemini_models.append({
-                            'model': model_1,
-                            'api_key': api_key_1[:10] + "...",
-                            'name': 'GEMINI_1',
-                            'failures': 0
-                        })
-                        logging.getLogger(__name__).info("🤖 Gemini AI 모델 1 초기화 성공")
-                    except Exception as e:
-                        logging.getLogger(__name__).error(f"❌ Gemini 모델 1 초기화 실패: {e}")
-                
-                # 두 번째 모델 설정
-                if api_key_2:
-                    try:
-                        import google.generativeai as genai
-                        genai.configure(api_key=api_key_2)
-                        model_2 = genai.GenerativeModel(
-                            "gemini-2.0-flash-lite-001",
-                            generation_config=self.gemini_config
-                        )
-                        self.gemini_models.append({
-                            'model': model_2,
-                            'api_key': api_key_2[:10] + "...",
-                            'name': 'GEMINI_2',
-                            'failures': 0
-                        })
-                        logging.getLogger(__name__).info("🤖 Gemini AI 모델 2 초기화 성공")
-                    except Exception as e:
-                        logging.getLogger(__name__).error(f"❌ Gemini 모델 2 초기화 실패: {e}")
-                
-                # 세 번째 모델 설정
-                if api_key_3:
-                    try:
-                        import google.generativeai as genai
-                        genai.configure(api_key=api_key_3)
-                        model_3 = genai.GenerativeModel(
-                            "gemini-2.0-flash-lite-001",
-                            generation_config=self.gemini_config
-                        )
-                        self.gemini_models.append({
-                            'model': model_3,
-                            'api_key': api_key_3[:10] + "...",
-                            'name': 'GEMINI_3',
-                            'failures': 0
-                        })
-                        logging.getLogger(__name__).info("🤖 Gemini AI 모델 3 초기화 성공")
-                    except Exception as e:
-                        logging.getLogger(__name__).error(f"❌ Gemini 모델 3 초기화 실패: {e}")
-                
-                # 네 번째 모델 설정
-                if api_key_4:
-                    try:
-                        import google.generativeai as genai
-                        genai.configure(api_key=api_key_4)
-                        model_4 = genai.GenerativeModel(
-                            "gemini-2.0-flash-lite-001",
-                            generation_config=self.gemini_config
-                        )
-                        self.gemini_models.append({
-                            'model': model_4,
-                            'api_key': api_key_4[:10] + "...",
-                            'name': 'GEMINI_4',
-                            'failures': 0
-                        })
-                        logging.getLogger(__name__).info("🤖 Gemini AI 모델 4 초기화 성공")
-                    except Exception as e:
-                        logging.getLogger(__name__).error(f"❌ Gemini 모델 4 초기화 실패: {e}")
-                
-                if not self.gemini_models:
-                    raise ValueError("사용 가능한 Gemini 모델이 없습니다.")
-                
-                logging.getLogger(__name__).info(f"🎉 총 {len(self.gemini_models)}개의 Gemini 모델 초기화 완료")
+                self.model = self.key_pool.model(
+                    "gemini-2.0-flash-lite-001",
+                    source="center_crawler",
+                    generation_config=self.gemini_config
+                )
+                logging.getLogger(__name__).info(f"🎉 총 {len(self.key_pool)}개의 Gemini API 키로 모델 초기화 완료")
                 
             except Exception as e:
                 logging.getLogger(__name__).error(f"❌ AI 모델 초기화 실패: {e}")
                 raise
         
-        def get_next_model(self):
-            """다음 사용 가능한 모델 선택"""
-            if not self.gemini_models:
-                return None
-            
-            # 실패 횟수가 적은 모델 우선 선택
-            available_models = [m for m in self.gemini_models if m['failures'] < 3]
-            if not available_models:
-                # 모든 모델이 실패한 경우 실패 횟수 리셋
-                for model in self.gemini_models:
-                    model['failures'] = 0
-                available_models = self.gemini_models
-            
-            # 라운드 로빈 방식으로 선택
-            model = available_models[self.current_model_index % len(available_models)]
-            self.current_model_index = (self.current_model_index + 1) % len(available_models)
-            
-            return model
-        
-        def extract_with_gemini(self, text_content: str, prompt_template: str) -> str:
-            """Gemini API를 통한 정보 추출 (다중 모델 지원)"""
-            if not self.gemini_models:
+        def extract_with_gemini(self, text_content: str, prompt_template: str, task: str = "default",
+                                document: Any = None) -> str:
+            """Gemini API를 통한 정보 추출 (키 선택/실패 시 다른 키 재시도는 키 풀이 처리)"""
+            if not self.model:
                 return "오류: 사용 가능한 모델이 없습니다."
             
-            # 모든 모델을 시도해볼 수 있도록 최대 시도 횟수 설정
-            max_attempts = len(self.gemini_models)
-            
-            for attempt in range(max_attempts):
-                current_model = self.get_next_model()
-                if not current_model:
-                    continue
+            logger = logging.getLogger(__name__)
+            try:
+                # 연락처 주변 텍스트만 작업별 토큰 예산 안으로 압축
+                text_content = compact_text(text_content, task, document)
                 
-                try:
-                    # 텍스트 길이 제한
-                    max_length = 32000
-                    if len(text_content) > max_length:
-                        front_portion = int(max_length * 0.67)
-                        back_portion = max_length - front_portion
-                        text_content = text_content[:front_portion] + "\n... (중략) ...\n" + text_content[-back_portion:]
-                    
-                    prompt = prompt_template.format(text_content=text_content)
-                    
-                    # 현재 모델로 API 호출
-                    response = current_model['model'].generate_content(prompt)
-                    result_text = response.text
-                    
-                    # 성공 시 로그 출력
-                    logger = logging.getLogger(__name__)
-                    logger.info(f"✅ {current_model['name']} API 성공 - 응답 (일부): {result_text[:200]}...")
-                    
-                    return result_text
-                    
-                except Exception as e:
-                    # 실패 시 다음 모델로 시도
-                    current_model['failures'] += 1
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"⚠️ {current_model['name']} API 실패 (시도 {attempt + 1}/{max_attempts}): {str(e)}")
-                    
-                    if attempt < max_attempts - 1:
-                        logger.info(f"🔄 다음 모델로 재시도 중...")
-                        continue
-                    else:
-                        logger.error(f"❌ 모든 Gemini 모델 실패")
-                        return f"오류: 모든 API 호출 실패 - 마지막 오류: {str(e)}"
-            
-            return "오류: 모든 모델 시도 실패"
+                prompt = prompt_template.format(text_content=text_content)
+                
+                response = self.model.generate_content(prompt)
+                result_text = response.text
+                
+                logger.info(f"✅ Gemini API 성공 - 응답 (일부): {result_text[:200]}...")
+                return result_text
+                
+            except Exception as e:
+                logger.error(f"❌ 모든 Gemini API 키 실패: {e}")
+                return f"오류: 모든 API 호출 실패 - 마지막 오류: {str(e)}"
         
         def get_model_status(self) -> str:
-            """모델 상태 정보 반환"""
-            if not self.gemini_models:
+            """키별 상태 정보 반환"""
+            if not self.key_pool or not len(self.key_pool):
                 return "❌ 사용 가능한 모델 없음"
             
             status_info = []
-            for model in self.gemini_models:
-                status = "✅ 정상" if model['failures'] < 3 else "❌ 실패"
-                status_info.append(f"{model['name']}: {status} (실패: {model['failures']}회)")
+            for key in self.key_pool.status():
+                status = "❌ 차단" if key['circuit_open'] else "✅ 정상"
+                status_info.append(
+                    f"{key['name']}: {status} (여유: {key['headroom']:.0f}/{key['capacity']:.0f}, "
+                    f"실패: {key['error']}회, 429: {key['rate_limited']}회)"
+                )
             
             return " | ".join(status_info)
     
@@ -396,6 +294,8 @@ class ImprovedCenterCrawlingBot:
             chrome_options.add_argument('--disable-notifications')
             
             self.driver = uc.Chrome(options=chrome_options, version_main=None)
+            WEBDRIVERS_CREATED.labels("center_bot").inc()
+            WEBDRIVERS_ACTIVE.labels("center_bot").inc()
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             self.driver.implicitly_wait(10)
             self.logger.info("🌐 WebDriver 초기화 완료")
@@ -510,32 +410,60 @@ class ImprovedCenterCrawlingBot:
             self.logger.info("📞 팩스번호 추출할 데이터가 없습니다.")
             return
         
-        # 데이터를 워커 수만큼 분할
-        chunks = self._split_dataframe(missing_fax_rows, self.max_workers)
+        # 워커 수만큼 미리 나누지 않고 작은 청크로 나눠, 적응형 한도만큼만 동시에 브라우저를 띄움
+        chunks = [
+            missing_fax_rows.iloc[start:start + self.chunk_size].copy()
+            for start in range(0, len(missing_fax_rows), self.chunk_size)
+        ]
+        limit = get_adaptive_limit("center_browsers", max_limit=self.max_workers)
+        
+        self.logger.info(f"📞 팩스번호 추출 시작: {len(missing_fax_rows)}개 데이터를 {len(chunks)}개 청크로 처리 "
+                         f"(동시 브라우저 한도: {limit.limit}/{self.max_workers})")
         
-        self.logger.info(f"📞 팩스번호 추출 시작: {len(missing_fax_rows)}개 데이터를 {len(chunks)}개 프로세스로 처리")
+        # 워커 프로세스마다 번호 1개를 받아 드라이버/스케줄러/차단 가드/메트릭 포트를 프로세스 수명 동안 유지
+        worker_ids = multiprocessing.Queue()
+        for worker_id in range(self.max_workers):
+            worker_ids.put(worker_id)
         
         # 멀티프로세싱으로 병렬 처리
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            
-            for i, chunk in enumerate(chunks):
-                future = executor.submit(
-                    process_improved_fax_extraction,
-                    chunk,
-                    i,
-                    self.fax_patterns,
-                    KOREAN_AREA_CODES
-                )
-                futures.append(future)
-            
-            # 결과 수집
-            for future in as_completed(futures):
-                try:
-                    results = future.result()
-                    self._merge_extraction_results(results)
-                except Exception as e:
-                    self.logger.error(f"❌ 팩스번호 추출 프로세스 오류: {e}")
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=init_fax_worker,
+            initargs=(worker_ids, (self.request_delay_min, self.request_delay_max))
+        ) as executor:
+            pending = {}
+            next_chunk = 0
+            
+            while next_chunk < len(chunks) or pending:
+                # 적응형 한도 안에서 청크 제출 (유휴 워커 프로세스가 가져감)
+                while next_chunk < len(chunks) and len(pending) < limit.limit:
+                    future = executor.submit(
+                        process_improved_fax_extraction,
+                        chunks[next_chunk],
+                        self.fax_patterns,
+                        KOREAN_AREA_CODES
+                    )
+                    pending[future] = (len(chunks[next_chunk]), time.perf_counter())
+                    next_chunk += 1
+                
+                # 결과 수집 + 청크 결과로 한도 조정 (기관당 지연, 이번 청크의 차단 여부)
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    size, started = pending.pop(future)
+                    latency = (time.perf_counter() - started) / max(1, size)
+                    try:
+                        results, chunk_stats = future.result()
+                        self._merge_extraction_results(results)
+                        if chunk_stats.get('blocks'):
+                            outcome = "block"
+                        elif chunk_stats.get('failed', 0) * 2 > size:
+                            outcome = "error"
+                        else:
+                            outcome = "success"
+                        limit.record(latency, outcome)
+                    except Exception as e:
+                        limit.record(latency, "error")
+                        self.logger.error(f"❌ 팩스번호 추출 프로세스 오류: {e}")
         
         # 중간 저장
         self._save_intermediate_results("병렬팩스추출_완료")
@@ -893,17 +821,15 @@ class ImprovedCenterCrawlingBot:
             time.sleep(3)
             
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            text_content = soup.get_text(separator=' ', strip=True)
-            
-            title = soup.find('title')
-            title_text = title.get_text(strip=True) if title else ''
+            # 1회 파싱한 문서를 AI 프롬프트 압축(footer/연락처 영역)에도 사용
+            document = HtmlDocument(page_source, url)
             
             return {
                 'url': url,
                 'html': page_source,
-                'text_content': text_content,
-                'title': title_text
+                'text_content': document.text,
+                'title': document.title,
+                'document': document
             }
             
         except Exception as e:
@@ -933,6 +859,15 @@ class ImprovedCenterCrawlingBot:
             return None
         
         try:
+            # 홈페이지 내용({text_content})은 extract_with_gemini에서 압축해 1번만 넣음
+            fields = {
+                key: str(value).replace('{', '{{').replace('}', '}}')
+                for key, value in (
+                    ('org_name', org_name),
+                    ('title', page_data.get('title', '')),
+                    ('url', page_data.get('url', ''))
+                )
+            }
             prompt_template = """
 '{org_name}' 기관의 홈페이지에서 팩스번호를 찾아주세요.
 
@@ -950,16 +885,13 @@ class ImprovedCenterCrawlingBot:
 
 주의: 전화번호와 팩스번호가 다른 번호인지 확인해주세요.
 팩스번호가 전화번호와 같아도 괜찮습니다.
-""".format(
-                org_name=org_name,
-                title=page_data.get('title', ''),
-                url=page_data.get('url', ''),
-                text_content=page_data.get('text_content', '')[:3000]
-            )
+""".format(text_content="{text_content}", **fields)
             
             response_text = self.ai_model_manager.extract_with_gemini(
                 page_data.get('text_content', ''),
-                prompt_template
+                prompt_template,
+                task="fax",
+                document=page_data.get('document')
             )
             
             self.logger.info(f"🤖 [{org_name}] AI 원본 응답: {response_text}")
@@ -1173,9 +1105,10 @@ ImprovedCenterCrawlingBot 🤖
                 system_memory = psutil.virtual_memory()
                 memory_percent = (memory_info.rss / system_memory.total) * 100
                 
-                # 전체 시스템 리소스 확인
-                system_cpu = psutil.cpu_percent(interval=1)
-                system_memory_percent = system_memory.percent
+                # 전체 시스템 리소스 확인 (샘플러 스냅샷 EWMA)
+                snapshot = get_system_snapshot()
+                system_cpu = snapshot.cpu_percent
+                system_memory_percent = snapshot.memory_percent
                 
                 self.system_stats.update({
                     'cpu_percent': cpu_percent,
@@ -1206,6 +1139,17 @@ ImprovedCenterCrawlingBot 🤖
                 self.logger.error(f"❌ 시스템 모니터링 오류: {e}")
                 time.sleep(30)
     
+    def _progress_stats(self) -> Dict[str, float]:
+        """처리/성공/무효 기관 수와 초당 처리량 (메트릭 노출용)"""
+        elapsed = (datetime.now() - self.start_time).total_seconds()
+        return {
+            'processed': self.processed_count,
+            'success': self.success_count,
+            'invalid': self.invalid_count,
+            'elapsed_seconds': elapsed,
+            'orgs_per_second': self.processed_count / elapsed if elapsed > 0 else 0.0
+        }
+    
     def _log_system_stats(self, stage: str):
         """시스템 통계 로깅"""
         try:
@@ -1246,6 +1190,7 @@ ImprovedCenterCrawlingBot 🤖
             
             if self.driver:
                 self.driver.quit()
+                WEBDRIVERS_ACTIVE.labels("center_bot").dec()
                 self.logger.info("🧹 WebDriver 정리 완료")
                 
             self.logger.info("🧹 시스템 정리 완료")
@@ -1255,16 +1200,69 @@ ImprovedCenterCrawlingBot 🤖
 
 # ===== 병렬 처리 워커 함수들 =====
 
-def create_improved_worker_driver(worker_id: int):
-    """개선된 워커용 WebDriver 생성 (과부하 방지)"""
+# 워커 프로세스 상태 (init_fax_worker에서 1회 생성, 청크 간 재사용)
+_fax_worker = None
+
+
+class FaxWorkerState:
+    """워커 프로세스 1개의 드라이버/스케줄러/차단 가드 (쿨다운/차단 상태가 청크 간 유지됨)"""
+    
+    def __init__(self, worker_id: int, request_interval: Tuple[float, float]):
+        self.worker_id = worker_id
+        # 워커 프로세스 전용 스케줄러 (구글 요청만 간격 유지, 기관 간 고정 대기 없음)
+        self.scheduler = PolitenessScheduler(host_intervals={"google.com": request_interval})
+        # 워커 프로세스 전용 차단 감지/페일오버 (구글 -> 네이버 -> 다음)
+        self.guard = SearchEngineGuard(scheduler=self.scheduler)
+        self.driver = None
+        self.drivers_created = 0
+    
+    def get_driver(self):
+        """드라이버 반환 (없으면 생성, 시차 기동은 프로세스의 첫 드라이버만)"""
+        if self.driver is None:
+            self.driver = create_improved_worker_driver(self.worker_id, stagger=self.drivers_created == 0)
+            if self.driver:
+                self.drivers_created += 1
+        return self.driver
+    
+    def reset_driver(self):
+        """드라이버 종료 (세션이 깨진 경우 다음 청크에서 다시 생성)"""
+        driver, self.driver = self.driver, None
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            WEBDRIVERS_ACTIVE.labels("fax_worker").dec()
+
+
+def init_fax_worker(worker_ids=None, request_interval: Tuple[float, float] = (2.0, 5.0)):
+    """ProcessPoolExecutor initializer - 워커 번호를 받아 프로세스 상태 생성 + 메트릭 익스포터 포트 고정"""
+    global _fax_worker
+    worker_id = worker_ids.get() if worker_ids is not None else 0
+    _fax_worker = FaxWorkerState(worker_id, request_interval)
+    start_worker_exporter(worker_id)
+    # 프로세스 종료 시 드라이버 정리 (multiprocessing 워커는 atexit를 실행하지 않음)
+    multiprocessing.util.Finalize(None, _fax_worker.reset_driver, exitpriority=10)
+
+
+def get_fax_worker() -> FaxWorkerState:
+    """현재 프로세스의 워커 상태 (initializer 없이 호출되면 워커 0으로 생성)"""
+    if _fax_worker is None:
+        init_fax_worker()
+    return _fax_worker
+
+
+def create_improved_worker_driver(worker_id: int, stagger: bool = True):
+    """개선된 워커용 WebDriver 생성 (과부하 방지, stagger=False면 시차 없이 즉시 생성)"""
     try:
         import undetected_chromedriver as uc
         import random
         import time
         
-        # 워커 간 시차 두기
-        startup_delay = random.uniform(1.0, 3.0) * worker_id
-        time.sleep(startup_delay)
+        # 워커 간 시차 두기 (첫 제출분만, 이후 청크는 이미 시차가 벌어진 상태)
+        if stagger:
+            startup_delay = random.uniform(1.0, 3.0) * worker_id
+            time.sleep(startup_delay)
         
         chrome_options = uc.ChromeOptions()
         
@@ -1313,6 +1311,8 @@ def create_improved_worker_driver(worker_id: int):
         
         # 드라이버 생성
         driver = uc.Chrome(options=chrome_options, version_main=None)
+        WEBDRIVERS_CREATED.labels("fax_worker").inc()
+        WEBDRIVERS_ACTIVE.labels("fax_worker").inc()
         
         # 타임아웃 설정 (12개 워커에 맞게 최적화)
         driver.implicitly_wait(10)  # 더 짧은 대기 시간
@@ -1410,20 +1410,27 @@ def normalize_org_name(name: str) -> str:
     # 그렇지 않은 경우 "지역아동센터" 추가
     return f"{name} 지역아동센터"
 
-def process_improved_fax_extraction(chunk_df: pd.DataFrame, worker_id: int, fax_patterns: List[str], area_codes: Dict) -> List[Dict]:
-    """개선된 팩스번호 추출 청크 처리"""
+def process_improved_fax_extraction(chunk_df: pd.DataFrame, fax_patterns: List[str],
+                                    area_codes: Dict) -> Tuple[List[Dict], Dict]:
+    """
+    개선된 팩스번호 추출 청크 처리 - 워커 프로세스의 드라이버/스케줄러/차단 가드를 재사용
+    (결과, 이번 청크 통계 {worker_id, processed, failed, requests, blocks}) 반환
+    """
     import pandas as pd
-    import re
     import time
-    import random
+    
+    state = get_fax_worker()
+    worker_id, scheduler, guard = state.worker_id, state.scheduler, state.guard
     
     results = []
-    driver = None
+    before = guard.get_stats()
+    chunk_stats = {"worker_id": worker_id, "processed": 0, "failed": 0, "requests": 0, "blocks": 0}
     
     try:
-        driver = create_improved_worker_driver(worker_id)
+        driver = state.get_driver()
         if not driver:
-            return results
+            chunk_stats["failed"] = len(chunk_df)
+            return results, chunk_stats
         
         print(f"🔧 워커 {worker_id}: 개선된 팩스번호 추출 시작 ({len(chunk_df)}개)")
         
@@ -1452,8 +1459,14 @@ def process_improved_fax_extraction(chunk_df: pd.DataFrame, worker_id: int, fax_
                 
                 print(f"🔍 워커 {worker_id}: 검색쿼리 - {search_query}")
                 
-                # 구글 검색
-                fax_number = search_google_improved(driver, search_query, fax_patterns)
+                # 🛡️ 모든 검색엔진이 쿨다운 중이면 빈 결과를 쌓지 않고 해제까지 대기
+                resume_in = guard.next_available_in()
+                if resume_in > 0:
+                    print(f"⏳ 워커 {worker_id}: 모든 검색엔진 차단 - {resume_in:.0f}초 대기")
+                    time.sleep(resume_in)
+                
+                # 구글 검색 (차단 시 네이버/다음 전환)
+                fax_number = search_google_improved(driver, search_query, fax_patterns, scheduler, guard)
                 
                 # 유효성 검사
                 if fax_number and is_valid_fax_improved(fax_number, phone, address, name):
@@ -1462,8 +1475,10 @@ def process_improved_fax_extraction(chunk_df: pd.DataFrame, worker_id: int, fax_
                         'name': name,
                         'fax': fax_number
                     })
+                    FAX_ORGANIZATIONS_TOTAL.labels("found").inc()
                     print(f"✅ 워커 {worker_id}: 팩스번호 발견 - {name} -> {fax_number}")
                 else:
+                    FAX_ORGANIZATIONS_TOTAL.labels("invalid" if fax_number else "not_found").inc()
                     results.append({
                         'index': idx,
                         'name': name,
@@ -1474,17 +1489,14 @@ def process_improved_fax_extraction(chunk_df: pd.DataFrame, worker_id: int, fax_
                     else:
                         print(f"❌ 워커 {worker_id}: 팩스번호 없음 - {name}")
                 
-                # 🛡️ 안전한 랜덤 지연 (1-2초로 최적화)
-                delay = random.uniform(1.0, 2.0)
-                time.sleep(delay)
+                # 🛡️ 요청 간격은 search_google_improved()에서 스케줄러가 관리
                 
             except Exception as e:
+                FAX_ORGANIZATIONS_TOTAL.labels("error").inc()
+                chunk_stats["failed"] += 1
                 print(f"❌ 워커 {worker_id}: 팩스번호 검색 오류 - {name}: {e}")
                 
-                # 에러 발생 시 더 긴 대기 (단축)
-                error_delay = random.uniform(3.0, 5.0)
-                print(f"⏳ 워커 {worker_id}: 에러 발생으로 {error_delay:.1f}초 대기...")
-                time.sleep(error_delay)
+                # 🛡️ 다음 요청 간격은 스케줄러, 차단 시 대기는 가드 쿨다운이 관리 (고정 대기 없음)
                 
                 results.append({
                     'index': idx,
@@ -1497,34 +1509,47 @@ def process_improved_fax_extraction(chunk_df: pd.DataFrame, worker_id: int, fax_
         
     except Exception as e:
         print(f"❌ 워커 {worker_id}: 팩스번호 추출 프로세스 오류: {e}")
-    finally:
-        if driver:
-            driver.quit()
+        chunk_stats["failed"] = len(chunk_df) - len(results)
+        # 드라이버 세션이 깨졌을 수 있으므로 다음 청크에서 새로 생성
+        state.reset_driver()
     
-    return results
+    after = guard.get_stats()
+    chunk_stats["processed"] = len(results)
+    chunk_stats["requests"] = after['total_requests'] - before['total_requests']
+    chunk_stats["blocks"] = after['total_blocks'] - before['total_blocks']
+    print(f"📊 워커 {worker_id}: 누적 검색 {after['total_requests']}회, 차단 {after['total_blocks']}회 "
+          f"(차단율 {after['block_rate']:.1%}), 검색엔진 전환 {after['failovers']}회")
+    
+    return results, chunk_stats
 
-def search_google_improved(driver, query: str, fax_patterns: List[str]):
-    """개선된 구글 검색 (과부하 방지)"""
+def search_google_improved(driver, query: str, fax_patterns: List[str], scheduler: Optional[PolitenessScheduler] = None,
+                           guard: Optional[SearchEngineGuard] = None):
+    """개선된 구글 검색 (과부하 방지, 차단 시 네이버/다음 전환)"""
     try:
         from selenium.webdriver.common.by import By
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         from selenium.webdriver.common.keys import Keys
         from selenium.common.exceptions import TimeoutException, WebDriverException
-        from bs4 import BeautifulSoup
         import time
         import random
-        import re
         
-        # 🛡️ 안전한 랜덤 지연 (1-3초로 조정)
-        delay = random.uniform(1.0, 3.0)
-        time.sleep(delay)
+        if scheduler is None:
+            scheduler = PolitenessScheduler()
+        if guard is None:
+            guard = SearchEngineGuard(scheduler=scheduler)
+        
+        # 🛡️ 구글 쿨다운 중이면 바로 대체 검색엔진 사용
+        if not guard.is_available('google'):
+            return search_fallback_improved(driver, query, fax_patterns, guard)
         
         # 재시도 로직
         max_retries = 3
         for retry in range(max_retries):
             try:
-                # 구글 검색 페이지로 이동
+                # 🛡️ 구글 요청 간격 확보 후 검색 페이지로 이동
+                scheduler.wait('google.com')
+                guard.record_request('google')
                 driver.get('https://www.google.com')
                 
                 # 추가 대기 시간
@@ -1552,26 +1577,20 @@ def search_google_improved(driver, query: str, fax_patterns: List[str]):
                 # 추가 대기 시간
                 time.sleep(random.uniform(1.0, 2.0))
                 
-                # 페이지 소스 가져오기
-                page_source = driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                # 팩스번호 추출
-                for pattern in fax_patterns:
-                    matches = re.findall(pattern, soup.get_text(), re.IGNORECASE)
-                    for match in matches:
-                        normalized = normalize_phone_simple(match)
-                        if is_valid_phone_format_simple(normalized):
-                            return normalized
+                guard.record_success('google')
                 
-                # 검색 성공했지만 결과 없음
-                return None
+                # 검색 성공 - 결과가 없으면 None
+                return extract_fax_from_driver_page(driver, fax_patterns)
                 
             except (TimeoutException, WebDriverException) as e:
+                # 🚫 CAPTCHA / unusual traffic 페이지면 재시도하지 않고 쿨다운 후 전환
+                if guard.check_driver('google', driver):
+                    return search_fallback_improved(driver, query, fax_patterns, guard)
+                
+                guard.record_error('google')
                 if retry < max_retries - 1:
-                    wait_time = random.uniform(5, 10)  # 5-10초 대기
-                    print(f"⚠️ 검색 실패 (재시도 {retry + 1}/{max_retries}), {wait_time:.1f}초 후 재시도: {e}")
-                    time.sleep(wait_time)
+                    # 재시도 간격은 루프 시작의 scheduler.wait()가 확보
+                    print(f"⚠️ 검색 실패 (재시도 {retry + 1}/{max_retries}): {e}")
                     continue
                 else:
                     raise
@@ -1580,12 +1599,37 @@ def search_google_improved(driver, query: str, fax_patterns: List[str]):
         
     except Exception as e:
         print(f"❌ 구글 검색 오류: {e}")
-        # 에러 발생 시 더 긴 대기
-        time.sleep(random.uniform(5, 10))
         return None
 
+def search_fallback_improved(driver, query: str, fax_patterns: List[str], guard: SearchEngineGuard):
+    """구글 차단 시 네이버 -> 다음 순으로 검색하여 팩스번호 추출"""
+    engine = guard.search(driver, query, engines=['naver', 'daum'])
+    if not engine:
+        return None
+    
+    print(f"🔀 {engine} 검색으로 대체: {query}")
+    return extract_fax_from_driver_page(driver, fax_patterns)
+
+def extract_fax_from_driver_page(driver, fax_patterns: List[str]):
+    """현재 드라이버 페이지에서 첫 번째 유효한 팩스번호 추출"""
+    soup = BeautifulSoup(driver.page_source, 'html.parser')
+    page_text = soup.get_text()
+    
+    for pattern in fax_patterns:
+        matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for match in matches:
+            normalized = normalize_phone_simple(match)
+            if is_valid_phone_format_simple(normalized):
+                return normalized
+    
+    return None
+
 def normalize_phone_simple(phone: str) -> str:
-    """간단한 전화번호 정규화"""
+    """간단한 전화번호 정규화 (유효한 번호는 공용 정규화기 포맷, 아니면 숫자 묶음 연결)"""
+    formatted = get_phone_normalizer().format(phone)
+    if formatted:
+        return formatted
+    
     numbers = re.findall(r'\d+', phone)
     if not numbers:
         return phone
@@ -1600,24 +1644,7 @@ def normalize_phone_simple(phone: str) -> str:
 def is_valid_phone_format_simple(phone: str) -> bool:
     """간단한 전화번호 형식 검사"""
     try:
-        digits = re.sub(r'[^\d]', '', phone)
-        if len(digits) < 8 or len(digits) > 11:
-            return False
-        
-        valid_patterns = [
-            r'^02\d{7,8}$',
-            r'^0[3-6]\d{7,8}$',
-            r'^070\d{7,8}$',
-            r'^1[5-9]\d{6,7}$',
-            r'^080\d{7,8}$',
-        ]
-        
-        for pattern in valid_patterns:
-            if re.match(pattern, digits):
-                return True
-        
-        return False
-        
+        return get_phone_normalizer().is_valid(phone)
     except Exception:
         return False
 
@@ -1675,7 +1702,10 @@ def is_same_area_code_simple(fax: str, phone: str) -> bool:
         return False
 
 def extract_area_code_simple(phone_digits: str) -> str:
-    """간단한 지역번호 추출"""
+    """간단한 지역번호 추출 (지역번호 테이블 우선, 미등록 번호는 앞자리)"""
+    area_code = get_phone_normalizer().area_code_of(phone_digits)
+    if area_code:
+        return area_code
     if len(phone_digits) >= 10:
         if phone_digits.startswith('02'):
             return '02'
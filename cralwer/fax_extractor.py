@@ -35,16 +35,17 @@ from utils.settings import (
     format_phone_number,
     extract_phone_area_code
 )
+from utils.politeness_scheduler import get_politeness_scheduler
+from utils.search_client import get_search_guard
+from utils.contact_query_planner import get_contact_query_planner
+from utils.log_pipeline import attach_handlers, route_prints
+from utils.phone_normalizer import get_phone_normalizer
 
 # 로거 설정 (콘솔 출력만)
 def setup_logger():
     logger = logging.getLogger(LOGGER_NAMES["fax_crawler"]) 
     logger.setLevel(logging.INFO)
     
-    # 기존 핸들러 제거
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
     # 콘솔 핸들러만 추가
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -53,7 +54,8 @@ def setup_logger():
     formatter = logging.Formatter(LOG_FORMAT)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(console_handler)
+    # 기존 핸들러 교체 (비동기 모드면 백그라운드 기록 스레드에서 출력)
+    attach_handlers(logger, [console_handler])
     return logger
 
 class GoogleContactCrawler:
@@ -62,6 +64,9 @@ class GoogleContactCrawler:
         self.base_url = "https://www.google.com/search"
         self.driver = None
         self.wait = None
+        self.scheduler = get_politeness_scheduler()
+        self.search_guard = get_search_guard()
+        self.query_planner = get_contact_query_planner()
         
         # constants.py에서 가져온 패턴들 사용 (수정)
         self.phone_patterns = PHONE_EXTRACTION_PATTERNS
@@ -144,7 +149,18 @@ class GoogleContactCrawler:
             if not self.driver:
                 self.setup_driver()
             
+            # 구글이 쿨다운 중이면 네이버/다음으로 바로 전환
+            if not self.search_guard.is_available("google"):
+                self.logger.info(f"구글 쿨다운 중 ({self.search_guard.cooldown_remaining('google'):.0f}초 남음)")
+                return self._search_fallback(query)
+            
+            # 구글 요청 간격 확보 (다른 호스트 요청은 대기하지 않음)
+            waited = self.scheduler.wait("google.com")
+            if waited > 0:
+                self.logger.info(f"구글 요청 간격 대기: {waited:.2f}초")
+            
             # 구글 검색 페이지로 이동
+            self.search_guard.record_request("google")
             self.driver.get("https://www.google.com")
             time.sleep(random.uniform(2, 4))
             
@@ -163,11 +179,24 @@ class GoogleContactCrawler:
             # 검색 결과 로딩 대기
             time.sleep(random.uniform(3, 5))
             
+            # CAPTCHA / unusual traffic 페이지면 쿨다운 후 전환
+            block_reason = self.search_guard.check_driver("google", self.driver)
+            if block_reason:
+                self.logger.warning(f"구글 차단 감지: {block_reason}")
+                return self._search_fallback(query)
+            
+            self.search_guard.record_success("google")
             self.logger.info(f"구글 검색 완료: {query}")
             print(f"🔍 구글 검색 완료: {query}")
             return True
             
         except TimeoutException:
+            # 검색창 대신 차단 페이지가 뜬 경우 타임아웃으로 나타남
+            if self.driver and self.search_guard.check_driver("google", self.driver):
+                self.logger.warning(f"구글 차단 감지 (검색창 없음): {query}")
+                return self._search_fallback(query)
+            
+            self.search_guard.record_error("google")
             self.logger.warning(f"구글 검색 시간 초과: {query}")
             print(f"⏰ 구글 검색 시간 초과: {query}")
             return False
@@ -176,6 +205,17 @@ class GoogleContactCrawler:
             print(f"❌ 구글 검색 중 오류: {e}")
             return False
     
+    def _search_fallback(self, query):
+        """구글 차단 시 네이버 -> 다음 순으로 검색 (결과는 같은 드라이버 페이지에 로드)"""
+        engine = self.search_guard.search(self.driver, query, engines=["naver", "daum"])
+        if engine:
+            self.logger.info(f"대체 검색엔진 검색 완료: {engine} - {query}")
+            print(f"🔀 {engine} 검색 완료: {query}")
+            return True
+        
+        self.logger.warning(f"모든 검색엔진 차단/실패: {query}")
+        return False
+    
     def extract_phone_from_page(self):
         """현재 페이지에서 전화번호 추출"""
         self.logger.info("페이지에서 전화번호 추출 시작")
@@ -279,44 +319,20 @@ class GoogleContactCrawler:
         return None, None
     
     def is_valid_korean_phone_number(self, number_str):
-        """한국 전화번호 체계 검증 (constants.py 데이터 활용)"""
-        # 숫자만 추출
-        number = re.sub(r'[^\d]', '', number_str)
-        
-        # 최소 길이 체크
-        if len(number) < 9:
-            return False
-        
-        # constants.py의 지역번호별 길이 규칙 사용 (수정)
-        for area_code, rules in AREA_CODE_LENGTH_RULES.items():
-            if number.startswith(area_code):
-                if rules['min_length'] <= len(number) <= rules['max_length']:
-                    area_name = get_area_name(area_code)
-                    self.logger.debug(f"유효한 한국 전화번호: {number} (지역번호: {area_code}, 지역: {area_name})")
-                    return True
-                else:
-                    self.logger.debug(f"길이 불일치: {number} (지역번호: {area_code}, 길이: {len(number)})")
-                    return False
-        
-        self.logger.debug(f"유효하지 않은 지역번호: {number}")
-        return False
+        """한국 전화번호 체계 검증 (지역번호 테이블 + 길이 규칙)"""
+        result = get_phone_normalizer().normalize(number_str)
+        if result.is_valid:
+            self.logger.debug(f"유효한 한국 전화번호: {result.digits} (지역번호: {result.area_code}, 지역: {result.area_name})")
+        else:
+            self.logger.debug(f"유효하지 않은 전화번호: {result.digits} ({result.reason})")
+        return result.is_valid
     
     def format_phone_number_safe(self, number_str):  # 메서드명 변경 (충돌 방지)
         """전화번호 포맷팅 (한국 번호 체계 검증 포함)"""
-        # 숫자만 추출
-        number = re.sub(r'[^\d]', '', number_str)
-        
-        # 한국 전화번호 체계 검증
-        if not self.is_valid_korean_phone_number(number):
+        formatted = get_phone_normalizer().format(number_str)
+        if not formatted:
             self.logger.debug(f"유효하지 않은 전화번호 제외: {number_str}")
-            return None
-        
-        # constants.py의 포맷팅 함수 사용 (수정)
-        area_code = extract_phone_area_code(number)
-        if area_code:
-            return format_phone_number(number, area_code)
-        else:
-            return number_str  # 원본 반환
+        return formatted
     
     def search_phone_number(self, organization_name):
         """기관명으로 전화번호 검색"""
@@ -357,12 +373,8 @@ class GoogleContactCrawler:
                 self.logger.warning(f"전화번호 쿼리 검색 실패: {query}")
             
             # 드라이버 재시작 (매크로 감지 방지)
+            # 요청 간격은 search_google()에서 스케줄러가 조절
             self.restart_driver()
-            
-            # 요청 간격 조절
-            sleep_time = random.uniform(3, 6)
-            self.logger.info(f"다음 쿼리까지 대기: {sleep_time:.2f}초")
-            time.sleep(sleep_time)
         
         self.logger.info(f"기관 전화번호 검색 완료: {organization_name}, 결과: {len(phone_numbers)}개")
         return phone_numbers
@@ -406,16 +418,36 @@ class GoogleContactCrawler:
                 self.logger.warning(f"팩스번호 쿼리 검색 실패: {query}")
             
             # 드라이버 재시작 (매크로 감지 방지)
+            # 요청 간격은 search_google()에서 스케줄러가 조절
             self.restart_driver()
-            
-            # 요청 간격 조절
-            sleep_time = random.uniform(3, 6)
-            self.logger.info(f"다음 쿼리까지 대기: {sleep_time:.2f}초")
-            time.sleep(sleep_time)
         
         self.logger.info(f"기관 팩스번호 검색 완료: {organization_name}, 결과: {len(fax_numbers)}개")
         return fax_numbers
     
+    def search_contacts(self, organization_name, address=""):
+        """
+        통합 쿼리로 전화번호와 팩스번호를 함께 검색
+        첫 검색 결과에서 찾지 못한 항목만 전용 쿼리로 추가 검색
+        """
+        region = self.query_planner.extract_region(address)
+        result = self.query_planner.search(self._fetch_search_text, organization_name, region)
+        
+        self.logger.info(f"기관 연락처 통합 검색 완료: {organization_name}, 쿼리 {len(result.queries)}회, "
+                         f"전화 {len(result.phones)}개, 팩스 {len(result.faxes)}개")
+        return result.phones, result.faxes
+    
+    def _fetch_search_text(self, query):
+        """쿼리 플래너용 검색 함수 - 검색 결과 페이지 본문 텍스트 반환"""
+        print(f"🔍 연락처 통합 검색 중: {query}")
+        if not self.search_google(query):
+            return None
+        
+        try:
+            return self.driver.find_element(By.TAG_NAME, "body").text
+        except Exception as e:
+            self.logger.warning(f"검색 결과 텍스트 추출 실패: {e}")
+            return None
+    
     def analyze_phone_fax_relationship(self, phone_numbers, fax_numbers):
         """전화번호와 팩스번호 관계 분석"""
         if not phone_numbers or not fax_numbers:
@@ -477,13 +509,8 @@ class GoogleContactCrawler:
         self.logger.info(f"기관 연락처 처리 시작: {name}")
         print(f"🔍 연락처 검색 중: {name}")
         
-        # 1. 전화번호 검색
-        print(f"📞 전화번호 검색 시작: {name}")
-        phone_numbers = self.search_phone_number(name)
-        
-        # 2. 팩스번호 검색
-        print(f"📠 팩스번호 검색 시작: {name}")
-        fax_numbers = self.search_fax_number(name)
+        # 1~2. 전화번호 + 팩스번호 통합 검색 (부족한 항목만 추가 검색)
+        phone_numbers, fax_numbers = self.search_contacts(name, org_data.get("address", ""))
         
         # 3. 전화번호와 팩스번호 관계 분석
         phone_google, fax_google, relationship = self.analyze_phone_fax_relationship(phone_numbers, fax_numbers)
@@ -533,10 +560,7 @@ class GoogleContactCrawler:
             self.logger.warning(f"연락처를 찾을 수 없음: {name}")
             print(f"⚠️ 연락처를 찾을 수 없음: {name}")
         
-        # 요청 간격 조절 (봇 탐지 방지)
-        sleep_time = random.uniform(5, 10)
-        self.logger.info(f"다음 기관까지 대기: {sleep_time:.2f}초")
-        time.sleep(sleep_time)
+        # 기관 간 고정 대기 없음 - 구글 요청 간격은 스케줄러가 호스트 단위로 관리
         
         self.logger.info(f"기관 연락처 처리 완료: {name}")
         return org_data
@@ -556,33 +580,42 @@ class GoogleContactCrawler:
         self.logger.info(f"총 처리할 기관 수: {total_organizations}")
         
         try:
-            # 각 카테고리별 처리
-            for category, organizations in data.items():
-                self.logger.info(f"카테고리 처리 시작: {category}, 기관 수: {len(organizations)}")
-                print(f"📂 카테고리 처리 시작: {category}")
+            # 각 카테고리별 처리 (루프 안의 print도 로그 큐로 기록)
+            with route_prints():
+                for category, organizations in data.items():
+                    self.logger.info(f"카테고리 처리 시작: {category}, 기관 수: {len(organizations)}")
+                    print(f"📂 카테고리 처리 시작: {category}")
                 
-                for i, org in enumerate(organizations):
-                    org_name = org.get('name', 'Unknown')
-                    self.logger.info(f"[{category}] {i+1}/{len(organizations)} 처리 중: {org_name}")
-                    print(f"[{category}] {i+1}/{len(organizations)} 처리 중...")
+                    for i, org in enumerate(organizations):
+                        org_name = org.get('name', 'Unknown')
+                        self.logger.info(f"[{category}] {i+1}/{len(organizations)} 처리 중: {org_name}")
+                        print(f"[{category}] {i+1}/{len(organizations)} 처리 중...")
+                    
+                        # 모든 검색엔진이 차단된 상태면 헛검색 대신 쿨다운 해제까지 대기
+                        resume_in = self.search_guard.next_available_in()
+                        if resume_in > 0:
+                            self.logger.warning(f"모든 검색엔진 쿨다운 중 - {resume_in:.0f}초 대기")
+                            time.sleep(resume_in)
                     
-                    # 기관 처리
-                    updated_org = self.process_organization(org)
-                    organizations[i] = updated_org
-                    total_processed += 1
+                        # 기관 처리
+                        updated_org = self.process_organization(org)
+                        organizations[i] = updated_org
+                        total_processed += 1
                     
-                    # 중간 저장 (5개마다)
-                    if total_processed % 5 == 0:
-                        self.logger.info(f"중간 저장 실행: {total_processed}/{total_organizations}")
-                        self.save_data(data, output_file)
-                        print(f"💾 중간 저장 완료: {total_processed}개 처리됨")
+                        # 중간 저장 (5개마다)
+                        if total_processed % 5 == 0:
+                            self.logger.info(f"중간 저장 실행: {total_processed}/{total_organizations}")
+                            self.save_data(data, output_file)
+                            print(f"💾 중간 저장 완료: {total_processed}개 처리됨")
                 
-                self.logger.info(f"카테고리 처리 완료: {category}")
+                    self.logger.info(f"카테고리 처리 완료: {category}")
             
             # 최종 저장
             self.logger.info("최종 저장 실행")
             self.save_data(data, output_file)
             self.logger.info(f"전체 팩스번호 크롤링 완료: 총 {total_processed}개 기관 처리됨")
+            self.logger.info(f"검색엔진 차단 통계: {self.search_guard.get_stats()}")
+            self.logger.info(f"검색 쿼리 플래너 통계: {self.query_planner.get_stats()}")
             print(f"🎉 팩스번호 크롤링 완료: 총 {total_processed}개 기관 처리됨")
             
         except KeyboardInterrupt:
@@ -14,6 +14,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from datetime import datetime
 
+from utils.politeness_scheduler import get_politeness_scheduler
+
 def setup_driver():
     """Chrome WebDriver 설정"""
     options = Options()
@@ -156,7 +158,8 @@ def search_phone_number(driver, name):
         try:
             print(f"📞 전화번호 검색 {i}/{len(search_queries)}: {search_query}")
             
-            # 구글 검색 페이지로 이동
+            # 구글 요청 간격 확보 후 검색 페이지로 이동
+            get_politeness_scheduler().wait("google.com")
             driver.get("https://www.google.com")
             time.sleep(2)
             
@@ -186,9 +189,6 @@ def search_phone_number(driver, name):
             else:
                 print(f"❌ 전화번호 없음: {search_query}")
             
-            # 다음 검색 전 잠시 대기
-            time.sleep(2)
-            
         except (TimeoutException, NoSuchElementException) as e:
             print(f"❌ 검색 실패 - {search_query}: {str(e)}")
             continue
@@ -249,8 +249,7 @@ def update_phone_data():
             else:
                 print(f"✗ 전화번호 없음: {name}")
             
-            # 요청 간 딜레이 (차단 방지)
-            time.sleep(2)
+            # 요청 간 딜레이는 search_phone_number()의 스케줄러가 구글 단위로 관리
             
             # 중간 저장 (50개마다)
             if (i + 1) % 50 == 0:
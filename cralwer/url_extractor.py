@@ -41,9 +41,9 @@ try:
         EMAIL_EXTRACTION_PATTERNS,
         ADDRESS_EXTRACTION_PATTERNS,
         GEMINI_API_KEY,
-        LOGGER_NAMES
+        LOGGER_NAMES,
+        HTML_PARSE_CONFIG
     )
-    print("✅ settings.py import 성공")
 except ImportError as e:
     print(f"⚠️ settings.py import 실패: {e}")
     # 기본값 설정
@@ -53,31 +53,21 @@ except ImportError as e:
     ADDRESS_EXTRACTION_PATTERNS = [r'([가-힣\s\d\-\(\)]+(?:시|군|구|동|로|길)[가-힣\s\d\-\(\)]*)']
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
     LOGGER_NAMES = {"parser": "web_parser"}
+    HTML_PARSE_CONFIG = {}
 
-# AI 및 BS4 초기화 (기존 코드와 동일)
-AI_AVAILABLE = False
-genai = None
-BS4_AVAILABLE = False
+from utils.gemini_key_pool import get_gemini_key_pool
+from utils.lazy_import import module_available
+from utils.politeness_scheduler import get_politeness_scheduler
+from utils.log_pipeline import attach_handlers, route_prints
 
-# AI 모델 import 및 초기화
-try:
-    import google.generativeai as genai
-    if GEMINI_API_KEY:
-        genai.configure(api_key=GEMINI_API_KEY)
-        AI_AVAILABLE = True
-        print("🤖 AI 기능 활성화")
-    else:
-        AI_AVAILABLE = False
-        print("⚠️ GEMINI_API_KEY가 설정되지 않음")
-except ImportError as e:
-    AI_AVAILABLE = False
-    genai = None
-    print(f"⚠️ google.generativeai 모듈 import 실패: {e}")
+# AI 사용 가능 여부 - google.generativeai는 import하지 않고 설치 여부만 확인 (모델은 HomepageParser 생성 시 키 풀에서 로드)
+AI_AVAILABLE = bool(GEMINI_API_KEY) and module_available("google.generativeai")
 
+BS4_AVAILABLE = False
 try:
     from bs4 import BeautifulSoup
+    from utils.html_document import HtmlDocument
     BS4_AVAILABLE = True
-    print("✅ BeautifulSoup 사용 가능")
 except ImportError:
     BS4_AVAILABLE = False
     print("⚠️ BeautifulSoup이 없음 - HTML 파싱 제한됨")
@@ -94,9 +84,10 @@ class HomepageParser:
         self.ai_model = None
         self.use_ai = AI_AVAILABLE  # 전역 변수 사용
         
-        if self.use_ai and genai:
+        if self.use_ai:
             try:
-                self.ai_model = genai.GenerativeModel('gemini-1.5-flash')
+                # 공용 키 풀 모델 (키별 독립 클라이언트, 여유가 큰 키로 호출)
+                self.ai_model = get_gemini_key_pool().model('gemini-1.5-flash', source="homepage_parser")
                 print("✅ Gemini AI 모델 초기화 성공")
             except Exception as e:
                 print(f"❌ AI 모델 초기화 실패: {e}")
@@ -108,6 +99,7 @@ class HomepageParser:
         # 파싱 설정
         self.page_timeout = 30
         self.delay_range = (2, 4)
+        self.scheduler = get_politeness_scheduler()
         self.max_content_length = 10000  # AI 처리용 최대 텍스트 길이
         self.max_wait_time = 20  # JavaScript 로딩 최대 대기시간
 
@@ -134,10 +126,6 @@ class HomepageParser:
         logger = logging.getLogger('homepage_parser')
         logger.setLevel(logging.INFO)  # DEBUG로 변경하면 프롬프트도 볼 수 있음
         
-        # 핸들러가 이미 있으면 제거
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-        
         # 콘솔 핸들러 추가
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
@@ -145,18 +133,19 @@ class HomepageParser:
         # 포맷터 설정
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         console_handler.setFormatter(formatter)
-        
-        logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # 파일 핸들러도 추가 (선택사항)
         try:
             file_handler = logging.FileHandler('homepage_parser.log', encoding='utf-8')
             file_handler.setLevel(logging.DEBUG)  # 파일에는 모든 로그 저장
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             print(f"파일 로그 핸들러 설정 실패: {e}")
         
+        # 기존 핸들러 교체 (비동기 모드면 백그라운드 기록 스레드에서 출력)
+        attach_handlers(logger, handlers)
         return logger
     
     def setup_driver(self):
@@ -246,11 +235,18 @@ class HomepageParser:
             self.driver = None
             self.logger.info("드라이버 종료 완료")
     
-    def add_delay(self):
-        """요청 간 지연"""
-        delay = random.uniform(*self.delay_range)
-        self.logger.info(f"지연 시간: {delay:.1f}초")
-        time.sleep(delay)
+    def add_delay(self, url: str = ""):
+        """요청 간 지연 (같은 도메인에 연속 요청할 때만 대기)"""
+        if not url:
+            delay = random.uniform(*self.delay_range)
+            self.logger.info(f"지연 시간: {delay:.1f}초")
+            time.sleep(delay)
+            return
+        
+        # 홈페이지 도메인 간격은 POLITENESS_CONFIG의 default_interval 적용
+        delay = self.scheduler.wait(url)
+        if delay > 0:
+            self.logger.info(f"지연 시간 ({self.scheduler.normalize_host(url)}): {delay:.1f}초")
 
     def wait_for_dynamic_content(self, url: str) -> bool:
         """동적 콘텐츠 로딩 대기 (강화된 버전)"""
@@ -432,8 +428,26 @@ class HomepageParser:
         except Exception as e:
             self.logger.warning(f"강화된 스크롤 트리거 실패: {e}")
     
-    def extract_content_with_multiple_strategies(self) -> Dict[str, str]:
-        """여러 전략으로 콘텐츠 추출"""
+    def _select_element_texts(self, selectors: List[str], min_length: int) -> List[str]:
+        """WebDriver로 선택자별 요소 텍스트 수집 (BeautifulSoup이 없을 때만 사용)"""
+        texts = []
+        for selector in selectors:
+            try:
+                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                for element in elements:
+                    text = element.text.strip()
+                    if len(text) > min_length:
+                        texts.append(text)
+            except:
+                continue
+        return texts
+    
+    def extract_content_with_multiple_strategies(self, document: "HtmlDocument" = None) -> Dict[str, str]:
+        """
+        여러 전략으로 콘텐츠 추출
+        document가 있으면 그 파싱 결과를 재사용하고, 텍스트는 예산(max_content_length) 안에서
+        연락처/푸터 영역을 먼저 채운 뒤 본문 순서로 채움 (전체 텍스트를 만들지 않음)
+        """
         content_results = {
             "full_text": "",
             "main_content": "",
@@ -442,56 +456,29 @@ class HomepageParser:
         }
         
         try:
-            # 전략 1: BeautifulSoup으로 전체 파싱
+            # 전략 1: 1회 파싱한 문서에서 예산 내 텍스트 (연락처 영역 우선 포함)
             if BS4_AVAILABLE:
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                # 스크립트, 스타일 제거
-                for element in soup(["script", "style", "noscript", "meta", "link"]):
-                    element.decompose()
+                if document is None:
+                    document = HtmlDocument(self.driver.page_source, self.driver.current_url)
                 
-                # 전체 텍스트
-                full_text = soup.get_text()
-                full_text = re.sub(r'\s+', ' ', full_text).strip()
+                full_text = document.budget_text(self.max_content_length, self.contact_selectors)
                 content_results["full_text"] = full_text
                 content_results["method_used"] = "beautifulsoup"
                 
-                self.logger.info(f"✅ BeautifulSoup 파싱: {len(full_text)} chars")
-            
-            # 전략 2: 주요 콘텐츠 영역 타겟팅
-            main_content_texts = []
-            for selector in self.content_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if len(text) > 100:  # 의미있는 콘텐츠만
-                            main_content_texts.append(text)
-                            self.logger.info(f"📝 주요 콘텐츠 발견 ({selector}): {len(text)} chars")
-                except:
-                    continue
+                self.logger.info(f"✅ BeautifulSoup 파싱 ({document.parser}): {len(full_text)} chars")
             
-            if main_content_texts:
-                content_results["main_content"] = " ".join(main_content_texts)
-                if not content_results["method_used"] or content_results["method_used"] == "none":
+            else:
+                # 전략 2: 주요 콘텐츠 영역 타겟팅 (BeautifulSoup이 없을 때)
+                main_content_texts = self._select_element_texts(self.content_selectors, 100)
+                if main_content_texts:
+                    content_results["main_content"] = " ".join(main_content_texts)
                     content_results["method_used"] = "targeted_selectors"
-            
-            # 전략 3: 연락처 정보 영역 특별 추출
-            contact_texts = []
-            for selector in self.contact_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if len(text) > 20:  # 연락처 정보는 더 짧아도 됨
-                            contact_texts.append(text)
-                except:
-                    continue
-            
-            if contact_texts:
-                content_results["contact_content"] = " ".join(contact_texts)
-                self.logger.info(f"📞 연락처 영역 발견: {len(contact_texts)}개 섹션")
+                
+                # 전략 3: 연락처 정보 영역 특별 추출 (연락처 정보는 더 짧아도 됨)
+                contact_texts = self._select_element_texts(self.contact_selectors, 20)
+                if contact_texts:
+                    content_results["contact_content"] = " ".join(contact_texts)
+                    self.logger.info(f"📞 연락처 영역 발견: {len(contact_texts)}개 섹션")
             
             # 전략 4: Selenium 직접 텍스트 추출 (fallback)
             if not any([content_results["full_text"], content_results["main_content"]]):
@@ -533,9 +520,11 @@ class HomepageParser:
         
         return content_results
     
-    def extract_page_content(self, url: str) -> Dict[str, Any]:
+    def extract_page_content(self, url: str, keep_html: bool = False, delay: bool = True) -> Dict[str, Any]:
         """
         향상된 페이지 파싱 (다중 전략 + 동적 콘텐츠 처리)
+        keep_html=True면 원본 HTML을 결과에 남김 (fixture 기록 등 호출자가 사용 후 해제)
+        delay=False면 도메인 간격 대기 생략 (호출자가 드라이버 잠금 전에 이미 슬롯을 예약한 경우)
         """
         result = {
             "url": url,
@@ -552,7 +541,8 @@ class HomepageParser:
             "parsing_details": {},
             "error": None,
             "accessible": False,
-            "raw_html": ""  # 원본 HTML 추가
+            "raw_html": "",  # 원본 HTML 추가
+            "document": None  # 1회 파싱한 HtmlDocument (후속 단계에서 재사용)
         }
         
         try:
@@ -567,6 +557,10 @@ class HomepageParser:
                     self.logger.error(f"❌ WebDriver 초기화 실패: {url}")
                     return result
             
+            # 같은 도메인 연속 요청 간격 확보
+            if delay:
+                self.add_delay(url)
+            
             self.logger.info(f"🌐 향상된 페이지 접속: {url}")
             
             # 1. 페이지 로드
@@ -579,8 +573,9 @@ class HomepageParser:
             else:
                 self.logger.warning("⚠️ 동적 콘텐츠 로딩 시간 초과")
             
-            # 3. 페이지 접근 가능성 확인
-            if not self.is_page_accessible():
+            # 3. 페이지 접근 가능성 확인 (page_source는 1회만 가져옴)
+            page_source = self.driver.page_source
+            if not self.is_page_accessible(page_source):
                 result["status"] = "error"
                 result["error"] = "페이지 접근 불가 (404, 403 등)"
                 result["accessible"] = False
@@ -592,14 +587,16 @@ class HomepageParser:
             # 4. 기본 정보 추출
             try:
                 result["title"] = self.driver.title.strip()
-                result["raw_html"] = self.driver.page_source
+                result["raw_html"] = page_source
                 self.logger.info(f"📄 페이지 제목: {result['title']}")
                 self.logger.info(f"📊 HTML 크기: {len(result['raw_html']):,} bytes")
             except Exception as e:
                 self.logger.warning(f"기본 정보 추출 오류: {str(e)}")
             
-            # 5. 콘텐츠 추출 (다중 전략)
-            content_results = self.extract_content_with_multiple_strategies()
+            # 5. 콘텐츠 추출 (다중 전략, 문서는 여기서 1회만 파싱해 이후 단계가 공유)
+            if BS4_AVAILABLE and result["raw_html"]:
+                result["document"] = HtmlDocument(result["raw_html"], url)
+            content_results = self.extract_content_with_multiple_strategies(result["document"])
             result["text_content"] = content_results.get("final_text", "")
             result["parsing_details"] = {
                 "content_extraction_method": content_results.get("method_used", "unknown"),
@@ -609,11 +606,10 @@ class HomepageParser:
                 "processing_time": time.time() - load_start_time
             }
             
-            # 6. 메타 정보 추출 (BeautifulSoup 사용)
-            if BS4_AVAILABLE and result["raw_html"]:
+            # 6. 메타 정보 추출 (같은 파싱 트리 사용)
+            if result["document"] is not None:
                 try:
-                    soup = BeautifulSoup(result["raw_html"], 'html.parser')
-                    result["meta_info"] = self.extract_meta_info(soup)
+                    result["meta_info"] = self.extract_meta_info(result["document"].soup)
                 except Exception as e:
                     self.logger.warning(f"메타 정보 추출 오류: {str(e)}")
             
@@ -659,10 +655,23 @@ class HomepageParser:
                 except Exception as setup_error:
                     self.logger.error(f"❌ WebDriver 재초기화 실패: {str(setup_error)}")
         
+        self._release_page_html(result, keep_html)
         return result
     
-    def is_page_accessible(self) -> bool:
-        """페이지 접근 가능 여부 확인 (개선된 버전)"""
+    def _release_page_html(self, result: Dict[str, Any], keep_html: bool = False):
+        """
+        추출이 끝난 페이지의 원본 HTML/파싱 트리 해제 (장시간 실행 시 메모리가 페이지 수만큼 늘지 않도록)
+        CAPTURE_RAW_HTML=true 또는 keep_html=True면 원본 HTML 보관
+        """
+        capture = keep_html or HTML_PARSE_CONFIG.get("capture_raw_html", False)
+        result["parsing_details"]["html_size"] = len(result.get("raw_html") or "")
+        if not capture:
+            result["raw_html"] = ""
+        if result.get("document") is not None:
+            result["document"].compact(keep_html=capture)
+    
+    def is_page_accessible(self, page_source: str = None) -> bool:
+        """페이지 접근 가능 여부 확인 (개선된 버전, 이미 가져온 page_source가 있으면 재사용)"""
         try:
             # 1. 타이틀 확인
             title = self.driver.title.lower()
@@ -670,7 +679,8 @@ class HomepageParser:
                 return False
             
             # 2. 페이지 소스 크기 확인
-            page_source = self.driver.page_source
+            if page_source is None:
+                page_source = self.driver.page_source
             if len(page_source) < 1000:  # 최소 크기 증가
                 return False
             
@@ -1138,7 +1148,11 @@ class HomepageParser:
         }
     
     def process_organizations(self, organizations: List[Dict]) -> List[Dict]:
-        """기관 목록 처리"""
+        """기관 목록 처리 (처리 루프 안의 print도 로그 큐로 기록)"""
+        with route_prints():
+            return self._process_organizations(organizations)
+    
+    def _process_organizations(self, organizations: List[Dict]) -> List[Dict]:
         if not self.driver:
             self.setup_driver()
         
@@ -1209,9 +1223,7 @@ class HomepageParser:
                         success_rate = success_count / i * 100
                         self.logger.info(f"📊 진행률: {success_count}/{i} ({success_rate:.1f}%)")
                     
-                    # 지연 (서버 부하 방지)
-                    if i < total_count:
-                        self.add_delay()
+                    # 서버 부하 방지 지연은 extract_page_content()에서 도메인 단위로 처리
                 
                 except Exception as e:
                     self.logger.error(f"❌ 처리 오류: {org.get('name', 'Unknown')} - {e}")
@@ -16,10 +16,13 @@ import json
 import time
 import re
 import logging
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
 from enum import Enum
 
 # 프로젝트 설정 import
@@ -30,48 +33,59 @@ from utils.file_utils import FileUtils
 from utils.phone_utils import PhoneUtils
 from utils.crawler_utils import CrawlerUtils
 from utils.ai_helpers import AIModelManager
+from utils.politeness_scheduler import get_politeness_scheduler
+from utils.contact_query_planner import get_contact_query_planner, fetch_serp_text
+from utils.metrics import get_metrics_registry
+from utils.concurrency_controller import get_adaptive_limit
+from utils.html_document import HtmlDocument
+from utils.prompt_compactor import compact_text, estimate_tokens
+from utils.fixture_corpus import FixtureFetcher
+from utils.tracing import get_tracer
+from utils.log_pipeline import get_log_pipeline, route_prints
+from utils.lazy_import import LazyRegistry
+from utils.contact_rules import (
+    ScoredContact, extract_contacts, get_ai_skip_stats, record_ai_decision, score_number, skip_threshold
+)
 
 
-# 전문 모듈들 import (기존 유지)
-try:
-    from cralwer.fax_extractor import GoogleContactCrawler as FaxExtractor
-    FAX_EXTRACTOR_AVAILABLE = True
-    print("✅ fax_extractor.py 모듈 로드 성공")
-except ImportError as e:
-    print(f"❌ fax_extractor.py 모듈 로드 실패: {e}")
-    FAX_EXTRACTOR_AVAILABLE = False
+# 전문 모듈들 - import 시점에는 등록만 하고 initialize_modules()/실제 사용 시점에 로드
+# (Selenium, google.generativeai, cralwer/*, psycopg2를 크롤러를 띄우지 않는 API/워커 기동에서 제외)
+OPTIONAL_MODULES = LazyRegistry("crawler_main")
+OPTIONAL_MODULES.register("fax_extractor", "cralwer.fax_extractor", "GoogleContactCrawler", "fax_extractor.py")
+OPTIONAL_MODULES.register("phone_driver", "cralwer.phone_extractor", "setup_driver", "phone_extractor.py")
+OPTIONAL_MODULES.register("homepage_parser", "cralwer.url_extractor", "HomepageParser", "url_extractor.py")
+OPTIONAL_MODULES.register("contact_validator", "utils.validator", "ContactValidator", "validator.py")
+OPTIONAL_MODULES.register("ai_validator", "utils.validator", "AIValidator", "validator.py (AI)")
+OPTIONAL_MODULES.register("database", "database.database", "get_database", "database.py")
 
-try:
-    from cralwer.phone_extractor import extract_phone_numbers, search_phone_number, setup_driver
-    PHONE_EXTRACTOR_AVAILABLE = True
-    print("✅ phone_extractor.py 모듈 로드 성공")
-except ImportError as e:
-    print(f"❌ phone_extractor.py 모듈 로드 실패: {e}")
-    PHONE_EXTRACTOR_AVAILABLE = False
+# ==================== 메트릭 ====================
 
-try:
-    from cralwer.url_extractor import HomepageParser
-    URL_EXTRACTOR_AVAILABLE = True
-    print("✅ url_extractor.py 모듈 로드 성공")
-except ImportError as e:
-    print(f"❌ url_extractor.py 모듈 로드 실패: {e}")
-    URL_EXTRACTOR_AVAILABLE = False
+METRICS = get_metrics_registry()
+FETCH_SECONDS = METRICS.histogram("crawler_fetch_seconds", "웹 페이지/검색 결과 로드 시간", ["method"])
+AI_CALL_SECONDS = METRICS.histogram("crawler_ai_call_seconds", "AI 호출 시간", ["purpose"])
+DB_WRITE_SECONDS = METRICS.histogram("crawler_db_write_seconds", "DB 저장 시간", ["operation"])
+ORGANIZATION_SECONDS = METRICS.histogram("crawler_organization_seconds", "기관 1건 처리 시간")
+STAGE_SECONDS = METRICS.histogram("crawler_stage_seconds", "에이전트 단계별 처리 시간", ["stage"])
+ORGANIZATIONS_TOTAL = METRICS.counter("crawler_organizations_total", "처리한 기관 수", ["result"])
+WEBDRIVERS_ACTIVE = METRICS.gauge("webdriver_active", "사용 중인 WebDriver 수", ["owner"])
+WEBDRIVERS_CREATED = METRICS.counter("webdriver_created_total", "생성한 WebDriver 수", ["owner"])
 
-try:
-    from utils.validator import ContactValidator, AIValidator
-    VALIDATOR_AVAILABLE = True
-    print("✅ validator.py 모듈 로드 성공")
-except ImportError as e:
-    print(f"❌ validator.py 모듈 로드 실패: {e}")
-    VALIDATOR_AVAILABLE = False
+TRACER = get_tracer()
 
-try:
-    from database.database import get_database, ChurchCRMDatabase
-    DATABASE_AVAILABLE = True
-    print("✅ database.py 모듈 로드 성공")
-except ImportError as e:
-    print(f"❌ database.py 모듈 로드 실패: {e}")
-    DATABASE_AVAILABLE = False
+
+def timed_serp_fetch(driver, query: str) -> Optional[str]:
+    """검색 결과 로드 (시간 기록)"""
+    with FETCH_SECONDS.labels("serp").time():
+        return fetch_serp_text(driver, query)
+
+
+@contextmanager
+def ai_call_span(purpose: str, prompt: str):
+    """AI 호출 시간 기록 + 트레이스 스팬 (프롬프트 글자/추정 토큰 수)"""
+    with TRACER.span(f"ai.{purpose}", {"ai.purpose": purpose, "ai.prompt_chars": len(prompt),
+                                       "ai.prompt_tokens": estimate_tokens(prompt)}) as span, \
+            AI_CALL_SECONDS.labels(purpose).time():
+        yield span
 
 # ==================== AI Agentic Workflow 시스템 통합 ====================
 
@@ -97,6 +111,8 @@ class CrawlingContext:
     error_log: List[str]
     processing_time: float
     confidence_scores: Dict[str, float]
+    # 에이전트별 실행 시간 (초, 트레이싱 비활성화여도 기록)
+    stage_timings: Dict[str, float] = field(default_factory=dict)
 
 class AIAgent:
     """AI 에이전트 기본 클래스"""
@@ -118,6 +134,13 @@ class AIAgent:
     def update_confidence(self, context: CrawlingContext, field: str, score: float):
         """신뢰도 점수 업데이트"""
         context.confidence_scores[field] = score
+    
+    def store_deterministic(self, context: CrawlingContext, contact: ScoredContact, source: str):
+        """규칙 기반으로 확정한 연락처 저장 (AI 검증 생략 판단에 점수 사용)"""
+        context.extracted_data[contact.kind] = contact.value
+        context.extracted_data[f'{contact.kind}_source'] = source
+        context.ai_insights.setdefault('deterministic', {})[contact.kind] = contact.confidence
+        self.update_confidence(context, contact.kind, contact.confidence)
 
 class EnhancedHomepageSearchAgent(AIAgent):
     """AI 강화 홈페이지 검색 에이전트"""
@@ -322,7 +345,8 @@ class EnhancedHomepageSearchAgent(AIAgent):
             REASON: [판단 이유 1-2문장]
             """
             
-            response = await self.ai_manager.extract_with_gemini(url, prompt)
+            with ai_call_span("homepage_verification", prompt):
+                response = await self.ai_manager.extract_with_gemini(url, prompt)
             self.logger.info(f"🤖 [AI 프롬프트] 홈페이지 검증 - {org_name}")
             self.logger.debug(f"📝 프롬프트: {prompt}")
             self.logger.info(f"🤖 [AI 응답] 홈페이지 검증 - {org_name}")
@@ -385,27 +409,47 @@ class EnhancedHomepageAnalysisAgent(AIAgent):
             self.logger.info(f"🔍 [{self.name}] 단계별 홈페이지 분석: {homepage_url}")
             
             # 1단계: BS4로 텍스트 추출 시도
-            extracted_text = await self._extract_with_bs4(homepage_url)
-            soup_object = None
+            extraction_result = await self._extract_with_bs4(homepage_url)
             
-            if not extracted_text:
+            if not extraction_result:
                 # 2단계: JS 렌더링으로 텍스트 추출 시도
                 extraction_result = await self._extract_with_selenium(homepage_url)
-                if extraction_result:
-                    extracted_text = extraction_result.get('text')
-                    soup_object = extraction_result.get('soup')
+            
+            extracted_text = extraction_result.get('text') if extraction_result else None
+            # 추출 단계에서 1회 파싱한 문서를 링크 탐색에도 재사용
+            document = extraction_result.get('document') if extraction_result else None
             
             if extracted_text:
-                # 3단계: AI로 연락처 정보 추출
-                contact_info = await self._extract_contacts_with_ai(extracted_text, org_name)
-                if contact_info:
-                    self._store_enhanced_contact_info(context, contact_info)
+                # 3단계: 규칙 기반 추출 (전화/팩스 신뢰도가 임계값 이상이면 AI 생략)
+                deterministic = extract_contacts(extracted_text, context.organization.get('address', ''), document)
+                if deterministic.is_conclusive():
+                    record_ai_decision("homepage_contacts", skipped=True)
+                    for contact in (deterministic.phone, deterministic.fax, deterministic.email):
+                        if contact:
+                            self.store_deterministic(context, contact, 'homepage_rules')
                     context.extracted_data['homepage_analyzed'] = True
-                    self.logger.info(f"✅ [{self.name}] AI 홈페이지 분석 완료")
+                    self.logger.info(
+                        f"⚡ [{self.name}] 규칙 기반 연락처 확정 (AI 생략): "
+                        f"전화 {deterministic.phone.value} ({deterministic.phone.confidence}), "
+                        f"팩스 {deterministic.fax.value} ({deterministic.fax.confidence})"
+                    )
+                else:
+                    # AI로 연락처 정보 추출
+                    record_ai_decision("homepage_contacts", skipped=False)
+                    contact_info = await self._extract_contacts_with_ai(extracted_text, org_name, document)
+                    if contact_info:
+                        self._store_enhanced_contact_info(context, contact_info)
+                        context.extracted_data['homepage_analyzed'] = True
+                        self.logger.info(f"✅ [{self.name}] AI 홈페이지 분석 완료")
+                    # AI가 찾지 못한 항목은 임계값을 넘은 규칙 기반 결과로 채움
+                    for contact in (deterministic.phone, deterministic.fax):
+                        if contact and not context.extracted_data.get(contact.kind) \
+                                and contact.confidence >= skip_threshold():
+                            self.store_deterministic(context, contact, 'homepage_rules')
                 
                 # 4단계: 연락처 페이지 링크 찾기 (additionalplan.py에서 가져온 기능)
-                if soup_object:
-                    contact_links = self._find_contact_page_links(soup_object, homepage_url)
+                if document:
+                    contact_links = self._find_contact_page_links(document, homepage_url)
                     if contact_links:
                         context.extracted_data['contact_page_links'] = contact_links
                         self.logger.info(f"🔗 연락처 페이지 링크 {len(contact_links)}개 발견")
@@ -423,10 +467,8 @@ class EnhancedHomepageAnalysisAgent(AIAgent):
             self.logger.error(f"❌ [{self.name}] 오류: {e}")
             return context
     
-    def _find_contact_page_links(self, soup, base_url: str) -> List[Dict]:
-        """연락처 페이지 링크 찾기 (additionalplan.py에서 가져온 기능)"""
-        contact_links = []
-        
+    def _find_contact_page_links(self, document: HtmlDocument, base_url: str) -> List[Dict]:
+        """연락처 페이지 링크 찾기 (additionalplan.py에서 가져온 기능, 이미 파싱한 문서의 링크 뷰 사용)"""
         try:
             # 연락처 관련 키워드
             CONTACT_NAVIGATION_KEYWORDS = [
@@ -434,70 +476,37 @@ class EnhancedHomepageAnalysisAgent(AIAgent):
                 "찾아오시는길", "위치", "주소", "전화", "TEL", "전화번호", "연락망"
             ]
             
-            # 링크 요소들 찾기
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                link_text = link.get_text(strip=True).lower()
-                href = link.get('href', '')
-                
-                # 연락처 관련 키워드 확인
-                for keyword in CONTACT_NAVIGATION_KEYWORDS:
-                    if keyword.lower() in link_text:
-                        full_url = self._resolve_url(href, base_url)
-                        if full_url:
-                            contact_links.append({
-                                'url': full_url,
-                                'text': link.get_text(strip=True),
-                                'keyword': keyword
-                            })
-                        break
+            document.url = document.url or base_url
+            return document.contact_page_links(CONTACT_NAVIGATION_KEYWORDS, limit=5)  # 최대 5개까지
         
         except Exception as e:
             self.logger.warning(f"연락처 페이지 링크 찾기 오류: {e}")
-        
-        return contact_links[:5]  # 최대 5개까지
-    
-    def _resolve_url(self, href: str, base_url: str) -> Optional[str]:
-        """상대 URL을 절대 URL로 변환"""
-        try:
-            from urllib.parse import urljoin, urlparse
-            
-            if href.startswith(('http://', 'https://')):
-                return href
-            elif href.startswith('/'):
-                parsed = urlparse(base_url)
-                return f"{parsed.scheme}://{parsed.netloc}{href}"
-            else:
-                return urljoin(base_url, href)
-        except:
-            return None
+            return []
     
-    async def _extract_with_bs4(self, url: str) -> Optional[str]:
-        """1단계: BS4로 텍스트 추출"""
+    async def _extract_with_bs4(self, url: str) -> Optional[Dict]:
+        """1단계: BS4로 텍스트 추출 (텍스트 + 파싱한 문서)"""
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
             self.logger.info(f"🔍 BS4 텍스트 추출 시도: {url}")
             
-            headers = REQUEST_HEADERS
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # 같은 호스트 연속 요청만 간격 유지 (재생 모드는 실제 호스트에 요청하지 않으므로 생략)
+            if not self.parent_crawler.fixtures.replaying:
+                await get_politeness_scheduler().wait_async(url)
             
-            # 스크립트, 스타일 제거
-            for element in soup(["script", "style", "noscript", "meta", "link"]):
-                element.decompose()
+            content, final_url = await asyncio.to_thread(self.parent_crawler.fetch_page, url)
             
-            # 텍스트 추출
-            text = soup.get_text()
-            text = re.sub(r'\s+', ' ', text).strip()
+            # 문서는 1회만 파싱 (텍스트/링크 뷰 공유, script/style은 텍스트 수집 시 제외)
+            document = HtmlDocument(content, final_url)
+            # 최대 10,000자 - 연락처/푸터 영역 우선, 예산이 차면 추출 중단
+            text = document.budget_text(10000)
+            # 링크 뷰만 남기고 원본 HTML/파싱 트리 해제
+            document.compact(keep_html=HTML_PARSE_CONFIG.get("capture_raw_html", False))
             
             if len(text) > 500:  # 의미있는 텍스트인지 확인
                 self.logger.info(f"✅ BS4 추출 성공: {len(text)} chars")
-                return text[:10000]  # 최대 10,000자
+                return {
+                    'text': text,
+                    'document': document
+                }
             else:
                 self.logger.warning(f"⚠️ BS4 추출된 텍스트가 너무 짧음: {len(text)} chars")
                 return None
@@ -511,19 +520,18 @@ class EnhancedHomepageAnalysisAgent(AIAgent):
         try:
             self.logger.info(f"🔍 Selenium JS 렌더링 텍스트 추출 시도: {url}")
             
-            if self.parent_crawler and self.parent_crawler.homepage_parser:
-                page_data = self.parent_crawler.homepage_parser.extract_page_content(url)
+            if self.parent_crawler and self.parent_crawler.renderer_available:
+                page_data = await self.parent_crawler.extract_page_content_async(url)
                 if page_data and page_data.get('accessible') and page_data.get('text_content'):
                     text = page_data['text_content']
                     
-                    # BeautifulSoup 객체도 생성
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(page_data.get('raw_html', ''), 'html.parser') if page_data.get('raw_html') else None
+                    # 홈페이지 파서가 이미 파싱한 문서를 그대로 사용 (다시 파싱하지 않음)
+                    document = HtmlDocument.of(page_data.get('document') or page_data.get('raw_html'), url)
                     
                     self.logger.info(f"✅ Selenium 추출 성공: {len(text)} chars")
                     return {
                         'text': text,
-                        'soup': soup
+                        'document': document
                     }
             
             self.logger.warning("⚠️ Selenium 텍스트 추출 실패")
@@ -533,17 +541,21 @@ class EnhancedHomepageAnalysisAgent(AIAgent):
             self.logger.warning(f"Selenium 텍스트 추출 실패: {e}")
             return None
     
-    async def _extract_contacts_with_ai(self, text_content: str, org_name: str) -> Optional[Dict]:
+    async def _extract_contacts_with_ai(self, text_content: str, org_name: str,
+                                        document: Optional[HtmlDocument] = None) -> Optional[Dict]:
         """3단계: AI로 연락처 정보 추출"""
         try:
             self.logger.info(f"🤖 AI 연락처 추출: {org_name}")
             
+            # 연락처 주변 텍스트만 토큰 예산 안으로 압축
+            prompt_text = compact_text(text_content, "contacts", document)
+            
             prompt = f"""
             다음은 '{org_name}' 기관의 홈페이지 텍스트입니다.
             이 텍스트에서 연락처 정보를 정확히 추출해주세요.
 
             **홈페이지 텍스트:**
-            {text_content[:5000]}
+            {prompt_text}
 
             **추출할 정보:**
             1. 전화번호 (02-XXX-XXXX, 031-XXX-XXXX 형태)
@@ -568,7 +580,8 @@ class EnhancedHomepageAnalysisAgent(AIAgent):
             """
             
             if self.ai_manager and self.ai_manager.gemini_model:
-                response = self.ai_manager.gemini_model.generate_content(prompt)
+                with ai_call_span("contact_extraction", prompt):
+                    response = await asyncio.to_thread(self.ai_manager.gemini_model.generate_content, prompt)
                 response_text = response.text.strip()
                 
                 # JSON 추출 및 파싱
@@ -655,26 +668,33 @@ class EnhancedContactExtractionAgent(AIAgent):
             
             self.logger.info(f"📞 [{self.name}] 주소 기반 연락처 검색: {org_name}")
             
-            # 전화번호가 없으면 검색
-            if not context.extracted_data.get('phone'):
-                phone_result = await self._search_phone_with_address(org_name, org_address)
+            need_phone = not context.extracted_data.get('phone')
+            need_fax = not context.extracted_data.get('fax')
+            
+            # 전화번호/팩스번호 중 없는 항목을 통합 쿼리 1회로 검색
+            if need_phone or need_fax:
+                phone_result, fax_result, labeled, named = await self._search_contacts_with_address(
+                    org_name, org_address, need_phone, need_fax, context.extracted_data.get('phone')
+                )
+                
                 if phone_result:
-                    # AI로 검증
-                    is_valid = await self._verify_contact_with_ai(phone_result, org_name, 'phone')
-                    if is_valid:
+                    # 규칙 기반 신뢰도가 충분하고 검색 결과에서 기관명이 번호 근처에 있으면 AI 검증 생략
+                    scored = score_number(phone_result, 'phone', org_address,
+                                          label_distance=0 if phone_result in labeled else None)
+                    if self._is_conclusive(scored, phone_result in named):
+                        self.store_deterministic(context, scored, 'address_based_search')
+                    elif await self._verify_contact_with_ai(phone_result, org_name, 'phone'):
                         context.extracted_data['phone'] = phone_result
                         context.extracted_data['phone_source'] = 'address_based_search'
                         self.update_confidence(context, 'phone', 0.8)
-            
-            # 팩스번호가 없으면 검색 (전화번호와 중복 방지)
-            if not context.extracted_data.get('fax'):
-                fax_result = await self._search_fax_with_address(
-                    org_name, org_address, context.extracted_data.get('phone')
-                )
-                if fax_result:
-                    # AI로 검증
-                    is_valid = await self._verify_contact_with_ai(fax_result, org_name, 'fax')
-                    if is_valid:
+                
+                # 팩스번호 (전화번호와 중복 방지)
+                if fax_result and not self._is_duplicate_number(fax_result, context.extracted_data.get('phone')):
+                    scored = score_number(fax_result, 'fax', org_address,
+                                          label_distance=0 if fax_result in labeled else None)
+                    if self._is_conclusive(scored, fax_result in named):
+                        self.store_deterministic(context, scored, 'address_based_search')
+                    elif await self._verify_contact_with_ai(fax_result, org_name, 'fax'):
                         context.extracted_data['fax'] = fax_result
                         context.extracted_data['fax_source'] = 'address_based_search'
                         self.update_confidence(context, 'fax', 0.8)
@@ -687,79 +707,60 @@ class EnhancedContactExtractionAgent(AIAgent):
             self.logger.error(f"❌ [{self.name}] 오류: {e}")
             return context
     
-    async def _search_phone_with_address(self, org_name: str, address: str) -> Optional[str]:
-        """주소 기반 전화번호 검색"""
+    async def _search_contacts_with_address(self, org_name: str, address: str, need_phone: bool, need_fax: bool,
+                                            existing_phone: Optional[str] = None
+                                            ) -> Tuple[Optional[str], Optional[str], List[str], List[str]]:
+        """
+        주소 기반 전화/팩스 통합 검색 (첫 결과로 부족한 항목만 추가 검색)
+        라벨이 붙어 있던 번호 목록과 주변에 기관명이 있던 번호 목록도 함께 반환
+        """
         try:
-            if not org_name:
-                return None
+            if not org_name or not (self.parent_crawler and self.parent_crawler.search_available):
+                return None, None, [], []
             
-            # 지역 정보 추출
             region_info = self._extract_region_from_address(address)
-            search_query = f"{org_name} 전화번호"
+            planner = get_contact_query_planner()
             
-            if region_info:
-                search_query = f"{region_info} {org_name} 전화번호"
+            self.logger.info(f"🔍 연락처 통합 검색: {planner.build_combined_query(org_name, region_info)}")
             
-            self.logger.info(f"🔍 전화번호 검색: {search_query}")
+            # Selenium 검색은 블로킹이므로 스레드에서 실행
+            result = await asyncio.to_thread(
+                planner.search, self.parent_crawler.fetch_serp,
+                org_name, region_info, need_phone, need_fax
+            )
             
-            # Selenium으로 검색
-            if self.parent_crawler and self.parent_crawler.phone_driver:
-                from cralwer.phone_extractor import search_phone_number
-                found_phones = search_phone_number(self.parent_crawler.phone_driver, search_query)
-                
-                if found_phones:
-                    # 첫 번째 결과를 반환 (가장 관련성 높은 것으로 가정)
-                    phone = found_phones[0]
-                    
+            phone = None
+            if need_phone:
+                for candidate in result.phones:
                     # 지역번호 검증
-                    if self._validate_phone_by_region(phone, address):
-                        self.logger.info(f"✅ 전화번호 발견: {phone}")
-                        return phone
-                    else:
-                        self.logger.warning(f"⚠️ 지역번호 불일치: {phone} (주소: {address})")
-            
-            return None
-            
-        except Exception as e:
-            self.logger.warning(f"전화번호 검색 실패: {e}")
-            return None
-    
-    async def _search_fax_with_address(self, org_name: str, address: str, existing_phone: str) -> Optional[str]:
-        """주소 기반 팩스번호 검색 (전화번호와 중복 방지)"""
-        try:
-            if not org_name:
-                return None
-            
-            # 지역 정보 추출
-            region_info = self._extract_region_from_address(address)
-            search_query = f"{org_name} 팩스번호"
-            
-            if region_info:
-                search_query = f"{region_info} {org_name} 팩스번호"
-            
-            self.logger.info(f"📠 팩스번호 검색: {search_query}")
+                    if self._validate_phone_by_region(candidate, address):
+                        self.logger.info(f"✅ 전화번호 발견: {candidate}")
+                        phone = candidate
+                        break
+                    self.logger.warning(f"⚠️ 지역번호 불일치: {candidate} (주소: {address})")
             
-            # 팩스 추출기로 검색
-            if self.parent_crawler and self.parent_crawler.fax_extractor:
-                found_faxes = self.parent_crawler.fax_extractor.search_fax_number(org_name)
-                
-                for fax in found_faxes:
+            fax = None
+            if need_fax:
+                compare_phone = phone or existing_phone
+                for candidate in result.faxes:
                     # 전화번호와 중복 체크
-                    if not self._is_duplicate_number(fax, existing_phone):
-                        # 지역번호 검증
-                        if self._validate_phone_by_region(fax, address):
-                            self.logger.info(f"✅ 팩스번호 발견: {fax}")
-                            return fax
-                    else:
-                        self.logger.warning(f"⚠️ 팩스 지역번호 불일치: {fax}")
+                    if self._is_duplicate_number(candidate, compare_phone):
+                        continue
+                    # 지역번호 검증
+                    if self._validate_phone_by_region(candidate, address):
+                        self.logger.info(f"✅ 팩스번호 발견: {candidate}")
+                        fax = candidate
+                        break
+                    self.logger.warning(f"⚠️ 팩스 지역번호 불일치: {candidate}")
                 
-                self.logger.info("📠 중복되지 않는 팩스번호 없음")
+                if not fax:
+                    self.logger.info("📠 중복되지 않는 팩스번호 없음")
             
-            return None
+            return phone, fax, result.labeled, result.named
             
         except Exception as e:
-            self.logger.warning(f"팩스번호 검색 실패: {e}")
-            return None
+            self.logger.warning(f"연락처 통합 검색 실패: {e}")
+            return None, None, [], []
     
     def _extract_region_from_address(self, address: str) -> Optional[str]:
         """주소에서 지역 정보 추출"""
@@ -789,6 +790,17 @@ class EnhancedContactExtractionAgent(AIAgent):
         # settings.py의 is_phone_fax_duplicate 활용
         return is_phone_fax_duplicate(number1, number2)
     
+    def _is_conclusive(self, scored: ScoredContact, name_nearby: bool) -> bool:
+        """
+        규칙 기반 신뢰도가 임계값 이상이면 AI 검증 생략 (생략/실행 기록)
+        검색 결과의 번호는 다른 기관 스니펫일 수 있으므로 기관명이 번호 근처에 있을 때만 생략
+        """
+        conclusive = name_nearby and scored.confidence >= skip_threshold()
+        record_ai_decision("contact_verification", skipped=conclusive)
+        if conclusive:
+            self.logger.info(f"⚡ 규칙 기반 {scored.kind} 확정 (AI 검증 생략): {scored.value} ({scored.confidence})")
+        return conclusive
+    
     async def _verify_contact_with_ai(self, contact: str, org_name: str, contact_type: str) -> bool:
         """AI로 연락처 유효성 검증"""
         try:
@@ -810,7 +822,8 @@ class EnhancedContactExtractionAgent(AIAgent):
             """
             
             if self.ai_manager and self.ai_manager.gemini_model:
-                response = self.ai_manager.gemini_model.generate_content(prompt)
+                with ai_call_span("contact_verification", prompt):
+                    response = await asyncio.to_thread(self.ai_manager.gemini_model.generate_content, prompt)
                 response_text = response.text.strip()
                 
                 # 응답 파싱
@@ -848,6 +861,16 @@ class AIVerificationAgent(AIAgent):
         """AI 종합 검증"""
         try:
             org_name = context.organization.get('name', '')
+            
+            # 전화/팩스가 모두 규칙 기반으로 확정됐으면 AI 종합 검증 생략
+            deterministic = self._deterministic_verification(context)
+            record_ai_decision("comprehensive_verification", skipped=deterministic is not None)
+            if deterministic:
+                self.logger.info(f"⚡ [{self.name}] 규칙 기반 확정 연락처 - AI 종합 검증 생략: {org_name}")
+                context.ai_insights['verification'] = deterministic
+                context.current_stage = CrawlingStage.COMPLETION
+                return context
+            
             self.logger.info(f"🔍 [{self.name}] AI 종합 검증: {org_name}")
             
             # AI 종합 검증 실행
@@ -865,6 +888,21 @@ class AIVerificationAgent(AIAgent):
             self.logger.error(f"❌ [{self.name}] 오류: {e}")
             return context
     
+    def _deterministic_verification(self, context: CrawlingContext) -> Optional[Dict[str, Any]]:
+        """추출된 전화/팩스가 모두 임계값 이상의 규칙 기반 결과면 검증 결과 반환 (아니면 None)"""
+        scores = context.ai_insights.get('deterministic', {})
+        fields = [field for field in ('phone', 'fax') if context.extracted_data.get(field)]
+        if not fields or any(scores.get(field, 0.0) < skip_threshold() for field in fields):
+            return None
+        return {
+            'overall_validity': 'valid',
+            'phone_validity': 'valid' if 'phone' in fields else 'uncertain',
+            'fax_validity': 'valid' if 'fax' in fields else 'uncertain',
+            'homepage_validity': 'uncertain',
+            'confidence_score': min(scores[field] for field in fields),
+            'verification_method': 'deterministic'
+        }
+    
     async def _ai_comprehensive_verification(self, context: CrawlingContext) -> Dict[str, Any]:
         """AI 종합 검증"""
         try:
@@ -890,7 +928,10 @@ class AIVerificationAgent(AIAgent):
             """
             
             if self.ai_manager and self.ai_manager.gemini_model:
-                response = self.ai_manager.gemini_model.generate_content(verification_prompt)
+                with ai_call_span("comprehensive_verification", verification_prompt):
+                    response = await asyncio.to_thread(
+                        self.ai_manager.gemini_model.generate_content, verification_prompt
+                    )
                 response_text = response.text.strip()
                 
                                 # 응답 파싱
@@ -1031,8 +1072,8 @@ class ContactPageSearchAgent(AIAgent):
         try:
             self.logger.info(f"🔍 연락처 페이지 추출: {url}")
             
-            if self.parent_crawler and self.parent_crawler.homepage_parser:
-                page_data = self.parent_crawler.homepage_parser.extract_page_content(url)
+            if self.parent_crawler and self.parent_crawler.renderer_available:
+                page_data = await self.parent_crawler.extract_page_content_async(url)
                 if page_data and page_data.get('accessible') and page_data.get('text_content'):
                     page_text = page_data['text_content']
                     
@@ -1152,6 +1193,8 @@ class AIEnhancedModularUnifiedCrawler:
         self.config = config_override or CRAWLING_CONFIG
         self.logger = LoggerUtils.setup_crawler_logger("ai_enhanced_modular_crawler")
         self.progress_callback = progress_callback
+        # 페이지/검색 응답 기록/재생 (CRAWL_FIXTURE_MODE, 기본 off)
+        self.fixtures = FixtureFetcher()
         
         # AI 매니저 초기화
         try:
@@ -1167,6 +1210,9 @@ class AIEnhancedModularUnifiedCrawler:
         self.contact_validator = None
         self.ai_validator = None
         self.database = None
+        # 드라이버는 인스턴스당 1개라 동시 처리 중인 기관들이 잠금으로 순서대로 사용
+        self.phone_driver_lock = threading.Lock()
+        self.homepage_driver_lock = threading.Lock()
         
         # AI 에이전트들 초기화 (수정: parent_crawler 전달)
         self.ai_agents = []
@@ -1201,46 +1247,141 @@ class AIEnhancedModularUnifiedCrawler:
             "end_time": None,
             "agent_stats": {agent.name: {"executed": 0, "success": 0} for agent in self.ai_agents}
         }
+        METRICS.mapping("crawler_stats", "AI 강화 크롤러 통계 (self.stats 숫자 항목)", lambda: self.stats)
         
         self.logger.info("🚀 AI 강화 모듈러 크롤러 초기화 완료")
     
+    @property
+    def search_available(self) -> bool:
+        """검색 결과를 가져올 수 있는지 (전화번호 드라이버 또는 재생 모드)"""
+        return self.phone_driver is not None or self.fixtures.replaying
+    
+    @property
+    def renderer_available(self) -> bool:
+        """JS 렌더링 페이지를 가져올 수 있는지 (홈페이지 파서 또는 재생 모드)"""
+        return self.homepage_parser is not None or self.fixtures.replaying
+    
+    def fetch_serp(self, query: str) -> Optional[str]:
+        """공유 전화번호 드라이버로 검색 결과 로드 (스레드에서 호출, 드라이버 잠금)"""
+        with TRACER.span("search.serp", {"search.query": query,
+                                         "fixture.replay": self.fixtures.replaying}) as span:
+            if self.fixtures.replaying:
+                with FETCH_SECONDS.labels("serp").time():
+                    text = self.fixtures.serp(query)
+            else:
+                with self.phone_driver_lock:
+                    text = timed_serp_fetch(self.phone_driver, query)
+                self.fixtures.record_serp(query, text)
+            span.set_attributes({"search.success": text is not None, "response.chars": len(text or "")})
+            return text
+    
+    def fetch_page(self, url: str) -> Tuple[Any, str]:
+        """HTTP로 페이지 본문 로드 (스레드에서 호출) - (본문, 최종 URL), 실패 시 예외"""
+        import requests
+        
+        with TRACER.span("fetch.page", {"url.domain": urlparse(url).netloc,
+                                        "fixture.replay": self.fixtures.replaying}) as span:
+            with FETCH_SECONDS.labels("requests").time():
+                if self.fixtures.replaying:
+                    content, final_url = self.fixtures.page(url)
+                    span.set_attribute("response.bytes", len(content))
+                    return content, final_url
+                response = requests.get(url, headers=REQUEST_HEADERS, timeout=30)
+            span.set_attributes({"http.status_code": response.status_code, "response.bytes": len(response.content)})
+            response.raise_for_status()
+            final_url = response.url or url
+            if self.fixtures.recording:
+                self.fixtures.record_page(url, response.text, final_url, response.status_code)
+            return response.content, final_url
+    
+    async def extract_page_content_async(self, url: str) -> Dict[str, Any]:
+        """
+        extract_page_content의 비동기 버전
+        도메인 간격은 이벤트 루프에서 기다린 뒤 드라이버를 잡으므로, 한 기관의 간격 대기가
+        다른 호스트로 가는 기관의 렌더링을 막지 않음
+        """
+        if not self.fixtures.replaying:
+            await get_politeness_scheduler().wait_async(url)
+        return await asyncio.to_thread(self.extract_page_content, url, True)
+    
+    def extract_page_content(self, url: str, reserved: bool = False) -> Dict[str, Any]:
+        """
+        공유 홈페이지 파서로 페이지 추출 (스레드에서 호출, 드라이버 잠금)
+        reserved=False면 드라이버 잠금 전에 도메인 간격을 기다림 (잠금을 쥔 채로 대기하지 않음)
+        """
+        with TRACER.span("fetch.rendered", {"url.domain": urlparse(url).netloc,
+                                            "fixture.replay": self.fixtures.replaying}) as span:
+            if self.fixtures.replaying:
+                with FETCH_SECONDS.labels("selenium").time():
+                    page_data = self.fixtures.rendered(url)
+            else:
+                recording = self.fixtures.recording
+                if not reserved:
+                    get_politeness_scheduler().wait(url)
+                with self.homepage_driver_lock:
+                    with FETCH_SECONDS.labels("selenium").time():
+                        # 기록 모드는 렌더링된 HTML을 fixture에 남겨야 하므로 파서가 해제하지 않도록 요청
+                        # (도메인 간격은 위에서 확보했으므로 파서는 대기하지 않음)
+                        page_data = self.homepage_parser.extract_page_content(url, keep_html=recording,
+                                                                              delay=False)
+                if recording:
+                    if page_data.get('accessible'):
+                        self.fixtures.record_rendered(url, page_data.get('text_content', ''),
+                                                      page_data.get('raw_html', ''))
+                    # 기록 후에는 평소처럼 원본 HTML 해제
+                    if not HTML_PARSE_CONFIG.get("capture_raw_html", False):
+                        page_data['raw_html'] = ""
+                        if page_data.get('document') is not None:
+                            page_data['document'].html = ""
+            span.set_attributes({"page.accessible": bool(page_data.get('accessible')),
+                                 "response.chars": len(page_data.get('text_content') or "")})
+            return page_data
+    
     def initialize_modules(self):
         """전문 모듈들 초기화 (기존 로직 유지)"""
         try:
             self.logger.info("🔧 전문 모듈들 초기화 시작...")
             
+            # 재생 모드는 fixture 코퍼스가 검색/렌더링을 대신하므로 브라우저 모듈을 띄우지 않음
+            use_browser = not self.fixtures.replaying
+            if not use_browser:
+                self.logger.info(f"📼 fixture 재생 모드 - 브라우저 모듈 생략 ({self.fixtures.corpus.root})")
+            
             # 1. 팩스 추출기 초기화
-            if FAX_EXTRACTOR_AVAILABLE:
+            if use_browser and OPTIONAL_MODULES.available("fax_extractor"):
                 try:
-                    self.fax_extractor = FaxExtractor()
+                    self.fax_extractor = OPTIONAL_MODULES.load("fax_extractor")()
                     self.logger.info("✅ 팩스 추출기 초기화 성공")
                 except Exception as e:
                     self.logger.error(f"❌ 팩스 추출기 초기화 실패: {e}")
                     self.fax_extractor = None
             
             # 2. 전화번호 추출기 초기화 (Selenium 드라이버)
-            if PHONE_EXTRACTOR_AVAILABLE:
+            if use_browser and OPTIONAL_MODULES.available("phone_driver"):
                 try:
-                    self.phone_driver = setup_driver()
+                    self.phone_driver = OPTIONAL_MODULES.load("phone_driver")()
+                    if self.phone_driver:
+                        WEBDRIVERS_CREATED.labels("phone_extractor").inc()
+                        WEBDRIVERS_ACTIVE.labels("phone_extractor").inc()
                     self.logger.info("✅ 전화번호 추출기 드라이버 초기화 성공")
                 except Exception as e:
                     self.logger.error(f"❌ 전화번호 추출기 초기화 실패: {e}")
                     self.phone_driver = None
             
             # 3. 홈페이지 파서 초기화
-            if URL_EXTRACTOR_AVAILABLE:
+            if use_browser and OPTIONAL_MODULES.available("homepage_parser"):
                 try:
-                    self.homepage_parser = HomepageParser(headless=True)
+                    self.homepage_parser = OPTIONAL_MODULES.load("homepage_parser")(headless=True)
                     self.logger.info("✅ 홈페이지 파서 초기화 성공")
                 except Exception as e:
                     self.logger.error(f"❌ 홈페이지 파서 초기화 실패: {e}")
                     self.homepage_parser = None
             
             # 4. 검증기 초기화
-            if VALIDATOR_AVAILABLE:
+            if OPTIONAL_MODULES.available("contact_validator"):
                 try:
-                    self.contact_validator = ContactValidator()
-                    self.ai_validator = AIValidator()
+                    self.contact_validator = OPTIONAL_MODULES.load("contact_validator")()
+                    self.ai_validator = OPTIONAL_MODULES.load("ai_validator")()
                     self.logger.info("✅ 연락처 검증기 초기화 성공")
                 except Exception as e:
                     self.logger.error(f"❌ 검증기 초기화 실패: {e}")
@@ -1248,9 +1389,9 @@ class AIEnhancedModularUnifiedCrawler:
                     self.ai_validator = None
             
             # 5. 데이터베이스 초기화
-            if DATABASE_AVAILABLE:
+            if self.config.get("save_to_database", True) and OPTIONAL_MODULES.available("database"):
                 try:
-                    self.database = get_database()
+                    self.database = OPTIONAL_MODULES.load("database")()
                     self.logger.info("✅ 데이터베이스 연결 성공")
                 except Exception as e:
                     self.logger.error(f"❌ 데이터베이스 연결 실패: {e}")
@@ -1275,28 +1416,40 @@ class AIEnhancedModularUnifiedCrawler:
         # 모듈 초기화
         self.initialize_modules()
         
-        self.logger.info(f"📊 총 {len(organizations)}개 조직 AI 강화 처리 시작")
+        # 동시 처리 기관 수는 지연/오류율/메모리 여유에 따라 적응형 한도가 조정
+        limit = get_adaptive_limit("crawler_organizations")
+        self.logger.info(f"📊 총 {len(organizations)}개 조직 AI 강화 처리 시작 (동시 처리 한도: {limit.limit})")
         
-        results = []
+        # 기관 수만큼 태스크를 미리 만들지 않도록 한도 최대치만큼의 워커가 이터레이터에서 하나씩 가져감
+        # 결과는 입력 위치에 기록하므로 결과 순서는 기존과 동일
+        results: List[Optional[Dict]] = [None] * len(organizations)
+        pending = enumerate(organizations)
+        
+        async def worker():
+            for position, org in pending:
+                i = position + 1
+                async with limit.slot() as slot:
+                    try:
+                        # AI 에이전트를 사용한 단일 조직 처리
+                        processed_org = await self.process_single_organization_with_ai(org, i)
+                        
+                        self.stats["successful"] += 1
+                        if processed_org.get('ai_enhanced'):
+                            self.stats["ai_enhanced"] += 1
+                        
+                        # 조직 간 고정 딜레이 없음 - 요청 간격은 호스트별 스케줄러가 관리
+                        results[position] = processed_org
+                        
+                    except Exception as e:
+                        self.logger.error(f"❌ 조직 처리 실패 [{i}]: {org.get('name', 'Unknown')} - {e}")
+                        self.stats["failed"] += 1
+                        slot.mark("error")
+                        results[position] = org
         
         try:
-            for i, org in enumerate(organizations, 1):
-                try:
-                    # AI 에이전트를 사용한 단일 조직 처리
-                    processed_org = await self.process_single_organization_with_ai(org, i)
-                    results.append(processed_org)
-                    
-                    self.stats["successful"] += 1
-                    if processed_org.get('ai_enhanced'):
-                        self.stats["ai_enhanced"] += 1
-                    
-                    # 딜레이
-                    await asyncio.sleep(self.config.get("default_delay", 2))
-                    
-                except Exception as e:
-                    self.logger.error(f"❌ 조직 처리 실패 [{i}]: {org.get('name', 'Unknown')} - {e}")
-                    self.stats["failed"] += 1
-                    results.append(org)
+            # 에이전트/파서의 print는 로그 큐로 보내 콘솔 기록이 처리 경로를 막지 않도록 함
+            with route_prints():
+                await asyncio.gather(*(worker() for _ in range(min(limit.max_limit, len(organizations)))))
         
         finally:
             # 모듈 정리
@@ -1308,7 +1461,32 @@ class AIEnhancedModularUnifiedCrawler:
         return results
     
     async def process_single_organization_with_ai(self, org: Dict, index: int) -> Dict:
-        """AI 에이전트를 사용한 단일 조직 처리"""
+        """AI 에이전트를 사용한 단일 조직 처리 (기관 1건 = 트레이스 1개)"""
+        attributes = {
+            "org.id": org.get('db_id') or org.get('id'),
+            "org.name": org.get('name'),
+            "org.index": index,
+            "url.domain": urlparse(org.get('homepage') or '').netloc or None
+        }
+        with TRACER.span("organization", attributes):
+            return await self._process_single_organization_with_ai(org, index)
+    
+    def _report_progress(self, org: Dict, status: str, current_step: str, **extra):
+        """진행 콜백 호출 (콜백 오류가 기관 처리를 중단시키지 않도록)"""
+        if not self.progress_callback:
+            return
+        try:
+            self.progress_callback({
+                'status': status,
+                'name': org.get('name'),
+                'category': org.get('category'),
+                'current_step': current_step,
+                **extra
+            })
+        except Exception as e:
+            self.logger.debug(f"진행 콜백 오류: {e}")
+    
+    async def _process_single_organization_with_ai(self, org: Dict, index: int) -> Dict:
         start_time = time.time()
         
         try:
@@ -1339,7 +1517,14 @@ class AIEnhancedModularUnifiedCrawler:
                 try:
                     if await agent.should_execute(context):
                         self.logger.info(f"🔄 에이전트 실행: {agent.name}")
-                        context = await agent.execute(context)
+                        self._report_progress(org, 'PROCESSING', agent.name)
+                        stage_start = time.perf_counter()
+                        try:
+                            with TRACER.span(f"agent.{agent.name}", {"stage": context.current_stage.value}), \
+                                    STAGE_SECONDS.labels(agent.name).time():
+                                context = await agent.execute(context)
+                        finally:
+                            context.stage_timings[agent.name] = round(time.perf_counter() - stage_start, 3)
                     else:
                         self.logger.info(f"⏭️ 에이전트 건너뛰기: {agent.name}")
                 except Exception as e:
@@ -1358,8 +1543,13 @@ class AIEnhancedModularUnifiedCrawler:
             # 전통적인 모듈로 보완
             await self._supplement_with_traditional_modules(result, context)
             
+            # 단계별 스팬 요약 (트레이싱 활성화 + 샘플링된 경우만)
+            trace = TRACER.trace_summary()
+            if trace:
+                result['processing_metadata']['trace'] = trace
+            
             # 여기에 즉시 저장 로직 추가
-            if DATABASE_AVAILABLE:
+            if self.config.get("save_to_database", True) and OPTIONAL_MODULES.available("database"):
                 try:
                     # 데이터베이스에 즉시 저장
                     saved_result = await self.save_to_database(result)
@@ -1373,16 +1563,33 @@ class AIEnhancedModularUnifiedCrawler:
                                 'name': org.get('name'),
                                 'current_step': 'DB_SAVE',
                                 'processing_time': time.time() - start_time,
+                                'stage_timings': context.stage_timings,
+                                'trace': TRACER.trace_summary() or None,
                                 **saved_result
                             })
                 except Exception as e:
                     self.logger.error(f"❌ 기관 정보 저장 실패: {e}")
+            elif not self.config.get("save_to_database", True):
+                # DB 저장을 호출 측이 맡는 경우 (상주 런타임/보강 서비스) - 완료 상태만 알림
+                self._report_progress(
+                    org, 'COMPLETED', 'DONE',
+                    processing_time=time.time() - start_time,
+                    homepage_url=result.get('homepage', ''),
+                    **{field: result.get(field, '') for field in ('phone', 'fax', 'email', 'mobile', 'address')}
+                )
             
+            ORGANIZATIONS_TOTAL.labels("success").inc()
             return result
             
         except Exception as e:
             self.logger.error(f"❌ 기관 처리 실패: {e}")
+            ORGANIZATIONS_TOTAL.labels("failure").inc()
+            self._report_progress(org, 'FAILED', 'ERROR', processing_time=time.time() - start_time,
+                                  error_message=str(e))
             return org
+        
+        finally:
+            ORGANIZATION_SECONDS.observe(time.time() - start_time)
     
     def _combine_ai_results(self, original_org: Dict, context: CrawlingContext) -> Dict:
         """AI 결과 조합"""
@@ -1403,6 +1610,7 @@ class AIEnhancedModularUnifiedCrawler:
             'errors': context.error_log,
             'extraction_method': 'ai_enhanced_modular',
             'ai_enhanced': True,
+            'stage_timings': context.stage_timings,
             'timestamp': datetime.now().isoformat()
         }
         
@@ -1414,33 +1622,36 @@ class AIEnhancedModularUnifiedCrawler:
             org_name = result.get('name', 'Unknown')
             self.logger.info(f"🔧 기존 모듈로 보완 처리: {org_name}")
             
-            # 전화번호가 없거나 신뢰도가 낮으면 기존 모듈로 추가 시도
+            # 전화/팩스가 없거나 신뢰도가 낮으면 통합 검색으로 추가 시도
+            # (에이전트 단계와 같은 쿼리는 플래너 캐시를 사용하므로 재검색 없음)
             phone_confidence = context.confidence_scores.get('phone', 0.0)
-            if (not result.get('phone') or phone_confidence < 0.7) and self.phone_driver:
+            fax_confidence = context.confidence_scores.get('fax', 0.0)
+            need_phone = not result.get('phone') or phone_confidence < 0.7
+            need_fax = not result.get('fax') or fax_confidence < 0.7
+            
+            if (need_phone or need_fax) and self.search_available:
                 try:
-                    self.logger.info(f"📞 전화번호 검색 시도: {org_name}")
-                    found_phones = search_phone_number(self.phone_driver, org_name)
-                    if found_phones:
+                    self.logger.info(f"📞📠 연락처 통합 검색 시도: {org_name}")
+                    planner = get_contact_query_planner()
+                    region_info = planner.extract_region(result.get('address', ''))
+                    found = await asyncio.to_thread(
+                        planner.search, self.fetch_serp,
+                        org_name, region_info, need_phone, need_fax
+                    )
+                    
+                    if need_phone and found.phones:
                         # 가장 적절한 전화번호 선택
-                        best_phone = self._select_best_phone_number(found_phones, result.get('address', ''))
+                        best_phone = self._select_best_phone_number(found.phones, result.get('address', ''))
                         if best_phone:
                             result['phone'] = best_phone
                             result['phone_source'] = 'traditional_module_supplement'
                             result['phone_confidence'] = 0.8  # 검색 결과 신뢰도
                             self.stats["phone_extracted"] += 1
                             self.logger.info(f"✅ 전화번호 보완 성공: {best_phone}")
-                except Exception as e:
-                    self.logger.warning(f"전화번호 보완 실패: {e}")
-            
-            # 팩스번호가 없거나 신뢰도가 낮으면 기존 모듈로 추가 시도
-            fax_confidence = context.confidence_scores.get('fax', 0.0)
-            if (not result.get('fax') or fax_confidence < 0.7) and self.fax_extractor:
-                try:
-                    self.logger.info(f"📠 팩스번호 검색 시도: {org_name}")
-                    found_faxes = self.fax_extractor.search_fax_number(org_name)
-                    if found_faxes:
+                    
+                    if need_fax and found.faxes:
                         # 전화번호와 중복되지 않는 팩스번호 선택
-                        best_fax = self._select_best_fax_number(found_faxes, result.get('phone', ''))
+                        best_fax = self._select_best_fax_number(found.faxes, result.get('phone', ''))
                         if best_fax:
                             result['fax'] = best_fax
                             result['fax_source'] = 'traditional_module_supplement'
@@ -1448,7 +1659,7 @@ class AIEnhancedModularUnifiedCrawler:
                             self.stats["fax_extracted"] += 1
                             self.logger.info(f"✅ 팩스번호 보완 성공: {best_fax}")
                 except Exception as e:
-                    self.logger.warning(f"팩스번호 보완 실패: {e}")
+                    self.logger.warning(f"연락처 보완 실패: {e}")
             
             # 홈페이지가 없으면 기존 모듈로 추가 시도
             if not result.get('homepage') and self.homepage_parser:
@@ -1543,6 +1754,7 @@ class AIEnhancedModularUnifiedCrawler:
                     self.phone_driver.quit()
                 except:
                     pass
+                WEBDRIVERS_ACTIVE.labels("phone_extractor").dec()
             
             if self.homepage_parser:
                 try:
@@ -1558,11 +1770,11 @@ class AIEnhancedModularUnifiedCrawler:
     async def save_to_database(self, org_data: Dict) -> Optional[Dict]:
         """크롤링 결과를 데이터베이스에 저장/업데이트 (개선된 버전)"""
         try:
-            if not DATABASE_AVAILABLE:
+            get_database = OPTIONAL_MODULES.load("database")
+            if get_database is None:
                 self.logger.warning("데이터베이스 모듈을 사용할 수 없습니다")
                 return None
             
-            from database.database import get_database
             db = get_database()
             
             # DB ID가 있으면 업데이트, 없으면 새로 생성
@@ -1617,6 +1829,8 @@ class AIEnhancedModularUnifiedCrawler:
                     'email_source': org_data.get('email_source', '')
                 },
                 'processing_time': org_data.get('processing_metadata', {}).get('processing_time', 0),
+                'stage_timings': org_data.get('processing_metadata', {}).get('stage_timings', {}),
+                'trace': org_data.get('processing_metadata', {}).get('trace'),
                 'error_count': len(org_data.get('processing_metadata', {}).get('errors', [])),
                 'changes_made': changes_made
             }
@@ -1629,7 +1843,8 @@ class AIEnhancedModularUnifiedCrawler:
             
             if db_id:
                 # 기존 조직 업데이트
-                success = db.update_organization(db_id, update_data, 'crawler_system')
+                with TRACER.span("db.update", {"org.id": db_id}), DB_WRITE_SECONDS.labels("update").time():
+                    success = db.update_organization(db_id, update_data, 'crawler_system')
                 if success:
                     self.stats["saved_to_db"] += 1
                     self.logger.info(f"✅ 조직 업데이트 완료: {org_name} (ID: {db_id})")
@@ -1659,7 +1874,8 @@ class AIEnhancedModularUnifiedCrawler:
                     'lead_source': 'CRAWLER'
                 }
                 
-                new_id = db.create_organization(org_data_for_db)
+                with TRACER.span("db.create", {"org.name": org_name}), DB_WRITE_SECONDS.labels("create").time():
+                    new_id = db.create_organization(org_data_for_db)
                 if new_id:
                     self.stats["saved_to_db"] += 1
                     self.logger.info(f"✅ 새 조직 생성 완료: {org_name} (ID: {new_id})")
@@ -1733,6 +1949,36 @@ class AIEnhancedModularUnifiedCrawler:
             success = stats["success"]
             success_rate = (success / executed * 100) if executed > 0 else 0
             print(f"  - {agent_name}: {executed}회 실행, {success}회 성공 ({success_rate:.1f}%)")
+
+        # 규칙 기반 확정으로 생략한 AI 단계
+        skip_stats = get_ai_skip_stats()
+        if skip_stats:
+            print(f"\n⚡ AI 단계 생략률 (규칙 기반 신뢰도 ≥ {skip_threshold()}):")
+            for stage, stats in skip_stats.items():
+                print(f"  - {stage}: {stats['skipped']}회 생략 / {stats['called']}회 호출 "
+                      f"({stats['skip_rate'] * 100:.1f}%)")
+
+        # 트레이싱 (활성화된 경우)
+        if TRACER.enabled:
+            trace_stats = TRACER.get_stats()
+            print(f"\n🔭 트레이싱: 트레이스 {trace_stats['traces']}개, 스팬 {trace_stats['spans']}개 "
+                  f"(샘플링 {trace_stats['sample_rate']:.0%}, 제외 {trace_stats['unsampled']}개, "
+                  f"내보내기 {trace_stats['exporter']})")
+        
+        # 비동기 로그 파이프라인 (반복 메시지 생략/큐 초과 버림)
+        if LOGGING_CONFIG.get("async"):
+            log_stats = get_log_pipeline().get_stats()
+            print(f"\n📝 로그 파이프라인: 반복 생략 {log_stats['suppressed']}건, 큐 초과 버림 {log_stats['dropped']}건")
+        
+        # 구간별 지연 시간 (p50/p95/p99)
+        print(f"\n⏱️ 지연 시간 분포:")
+        for family in (ORGANIZATION_SECONDS, STAGE_SECONDS, FETCH_SECONDS, AI_CALL_SECONDS, DB_WRITE_SECONDS):
+            for labels, histogram in family.children():
+                summary = histogram.summary()
+                if summary['count']:
+                    label = "/".join(labels.values()) or "전체"
+                    print(f"  - {family.name}[{label}]: {summary['count']}회, "
+                          f"p50 {summary['p50']:.2f}s, p95 {summary['p95']:.2f}s, p99 {summary['p99']:.2f}s")
         
         print("="*80)
     
@@ -1917,7 +2163,7 @@ async def main():
         crawler = AIEnhancedModularUnifiedCrawler()
         
         # 데이터베이스에서 미처리 조직 가져오기
-        db = get_database()  # ChurchCRMDatabase 인스턴스 가져오기
+        db = OPTIONAL_MODULES.load("database")()  # ChurchCRMDatabase 인스턴스 가져오기
         
         # AI 크롤링이 필요한 조직들 조회 (ai_crawled가 False이거나 NULL인 경우)
         # get_organizations_for_ai_crawling 메서드가 없으므로 기존 메서드 사용
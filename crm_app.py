@@ -10,6 +10,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'test'))
 
+import asyncio
 import uvicorn
 import logging
 from datetime import datetime
@@ -35,8 +36,21 @@ except ImportError:
     statistics_router = None
     user_router = None
 
+try:
+    from api.dedup_api import router as dedup_router
+except ImportError:
+    dedup_router = None
+
+try:
+    from api.metrics_api import router as metrics_router, record_http_metrics
+except ImportError:
+    metrics_router = None
+    record_http_metrics = None
+
 from database.database import get_database
+from services.crawler_runtime import get_crawler_runtime
 from services.organization_service import OrganizationService, OrganizationSearchFilter
+from services.progress_bus import get_progress_bus
 try:
     from services.contact_enrichment_service import ContactEnrichmentService
 except ImportError:
@@ -80,9 +94,25 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ 상세 오류: {traceback.format_exc()}")
         raise
     
+    # 진행 상황 버스 - 여러 워커 구성이면 다른 워커의 진행 이벤트를 LISTEN으로 수신
+    progress_bus = get_progress_bus()
+    if progress_bus.start_listener():
+        logger.info("📡 진행 상황 NOTIFY 팬아웃 활성화")
+    
+    # 상주 크롤러 런타임 - 백그라운드로 미리 띄워 첫 보강 요청의 드라이버/모듈 초기화 대기를 없앰
+    crawler_runtime = get_crawler_runtime()
+    warmup_task = None
+    if CRAWLER_RUNTIME_CONFIG.get("warm_on_startup", True):
+        warmup_task = asyncio.create_task(crawler_runtime.start())
+        logger.info("🔥 크롤러 런타임 워밍업 시작 (백그라운드)")
+    
     yield
     
     # 종료 시
+    if warmup_task is not None and not warmup_task.done():
+        await warmup_task
+    await crawler_runtime.stop()
+    progress_bus.stop()
     logger.info("⏹️ CRM 애플리케이션 종료")
 
 # FastAPI 애플리케이션 생성
@@ -103,6 +133,8 @@ app = FastAPI(
     - `/api/organizations`: 기관 관리 API
     - `/api/enrichment`: 연락처 보강 API
     - `/api/users`: 사용자 관리 API
+    - `/api/dedup`: 중복 기관 검토 API
+    - `/metrics`: Prometheus 메트릭
     - `/dashboard`: 웹 대시보드
     """,
     version="2.0.0",
@@ -122,6 +154,9 @@ app.add_middleware(
 
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+if record_http_metrics:
+    app.middleware("http")(record_http_metrics)
+
 # 정적 파일 및 템플릿 설정
 app.mount("/templates", StaticFiles(directory="templates"), name="templates")
 templates = Jinja2Templates(directory="templates")
@@ -135,6 +170,10 @@ if statistics_router:
     app.include_router(statistics_router)
 if user_router:
     app.include_router(user_router)
+if dedup_router:
+    app.include_router(dedup_router)
+if metrics_router:
+    app.include_router(metrics_router)
 
 # ==================== 웹 인터페이스 라우트 ====================
 
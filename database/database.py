@@ -15,8 +15,16 @@ from contextlib import contextmanager
 from typing import Optional, List, Dict, Any, Tuple
 from dotenv import load_dotenv
 
+from utils.metrics import get_metrics_registry
+
 load_dotenv()
 
+# 커넥션 풀이 없어 연결 획득 = 새 연결 수립 (풀 대기 시간에 해당하는 지표)
+METRICS = get_metrics_registry()
+DB_CONNECT_SECONDS = METRICS.histogram("db_connect_seconds", "PostgreSQL 연결 획득 시간")
+DB_CONNECTIONS_ACTIVE = METRICS.gauge("db_connections_active", "사용 중인 PostgreSQL 연결 수")
+DB_CONNECT_ERRORS = METRICS.counter("db_connect_errors_total", "PostgreSQL 연결 실패 수")
+
 class ChurchCRMDatabase:
     """PostgreSQL 기반 CRM 데이터베이스 클래스"""
     
@@ -41,7 +49,13 @@ class ChurchCRMDatabase:
     @contextmanager
     def get_connection(self):
         """PostgreSQL 연결 관리"""
-        conn = psycopg2.connect(self.db_url)
+        try:
+            with DB_CONNECT_SECONDS.time():
+                conn = psycopg2.connect(self.db_url)
+        except Exception:
+            DB_CONNECT_ERRORS.inc()
+            raise
+        DB_CONNECTIONS_ACTIVE.inc()
         try:
             yield conn
         except Exception:
@@ -49,6 +63,7 @@ class ChurchCRMDatabase:
             raise
         finally:
             conn.close()
+            DB_CONNECTIONS_ACTIVE.dec()
     
     def execute_query(self, query: str, params: Tuple = None, fetch_all: bool = True) -> List[Dict[str, Any]]:
         """PostgreSQL 쿼리 실행 (딕셔너리 결과 반환)"""
@@ -225,6 +240,16 @@ class ChurchCRMDatabase:
                 'recent_activities': 0
             }
 
+    def find_organization_by_name(self, name: str) -> Optional[int]:
+        """활성 기관 중 이름이 같은 기관 ID (없으면 None)"""
+        if not name or not name.strip():
+            return None
+        row = self.execute_query(
+            "SELECT id FROM organizations WHERE name = %s AND is_active = true ORDER BY id LIMIT 1",
+            (name.strip(),), fetch_all=False
+        )
+        return row['id'] if row else None
+
 def get_database() -> ChurchCRMDatabase:
     """데이터베이스 인스턴스 반환"""
     return ChurchCRMDatabase()
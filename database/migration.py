@@ -19,6 +19,8 @@ from datetime import datetime, timedelta
 from contextlib import contextmanager
 from pathlib import Path
 
+from database.org_index import OrganizationIndex
+
 import logging
 import sys
 
@@ -532,6 +534,10 @@ class AIAgenticDataMigrator:
             "errors": []
         }
     
+        # 중복 체크용 인메모리 인덱스 (기존 기관 1회 적재 후 추가분만 반영)
+        self.org_index = OrganizationIndex()
+        self._load_org_index()
+    
         # AI 분석 결과
         self.analyses = []
         self.integration_strategy = None
@@ -769,36 +775,34 @@ class AIAgenticDataMigrator:
             'created_by': 'AI_MIGRATION'
         }
     
-    def is_duplicate_by_address(self, org_data: Dict[str, Any]) -> bool:
-        """주소 기반 중복 체크"""
+    def _load_org_index(self):
+        """기존 활성 기관을 인덱스에 스트리밍 적재 (행 단위 커서 순회)"""
         try:
             with sqlite3.connect(self.db.db_path) as conn:
-                address = org_data.get('address', '').strip()
-                name = org_data.get('name', '').strip()
-                
-                if not name:
-                    return False
-                
-                if address:
-                    # 주소와 상호명이 모두 같은 경우
-                    existing = conn.execute('''
-                    SELECT COUNT(*) FROM organizations 
-                    WHERE address = ? AND name = ? AND is_active = 1
-                    ''', (address, name)).fetchone()[0]
-                else:
-                    # 주소가 없으면 상호명 + 전화번호로 체크
-                    phone = org_data.get('phone', '').strip()
-                existing = conn.execute('''
-                SELECT COUNT(*) FROM organizations 
-                    WHERE name = ? AND phone = ? AND is_active = 1
-                    ''', (name, phone)).fetchone()[0]
-                
-                return existing > 0
-                
+                count = self.org_index.load_rows(conn.execute(
+                    "SELECT id, name, address, phone FROM organizations WHERE is_active = 1"
+                ))
+            ai_logger.info(f"📇 중복 체크 인덱스 적재: {count:,}개")
+        except Exception as e:
+            print(f"⚠️  중복 체크 인덱스 적재 실패: {e}")
+    
+    def is_duplicate_by_address(self, org_data: Dict[str, Any]) -> bool:
+        """주소 기반 중복 체크 (주소 없으면 상호명 + 전화번호)"""
+        try:
+            return self.org_index.is_duplicate(
+                org_data.get('name', '').strip(),
+                org_data.get('address', '').strip(),
+                org_data.get('phone', '').strip()
+            )
         except Exception as e:
             print(f"⚠️  중복 체크 실패: {e}")
             return False
     
+    def _index_created_organization(self, org_id: int, org_data: Dict[str, Any]):
+        """새로 추가한 기관을 인덱스에 반영 (같은 배치 내 중복 방지)"""
+        if org_id:
+            self.org_index.upsert(org_id, org_data.get('name', ''), org_data.get('address', ''), org_data.get('phone', ''))
+    
     def migrate_all_sources(self, batch_size: int = 1000) -> bool:
         """모든 소스 통합 마이그레이션"""
         ai_logger.info("🚀 통합 데이터 마이그레이션 시작")
@@ -852,6 +856,7 @@ class AIAgenticDataMigrator:
                         continue
                     
                     org_id = self.db.create_organization(org_data)
+                    self._index_created_organization(org_id, org_data)
                     
                     if org_id:
                         self.stats["successfully_migrated"] += 1
@@ -892,6 +897,7 @@ class AIAgenticDataMigrator:
                         continue
                     
                     org_id = self.db.create_organization(org_data)
+                    self._index_created_organization(org_id, org_data)
                     
                     if org_id:
                         self.stats["successfully_migrated"] += 1
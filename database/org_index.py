@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기관 인메모리 인덱스
+진행 콜백/마이그레이션에서 건마다 DB를 조회하던 기관명·주소·전화번호 매칭을
+프로세스 내 컴팩트 인덱스로 대체 (기관명 / 전화번호 / 중복 조회 모두 마이크로초 단위)
+
+저장 구조 (행 위치 기준 컬럼 배열)
+- ids: array('q')             기관 ID (삭제 시 -1)
+- names: list[str]             정규화 기관명 (sys.intern)
+- regions: array('H')          지역번호 정수 (02 -> 2, 031 -> 31, 미상 0)
+- phones: array('q')           전화번호 숫자 (앞자리 0 제외 정수, 없음 0)
+- address_hashes: array('q')   정규화 주소 해시 (없음 0)
+보조 인덱스: ID -> 위치, 기관명 -> 위치, 전화번호 -> 위치
+수정/삭제된 위치는 ID를 -1로 표시하고, 삭제 표시가 전체의 1/4을 넘으면 배열을 다시 채워 압축
+
+메모리 예산 (218k 행 기준, python 3.11 / 64bit)
+- 컬럼 배열: 행당 약 34B (8 + 8 + 8 + 2 + 리스트 포인터 8)   -> 약 7MB
+- 정규화 기관명 문자열: 평균 6~7자 한글 약 88B                  -> 약 19MB
+- 보조 딕셔너리 3개 (ID/기관명/전화) + 위치·ID·전화 int 객체    -> 약 45~50MB
+- 측정: 합성 행 218k개(기관명 "사랑12345교회" 형태, 시/도 주소, 지역번호 전화)를 load_rows로 적재하고
+  tracemalloc.start() 이후 get_traced_memory()의 current 값 → 약 73MB (기관명 길이/중복 분포에 따라 78MB 정도까지)
+- get_stats()["memory_mb"]는 sys.getsizeof 합계 추정치 (dict 항목이 가리키는 int 객체 등 제외, 같은 데이터에서 약 51MB)
+- 예산 상한 80MB (tracemalloc 기준)
+"""
+
+import json
+import re
+import select
+import sys
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.phone_normalizer import get_phone_normalizer
+from utils.settings import REGION_TO_AREA_CODE
+
+# 법인 형태 표기 / 괄호 내용 / 기호 제거용 패턴
+LEGAL_FORM_PATTERN = re.compile(r'\((?:재|사|주|유|복|학)\)|재단법인|사단법인|사회복지법인|학교법인|주식회사')
+BRACKET_PATTERN = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+NON_WORD_PATTERN = re.compile(r'[^0-9a-z가-힣]')
+
+# 지역명 -> 지역번호 정수, 부분 일치는 긴 지역명 우선 (서울특별시 > 서울시 > 서울)
+_REGION_CODES = {region: int(codes[0]) for region, codes in REGION_TO_AREA_CODE.items()}
+_REGION_NAMES = sorted(_REGION_CODES, key=len, reverse=True)
+
+CHANGE_CHANNEL = "organizations_changed"
+CHANGE_TRIGGER = "organizations_changed_trigger"
+_TOMBSTONE = -1
+# 삭제 표시가 이 개수 이상이고 전체 슬롯의 1/4을 넘으면 압축
+_COMPACT_MIN_TOMBSTONES = 1000
+
+
+def normalize_org_key(name: str) -> str:
+    """기관명 정규화 키 - 법인 표기, 괄호, 공백, 기호 제거 후 소문자 (intern)"""
+    if not name:
+        return ""
+    key = LEGAL_FORM_PATTERN.sub("", str(name).lower())
+    key = BRACKET_PATTERN.sub("", key)
+    key = NON_WORD_PATTERN.sub("", key)
+    return sys.intern(key)
+
+
+def region_code_of(text: str) -> int:
+    """주소/지역명에서 지역번호 정수 추출 (02 -> 2, 031 -> 31, 미상 0)"""
+    if not text:
+        return 0
+    # 대부분 주소는 첫 토큰이 시/도명이므로 딕셔너리 조회로 끝남
+    for token in text.split()[:2]:
+        code = _REGION_CODES.get(token)
+        if code:
+            return code
+    for region in _REGION_NAMES:
+        if region in text:
+            return _REGION_CODES[region]
+    return 0
+
+
+def phone_to_int(phone: str) -> int:
+    """전화번호를 정수로 변환 (숫자 9~11자리만, 그 외 0)"""
+    if not phone:
+        return 0
+    digits = get_phone_normalizer().digits_of(phone)
+    if not 9 <= len(digits) <= 11:
+        return 0
+    return int(digits)
+
+
+def address_hash_of(address: str) -> int:
+    """정규화 주소 해시 (공백/기호 차이 무시, 없음 0)"""
+    if not address:
+        return 0
+    key = NON_WORD_PATTERN.sub("", str(address).lower())
+    return (hash(key) or 1) if key else 0
+
+
+class OrganizationIndex:
+    """활성 기관 전체에 대한 컴팩트 인메모리 인덱스 (스레드 안전)"""
+
+    LOAD_QUERY = "SELECT id, name, address, phone FROM organizations WHERE is_active = true"
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+        self._listener_thread: Optional[threading.Thread] = None
+        self._listener_stop = threading.Event()
+        self._live = threading.Event()
+
+    def _reset(self):
+        self.ids = array('q')
+        self.names: List[str] = []
+        self.regions = array('H')
+        self.phones = array('q')
+        self.address_hashes = array('q')
+
+        self._pos_by_id: Dict[int, int] = {}
+        # 대부분 유일하므로 위치 int 하나만 저장, 충돌 시에만 list로 전환
+        self._by_name: Dict[str, Any] = {}
+        self._by_phone: Dict[int, Any] = {}
+        self._tombstones = 0
+        self.loaded = False
+
+    # ===== 적재 =====
+
+    def load_rows(self, rows: Iterable[Tuple[Any, ...]]) -> int:
+        """(id, name, address, phone) 행 스트림으로 인덱스 재구성"""
+        with self._lock:
+            self._reset()
+            count = 0
+            for org_id, name, address, phone in rows:
+                self._append(int(org_id), name, address, phone)
+                count += 1
+            self.loaded = True
+            return count
+
+    def load_from_database(self, db=None, batch_size: int = 5000) -> int:
+        """PostgreSQL 서버사이드 커서로 활성 기관 전체를 한 번에 스트리밍 적재"""
+        if db is None:
+            from database.database import get_database
+            db = get_database()
+
+        with db.get_connection() as conn:
+            # 이름 있는 커서 = 서버사이드 커서 (전체 결과를 클라이언트 메모리에 올리지 않음)
+            cursor = conn.cursor(name="org_index_load")
+            cursor.itersize = batch_size
+            cursor.execute(self.LOAD_QUERY)
+            count = self.load_rows(cursor)
+            cursor.close()
+
+        print(f"✅ 기관 인덱스 적재 완료: {count:,}개 ({self.memory_usage() / 1024 / 1024:.1f}MB)")
+        return count
+
+    # ===== 변경 =====
+
+    def _append(self, org_id: int, name: str, address: str, phone: str):
+        self._append_values(org_id, normalize_org_key(name), region_code_of(address),
+                            phone_to_int(phone), address_hash_of(address))
+
+    def _append_values(self, org_id: int, name_key: str, region: int, phone_value: int, address_hash: int):
+        pos = len(self.ids)
+        self.ids.append(org_id)
+        self.names.append(name_key)
+        self.regions.append(region)
+        self.phones.append(phone_value)
+        self.address_hashes.append(address_hash)
+
+        self._pos_by_id[org_id] = pos
+        self._add_ref(self._by_name, name_key, pos)
+        if phone_value:
+            self._add_ref(self._by_phone, phone_value, pos)
+
+    @staticmethod
+    def _add_ref(mapping: Dict, key, pos: int):
+        current = mapping.get(key)
+        if current is None:
+            mapping[key] = pos
+        elif isinstance(current, list):
+            current.append(pos)
+        else:
+            mapping[key] = [current, pos]
+
+    @staticmethod
+    def _remove_ref(mapping: Dict, key, pos: int):
+        current = mapping.get(key)
+        if current == pos:
+            del mapping[key]
+        elif isinstance(current, list) and pos in current:
+            current.remove(pos)
+            if len(current) == 1:
+                mapping[key] = current[0]
+
+    @staticmethod
+    def _refs(mapping: Dict, key) -> List[int]:
+        current = mapping.get(key)
+        if current is None:
+            return []
+        return current if isinstance(current, list) else [current]
+
+    def upsert(self, org_id: int, name: str, address: str = "", phone: str = ""):
+        """기관 추가/수정 반영 (기존 위치는 삭제 표시 후 새 위치에 추가)"""
+        with self._lock:
+            self.remove(org_id)
+            self._append(int(org_id), name, address, phone)
+
+    def remove(self, org_id: int):
+        """기관 삭제/비활성화 반영"""
+        with self._lock:
+            pos = self._pos_by_id.pop(int(org_id), None)
+            if pos is None:
+                return
+
+            name_key = self.names[pos]
+            self._remove_ref(self._by_name, name_key, pos)
+            if self.phones[pos]:
+                self._remove_ref(self._by_phone, self.phones[pos], pos)
+            self.ids[pos] = _TOMBSTONE
+            self._tombstones += 1
+
+            if self._tombstones >= _COMPACT_MIN_TOMBSTONES and self._tombstones * 4 > len(self.ids):
+                self.compact()
+
+    def compact(self) -> int:
+        """삭제 표시된 슬롯을 제거하고 살아있는 행으로 배열/보조 인덱스 재구성 (제거한 슬롯 수 반환)"""
+        with self._lock:
+            removed = self._tombstones
+            if not removed:
+                return 0
+            columns = (self.ids, self.names, self.regions, self.phones, self.address_hashes)
+            self._reset()
+            for org_id, name_key, region, phone_value, address_hash in zip(*columns):
+                if org_id != _TOMBSTONE:
+                    self._append_values(org_id, name_key, region, phone_value, address_hash)
+            self.loaded = True
+            return removed
+
+    # ===== 조회 =====
+
+    def find_by_name(self, name: str, region: str = "") -> Optional[int]:
+        """정규화 기관명 정확 일치 (지역 주어지면 같은 지역 우선)"""
+        name_key = normalize_org_key(name)
+        if not name_key:
+            return None
+
+        region_value = region_code_of(region)
+        with self._lock:
+            positions = self._refs(self._by_name, name_key)
+            if region_value:
+                for pos in positions:
+                    if self.regions[pos] == region_value:
+                        return self.ids[pos]
+            return self.ids[positions[0]] if positions else None
+
+    def find_by_phone(self, phone: str) -> List[int]:
+        """전화번호 일치 기관 ID 목록"""
+        phone_value = phone_to_int(phone)
+        if not phone_value:
+            return []
+        with self._lock:
+            return [self.ids[pos] for pos in self._refs(self._by_phone, phone_value)]
+
+    def is_duplicate(self, name: str, address: str = "", phone: str = "") -> bool:
+        """기관명 + 주소 (주소 없으면 기관명 + 전화번호) 일치 여부"""
+        name_key = normalize_org_key(name)
+        if not name_key:
+            return False
+
+        with self._lock:
+            positions = self._refs(self._by_name, name_key)
+            if not positions:
+                return False
+
+            if address and address.strip():
+                address_value = address_hash_of(address)
+                return any(self.address_hashes[pos] == address_value for pos in positions)
+
+            phone_value = phone_to_int(phone)
+            return any(self.phones[pos] == phone_value for pos in positions)
+
+    # ===== 변경 알림 (PostgreSQL LISTEN/NOTIFY) =====
+
+    @staticmethod
+    def install_change_trigger(db) -> None:
+        """
+        organizations 변경 시 NOTIFY를 보내는 트리거 설치 (여러 번 실행해도 안전)
+        테이블 잠금과 DDL 권한이 필요하므로 마이그레이션(test/migrate_org_change_trigger.py)에서만 실행
+        """
+        db.execute_update(f"""
+            CREATE OR REPLACE FUNCTION notify_organizations_changed() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    PERFORM pg_notify('{CHANGE_CHANNEL}', json_build_object('op', TG_OP, 'id', OLD.id)::text);
+                    RETURN OLD;
+                END IF;
+                PERFORM pg_notify('{CHANGE_CHANNEL}', json_build_object('op', TG_OP, 'id', NEW.id)::text);
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            DROP TRIGGER IF EXISTS {CHANGE_TRIGGER} ON organizations;
+            CREATE TRIGGER {CHANGE_TRIGGER}
+                AFTER INSERT OR UPDATE OF name, address, phone, is_active OR DELETE ON organizations
+                FOR EACH ROW EXECUTE FUNCTION notify_organizations_changed();
+        """)
+
+    @staticmethod
+    def has_change_trigger(db) -> bool:
+        """변경 트리거 설치 여부 (런타임 확인용, 카탈로그 조회만 함)"""
+        row = db.execute_query(
+            "SELECT 1 AS installed FROM pg_trigger WHERE tgname = %s AND NOT tgisinternal",
+            (CHANGE_TRIGGER,), fetch_all=False
+        )
+        return bool(row)
+
+    def apply_change(self, db, payload: str):
+        """NOTIFY 페이로드({"op", "id"}) 반영 - 변경된 행만 다시 조회"""
+        change = json.loads(payload)
+        org_id = int(change["id"])
+
+        if change.get("op") == "DELETE":
+            self.remove(org_id)
+            return
+
+        row = db.execute_query(
+            "SELECT id, name, address, phone, is_active FROM organizations WHERE id = %s",
+            (org_id,), fetch_all=False
+        )
+        if row and row.get("is_active"):
+            self.upsert(org_id, row.get("name"), row.get("address"), row.get("phone"))
+        else:
+            self.remove(org_id)
+
+    def start_change_listener(self, db=None, poll_interval: float = 5.0,
+                              max_backoff: float = 300.0) -> bool:
+        """
+        백그라운드 스레드에서 LISTEN 하며 변경 사항을 인덱스에 반영
+        연결 실패/끊김 시 지수 백오프로 재연결하고, 끊긴 동안 놓친 변경은 재연결 후 전체 재적재로 복구
+        LISTEN 중이 아닐 때(is_live False)는 인덱스 미스를 DB로 확인해야 함
+        """
+        if self._listener_thread and self._listener_thread.is_alive():
+            return True
+        if db is None:
+            from database.database import get_database
+            db = get_database()
+
+        import psycopg2
+        import psycopg2.extensions
+
+        def listen():
+            backoff, disconnected = poll_interval, False
+            while not self._listener_stop.is_set():
+                conn = None
+                try:
+                    conn = psycopg2.connect(db.db_url)
+                    conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                    conn.cursor().execute(f"LISTEN {CHANGE_CHANNEL};")
+                    if disconnected:
+                        # LISTEN 재개 후 재적재해야 그 사이 변경이 빠지지 않음
+                        self.load_from_database(db)
+                    self._live.set()
+                    backoff = poll_interval
+                    while not self._listener_stop.is_set():
+                        if select.select([conn], [], [], poll_interval) == ([], [], []):
+                            continue
+                        conn.poll()
+                        while conn.notifies:
+                            notify = conn.notifies.pop(0)
+                            try:
+                                self.apply_change(db, notify.payload)
+                            except Exception as e:
+                                print(f"⚠️ 기관 인덱스 변경 반영 실패: {e}")
+                except Exception as e:
+                    print(f"⚠️ 기관 인덱스 LISTEN 연결 오류 ({backoff:.0f}초 후 재연결): {e}")
+                    self._listener_stop.wait(backoff)
+                    backoff = min(backoff * 2, max_backoff)
+                finally:
+                    if self._live.is_set():
+                        disconnected = True
+                    self._live.clear()
+                    if conn is not None:
+                        conn.close()
+
+        self._listener_stop.clear()
+        self._listener_thread = threading.Thread(target=listen, name="org-index-listener", daemon=True)
+        self._listener_thread.start()
+        return True
+
+    @property
+    def is_live(self) -> bool:
+        """변경 알림을 받고 있는지 (False면 다른 프로세스의 추가/수정이 반영되지 않았을 수 있음)"""
+        return self._live.is_set()
+
+    def stop_change_listener(self):
+        self._listener_stop.set()
+
+    # ===== 통계 =====
+
+    def __len__(self) -> int:
+        return len(self._pos_by_id)
+
+    def memory_usage(self) -> int:
+        """인덱스가 점유한 대략적인 메모리 (bytes)"""
+        with self._lock:
+            size = sum(sys.getsizeof(column) for column in
+                       (self.ids, self.names, self.regions, self.phones, self.address_hashes))
+            size += sum(sys.getsizeof(name) for name in set(self.names))
+            size += sys.getsizeof(self._pos_by_id) + sys.getsizeof(self._by_name) + sys.getsizeof(self._by_phone)
+            return size
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "organizations": len(self._pos_by_id),
+                "slots": len(self.ids),
+                "tombstones": self._tombstones,
+                "memory_mb": round(self.memory_usage() / 1024 / 1024, 1),
+                "listening": self._live.is_set()
+            }
+
+
+_index_instance = None
+_index_lock = threading.Lock()
+
+
+def get_organization_index(db=None, listen: bool = True) -> OrganizationIndex:
+    """프로세스 공용 기관 인덱스 반환 (최초 호출 시 적재 + 변경 트리거 설치 + 변경 알림 구독)"""
+    global _index_instance
+    if _index_instance is None:
+        with _index_lock:
+            if _index_instance is None:
+                if db is None:
+                    from database.database import get_database
+                    db = get_database()
+                index = OrganizationIndex()
+                index.load_from_database(db)
+                if listen:
+                    # 트리거는 마이그레이션에서 설치 - 없으면 NOTIFY가 오지 않으므로 구독하지 않음 (is_live False)
+                    try:
+                        if index.has_change_trigger(db):
+                            index.start_change_listener(db)
+                        else:
+                            print("⚠️ 기관 변경 트리거 없음 (test/migrate_org_change_trigger.py 실행 필요) "
+                                  "- 인덱스 미스는 DB로 확인")
+                    except Exception as e:
+                        print(f"⚠️ 기관 인덱스 변경 알림 구독 실패 (수동 갱신 모드): {e}")
+                _index_instance = index
+    return _index_instance
@@ -14,6 +14,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter, defaultdict
 import traceback
 
+import pandas as pd
+
 from utils.settings import (
     KOREAN_AREA_CODES,
     AREA_CODE_LENGTH_RULES,
@@ -26,6 +28,7 @@ from utils.settings import (
     format_phone_number,
     extract_phone_area_code
 )
+from utils.contact_analytics import get_contact_analytics
 
 # Excel 관련 라이브러리 (선택적)
 try:
@@ -47,6 +50,9 @@ class DataStatisticsAnalyzer:
         self.phone_patterns = {}
         self.fax_patterns = {}
         
+        # 컬럼 단위 통계 백엔드 (CRMStatisticsAnalyzer와 공유)
+        self.analytics = get_contact_analytics()
+        
     def find_latest_files(self) -> Dict[str, Optional[str]]:
         """최신 JSON 및 Excel 파일 찾기"""
         files = {
@@ -75,53 +81,19 @@ class DataStatisticsAnalyzer:
         if not phone:
             return None
         
-        # 숫자만 추출
-        digits = re.sub(r'[^\d]', '', phone)
-        
-        # 지역코드 매칭
-        for code, area in self.korean_area_codes.items():
-            if digits.startswith(code):
-                return code
-        
-        return None
+        return self.analytics.normalizer.normalize(phone).area_code
     
     def validate_korean_phone(self, phone: str) -> Dict[str, Any]:
         """한국 전화번호 유효성 검증"""
-        if not phone:
-            return {"is_valid": False, "reason": "번호 없음"}
-        
-        digits = re.sub(r'[^\d]', '', phone)
-        
-        # 길이 체크
-        if len(digits) < 9 or len(digits) > 11:
-            return {"is_valid": False, "reason": "길이 오류"}
-        
-        # 지역코드 체크
-        area_code = self.extract_phone_area_code(phone)
-        if not area_code:
-            return {"is_valid": False, "reason": "지역코드 오류"}
-        
-        # 길이별 유효성 체크
-        area_info = self.korean_area_codes[area_code]
-        expected_lengths = {
-            '02': [9, 10],  # 서울
-            '070': [11],    # 인터넷전화
-            '010': [11], '017': [11]  # 핸드폰
-        }
-        
-        if area_code in expected_lengths:
-            if len(digits) not in expected_lengths[area_code]:
-                return {"is_valid": False, "reason": "길이 불일치"}
-        else:
-            # 기타 지역번호는 10-11자리
-            if len(digits) not in [10, 11]:
-                return {"is_valid": False, "reason": "길이 불일치"}
+        result = self.analytics.normalizer.normalize(phone)
+        if not result.is_valid:
+            return {"is_valid": False, "reason": result.reason}
         
         return {
             "is_valid": True,
-            "area_code": area_code,
-            "area_name": area_info,
-            "formatted": self.format_phone_number(digits, area_code)
+            "area_code": result.area_code,
+            "area_name": result.area_name,
+            "formatted": result.formatted
         }
     
     def format_phone_number(self, digits: str, area_code: str) -> str:
@@ -188,104 +160,57 @@ class DataStatisticsAnalyzer:
                 "email_analysis": {}
             }
             
-            # 카운터 초기화
-            total_orgs = 0
-            phone_count = 0
-            fax_count = 0
-            email_count = 0
-            url_count = 0
-            complete_contact_count = 0  # 전화+팩스+이메일 모두 있는 기관
-            
-            valid_phones = 0
-            valid_faxes = 0
-            
-            phone_areas = Counter()
-            fax_areas = Counter()
-            email_domains = Counter()
-            
-            # 카테고리별 분석
+            # 기관별 최종 연락처를 한 번만 펼친 뒤 컬럼 단위로 집계
+            records = []
             for category, organizations in data.items():
-                category_stats = {
-                    "count": len(organizations),
-                    "phone_count": 0,
-                    "fax_count": 0,
-                    "email_count": 0,
-                    "url_count": 0,
-                    "complete_contact_count": 0  # 전화+팩스+이메일 모두 있는 기관
-                }
-                
                 for org in organizations:
-                    total_orgs += 1
-                    
-                    # 기본 연락처 정보
-                    phone = org.get("phone", "")
-                    fax = org.get("fax", "")
-                    url = org.get("homepage", "")
-                    
                     # 홈페이지 파싱 결과
                     homepage_content = org.get("homepage_content", {})
                     parsed_contact = homepage_content.get("parsed_contact", {})
                     
-                    # 전화번호 분석
-                    final_phone = phone
-                    if not final_phone and parsed_contact.get("phones"):
-                        final_phone = ", ".join(parsed_contact["phones"])
-                    
-                    if final_phone:
-                        phone_count += 1
-                        category_stats["phone_count"] += 1
-                        
-                        # 첫 번째 전화번호만 분석 (여러 개인 경우)
-                        first_phone = final_phone.split(',')[0].strip()
-                        phone_validation = self.validate_korean_phone(first_phone)
-                        if phone_validation["is_valid"]:
-                            valid_phones += 1
-                            area_code = phone_validation["area_code"]
-                            phone_areas[area_code] += 1
-                    
-                    # 팩스번호 분석
-                    final_fax = fax
-                    if not final_fax and parsed_contact.get("faxes"):
-                        final_fax = ", ".join(parsed_contact["faxes"])
-                    
-                    if final_fax:
-                        fax_count += 1
-                        category_stats["fax_count"] += 1
-                        
-                        # 첫 번째 팩스번호만 분석 (여러 개인 경우)
-                        first_fax = final_fax.split(',')[0].strip()
-                        fax_validation = self.validate_korean_phone(first_fax)  # 팩스도 전화번호 검증 로직 사용
-                        if fax_validation["is_valid"]:
-                            valid_faxes += 1
-                            area_code = fax_validation["area_code"]
-                            fax_areas[area_code] += 1
-                    
-                    # 이메일 분석
-                    final_email = ""
-                    if parsed_contact.get("emails"):
-                        final_email = ", ".join(parsed_contact["emails"])
-                    
-                    if final_email:
-                        email_count += 1
-                        category_stats["email_count"] += 1
-                        
-                        # 첫 번째 이메일만 분석 (여러 개인 경우)
-                        first_email = final_email.split(',')[0].strip()
-                        domain = self.extract_email_domain(first_email)
-                        if domain:
-                            email_domains[domain] += 1
-                    
-                    # URL 분석
-                    if url:
-                        url_count += 1
-                        category_stats["url_count"] += 1
-                    
-                    # 완전한 연락처 정보 체크
-                    if final_phone and final_fax and final_email:
-                        complete_contact_count += 1
-                        category_stats["complete_contact_count"] += 1
-                
-                stats["categories"][category] = category_stats
+                    records.append({
+                        "category": category,
+                        "phone": org.get("phone", "") or ", ".join(parsed_contact.get("phones") or []),
+                        "fax": org.get("fax", "") or ", ".join(parsed_contact.get("faxes") or []),
+                        "email": ", ".join(parsed_contact.get("emails") or []),
+                        "url": org.get("homepage", "")
+                    })
+            
+            frame = self.analytics.frame_from_records(records, ["category", "phone", "fax", "email", "url"])
+            total_orgs = len(frame)
+            
+            filled = self.analytics.filled_columns(frame, ["phone", "fax", "email", "url"])
+            filled["complete_contact"] = filled[["phone", "fax", "email"]].all(axis=1)
+            phone_count = int(filled["phone"].sum())
+            fax_count = int(filled["fax"].sum())
+            email_count = int(filled["email"].sum())
+            url_count = int(filled["url"].sum())
+            complete_contact_count = int(filled["complete_contact"].sum())
+            
+            # 카테고리별 분석 (빈 카테고리도 원본 순서대로 포함)
+            category_counts = self.analytics.count_by_group(filled, frame["category"])
+            for category, organizations in data.items():
+                counts = category_counts.loc[category] if category in category_counts.index else None
+                stats["categories"][category] = {
+                    "count": len(organizations),
+                    "phone_count": int(counts["phone"]) if counts is not None else 0,
+                    "fax_count": int(counts["fax"]) if counts is not None else 0,
+                    "email_count": int(counts["email"]) if counts is not None else 0,
+                    "url_count": int(counts["url"]) if counts is not None else 0,
+                    "complete_contact_count": int(counts["complete_contact"]) if counts is not None else 0  # 전화+팩스+이메일 모두 있는 기관
+                }
+            
+            # 전화/팩스 품질 분석 (여러 개인 경우 첫 번째 번호만)
+            phone_summary = self.analytics.phone_summary(self.analytics.first_value(frame["phone"])[filled["phone"]])
+            fax_summary = self.analytics.phone_summary(self.analytics.first_value(frame["fax"])[filled["fax"]])
+            valid_phones = phone_summary["valid_count"]
+            valid_faxes = fax_summary["valid_count"]
+            phone_areas = phone_summary["area_counts"]
+            fax_areas = fax_summary["area_counts"]
+            
+            # 이메일 분석 (첫 번째 이메일만, 상위 50개 도메인 기준 카테고리 분류)
+            email_summary = self.analytics.email_summary(self.analytics.first_value(frame["email"]), category_top_n=50)
+            email_domains = email_summary["domain_counts"]
             
             # 기본 통계
             stats["basic_stats"] = {
@@ -296,10 +221,10 @@ class DataStatisticsAnalyzer:
             
             # 연락처 커버리지
             stats["contact_coverage"] = {
-                "phone": {"count": phone_count, "rate": round((phone_count / total_orgs * 100), 1) if total_orgs > 0 else 0},
-                "fax": {"count": fax_count, "rate": round((fax_count / total_orgs * 100), 1) if total_orgs > 0 else 0},
-                "email": {"count": email_count, "rate": round((email_count / total_orgs * 100), 1) if total_orgs > 0 else 0},
-                "url": {"count": url_count, "rate": round((url_count / total_orgs * 100), 1) if total_orgs > 0 else 0}
+                "phone": {"count": phone_count, "rate": self.analytics.rate(phone_count, total_orgs)},
+                "fax": {"count": fax_count, "rate": self.analytics.rate(fax_count, total_orgs)},
+                "email": {"count": email_count, "rate": self.analytics.rate(email_count, total_orgs)},
+                "url": {"count": url_count, "rate": self.analytics.rate(url_count, total_orgs)}
             }
             
             # 품질 지표
@@ -328,15 +253,9 @@ class DataStatisticsAnalyzer:
                 for area_code, count in all_areas.most_common()
             }
             
-            # 이메일 도메인 분석
-            email_categories = Counter()
-            for domain, count in email_domains.most_common(50):  # 상위 50개 도메인만
-                category = self.categorize_email_domain(domain)
-                email_categories[category] += count
-            
             stats["email_analysis"] = {
                 "top_domains": dict(email_domains.most_common(20)),
-                "domain_categories": dict(email_categories),
+                "domain_categories": dict(email_summary["category_counts"]),
                 "total_unique_domains": len(email_domains)
             }
             
@@ -363,92 +282,71 @@ class DataStatisticsAnalyzer:
         print(f"📊 Excel 데이터 분석 시작: {excel_file}")
         
         try:
-            wb = load_workbook(excel_file)
-            ws = wb.active
+            # 시트 전체를 한 번에 읽어 DataFrame으로 변환 (셀 단위 접근 제거)
+            wb = load_workbook(excel_file, read_only=True, data_only=True)
+            rows = wb.active.iter_rows(values_only=True)
+            headers = list(next(rows, ()))
+            frame = pd.DataFrame.from_records(list(rows), columns=range(len(headers)))
+            wb.close()
+            
+            # 셀 값 문자열화 + 앞뒤 공백 제거 후 빈 값 판정
+            text = frame.apply(lambda column: column.fillna("").astype(str).str.strip())
+            non_empty = text != ""
+            total_rows = len(frame)
             
             stats = {
                 "file_info": {
                     "filename": excel_file,
                     "file_size": os.path.getsize(excel_file),
                     "analysis_time": datetime.now().isoformat(),
-                    "total_rows": ws.max_row - 1  # 헤더 제외
+                    "total_rows": total_rows  # 헤더 제외
                 },
                 "column_analysis": {},
                 "data_quality": {},
                 "summary": {}
             }
             
-            # 헤더 분석
-            headers = [cell.value for cell in ws[1]]
-            
             # 컬럼별 데이터 분석
             column_stats = {}
-            for col_idx, header in enumerate(headers, 1):
+            for col_idx, header in enumerate(headers):
                 if not header:
                     continue
                 
-                values = []
-                non_empty_count = 0
-                
-                for row_idx in range(2, ws.max_row + 1):
-                    cell_value = ws.cell(row=row_idx, column=col_idx).value
-                    if cell_value and str(cell_value).strip():
-                        values.append(str(cell_value).strip())
-                        non_empty_count += 1
+                values = text[col_idx][non_empty[col_idx]]
+                non_empty_count = len(values)
                 
                 column_stats[header] = {
-                    "total_values": len(values),
+                    "total_values": non_empty_count,
                     "non_empty_count": non_empty_count,
-                    "fill_rate": (non_empty_count / (ws.max_row - 1) * 100) if ws.max_row > 1 else 0,
-                    "unique_values": len(set(values)),
-                    "sample_values": values[:5] if values else []
+                    "fill_rate": (non_empty_count / total_rows * 100) if total_rows > 0 else 0,
+                    "unique_values": int(values.nunique()),
+                    "sample_values": values.head(5).tolist()
                 }
                 
                 # 전화번호/팩스번호 컬럼 특별 분석
                 if "전화" in header or "phone" in header.lower():
-                    valid_count = 0
-                    area_distribution = Counter()
-                    
-                    for value in values:
-                        validation = self.validate_korean_phone(value)
-                        if validation["is_valid"]:
-                            valid_count += 1
-                            area_distribution[validation["area_code"]] += 1
+                    phone_summary = self.analytics.phone_summary(values)
+                    valid_count = phone_summary["valid_count"]
                     
                     column_stats[header]["validation"] = {
                         "valid_count": valid_count,
-                        "validity_rate": (valid_count / len(values) * 100) if values else 0,
-                        "area_distribution": dict(area_distribution.most_common(5))
+                        "validity_rate": (valid_count / non_empty_count * 100) if non_empty_count else 0,
+                        "area_distribution": dict(phone_summary["area_counts"].most_common(5))
                     }
                 
                 # 이메일 컬럼 특별 분석
                 elif "이메일" in header or "email" in header.lower():
-                    domain_distribution = Counter()
-                    category_distribution = Counter()
-                    
-                    for value in values:
-                        if '@' in value:
-                            domain = self.extract_email_domain(value)
-                            if domain:
-                                domain_distribution[domain] += 1
-                                category = self.categorize_email_domain(domain)
-                                category_distribution[category] += 1
+                    email_summary = self.analytics.email_summary(values[values.str.contains("@", regex=False)])
                     
                     column_stats[header]["analysis"] = {
-                        "domain_distribution": dict(domain_distribution.most_common(5)),
-                        "category_distribution": dict(category_distribution)
+                        "domain_distribution": dict(email_summary["domain_counts"].most_common(5)),
+                        "category_distribution": dict(email_summary["category_counts"])
                     }
             
             stats["column_analysis"] = column_stats
             
-            # 데이터 품질 분석
-            total_rows = ws.max_row - 1
-            complete_rows = 0
-            
-            for row_idx in range(2, ws.max_row + 1):
-                row_data = [ws.cell(row=row_idx, column=col).value for col in range(1, len(headers) + 1)]
-                if all(data and str(data).strip() for data in row_data[:5]):  # 기본 5개 컬럼 체크
-                    complete_rows += 1
+            # 데이터 품질 분석 (기본 5개 컬럼이 모두 채워진 행)
+            complete_rows = int(non_empty.iloc[:, :5].all(axis=1).sum()) if total_rows else 0
             
             stats["data_quality"] = {
                 "total_rows": total_rows,
@@ -3,14 +3,24 @@ CRM 서비스 레이어
 비즈니스 로직과 데이터 처리 서비스들
 """
 
-from .contact_enrichment_service import ContactEnrichmentService
+from .contact_enrichment_service import ContactEnrichmentService, get_contact_enrichment_service
+from .crawler_runtime import get_crawler_runtime, CrawlerRuntime
+from .progress_bus import get_progress_bus, ProgressBus
 from .organization_service import OrganizationService
 from .crawling_service import get_crawling_service, CrawlingService, CrawlingJobConfig
+from .dedup_service import get_dedup_service, DedupService
 
 __all__ = [
     'ContactEnrichmentService',
+    'get_contact_enrichment_service',
+    'CrawlerRuntime',
+    'get_crawler_runtime',
+    'ProgressBus',
+    'get_progress_bus',
     'OrganizationService',
     'CrawlingService',
     'CrawlingJobConfig',
-    'get_crawling_service'
+    'get_crawling_service',
+    'DedupService',
+    'get_dedup_service'
 ] 
\ No newline at end of file
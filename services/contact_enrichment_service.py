@@ -9,13 +9,17 @@ import asyncio
 import logging
 import json
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from database.database import get_database
-from crawler_main import AIEnhancedModularUnifiedCrawler
+from services.crawler_runtime import get_crawler_runtime
 from utils.logger_utils import LoggerUtils
 
+# crawler_main(Selenium/Gemini/cralwer 모듈)은 크롤러 런타임이 처음 만들 때 import - API 기동 시 비용 제외
+if TYPE_CHECKING:
+    from crawler_main import AIEnhancedModularUnifiedCrawler
+
 @dataclass
 class EnrichmentRequest:
     """연락처 보강 요청"""
@@ -42,7 +46,8 @@ class ContactEnrichmentService:
         """초기화"""
         self.db = get_database()
         self.logger = LoggerUtils.setup_logger(name="contact_enrichment", file_logging=False)
-        self.crawler = None
+        # 크롤러는 앱 공용 런타임이 소유 (요청/서비스 인스턴스마다 브라우저를 새로 띄우지 않음)
+        self.runtime = get_crawler_runtime()
         
         # 통계
         self.stats = {
@@ -60,28 +65,9 @@ class ContactEnrichmentService:
         
         self.logger.info("🔍 연락처 보강 서비스 초기화 완료")
     
-    def get_crawler(self) -> AIEnhancedModularUnifiedCrawler:
-        """크롤러 인스턴스 가져오기 (개선된 버전)"""
-        if not self.crawler:
-            try:
-                # 진행 상황 콜백 함수 정의
-                def progress_callback(data):
-                    try:
-                        status = data.get('status', 'unknown')
-                        name = data.get('name', 'Unknown')
-                        self.logger.info(f"🔄 크롤링 진행: {name} - {status}")
-                    except Exception as e:
-                        self.logger.debug(f"콜백 오류: {e}")
-                
-                # AIEnhancedModularUnifiedCrawler 초기화 (콜백 포함)
-                self.crawler = AIEnhancedModularUnifiedCrawler(progress_callback=progress_callback)
-                self.logger.info("🤖 AIEnhancedModularUnifiedCrawler 초기화 성공 (콜백 포함)")
-                
-            except Exception as e:
-                self.logger.error(f"❌ AIEnhancedModularUnifiedCrawler 초기화 실패: {e}")
-                raise
-        
-        return self.crawler
+    def get_crawler(self) -> "AIEnhancedModularUnifiedCrawler":
+        """공용 크롤러 런타임의 크롤러 (없으면 생성 + 모듈 초기화)"""
+        return self.runtime.ensure_started()
     
     def find_organizations_with_missing_contacts(self, limit: int = 100) -> List[EnrichmentRequest]:
         """누락된 연락처 정보가 있는 기관들 찾기"""
@@ -151,15 +137,6 @@ class ContactEnrichmentService:
             self.logger.info(f"🔍 연락처 보강 시작: {request.org_name} (ID: {request.org_id})")
             self.logger.info(f"  📋 누락 필드: {', '.join(request.missing_fields)}")
             
-            # 🔧 수정: 기존 크롤러 사용 (매번 새로 만들지 않음)
-            crawler = self.get_crawler()
-            
-            # 🔧 수정: 모듈 초기화 확인 및 실행
-            if not hasattr(crawler, '_modules_initialized') or not crawler._modules_initialized:
-                crawler.initialize_modules()
-                crawler._modules_initialized = True
-                self.logger.info("🔧 크롤러 모듈 초기화 완료")
-            
             # 기관 정보를 크롤러 형식으로 변환
             org_data = {
                 "name": request.org_name,
@@ -171,45 +148,46 @@ class ContactEnrichmentService:
                 "address": ""
             }
             
-            # 🚀 실제 크롤링 실행 - crawler_main.py의 강력한 기능 활용
-            try:
-                # 1. 홈페이지 검색
-                if not org_data.get('homepage'):
-                    homepage_result = await crawler.search_homepage(request.org_name)
-                    if homepage_result and homepage_result.get('homepage'):
-                        org_data['homepage'] = homepage_result['homepage']
-                        self.logger.info(f"  🌐 홈페이지 발견: {homepage_result['homepage']}")
+            # 🚀 실제 크롤링 실행 - 공용 크롤러 런타임 사용 (모듈/드라이버가 이미 떠 있음, 동시 요청 수 제한)
+            async with self.runtime.session() as crawler:
+                try:
+                    # 1. 홈페이지 검색
+                    if not org_data.get('homepage'):
+                        homepage_result = await crawler.search_homepage(request.org_name)
+                        if homepage_result and homepage_result.get('homepage'):
+                            org_data['homepage'] = homepage_result['homepage']
+                            self.logger.info(f"  🌐 홈페이지 발견: {homepage_result['homepage']}")
                 
-                # 2. 홈페이지에서 연락처 추출
-                if org_data.get('homepage'):
-                    homepage_details = await crawler.extract_details_from_homepage(org_data['homepage'])
+                    # 2. 홈페이지에서 연락처 추출
+                    if org_data.get('homepage'):
+                        homepage_details = await crawler.extract_details_from_homepage(org_data['homepage'])
                     
-                    # 결과 병합
-                    for field in ['phone', 'fax', 'email', 'address']:
-                        if homepage_details.get(field) and not org_data.get(field):
-                            org_data[field] = homepage_details[field]
-                            self.logger.info(f"  ✅ 홈페이지에서 {field} 발견: {homepage_details[field]}")
+                        # 결과 병합
+                        for field in ['phone', 'fax', 'email', 'address']:
+                            if homepage_details.get(field) and not org_data.get(field):
+                                org_data[field] = homepage_details[field]
+                                self.logger.info(f"  ✅ 홈페이지에서 {field} 발견: {homepage_details[field]}")
                 
-                # 3. 구글 검색으로 누락 정보 보완
-                missing_fields = [field for field in request.missing_fields 
-                                if not org_data.get(field) or org_data[field].strip() == ""]
+                    # 3. 구글 검색으로 누락 정보 보완
+                    missing_fields = [field for field in request.missing_fields 
+                                    if not org_data.get(field) or org_data[field].strip() == ""]
                 
-                if missing_fields:
-                    self.logger.info(f"  🔍 구글 검색으로 누락 정보 검색: {missing_fields}")
-                    google_results = await crawler.search_missing_info(request.org_name, missing_fields)
+                    if missing_fields:
+                        self.logger.info(f"  🔍 구글 검색으로 누락 정보 검색: {missing_fields}")
+                        google_results = await crawler.search_missing_info(request.org_name, missing_fields)
                     
-                    # 구글 검색 결과 병합
-                    for field, value in google_results.items():
-                        if value and value.strip() and not org_data.get(field):
-                            org_data[field] = value
-                            self.logger.info(f"  ✅ 구글 검색에서 {field} 발견: {value}")
+                        # 구글 검색 결과 병합
+                        for field, value in google_results.items():
+                            if value and value.strip() and not org_data.get(field):
+                                org_data[field] = value
+                                self.logger.info(f"  ✅ 구글 검색에서 {field} 발견: {value}")
                 
-                # 4. 데이터 검증 및 정리
-                org_data = crawler.validate_and_clean_data(org_data)
+                    # 4. 데이터 검증 및 정리
+                    org_data = crawler.validate_and_clean_data(org_data)
                 
-            except Exception as crawl_error:
-                self.logger.error(f"  ❌ 크롤링 과정 오류: {crawl_error}")
-                # 크롤링 실패해도 계속 진행
+                except Exception as crawl_error:
+                    self.logger.error(f"  ❌ 크롤링 과정 오류: {crawl_error}")
+                    # 크롤링 실패해도 계속 진행
             
             # 결과에서 찾은 데이터 추출
             found_data = {}
@@ -490,16 +468,25 @@ class ContactEnrichmentService:
             self.logger.error(f"❌ 보강 이력 조회 실패: {e}")
             return []
 
+_enrichment_service_instance = None
+
+def get_contact_enrichment_service() -> ContactEnrichmentService:
+    """연락처 보강 서비스 인스턴스 반환 (싱글톤 - 요청마다 로거/DB 핸들을 새로 만들지 않음)"""
+    global _enrichment_service_instance
+    if _enrichment_service_instance is None:
+        _enrichment_service_instance = ContactEnrichmentService()
+    return _enrichment_service_instance
+
 # 편의 함수들
 async def auto_enrich_contacts(limit: int = 50) -> Dict[str, Any]:
     """연락처 자동 보강 편의 함수"""
-    service = ContactEnrichmentService()
+    service = get_contact_enrichment_service()
     return await service.auto_enrich_missing_contacts(limit)
 
 async def enrich_organization_by_id(org_id: int) -> Optional[EnrichmentResult]:
     """특정 기관 연락처 보강 편의 함수"""
     try:
-        service = ContactEnrichmentService()
+        service = get_contact_enrichment_service()
         db = get_database()
         
         # 기관 정보 조회
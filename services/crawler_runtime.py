@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상주 크롤러 런타임
+요청마다 AIEnhancedModularUnifiedCrawler(AI 매니저, 에이전트 5개)를 만들고 initialize_modules()로
+Chrome 드라이버/HomepageParser/검증기/DB 연결을 띄우면 단일 기관 보강도 수 초씩 걸림
+→ crm_app 수명 동안 크롤러 1개를 유지하고 모든 보강 요청이 공유
+
+- start(): lifespan에서 백그라운드로 생성 + 모듈 초기화 (warm_on_startup=False면 첫 요청 시 생성)
+- session() / submit(): 동시 처리 수는 적응형 한도("crawler_runtime")로 제한, 드라이버는 크롤러의 잠금으로 순서대로 사용
+- stop(): 새 요청 거부 → 처리 중인 요청을 shutdown_timeout까지 기다린 뒤 드라이버 정리
+- 진행 콜백은 add_progress_listener()로 등록한 리스너 모두에게 전달 (기본: 진행 상황 버스 "enrichment" 토픽)
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from services.progress_bus import get_progress_bus
+from utils.concurrency_controller import get_adaptive_limit
+from utils.logger_utils import LoggerUtils
+from utils.metrics import get_metrics_registry
+from utils.settings import CRAWLER_RUNTIME_CONFIG, CRAWLING_CONFIG
+
+if TYPE_CHECKING:
+    from crawler_main import AIEnhancedModularUnifiedCrawler
+
+T = TypeVar("T")
+
+# 진행 상황 버스 토픽 (대시보드 SSE/WebSocket)
+PROGRESS_TOPIC = "enrichment"
+
+METRICS = get_metrics_registry()
+RUNTIME_REQUESTS = METRICS.counter(
+    "crawler_runtime_requests_total", "상주 크롤러 런타임 요청 결과", ["outcome"]
+)
+RUNTIME_SECONDS = METRICS.histogram(
+    "crawler_runtime_request_seconds", "상주 크롤러 런타임 요청 처리 시간 (대기 포함)", []
+)
+
+logger = LoggerUtils.setup_logger(name="crawler_runtime", file_logging=False)
+
+
+class CrawlerRuntimeClosed(RuntimeError):
+    """종료 중/종료된 런타임에 요청한 경우"""
+
+
+class CrawlerRuntime:
+    """앱 수명 동안 유지되는 크롤러 1개 (스레드/이벤트 루프 안전)"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or CRAWLER_RUNTIME_CONFIG
+        self.limit = get_adaptive_limit("crawler_runtime")
+        self._crawler: Optional["AIEnhancedModularUnifiedCrawler"] = None
+        self._build_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._state = "idle"  # idle → starting → ready → stopping → stopped (실패 시 failed, 다음 요청에서 재시도)
+        self._error: Optional[str] = None
+        self._inflight = 0
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._stats = {"requests": 0, "completed": 0, "failed": 0, "timeouts": 0, "rejected": 0,
+                       "warmup_seconds": 0.0}
+        METRICS.mapping("crawler_runtime", "상주 크롤러 런타임 상태", self.get_stats)
+        self.add_progress_listener(get_progress_bus().publisher(PROGRESS_TOPIC))
+
+    # ===== 상태 =====
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def closed(self) -> bool:
+        return self._state in ("stopping", "stopped")
+
+    @property
+    def crawler(self) -> Optional["AIEnhancedModularUnifiedCrawler"]:
+        """생성된 크롤러 (아직 없으면 None)"""
+        return self._crawler
+
+    # ===== 생성 =====
+
+    def ensure_started(self) -> "AIEnhancedModularUnifiedCrawler":
+        """크롤러가 없으면 생성 + 모듈 초기화 (동기, 여러 스레드가 불러도 1회만 생성)"""
+        if self._crawler is not None:
+            return self._crawler
+        if self.closed:
+            raise CrawlerRuntimeClosed("크롤러 런타임이 종료되었습니다")
+
+        with self._build_lock:
+            if self._crawler is not None:
+                return self._crawler
+            if self.closed:
+                raise CrawlerRuntimeClosed("크롤러 런타임이 종료되었습니다")
+
+            self._state = "starting"
+            started = time.perf_counter()
+            try:
+                from crawler_main import AIEnhancedModularUnifiedCrawler
+
+                crawler = AIEnhancedModularUnifiedCrawler(
+                    config_override={**CRAWLING_CONFIG, **self.config.get("crawler_config", {})},
+                    progress_callback=self._dispatch_progress
+                )
+                crawler.initialize_modules()
+            except Exception as e:
+                self._state = "failed"
+                self._error = str(e)
+                logger.error(f"❌ 크롤러 런타임 시작 실패: {e}")
+                raise
+
+            self._crawler = crawler
+            self._error = None
+            self._stats["warmup_seconds"] = round(time.perf_counter() - started, 3)
+            self._state = "ready"
+            logger.info(f"✅ 크롤러 런타임 준비 완료 ({self._stats['warmup_seconds']:.1f}초)")
+            return crawler
+
+    async def start(self) -> Optional["AIEnhancedModularUnifiedCrawler"]:
+        """이벤트 루프를 막지 않고 크롤러 생성 (lifespan 워밍업용, 실패해도 예외 없이 None)"""
+        try:
+            return await asyncio.to_thread(self.ensure_started)
+        except Exception:
+            return None
+
+    # ===== 요청 =====
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        크롤러 1회 사용 구간 (async with runtime.session() as crawler)
+        적응형 한도 1칸을 점유하고, 종료 시 처리 중 요청 수에서 빠짐
+        """
+        if self.closed:
+            with self._lock:
+                self._stats["rejected"] += 1
+            RUNTIME_REQUESTS.labels("rejected").inc()
+            raise CrawlerRuntimeClosed("크롤러 런타임이 종료 중입니다")
+
+        with self._lock:
+            self._inflight += 1
+            self._stats["requests"] += 1
+        started = time.perf_counter()
+        outcome = "completed"
+        try:
+            crawler = self._crawler or await asyncio.to_thread(self.ensure_started)
+            async with self.limit.slot() as slot:
+                try:
+                    yield crawler
+                except BaseException:
+                    slot.mark("error")
+                    raise
+        except asyncio.TimeoutError:
+            outcome = "timeouts"
+            raise
+        except BaseException:
+            outcome = "failed"
+            raise
+        finally:
+            with self._lock:
+                self._inflight -= 1
+                self._stats[outcome] += 1
+            RUNTIME_REQUESTS.labels(outcome).inc()
+            RUNTIME_SECONDS.labels().observe(time.perf_counter() - started)
+
+    async def submit(self, work: Callable[["AIEnhancedModularUnifiedCrawler"], Awaitable[T]],
+                     timeout: Optional[float] = None) -> T:
+        """크롤러로 비동기 작업 실행 (timeout 기본값: submit_timeout, 0이면 제한 없음)"""
+        if timeout is None:
+            timeout = self.config.get("submit_timeout", 0)
+        async with self.session() as crawler:
+            return await asyncio.wait_for(work(crawler), timeout or None)
+
+    async def process_organization(self, org: Dict[str, Any], index: int = 1,
+                                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """기관 1건 AI 에이전트 처리 (process_single_organization_with_ai)"""
+        return await self.submit(lambda crawler: crawler.process_single_organization_with_ai(org, index), timeout)
+
+    # ===== 진행 콜백 =====
+
+    def add_progress_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_progress_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _dispatch_progress(self, data: Dict[str, Any]):
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(data)
+            except Exception as e:
+                logger.debug(f"진행 콜백 오류: {e}")
+
+    # ===== 종료 =====
+
+    async def stop(self, timeout: Optional[float] = None):
+        """새 요청 거부 → 처리 중 요청 대기(최대 timeout초) → 드라이버/모듈 정리"""
+        if self._state == "stopped":
+            return
+        if timeout is None:
+            timeout = self.config.get("shutdown_timeout", 30)
+        self._state = "stopping"
+
+        deadline = time.monotonic() + timeout
+        while self._inflight > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        if self._inflight > 0:
+            logger.warning(f"⚠️ 처리 중인 요청 {self._inflight}건을 기다리지 않고 크롤러 런타임 종료")
+
+        await asyncio.to_thread(self._shutdown)
+
+    def _shutdown(self):
+        # 워밍업 중이면 생성이 끝난 뒤 정리
+        with self._build_lock:
+            crawler, self._crawler = self._crawler, None
+            self._state = "stopped"
+        if crawler is not None:
+            crawler.cleanup_modules()
+            logger.info("⏹️ 크롤러 런타임 종료 (드라이버/모듈 정리 완료)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["inflight"] = self._inflight
+            stats["listeners"] = len(self._listeners)
+        stats.update(state=self._state, ready=self._state == "ready", limit=self.limit.limit, error=self._error)
+        return stats
+
+
+_runtime_instance = None
+_runtime_lock = threading.Lock()
+
+
+def get_crawler_runtime() -> CrawlerRuntime:
+    """프로세스 공용 크롤러 런타임 반환 (싱글톤)"""
+    global _runtime_instance
+    if _runtime_instance is None:
+        with _runtime_lock:
+            if _runtime_instance is None:
+                _runtime_instance = CrawlerRuntime()
+    return _runtime_instance
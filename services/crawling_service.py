@@ -9,13 +9,17 @@ import asyncio
 import json
 import os
 import threading
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
 
 from database.database import get_database
+from database.org_index import get_organization_index
+from services.progress_bus import compact_progress, get_progress_bus
 from utils.file_utils import FileUtils
 from utils.logger_utils import LoggerUtils
+from utils.settings import PROGRESS_STREAM_CONFIG
 
 # 환경변수 로드
 from dotenv import load_dotenv
@@ -23,6 +27,13 @@ load_dotenv()
 
 logger = LoggerUtils.setup_logger(name="crawling_service", file_logging=True)
 
+# 진행 스트림 토픽 / DB에 항상 기록하는 최종 상태
+PROGRESS_TOPIC = "crawl_job"
+# 기관 인덱스 적재 실패 시 재시도 간격 (초, 실패할 때마다 2배, 최대값까지)
+ORG_INDEX_RETRY_SECONDS = 60.0
+ORG_INDEX_MAX_RETRY_SECONDS = 1800.0
+TERMINAL_STATUSES = ("COMPLETED", "FAILED")
+
 @dataclass
 class CrawlingJobConfig:
     """크롤링 작업 설정"""
@@ -54,11 +65,19 @@ class CrawlingService:
         self.db = get_database()
         self.logger = logger
         
+        # 기관명 매칭용 인메모리 인덱스 (최초 사용 시 적재)
+        self._org_index = None
+        self._org_index_retry_at = 0.0
+        self._org_index_backoff = ORG_INDEX_RETRY_SECONDS
+        
         # 크롤링 상태 관리
         self.current_job: Optional[CrawlingJobStatus] = None
         self.extractor_instance = None
         self.total_organizations = []
         
+        # 진행 상황 푸시 (대시보드 SSE/WebSocket)
+        self.progress_bus = get_progress_bus()
+        
         # 지원하는 데이터 파일 경로들
         self.data_file_paths = [
             "data/json/merged_church_data_20250618_174032.json",
@@ -66,6 +85,33 @@ class CrawlingService:
             "raw_data.json"
         ]
     
+    @property
+    def org_index(self):
+        """기관 인메모리 인덱스 (지연 적재, 적재 실패 시 재시도 시각 전까지 None)"""
+        if self._org_index is None and time.monotonic() >= self._org_index_retry_at:
+            try:
+                self._org_index = get_organization_index(self.db)
+            except Exception as e:
+                # 진행 콜백마다 전체 적재를 반복하지 않도록 실패를 backoff 동안 유지
+                self._org_index_retry_at = time.monotonic() + self._org_index_backoff
+                self.logger.warning(f"⚠️ 기관 인덱스 적재 실패 - {self._org_index_backoff:.0f}초 동안 DB 조회로 대체: {e}")
+                self._org_index_backoff = min(self._org_index_backoff * 2, ORG_INDEX_MAX_RETRY_SECONDS)
+        return self._org_index
+    
+    def find_organization_id(self, name: str, address: str = "") -> Optional[int]:
+        """
+        기관명(+주소 지역)으로 기관 ID 조회 - 인덱스 우선, 없으면 DB 조회
+        변경 알림을 받지 못하는 동안(is_live False)에는 다른 워커/CRM에서 추가된 기관이 인덱스에 없을 수 있으므로
+        미스를 DB로 확인 (중복 생성 방지)
+        """
+        index = self.org_index
+        if index is None:
+            return self.db.find_organization_by_name(name)
+        org_id = index.find_by_name(name, address)
+        if org_id is None and not index.is_live:
+            org_id = self.db.find_organization_by_name(name)
+        return org_id
+    
     def find_data_file(self) -> Optional[str]:
         """사용 가능한 데이터 파일 찾기"""
         for file_path in self.data_file_paths:
@@ -121,10 +167,52 @@ class CrawlingService:
             self.logger.error(f"❌ 크롤링 작업 생성 실패: {e}")
             raise
     
+    def publish_job_status(self, job_id: int, current_organization: Optional[str] = None):
+        """작업 단위 진행률 이벤트 발행 (대시보드 진행 막대용)"""
+        job = self.current_job
+        if not job or job.job_id != job_id:
+            return
+        done = job.processed_count + job.failed_count
+        data = {
+            "kind": "job",
+            "job_id": job_id,
+            "status": job.status,
+            "total_count": job.total_count,
+            "processed_count": job.processed_count,
+            "failed_count": job.failed_count,
+            "percentage": round(done / job.total_count * 100, 1) if job.total_count else 0,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "error_message": job.error_message
+        }
+        if current_organization:
+            data["current_organization"] = current_organization
+        self.progress_bus.publish(PROGRESS_TOPIC, f"{job_id}:job", data)
+    
     def create_progress_callback(self, job_id: int) -> Callable:
-        """진행 상황 콜백 함수 생성 - 실시간 DB 업데이트"""
+        """진행 상황 콜백 함수 생성 - 스트림 발행 + 최종 결과 DB 반영"""
         def progress_callback(result: dict):
             """크롤링 진행 상황 콜백 - 실시간 반영"""
+            status = result.get('status', 'PROCESSING')
+            
+            # 0. 진행 스트림 발행 (DB를 거치지 않고 구독 중인 대시보드로 바로 전달)
+            try:
+                name = result.get('name', '')
+                self.progress_bus.publish(PROGRESS_TOPIC, f"{job_id}:{name}",
+                                          {"kind": "organization", "job_id": job_id, **compact_progress(result)})
+                if self.current_job and self.current_job.job_id == job_id:
+                    if status == 'COMPLETED':
+                        self.current_job.processed_count += 1
+                    elif status == 'FAILED':
+                        self.current_job.failed_count += 1
+                self.publish_job_status(job_id, name)
+            except Exception as e:
+                self.logger.debug(f"진행 스트림 발행 실패: {e}")
+            
+            # 중간 단계는 스트림으로만 (폴링 화면용 DB 기록 생략)
+            if status not in TERMINAL_STATUSES and not PROGRESS_STREAM_CONFIG.get("persist_steps", False):
+                return
+            
             try:
                 # 1. crawling_results 테이블에 결과 저장
                 result_data = {
@@ -132,7 +220,7 @@ class CrawlingService:
                     'organization_name': result.get('name', ''),
                     'category': result.get('category', ''),
                     'homepage_url': result.get('homepage_url', ''),
-                    'status': result.get('status', 'PROCESSING'),
+                    'status': status,
                     'current_step': result.get('current_step', ''),
                     'processing_time': result.get('processing_time', 0),
                     'extraction_method': result.get('extraction_method', ''),
@@ -145,7 +233,9 @@ class CrawlingService:
                         'homepage_parsed': result.get('homepage_parsed'),
                         'ai_summary': result.get('ai_summary'),
                         'meta_info': result.get('meta_info'),
-                        'contact_info_extracted': result.get('contact_info_extracted')
+                        'contact_info_extracted': result.get('contact_info_extracted'),
+                        'stage_timings': result.get('stage_timings'),
+                        'trace': result.get('trace')
                     }),
                     'error_message': result.get('error_message', '')
                 }
@@ -153,9 +243,9 @@ class CrawlingService:
                 self.db.add_crawling_result(result_data)
                 
                 # 2. COMPLETED 상태일 때 organizations 테이블 실시간 업데이트
-                if result.get('status') == 'COMPLETED':
+                if status == 'COMPLETED':
                     # 기관명으로 organizations 테이블에서 해당 기관 찾기
-                    org_id = self.db.find_organization_by_name(result.get('name', ''))
+                    org_id = self.find_organization_id(result.get('name', ''), result.get('address', ''))
                     
                     if org_id:
                         # organizations 테이블 업데이트
@@ -209,6 +299,11 @@ class CrawlingService:
                         if org_data.get('name'):  # 이름이 있는 경우만 생성
                             new_org_id = self.db.create_organization(org_data)
                             self.logger.info(f"✅ 새 기관 생성: {result.get('name')} (ID: {new_org_id})")
+                            
+                            # 변경 알림 도착 전 같은 기관 결과가 다시 와도 중복 생성되지 않도록 즉시 반영
+                            if new_org_id and self.org_index is not None:
+                                self.org_index.upsert(new_org_id, org_data['name'],
+                                                      org_data.get('address', ''), org_data.get('phone', ''))
                     
                     # 진행률 업데이트
                     progress = self.db.get_crawling_progress(job_id)
@@ -248,6 +343,8 @@ class CrawlingService:
                 started_at=datetime.now().isoformat(),
                 data_file=data_file
             )
+            self.progress_bus.clear(PROGRESS_TOPIC)
+            self.publish_job_status(job_id)
             
             # 5. 크롤러 인스턴스 생성
             from crawler_main import AIEnhancedModularUnifiedCrawler
@@ -284,6 +381,7 @@ class CrawlingService:
                     if self.current_job:
                         self.current_job.status = "COMPLETED"
                         self.current_job.completed_at = datetime.now().isoformat()
+                        self.publish_job_status(job_id)
                     
                     self.logger.info(f"✅ 파일 기반 크롤링 완료: Job ID {job_id}")
                     
@@ -301,6 +399,7 @@ class CrawlingService:
                         self.current_job.status = "ERROR"
                         self.current_job.error_message = str(e)
                         self.current_job.completed_at = datetime.now().isoformat()
+                        self.publish_job_status(job_id)
             
             # 백그라운드 스레드 시작
             threading.Thread(target=run_crawling, daemon=True).start()
@@ -451,6 +550,7 @@ class CrawlingService:
             
             self.current_job.status = "STOPPED"
             self.current_job.completed_at = datetime.now().isoformat()
+            self.publish_job_status(self.current_job.job_id)
             
             self.logger.info(f"⏹️ 크롤링 중지: Job ID {self.current_job.job_id}")
             
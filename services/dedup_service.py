@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+중복 기관 탐지/검토 서비스
+DuplicateDetector로 전체 기관 테이블의 병합 후보를 찾아 저장하고,
+검토자가 승인(병합) 또는 반려할 수 있도록 관리
+"""
+
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import psycopg2.extras
+
+from database.database import get_database
+from utils.logger_utils import LoggerUtils
+
+logger = LoggerUtils.setup_logger(name="dedup_service", file_logging=False)
+
+# 병합 시 대표 기관에 비어 있으면 채워 넣을 필드
+MERGE_FILL_FIELDS = ["phone", "fax", "email", "mobile", "homepage", "address", "postal_code"]
+
+
+class DedupService:
+    """중복 기관 탐지 및 검토 관리"""
+
+    def __init__(self):
+        self.db = get_database()
+        self.logger = logger
+        self._detector = None
+
+        # 탐지 실행 상태 (한 번에 하나만 실행)
+        self.run_status: Dict[str, Any] = {"status": "IDLE"}
+        self._run_lock = threading.Lock()
+
+        self._ensure_schema()
+
+    @property
+    def detector(self):
+        """NumPy 기반 탐지기 (첫 탐지 실행 시 import)"""
+        if self._detector is None:
+            from database.dedup_engine import DuplicateDetector
+            self._detector = DuplicateDetector()
+        return self._detector
+
+    def _ensure_schema(self):
+        """검토 대상 클러스터 테이블 생성"""
+        try:
+            self.db.execute_update("""
+                CREATE TABLE IF NOT EXISTS organization_duplicate_clusters (
+                    id SERIAL PRIMARY KEY,
+                    org_ids INTEGER[] NOT NULL,
+                    canonical_id INTEGER NOT NULL,
+                    score REAL NOT NULL,
+                    pair_details JSONB,
+                    status VARCHAR(20) DEFAULT 'PENDING',
+                    reviewed_by VARCHAR(50),
+                    reviewed_at TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE INDEX IF NOT EXISTS idx_duplicate_clusters_status
+                    ON organization_duplicate_clusters(status);
+            """)
+        except Exception as e:
+            self.logger.error(f"❌ 중복 클러스터 테이블 생성 실패: {e}")
+
+    # ===== 탐지 =====
+
+    def load_records(self, batch_size: int = 5000) -> List[Dict[str, Any]]:
+        """활성 기관 전체를 서버사이드 커서로 로드"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(name="dedup_load", cursor_factory=psycopg2.extras.RealDictCursor)
+            cursor.itersize = batch_size
+            cursor.execute("""
+                SELECT id, name, address, phone, fax, email, homepage
+                FROM organizations WHERE is_active = true
+            """)
+            records = [dict(row) for row in cursor]
+            cursor.close()
+        return records
+
+    def run_detection(self, started_by: str = "SYSTEM") -> Dict[str, Any]:
+        """전체 기관 중복 탐지 후 검토 대기 클러스터 갱신 (동기 실행)"""
+        if not self._run_lock.acquire(blocking=False):
+            return {"status": "error", "message": "이미 중복 탐지가 실행 중입니다"}
+
+        try:
+            self.run_status = {"status": "RUNNING", "started_by": started_by,
+                               "started_at": datetime.now().isoformat()}
+            self.logger.info(f"🔍 중복 기관 탐지 시작 (요청자: {started_by})")
+
+            records = self.load_records()
+            clusters = self.detector.find_clusters(records)
+            self._save_clusters(clusters)
+
+            self.run_status.update({
+                "status": "COMPLETED",
+                "completed_at": datetime.now().isoformat(),
+                "stats": self.detector.stats
+            })
+            self.logger.info(f"✅ 중복 기관 탐지 완료: {self.detector.stats}")
+            return {"status": "success", **self.run_status}
+
+        except Exception as e:
+            self.logger.error(f"❌ 중복 기관 탐지 실패: {e}")
+            self.run_status.update({"status": "ERROR", "error_message": str(e)})
+            return {"status": "error", "message": str(e)}
+        finally:
+            self._run_lock.release()
+
+    def start_detection(self, started_by: str = "API_USER") -> Dict[str, Any]:
+        """백그라운드 스레드에서 중복 탐지 시작"""
+        if self.run_status.get("status") == "RUNNING":
+            return {"status": "error", "message": "이미 중복 탐지가 실행 중입니다"}
+
+        threading.Thread(target=self.run_detection, args=(started_by,), daemon=True).start()
+        return {"status": "success", "message": "중복 탐지가 시작되었습니다"}
+
+    def _save_clusters(self, clusters):
+        """이전 미검토 클러스터를 새 결과로 교체 (검토 완료 건은 보존)"""
+        rows = [
+            (cluster.org_ids, cluster.canonical_id, cluster.score, json.dumps(cluster.pairs, ensure_ascii=False))
+            for cluster in clusters
+        ]
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM organization_duplicate_clusters WHERE status = 'PENDING'")
+            psycopg2.extras.execute_values(cursor, """
+                INSERT INTO organization_duplicate_clusters (org_ids, canonical_id, score, pair_details)
+                VALUES %s
+            """, rows, page_size=1000)
+            conn.commit()
+
+    # ===== 검토 =====
+
+    def list_clusters(self, status: str = "PENDING", page: int = 1, per_page: int = 20) -> Dict[str, Any]:
+        """검토 클러스터 목록 (점수 높은 순, 소속 기관 요약 포함)"""
+        offset = (page - 1) * per_page
+        total = self.db.execute_query(
+            "SELECT COUNT(*) AS total FROM organization_duplicate_clusters WHERE status = %s",
+            (status,), fetch_all=False
+        )["total"]
+
+        clusters = self.db.execute_query("""
+            SELECT id, org_ids, canonical_id, score, status, reviewed_by, reviewed_at, created_at
+            FROM organization_duplicate_clusters
+            WHERE status = %s
+            ORDER BY score DESC, id
+            LIMIT %s OFFSET %s
+        """, (status, per_page, offset))
+
+        # 페이지 내 모든 기관을 한 번에 조회
+        org_ids = sorted({org_id for cluster in clusters for org_id in cluster["org_ids"]})
+        organizations = self._get_organizations(org_ids)
+        for cluster in clusters:
+            cluster["organizations"] = [organizations[org_id] for org_id in cluster["org_ids"] if org_id in organizations]
+
+        return {
+            "clusters": clusters,
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total_count": total,
+                "total_pages": (total + per_page - 1) // per_page
+            }
+        }
+
+    def get_cluster(self, cluster_id: int) -> Optional[Dict[str, Any]]:
+        """클러스터 상세 (쌍별 유사도 포함)"""
+        cluster = self.db.execute_query(
+            "SELECT * FROM organization_duplicate_clusters WHERE id = %s", (cluster_id,), fetch_all=False
+        )
+        if not cluster:
+            return None
+
+        organizations = self._get_organizations(cluster["org_ids"])
+        cluster["organizations"] = [organizations[org_id] for org_id in cluster["org_ids"] if org_id in organizations]
+        return cluster
+
+    def _get_organizations(self, org_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        if not org_ids:
+            return {}
+        rows = self.db.execute_query("""
+            SELECT id, name, address, phone, fax, email, homepage, mobile, postal_code, is_active, created_at
+            FROM organizations WHERE id = ANY(%s)
+        """, (list(org_ids),))
+        return {row["id"]: row for row in rows}
+
+    def approve_cluster(self, cluster_id: int, reviewed_by: str, canonical_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        클러스터 병합 승인
+        대표 기관의 빈 연락처를 다른 기관 값으로 채우고, 나머지 기관은 비활성화
+        클러스터/기관 행을 잠근 한 트랜잭션 안에서 상태를 확인하므로 동시 승인·반려가 겹쳐도 한 번만 반영
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+
+            def fail(message: str) -> Dict[str, Any]:
+                conn.rollback()
+                return {"status": "error", "message": message}
+
+            cursor.execute(
+                "SELECT * FROM organization_duplicate_clusters WHERE id = %s FOR UPDATE", (cluster_id,)
+            )
+            cluster = cursor.fetchone()
+            if not cluster:
+                return fail("클러스터를 찾을 수 없습니다")
+            if cluster["status"] != "PENDING":
+                return fail(f"이미 검토된 클러스터입니다 ({cluster['status']})")
+
+            canonical_id = canonical_id or cluster["canonical_id"]
+            if canonical_id not in cluster["org_ids"]:
+                return fail("대표 기관이 클러스터에 속하지 않습니다")
+
+            cursor.execute("""
+                SELECT id, name, address, phone, fax, email, homepage, mobile, postal_code, is_active
+                FROM organizations WHERE id = ANY(%s) ORDER BY id FOR UPDATE
+            """, (list(cluster["org_ids"]),))
+            organizations = {row["id"]: row for row in cursor.fetchall()}
+
+            canonical = organizations.get(canonical_id)
+            if not canonical:
+                return fail("대표 기관 정보를 찾을 수 없습니다")
+            if not canonical["is_active"]:
+                return fail(f"대표 기관이 비활성 상태입니다 (ID {canonical_id})")
+
+            duplicate_ids = [org_id for org_id in cluster["org_ids"] if org_id != canonical_id]
+            inactive_ids = [org_id for org_id in duplicate_ids if not organizations.get(org_id, {}).get("is_active")]
+            if inactive_ids:
+                return fail(f"이미 비활성화되었거나 없는 기관이 있습니다 (ID {inactive_ids})")
+
+            # 대표 기관에 비어 있는 필드만 채움 (대표 → 중복 순, ID 오름차순)
+            fill_values = {}
+            for field_name in MERGE_FILL_FIELDS:
+                if canonical.get(field_name):
+                    continue
+                for org_id in duplicate_ids:
+                    value = organizations[org_id].get(field_name)
+                    if value:
+                        fill_values[field_name] = value
+                        break
+
+            if fill_values:
+                assignments = ", ".join(f"{name} = %s" for name in fill_values)
+                cursor.execute(
+                    f"UPDATE organizations SET {assignments}, updated_by = %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s",
+                    (*fill_values.values(), reviewed_by, canonical_id)
+                )
+
+            cursor.execute("""
+                UPDATE organizations
+                SET is_active = false,
+                    internal_notes = COALESCE(internal_notes || E'\\n', '') || %s,
+                    updated_by = %s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ANY(%s) AND is_active = true
+            """, (f"[중복 병합] 대표 기관 ID {canonical_id}로 병합됨", reviewed_by, duplicate_ids))
+            if cursor.rowcount != len(duplicate_ids):
+                return fail("병합 중 기관 상태가 변경되었습니다")
+
+            cursor.execute("""
+                UPDATE organization_duplicate_clusters
+                SET status = 'MERGED', canonical_id = %s, reviewed_by = %s, reviewed_at = CURRENT_TIMESTAMP
+                WHERE id = %s AND status = 'PENDING'
+            """, (canonical_id, reviewed_by, cluster_id))
+            if cursor.rowcount != 1:
+                return fail("검토 대기 중인 클러스터가 아닙니다")
+            conn.commit()
+
+        self.logger.info(f"✅ 중복 병합 승인: 클러스터 {cluster_id} → 대표 {canonical_id}, 비활성화 {duplicate_ids}")
+        return {
+            "status": "success",
+            "canonical_id": canonical_id,
+            "merged_ids": duplicate_ids,
+            "filled_fields": list(fill_values.keys())
+        }
+
+    def reject_cluster(self, cluster_id: int, reviewed_by: str) -> Dict[str, Any]:
+        """클러스터 반려 (중복 아님)"""
+        updated = self.db.execute_update("""
+            UPDATE organization_duplicate_clusters
+            SET status = 'REJECTED', reviewed_by = %s, reviewed_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND status = 'PENDING'
+        """, (reviewed_by, cluster_id))
+
+        if not updated:
+            return {"status": "error", "message": "검토 대기 중인 클러스터가 아닙니다"}
+
+        self.logger.info(f"🚫 중복 후보 반려: 클러스터 {cluster_id} ({reviewed_by})")
+        return {"status": "success", "cluster_id": cluster_id}
+
+    def get_summary(self) -> Dict[str, Any]:
+        """상태별 클러스터 수 + 최근 탐지 실행 상태"""
+        rows = self.db.execute_query("""
+            SELECT status, COUNT(*) AS count, COALESCE(SUM(array_length(org_ids, 1) - 1), 0) AS duplicates
+            FROM organization_duplicate_clusters GROUP BY status
+        """)
+        return {
+            "run": self.run_status,
+            "by_status": {row["status"]: {"clusters": row["count"], "duplicates": row["duplicates"]} for row in rows}
+        }
+
+
+# 싱글톤 인스턴스
+_dedup_service_instance = None
+
+
+def get_dedup_service() -> DedupService:
+    """중복 탐지 서비스 인스턴스 반환 (싱글톤)"""
+    global _dedup_service_instance
+    if _dedup_service_instance is None:
+        _dedup_service_instance = DedupService()
+    return _dedup_service_instance
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 진행 상황 이벤트 버스
+대시보드가 2초마다 /api/enrichment/crawling-progress, /api/statistics/real-time-results(ORDER BY updated_at 쿼리)를
+폴링하고, 진행 콜백은 그 폴링에 보여주려고 단계마다 DB에 기록하던 구조를 프로세스 내 푸시로 대체
+
+- publish(topic, key, data): 크롤러 스레드/이벤트 루프 어디서든 호출 (잠금 + dict 갱신만, 구독자가 없으면 스냅샷만 갱신)
+- 병합: coalesce_interval 동안 같은 (topic, key)의 이벤트는 마지막 것만 전달 (기관별 단계 진행 → 최신 상태 1건)
+- subscribe(): 이벤트 루프별 asyncio 큐로 배치 전달 (느린 구독자는 오래된 배치부터 버림)
+- snapshot(): 새 구독자에게 보낼 토픽별 최신 상태 (재접속 시 폴링 없이 현재 화면 복원)
+- PostgreSQL LISTEN/NOTIFY 팬아웃 (PROGRESS_STREAM_CONFIG["notify"]): 여러 앱 워커가 있을 때
+  배치를 pg_notify로 보내고, 다른 워커가 보낸 배치는 LISTEN 스레드가 받아 로컬 구독자에게 전달
+"""
+
+import asyncio
+import json
+import select
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.logger_utils import LoggerUtils
+from utils.metrics import get_metrics_registry
+from utils.settings import PROGRESS_STREAM_CONFIG
+
+METRICS = get_metrics_registry()
+PROGRESS_EVENTS = METRICS.counter(
+    "progress_events_total", "진행 상황 이벤트 수 (published/coalesced/delivered/dropped/remote)", ["outcome"]
+)
+
+logger = LoggerUtils.setup_logger(name="progress_bus", file_logging=False)
+
+# 스트림으로 보내는 필드 (homepage_parsed/ai_summary 같은 큰 값은 제외 - 상세는 결과 조회 API)
+PROGRESS_FIELDS = (
+    "name", "category", "status", "current_step", "homepage_url", "phone", "fax", "email",
+    "mobile", "address", "processing_time", "error_message"
+)
+
+
+def compact_progress(data: Dict[str, Any], fields: Iterable[str] = PROGRESS_FIELDS) -> Dict[str, Any]:
+    """진행 콜백 데이터에서 스트림 필드만 추림 (빈 값 제외)"""
+    return {field: data[field] for field in fields if data.get(field) not in (None, "")}
+
+
+class Subscription:
+    """구독자 1명 (생성한 이벤트 루프에서만 사용)"""
+
+    def __init__(self, bus: "ProgressBus", topics: Optional[Set[str]], loop: asyncio.AbstractEventLoop,
+                 maxsize: int):
+        self.bus = bus
+        self.topics = topics
+        self.loop = loop
+        self.queue: "asyncio.Queue[List[Dict[str, Any]]]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+        self.closed = False
+
+    def wants(self, topic: str) -> bool:
+        return self.topics is None or topic in self.topics
+
+    def _put(self, batch: List[Dict[str, Any]]):
+        # 구독자 이벤트 루프에서 실행 (call_soon_threadsafe)
+        if self.closed:
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            self.bus.count_dropped()
+            PROGRESS_EVENTS.labels("dropped").inc()
+        self.queue.put_nowait(batch)
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """다음 배치 (timeout 동안 없으면 빈 리스트 - SSE/WebSocket heartbeat용)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class ProgressBus:
+    """프로세스 공용 진행 상황 버스 (스레드 안전)"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or PROGRESS_STREAM_CONFIG
+        self.origin = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._pending: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._snapshots: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {}
+        self._subscribers: List[Subscription] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._notify_conn = None
+        self._listener: Optional[threading.Thread] = None
+        self._stats = {"published": 0, "coalesced": 0, "delivered": 0, "batches": 0, "remote": 0,
+                       "dropped": 0, "notify_errors": 0}
+        METRICS.mapping("progress_bus", "진행 상황 버스 상태", self.get_stats)
+
+    @property
+    def notify_enabled(self) -> bool:
+        return self.config.get("notify", {}).get("enabled", False)
+
+    # ===== 발행 =====
+
+    def publish(self, topic: str, key: str, data: Dict[str, Any]):
+        """이벤트 발행 - 같은 (topic, key)는 다음 전달 시점까지 마지막 것으로 병합"""
+        with self._lock:
+            self._seq += 1
+            event = {
+                "topic": topic,
+                "key": key,
+                "seq": self._seq,
+                "time": datetime.now().isoformat(timespec="milliseconds"),
+                "data": data
+            }
+            self._remember(event)
+            self._stats["published"] += 1
+            if self._subscribers or self.notify_enabled:
+                if (topic, key) in self._pending:
+                    self._stats["coalesced"] += 1
+                    PROGRESS_EVENTS.labels("coalesced").inc()
+                    del self._pending[(topic, key)]
+                self._pending[(topic, key)] = event
+        PROGRESS_EVENTS.labels("published").inc()
+        self._ensure_flusher()
+
+    def publisher(self, topic: str, key_field: str = "name") -> Callable[[Dict[str, Any]], None]:
+        """진행 콜백 형태(data → None)의 발행 함수 (크롤러 런타임 리스너용)"""
+        def publish(data: Dict[str, Any]):
+            self.publish(topic, str(data.get(key_field) or "unknown"), compact_progress(data))
+        return publish
+
+    def _remember(self, event: Dict[str, Any]):
+        snapshot = self._snapshots.setdefault(event["topic"], OrderedDict())
+        snapshot.pop(event["key"], None)
+        snapshot[event["key"]] = event
+        while len(snapshot) > self.config.get("snapshot_size", 50):
+            snapshot.popitem(last=False)
+
+    def snapshot(self, topics: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """토픽별 최신 상태 (오래된 것부터)"""
+        with self._lock:
+            names = list(self._snapshots) if topics is None else [t for t in topics if t in self._snapshots]
+            events = [event for name in names for event in self._snapshots[name].values()]
+        return sorted(events, key=lambda event: event["seq"])
+
+    def clear(self, topic: str):
+        """토픽 스냅샷 비우기 (새 작업 시작 시 이전 작업 상태가 새 구독자에게 가지 않도록)"""
+        with self._lock:
+            self._snapshots.pop(topic, None)
+
+    # ===== 구독 =====
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None) -> Subscription:
+        """현재 이벤트 루프에 구독자 등록 (async 함수 안에서 호출)"""
+        subscription = Subscription(
+            self, set(topics) if topics else None, asyncio.get_running_loop(),
+            self.config.get("subscriber_queue_size", 100)
+        )
+        with self._lock:
+            self._subscribers.append(subscription)
+        self._ensure_flusher()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscription.closed = True
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def _deliver(self, events: List[Dict[str, Any]]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            batch = [event for event in events if subscription.wants(event["topic"])]
+            if not batch:
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, batch)
+            except RuntimeError:
+                # 이벤트 루프가 닫힌 구독자 (연결 종료 처리 전 서버 종료 등)
+                self.unsubscribe(subscription)
+                continue
+            with self._lock:
+                self._stats["delivered"] += len(batch)
+            PROGRESS_EVENTS.labels("delivered").inc(len(batch))
+
+    # ===== 전달 스레드 =====
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None or self._stop.is_set():
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="progress-bus-flusher", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        interval = self.config.get("coalesce_interval", 0.5)
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """병합된 이벤트를 구독자 / NOTIFY로 전달"""
+        with self._lock:
+            if not self._pending:
+                return
+            events = list(self._pending.values())
+            self._pending.clear()
+            self._stats["batches"] += 1
+        self._deliver(events)
+        if self.notify_enabled:
+            self._notify(events)
+
+    # ===== PostgreSQL LISTEN/NOTIFY 팬아웃 =====
+
+    def _notify(self, events: List[Dict[str, Any]]):
+        """배치를 pg_notify 페이로드 한도(기본 8000바이트 미만) 단위로 나눠 전송"""
+        max_bytes = self.config["notify"].get("max_payload_bytes", 7500)
+        channel = self.config["notify"].get("channel", "crawl_progress")
+        envelope = len(json.dumps({"origin": self.origin, "events": []}))
+        payloads, chunk, size = [], [], envelope
+        for event in events:
+            encoded = json.dumps(event, ensure_ascii=False, default=str)
+            length = len(encoded.encode("utf-8")) + 1
+            if length + envelope > max_bytes:
+                logger.debug(f"NOTIFY 한도 초과 이벤트 제외: {event['topic']}/{event['key']}")
+                continue
+            if chunk and size + length > max_bytes:
+                payloads.append(chunk)
+                chunk, size = [], envelope
+            chunk.append(encoded)
+            size += length
+        if chunk:
+            payloads.append(chunk)
+
+        try:
+            if self._notify_conn is None or self._notify_conn.closed:
+                self._notify_conn = self._connect()
+            with self._notify_conn.cursor() as cursor:
+                for chunk in payloads:
+                    payload = f'{{"origin": "{self.origin}", "events": [{",".join(chunk)}]}}'
+                    cursor.execute("SELECT pg_notify(%s, %s)", (channel, payload))
+        except Exception as e:
+            with self._lock:
+                self._stats["notify_errors"] += 1
+            logger.warning(f"⚠️ 진행 상황 NOTIFY 실패: {e}")
+            self._notify_conn = None
+
+    @staticmethod
+    def _connect():
+        import psycopg2
+        import psycopg2.extensions
+        from database.database import get_database
+
+        conn = psycopg2.connect(get_database().db_url)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def apply_remote(self, payload: str):
+        """다른 워커가 보낸 NOTIFY 페이로드를 로컬 스냅샷/구독자에 반영 (자기 워커가 보낸 것은 무시)"""
+        message = json.loads(payload)
+        if message.get("origin") == self.origin:
+            return
+        events = message.get("events", [])
+        with self._lock:
+            for event in events:
+                self._remember(event)
+            self._stats["remote"] += len(events)
+        PROGRESS_EVENTS.labels("remote").inc(len(events))
+        self._deliver(events)
+
+    def start_listener(self) -> bool:
+        """백그라운드 스레드에서 LISTEN (notify 설정이 켜진 경우만)"""
+        if not self.notify_enabled:
+            return False
+        if self._listener and self._listener.is_alive():
+            return True
+
+        channel = self.config["notify"].get("channel", "crawl_progress")
+        poll_interval = self.config["notify"].get("poll_interval", 5.0)
+
+        def listen():
+            while not self._stop.is_set():
+                conn = None
+                try:
+                    conn = self._connect()
+                    conn.cursor().execute(f"LISTEN {channel};")
+                    logger.info(f"📡 진행 상황 LISTEN 시작: {channel}")
+                    while not self._stop.is_set():
+                        if select.select([conn], [], [], poll_interval) == ([], [], []):
+                            continue
+                        conn.poll()
+                        while conn.notifies:
+                            notify = conn.notifies.pop(0)
+                            try:
+                                self.apply_remote(notify.payload)
+                            except Exception as e:
+                                logger.warning(f"⚠️ 진행 상황 NOTIFY 반영 실패: {e}")
+                except Exception as e:
+                    logger.warning(f"⚠️ 진행 상황 LISTEN 연결 오류 (재연결 대기): {e}")
+                    self._stop.wait(poll_interval)
+                finally:
+                    if conn is not None:
+                        conn.close()
+
+        self._listener = threading.Thread(target=listen, name="progress-bus-listener", daemon=True)
+        self._listener.start()
+        return True
+
+    # ===== 종료 / 통계 =====
+
+    def stop(self):
+        """남은 이벤트 전달 후 전달/LISTEN 스레드 종료"""
+        self._stop.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush()
+        if self._notify_conn is not None:
+            try:
+                self._notify_conn.close()
+            except Exception:
+                pass
+            self._notify_conn = None
+
+    def count_dropped(self):
+        with self._lock:
+            self._stats["dropped"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["subscribers"] = len(self._subscribers)
+            stats["pending"] = len(self._pending)
+        stats["listening"] = bool(self._listener and self._listener.is_alive())
+        return stats
+
+
+_bus_instance = None
+_bus_lock = threading.Lock()
+
+
+def get_progress_bus() -> ProgressBus:
+    """프로세스 공용 진행 상황 버스 반환 (싱글톤)"""
+    global _bus_instance
+    if _bus_instance is None:
+        with _bus_lock:
+            if _bus_instance is None:
+                _bus_instance = ProgressBus()
+    return _bus_instance
@@ -20,6 +20,10 @@ class CRMSystem {
             crawling: null,
             dashboard: null
         };
+        // 진행 상황 푸시 스트림 (SSE) - 연결 실패 시 폴링으로 대체
+        this.crawlingStream = null;
+        this.streamResults = new Map();
+        this.streamJobId = 0;
     }
 
     // ===== 초기화 =====
@@ -344,6 +348,71 @@ class CRMSystem {
     }
 
     startCrawlingMonitoring() {
+        if (this.crawlingStream || this.intervals.crawling) return;
+        
+        if (!window.EventSource) {
+            this.startCrawlingPolling();
+            return;
+        }
+        
+        this.streamResults.clear();
+        this.streamJobId = 0;
+        this.crawlingStream = new EventSource('/api/enrichment/crawling-stream?topics=crawl_job');
+        this.crawlingStream.addEventListener('crawl_job', (message) => {
+            this.handleCrawlingEvent(JSON.parse(message.data));
+        });
+        this.crawlingStream.onerror = () => {
+            // 서버가 스트림을 지원하지 않거나 연결이 닫힌 경우 (EventSource 자체 재연결 중이면 CONNECTING)
+            if (this.crawlingStream && this.crawlingStream.readyState === EventSource.CLOSED) {
+                console.warn('진행 상황 스트림 종료 - 폴링으로 전환');
+                this.crawlingStream = null;
+                this.startCrawlingPolling();
+            }
+        };
+    }
+
+    handleCrawlingEvent(event) {
+        const data = event.data || {};
+        
+        // 이전 작업 이벤트 무시 (작업 ID는 증가)
+        if (data.job_id < this.streamJobId) return;
+        this.streamJobId = data.job_id || 0;
+        
+        if (data.kind === 'organization') {
+            // 기관별 최신 상태 (최근 5건만 표시)
+            this.streamResults.delete(event.key);
+            this.streamResults.set(event.key, {
+                ...data,
+                organization_name: data.name,
+                processing_time: data.processing_time ? Math.round(data.processing_time * 10) / 10 : null
+            });
+            while (this.streamResults.size > 5) {
+                this.streamResults.delete(this.streamResults.keys().next().value);
+            }
+            return;
+        }
+        
+        if (data.kind !== 'job') return;
+        const status = (data.status || '').toLowerCase();
+        
+        if (status === 'completed' || status === 'error' || status === 'stopped') {
+            this.stopCrawlingMonitoring();
+            this.crawlingStatus = null;
+            UI.updateCrawlingControls(false);
+            
+            if (status === 'completed') {
+                UI.showSuccess('크롤링이 완료되었습니다!');
+                this.loadDashboardStats(); // 통계 갱신
+            } else if (status === 'error') {
+                UI.showError('크롤링 중 오류가 발생했습니다.');
+            }
+        } else if (this.crawlingStatus) {
+            this.crawlingStatus.progress = data;
+            UI.updateCrawlingProgress(data, Array.from(this.streamResults.values()).reverse());
+        }
+    }
+
+    startCrawlingPolling() {
         if (this.intervals.crawling) return;
         
         this.intervals.crawling = setInterval(async () => {
@@ -373,6 +442,10 @@ class CRMSystem {
     }
 
     stopCrawlingMonitoring() {
+        if (this.crawlingStream) {
+            this.crawlingStream.close();
+            this.crawlingStream = null;
+        }
         if (this.intervals.crawling) {
             clearInterval(this.intervals.crawling);
             this.intervals.crawling = null;
@@ -445,6 +518,7 @@ class CRMSystem {
         Object.values(this.intervals).forEach(interval => {
             if (interval) clearInterval(interval);
         });
+        if (this.crawlingStream) this.crawlingStream.close();
     }
 }
 
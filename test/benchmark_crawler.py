@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 크롤링 벤치마크
+AIEnhancedModularUnifiedCrawler.process_organizations를 fixture 재생 모드 + 모의 AI로 끝까지 실행하고
+처리량(orgs/sec), 단계별 p95, 메모리를 보고 (운영 배포 전 성능 회귀 확인용)
+
+- 코퍼스: 실제 크롤링을 CRAWL_FIXTURE_MODE=record로 돌려 기록하거나 --synthetic N으로 생성
+- 응답은 로컬 대역 서버(utils/fixture_server.py)를 거쳐 지연/실패 주입을 받음 (--no-server면 파일 직접 읽기)
+- AI는 모의 모델 (응답 지연 --ai-latency-ms, 연락처 추출은 규칙 기반 결과를 JSON으로 반환)
+- DB 저장은 하지 않음
+
+사용 예:
+    python test/benchmark_crawler.py --synthetic 200 --latency-ms 80 --failure-rate 0.02
+    python test/benchmark_crawler.py --fixtures test/fixtures/crawl --orgs orgs.json --output bench.json
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from utils.contact_query_planner import ContactQueryPlanner
+from utils.contact_rules import extract_contacts, get_ai_skip_stats
+from utils.fixture_corpus import FixtureCorpus, FixtureFetcher
+from utils.fixture_server import FixtureServer
+from utils.metrics import get_metrics_registry
+from utils.settings import CRAWL_FIXTURE_CONFIG, CRAWLING_CONFIG
+
+METRICS = get_metrics_registry()
+
+MOCK_VERIFICATION_RESPONSE = "\n".join([
+    "VALID: 예",
+    "TYPE: 공식사이트",
+    "CONFIDENCE: 0.9",
+    "REASON: 벤치마크 모의 응답",
+    "OVERALL_VALIDITY: valid",
+    "PHONE_VALIDITY: valid",
+    "FAX_VALIDITY: valid",
+    "HOMEPAGE_VALIDITY: valid",
+    "CONFIDENCE_SCORE: 0.9"
+])
+
+
+# ===== 모의 AI =====
+
+class MockGeminiModel:
+    """generate_content만 흉내 내는 모의 모델 (스레드에서 호출됨)"""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 42):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _delay(self) -> float:
+        with self._lock:
+            self.calls += 1
+            return (self.latency_ms + self._random.uniform(0, self.jitter_ms)) / 1000.0
+
+    def respond(self, prompt: str) -> str:
+        # 연락처 추출 프롬프트는 JSON 응답, 나머지(검증)는 VALID/OVERALL_VALIDITY 형식
+        if "응답 형식 (JSON)" in prompt:
+            return json.dumps(extract_contacts(prompt).to_contact_info(), ensure_ascii=False)
+        return MOCK_VERIFICATION_RESPONSE
+
+    def generate_content(self, prompt: str, **kwargs):
+        delay = self._delay()
+        if delay > 0:
+            time.sleep(delay)
+        return SimpleNamespace(text=self.respond(prompt))
+
+
+class MockAIManager:
+    """크롤러가 쓰는 AIModelManager 인터페이스 (gemini_model, extract_with_gemini)"""
+
+    def __init__(self, model: MockGeminiModel):
+        self.gemini_model = model
+
+    async def extract_with_gemini(self, text_content: str, prompt_template: str, task: str = None) -> str:
+        response = await asyncio.to_thread(self.gemini_model.generate_content, prompt_template)
+        return response.text
+
+
+# ===== 합성 코퍼스 =====
+
+_FILLER = ("저희 기관은 지역 사회와 함께 성장하며 이웃을 섬기는 공동체입니다. "
+           "매주 다양한 프로그램과 모임이 열리며 누구나 참여할 수 있습니다. ")
+_REGIONS = [("서울", "02", "서울특별시 관악구 봉천로 {n}"), ("부산", "051", "부산광역시 해운대구 해운대로 {n}"),
+            ("경기", "031", "경기도 고양시 일산동구 중앙로 {n}"), ("대구", "053", "대구광역시 수성구 동대구로 {n}")]
+
+
+def _number(rng: random.Random, area_code: str) -> str:
+    return f"{area_code}-{rng.randint(300, 899)}-{rng.randint(1000, 9999)}"
+
+
+def _page_html(name: str, body: str, footer: str, link_contact: bool) -> str:
+    menu = " ".join(f"<a href='/menu{i}'>메뉴{i}</a>" for i in range(8))
+    contact_link = "<a href='/contact'>오시는길</a>" if link_contact else ""
+    return (f"<html><head><title>{name}</title></head><body>"
+            f"<nav>{menu} {contact_link}</nav><main><h1>{name}</h1><p>{body}</p></main>"
+            f"<footer>{footer}</footer></body></html>")
+
+
+def build_synthetic_corpus(directory: str, count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    합성 기관 목록과 코퍼스 생성 (기관 4종을 번갈아 생성)
+    0: footer에 TEL/FAX 라벨 (규칙 기반으로 확정, AI 생략)
+    1: footer에 전화만 (AI 추출 + 팩스는 검색)
+    2: 홈페이지 없음 (검색만)
+    3: 본문이 짧아 렌더링 경로 사용 + 연락처 페이지
+    """
+    rng = random.Random(seed)
+    corpus = FixtureCorpus(directory)
+    planner = ContactQueryPlanner
+    organizations = []
+
+    for index in range(count):
+        profile = index % 4
+        region, area_code, address_format = _REGIONS[index % len(_REGIONS)]
+        name = f"벤치마크교회{index:04d}"
+        address = address_format.format(n=index + 1)
+        phone, fax = _number(rng, area_code), _number(rng, area_code)
+        homepage = "" if profile == 2 else f"http://org{index}.bench.local/"
+        organizations.append({"name": name, "category": "종교시설", "address": address, "homepage": homepage})
+
+        body = _FILLER * 12
+        if profile == 0:
+            html = _page_html(name, body, f"{address} TEL {phone} FAX {fax} © {name}", False)
+            corpus.put("page", homepage, html, url=homepage, status=200)
+        elif profile == 1:
+            html = _page_html(name, body, f"{address} 대표전화 {phone}", False)
+            corpus.put("page", homepage, html, url=homepage, status=200)
+        elif profile == 3:
+            corpus.put("page", homepage, _page_html(name, "준비 중", "", True), url=homepage, status=200)
+            corpus.put("rendered", homepage, f"{name} {body} 문의 {phone}",
+                       html=_page_html(name, body, f"문의 {phone}", True))
+            contact_url = homepage + "contact"
+            corpus.put("page", contact_url,
+                       _page_html(name, "오시는길", f"{address} 전화 {phone} 팩스 {fax}", False),
+                       url=contact_url, status=200)
+
+        serp = (f"{name} - {address} ... 전화 {phone} · 팩스 {fax} ... "
+                f"다른 기관 안내 {_number(rng, area_code)} ...")
+        corpus.put("serp", planner.build_combined_query(name, region), serp)
+
+    with open(os.path.join(directory, "organizations.json"), "w", encoding="utf-8") as f:
+        json.dump(organizations, f, ensure_ascii=False, indent=2)
+    return organizations
+
+
+# ===== 리포트 =====
+
+def _histogram_report(name: str, label: str) -> Dict[str, Dict[str, float]]:
+    family = METRICS.get(name)
+    report = {}
+    if family is None:
+        return report
+    for labels, child in family.children():
+        summary = child.summary()
+        if summary["count"]:
+            report[labels.get(label, "all")] = {
+                "count": summary["count"],
+                "mean": summary["mean"],
+                "p50": summary.get("p50", 0.0),
+                "p95": summary.get("p95", 0.0)
+            }
+    return report
+
+
+def _rss_mb() -> float:
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+class _RssPeak:
+    """백그라운드에서 RSS 최대값 추적"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = _rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _rss_mb())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_mb())
+
+
+async def run_benchmark(organizations: List[Dict[str, Any]], fixtures: FixtureFetcher,
+                        ai_model: MockGeminiModel, trace_memory: bool = False) -> Dict[str, Any]:
+    """재생 모드 크롤러로 기관 목록을 처리하고 결과 리포트 반환"""
+    from crawler_main import AIEnhancedModularUnifiedCrawler
+
+    crawler = AIEnhancedModularUnifiedCrawler(config_override={**CRAWLING_CONFIG, "save_to_database": False})
+    crawler.fixtures = fixtures
+    crawler.ai_manager = MockAIManager(ai_model)
+
+    if trace_memory:
+        tracemalloc.start()
+    rss_start = _rss_mb()
+    started = time.perf_counter()
+    with _RssPeak() as rss:
+        results = await crawler.process_organizations(organizations)
+    elapsed = time.perf_counter() - started
+    python_peak_mb = None
+    if trace_memory:
+        python_peak_mb = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+        tracemalloc.stop()
+
+    found = {field: sum(1 for result in results if result.get(field)) for field in ("phone", "fax", "email")}
+    return {
+        "organizations": len(organizations),
+        "elapsed_seconds": round(elapsed, 3),
+        "orgs_per_second": round(len(organizations) / elapsed, 3) if elapsed else 0.0,
+        "successful": crawler.stats.get("successful", 0),
+        "failed": crawler.stats.get("failed", 0),
+        "found": found,
+        "stages": _histogram_report("crawler_stage_seconds", "stage"),
+        "organization": _histogram_report("crawler_organization_seconds", "all"),
+        "fetch": _histogram_report("crawler_fetch_seconds", "method"),
+        "ai_calls": {"mock_calls": ai_model.calls, "skip_stats": get_ai_skip_stats()},
+        "fixtures": fixtures.get_stats(),
+        "memory_mb": {
+            "rss_start": round(rss_start, 2),
+            "rss_peak": round(rss.peak, 2),
+            "rss_end": round(_rss_mb(), 2),
+            "python_peak": python_peak_mb
+        }
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    print("\n" + "=" * 70)
+    print("📊 오프라인 크롤링 벤치마크 결과")
+    print("=" * 70)
+    print(f"🏢 기관: {report['organizations']}개 (성공 {report['successful']}, 실패 {report['failed']})")
+    print(f"⏱️ 소요: {report['elapsed_seconds']:.2f}초 → {report['orgs_per_second']:.2f} orgs/sec")
+    print(f"📞 발견: 전화 {report['found']['phone']}, 팩스 {report['found']['fax']}, 이메일 {report['found']['email']}")
+    for title, key in (("단계별", "stages"), ("기관 1건", "organization"), ("fetch", "fetch")):
+        if report[key]:
+            print(f"\n⏳ {title} 처리 시간 (초):")
+            for name, summary in report[key].items():
+                print(f"   {name:<36} n={summary['count']:<5} p50={summary['p50']:.3f} p95={summary['p95']:.3f}")
+    print(f"\n🤖 모의 AI 호출: {report['ai_calls']['mock_calls']}회")
+    for stage, stats in report['ai_calls']['skip_stats'].items():
+        print(f"   {stage}: 생략률 {stats['skip_rate']:.0%}")
+    memory = report["memory_mb"]
+    print(f"\n💾 메모리 RSS: 시작 {memory['rss_start']}MB / 최대 {memory['rss_peak']}MB / 종료 {memory['rss_end']}MB"
+          + (f", Python 힙 최대 {memory['python_peak']}MB" if memory["python_peak"] is not None else ""))
+    print(f"📼 fixture: {report['fixtures']}")
+    if report.get("server"):
+        print(f"🖥️ 대역 서버: {report['server']}")
+    print("=" * 70)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    server_defaults = CRAWL_FIXTURE_CONFIG.get("server", {})
+    parser = argparse.ArgumentParser(description="fixture 재생 + 모의 AI 오프라인 크롤링 벤치마크")
+    parser.add_argument("--fixtures", help="코퍼스 디렉터리 (기본: CRAWL_FIXTURE_DIR, --synthetic이면 임시 디렉터리)")
+    parser.add_argument("--orgs", help="기관 목록 JSON (기본: <fixtures>/organizations.json)")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 코퍼스 기관 수 (0이면 기존 코퍼스 사용)")
+    parser.add_argument("--limit", type=int, default=0, help="처리할 기관 수 상한")
+    parser.add_argument("--latency-ms", type=float, default=server_defaults.get("latency_ms", 0))
+    parser.add_argument("--jitter-ms", type=float, default=server_defaults.get("jitter_ms", 0))
+    parser.add_argument("--failure-rate", type=float, default=server_defaults.get("failure_rate", 0.0))
+    parser.add_argument("--ai-latency-ms", type=float, default=300.0, help="모의 AI 응답 지연")
+    parser.add_argument("--ai-jitter-ms", type=float, default=200.0)
+    parser.add_argument("--seed", type=int, default=server_defaults.get("seed", 42))
+    parser.add_argument("--no-server", action="store_true", help="대역 서버 없이 코퍼스 파일 직접 읽기")
+    parser.add_argument("--tracemalloc", action="store_true", help="Python 힙 최대 사용량 측정 (느려짐)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+
+    directory = args.fixtures or (tempfile.mkdtemp(prefix="crawl_fixtures_") if args.synthetic
+                                  else CRAWL_FIXTURE_CONFIG.get("dir"))
+    if args.synthetic:
+        organizations = build_synthetic_corpus(directory, args.synthetic, args.seed)
+        print(f"🧪 합성 코퍼스 생성: {directory} ({len(organizations)}개 기관)")
+    else:
+        orgs_path = args.orgs or os.path.join(directory, "organizations.json")
+        with open(orgs_path, "r", encoding="utf-8") as f:
+            organizations = json.load(f)
+    if args.limit:
+        organizations = organizations[:args.limit]
+
+    server = None
+    if not args.no_server:
+        server = FixtureServer(directory, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                               failure_rate=args.failure_rate, seed=args.seed)
+        server.start()
+    fixtures = FixtureFetcher(mode="replay", directory=directory, server_url=server.url if server else "")
+    ai_model = MockGeminiModel(args.ai_latency_ms, args.ai_jitter_ms, args.seed)
+
+    try:
+        report = asyncio.run(run_benchmark(organizations, fixtures, ai_model, args.tracemalloc))
+        report["server"] = server.get_stats() if server else None
+    finally:
+        fixtures.close()
+        if server:
+            server.stop()
+
+    report["config"] = {key: value for key, value in vars(args).items()}
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기관 변경 알림 트리거 마이그레이션 실행 스크립트
+organizations 테이블에 변경 시 pg_notify를 보내는 트리거 설치 (기관 인메모리 인덱스 동기화용)
+
+트리거 생성은 organizations 테이블 잠금과 DDL 권한이 필요하므로 배포 시 1회 실행
+(크롤러/API 런타임은 설치 여부만 확인)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from database.database import get_database
+from database.org_index import CHANGE_CHANNEL, CHANGE_TRIGGER, OrganizationIndex
+
+def main():
+    print("🚀 기관 변경 트리거 마이그레이션 시작")
+    print("="*60)
+    
+    try:
+        db = get_database()
+        
+        if OrganizationIndex.has_change_trigger(db):
+            print(f"ℹ️ 기존 트리거 교체: {CHANGE_TRIGGER}")
+        
+        OrganizationIndex.install_change_trigger(db)
+        
+        if not OrganizationIndex.has_change_trigger(db):
+            print("❌ 트리거 설치 확인 실패")
+            return False
+        
+        print("="*60)
+        print("✅ 기관 변경 트리거 마이그레이션 완료!")
+        print(f"  - 트리거: {CHANGE_TRIGGER}")
+        print(f"  - 알림 채널: {CHANGE_CHANNEL}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ 마이그레이션 실패: {e}")
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -11,9 +11,10 @@ import asyncio
 import logging
 import traceback
 from typing import Dict, Any, Optional, Union, List
-import google.generativeai as genai
 from utils.settings import AI_MODEL_CONFIG  # AI_MODEL_CONFIG만 import
 from utils.logger_utils import LoggerUtils
+from utils.gemini_key_pool import get_gemini_key_pool
+from utils.prompt_compactor import compact_text
 
 import ssl
 import urllib3
@@ -48,11 +49,11 @@ class AIModelManager:
     def setup_models(self):
         """AI 모델 초기화"""
         try:
-            # Gemini 설정
-            genai.configure(api_key=GEMINI_API_KEY)
+            # Gemini 설정 (공용 키 풀 - 전역 genai.configure 사용 안 함)
             self.gemini_config = AI_MODEL_CONFIG
-            self.gemini_model = genai.GenerativeModel(
+            self.gemini_model = get_gemini_key_pool().model(
                 GEMINI_MODEL_TEXT,
+                source="ai_helpers",
                 generation_config=self.gemini_config
             )
             
@@ -67,13 +68,14 @@ class AIModelManager:
             logger.debug(traceback.format_exc())
     
     
-    async def extract_with_gemini(self, text_content: str, prompt_template: str) -> str:
+    async def extract_with_gemini(self, text_content: str, prompt_template: str, task: str = None) -> str:
         """
         텍스트 콘텐츠를 Gemini API에 전달하여 정보 추출
         
         Args:
             text_content: 분석할 텍스트 콘텐츠
             prompt_template: 프롬프트 템플릿 문자열 ('{content}' 플레이스홀더 포함)
+            task: 연락처 추출 작업명 ("fax", "contacts" 등) - 지정하면 연락처 주변 텍스트만 예산 안으로 압축
             
         Returns:
             추출된 정보 문자열
@@ -81,7 +83,9 @@ class AIModelManager:
         try:
             # 보안 및 처리를 위한 텍스트 길이 제한
             max_length = 32000  # Gemini 모델의 최대 컨텍스트 길이보다 적게 설정
-            if len(text_content) > max_length:
+            if task:
+                text_content = compact_text(text_content, task)
+            elif len(text_content) > max_length:
                 # 앞부분 2/3, 뒷부분 1/3 유지
                 front_portion = int(max_length * 0.67)
                 back_portion = max_length - front_portion
@@ -237,12 +241,10 @@ async def _init_gemini_model():
         return
     
     try:
-        # Gemini API 키 설정
-        genai.configure(api_key=GEMINI_API_KEY)
-        
-        # Gemini 모델 초기화 (centralized config 사용)
-        gemini_model = genai.GenerativeModel(
+        # Gemini 모델 초기화 (공용 키 풀, centralized config 사용)
+        gemini_model = get_gemini_key_pool().model(
             GEMINI_MODEL_TEXT,
+            source="ai_helpers",
             generation_config=AI_MODEL_CONFIG
         )
         
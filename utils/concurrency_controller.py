@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+적응형 동시성 제어 (AIMD + 지연 기울기)
+고정 워커 수/배치 크기 대신 관측된 지연, 오류/차단율, 메모리/CPU 여유로 동시 처리 한도를 조정해
+호스트마다 안정적으로 낼 수 있는 최대 처리량을 자동으로 찾음
+
+- 완료마다 지연(EWMA 단기/장기)과 결과(success/error/block)를 기록
+- window개 완료마다 판단:
+  · 차단/오류율 초과, 메모리 여유 부족, CPU 과부하, 단기 지연 > 장기 지연 x latency_tolerance → 곱셈 감소
+  · 그 외 구간 중 한도까지 사용된 적이 있으면 → 1 증가 (쓰지도 않는 한도는 늘리지 않음)
+- 스레드(acquire/slot)와 asyncio(acquire_async/async with slot) 모두에서 같은 한도를 공유
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.metrics import get_metrics_registry
+from utils.settings import CONCURRENCY_CONFIG
+from utils.system_sampler import get_system_snapshot
+
+OUTCOMES = ("success", "error", "block")
+
+METRICS = get_metrics_registry()
+LIMIT_GAUGE = METRICS.gauge("concurrency_limit", "적응형 동시 처리 한도", ["name"])
+INFLIGHT_GAUGE = METRICS.gauge("concurrency_inflight", "처리 중인 작업 수", ["name"])
+ADJUSTMENTS = METRICS.counter("concurrency_adjustments_total", "동시 처리 한도 조정 수", ["name", "direction", "reason"])
+
+
+class _Slot:
+    """한도 1칸 점유 컨텍스트 (with/async with 공용, 예외는 error로 기록)"""
+
+    __slots__ = ("_limit", "_start", "outcome")
+
+    def __init__(self, limit: "AdaptiveLimit"):
+        self._limit = limit
+        self._start = 0.0
+        self.outcome = "success"
+
+    def mark(self, outcome: str):
+        """결과 지정 (예: 차단 감지 시 block)"""
+        self.outcome = outcome
+
+    def __enter__(self):
+        self._limit.acquire()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        outcome = "error" if exc_type is not None and self.outcome == "success" else self.outcome
+        self._limit.release(time.perf_counter() - self._start, outcome)
+        return False
+
+    async def __aenter__(self):
+        await self._limit.acquire_async()
+        self._start = time.perf_counter()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+
+class AdaptiveLimit:
+    """관측값으로 크기가 바뀌는 세마포어"""
+
+    def __init__(self, name: str, initial: int = None, min_limit: int = None, max_limit: int = None,
+                 **overrides):
+        config = dict(CONCURRENCY_CONFIG.get("defaults", {}))
+        config.update(CONCURRENCY_CONFIG.get("limits", {}).get(name, {}))
+        config.update({key: value for key, value in overrides.items() if value is not None})
+
+        self.name = name
+        self.min_limit = max(1, min_limit or config.get("min", 1))
+        self.max_limit = max(self.min_limit, max_limit or config.get("max", 8))
+        self.window = config.get("window", 10)
+        self.backoff = config.get("backoff", 0.7)
+        self.latency_tolerance = config.get("latency_tolerance", 1.5)
+        self.max_error_rate = config.get("max_error_rate", 0.2)
+        self.min_memory_headroom = config.get("min_memory_headroom", 15.0)
+        self.max_cpu_percent = config.get("max_cpu_percent", 90.0)
+        self.short_alpha = config.get("short_alpha", 0.3)
+        self.long_alpha = config.get("long_alpha", 0.05)
+
+        initial = initial or config.get("initial", self.min_limit)
+        self._limit = min(self.max_limit, max(self.min_limit, initial))
+        self._inflight = 0
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        # 현재 판단 구간
+        self._window_counts = {outcome: 0 for outcome in OUTCOMES}
+        self._window_saturated = False
+        # 지연 EWMA (단기: 현재 부하, 장기: 기준선)
+        self._short_latency = 0.0
+        self._long_latency = 0.0
+        self._history: List[Dict[str, Any]] = []
+
+        LIMIT_GAUGE.labels(name).set(self._limit)
+        INFLIGHT_GAUGE.labels(name).set_function(lambda: self._inflight)
+
+    # ===== 조회 =====
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "limit": self._limit,
+            "inflight": self._inflight,
+            "min": self.min_limit,
+            "max": self.max_limit,
+            "short_latency": round(self._short_latency, 4),
+            "long_latency": round(self._long_latency, 4),
+            "recent_adjustments": list(self._history[-10:])
+        }
+
+    # ===== 점유/반납 =====
+
+    def slot(self) -> _Slot:
+        """with limit.slot(): ... / async with limit.slot(): ..."""
+        return _Slot(self)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """한도 내 자리가 날 때까지 대기 (스레드용)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._inflight >= self._limit:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self._take()
+            return True
+
+    async def acquire_async(self):
+        """한도 내 자리가 날 때까지 대기 (이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._inflight < self._limit:
+                    self._take()
+                    return
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    self._async_waiters = [(l, f) for l, f in self._async_waiters if f is not future]
+                raise
+
+    def _take(self):
+        self._inflight += 1
+        if self._inflight >= self._limit:
+            self._window_saturated = True
+
+    def release(self, latency: Optional[float] = None, outcome: str = "success"):
+        """자리 반납 + 관측값 기록"""
+        with self._lock:
+            self._inflight = max(0, self._inflight - 1)
+            self._observe(latency, outcome)
+            self._wake()
+
+    def record(self, latency: Optional[float] = None, outcome: str = "success"):
+        """점유 없이 관측값만 기록 (동시성을 외부에서 실행하는 경우)"""
+        with self._lock:
+            self._window_saturated = True
+            self._observe(latency, outcome)
+            self._wake()
+
+    def _wake(self):
+        free = self._limit - self._inflight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        waiters, self._async_waiters = self._async_waiters[:free], self._async_waiters[free:]
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(None))
+
+    # ===== 조정 =====
+
+    def _observe(self, latency: Optional[float], outcome: str):
+        self._window_counts[outcome if outcome in OUTCOMES else "error"] += 1
+        if latency is not None and outcome == "success":
+            if self._long_latency == 0.0:
+                self._short_latency = self._long_latency = latency
+            else:
+                self._short_latency += self.short_alpha * (latency - self._short_latency)
+                self._long_latency += self.long_alpha * (latency - self._long_latency)
+
+        if sum(self._window_counts.values()) >= max(self.window, self._limit):
+            self._adjust()
+
+    def _overload_reason(self) -> Optional[str]:
+        completed = sum(self._window_counts.values())
+        if self._window_counts["block"]:
+            return "block"
+        if completed and self._window_counts["error"] / completed > self.max_error_rate:
+            return "error_rate"
+
+        snapshot = get_system_snapshot()
+        if 100.0 - snapshot.memory_percent < self.min_memory_headroom:
+            return "memory"
+        if snapshot.cpu_percent > self.max_cpu_percent:
+            return "cpu"
+        if self._long_latency and self._short_latency > self._long_latency * self.latency_tolerance:
+            return "latency"
+        return None
+
+    def _adjust(self):
+        previous = self._limit
+        reason = self._overload_reason()
+        if reason:
+            self._limit = max(self.min_limit, int(self._limit * self.backoff))
+            # 감소 후에는 현재 지연을 새 기준선으로 삼아 연속 감소를 막음
+            self._long_latency = self._short_latency
+            direction = "down"
+        elif self._window_saturated:
+            self._limit = min(self.max_limit, self._limit + 1)
+            reason, direction = "saturated", "up"
+        else:
+            direction = None
+
+        self._window_counts = {outcome: 0 for outcome in OUTCOMES}
+        self._window_saturated = self._inflight >= self._limit
+
+        if direction and self._limit != previous:
+            LIMIT_GAUGE.labels(self.name).set(self._limit)
+            ADJUSTMENTS.labels(self.name, direction, reason).inc()
+            self._history.append({"time": time.time(), "from": previous, "to": self._limit, "reason": reason})
+            del self._history[:-50]
+
+
+_limits: Dict[str, AdaptiveLimit] = {}
+_limits_lock = threading.Lock()
+
+
+def get_adaptive_limit(name: str, **options) -> AdaptiveLimit:
+    """이름별 공용 적응형 한도 반환 (첫 호출의 options로 생성, 설정은 CONCURRENCY_CONFIG["limits"][name])"""
+    limit = _limits.get(name)
+    if limit is None:
+        with _limits_lock:
+            limit = _limits.get(name)
+            if limit is None:
+                limit = AdaptiveLimit(name, **options)
+                _limits[name] = limit
+    return limit
+
+
+def get_concurrency_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 적응형 한도 상태"""
+    return {name: limit.stats() for name, limit in list(_limits.items())}
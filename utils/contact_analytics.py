@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연락처 통계 컬럼 분석 백엔드
+CRMStatisticsAnalyzer(DB)와 DataStatisticsAnalyzer(JSON/Excel 파일)가 공유
+
+- DB: COPY ... TO STDOUT 1회로 필요한 컬럼만 DataFrame으로 로드
+- 보유/완성도/카테고리별 커버리지: 불리언 컬럼 합계 + groupby
+- 전화/팩스 유효성·지역번호 분포: PhoneNormalizer.validate_many (컬럼 단위)
+- 이메일 도메인 추출/분류: 벡터화 문자열 연산 (분류는 고유 도메인 단위)
+"""
+
+import io
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.phone_normalizer import get_phone_normalizer
+from utils.settings import (
+    BUSINESS_EMAIL_SUFFIXES,
+    EDUCATION_EMAIL_SUFFIXES,
+    GOVERNMENT_EMAIL_SUFFIXES,
+    PORTAL_EMAIL_DOMAINS,
+    RELIGIOUS_EMAIL_KEYWORDS
+)
+
+# 통계에 필요한 organizations 컬럼
+ORGANIZATION_STATS_COLUMNS = ["category", "phone", "fax", "email", "homepage"]
+
+# 이메일 도메인 (email.split('@')[1]과 동일: 첫 '@'와 다음 '@' 사이)
+EMAIL_DOMAIN_PATTERN = r'^[^@]*@([^@]*)'
+
+# 개행으로 이어 붙인 이메일 컬럼에서 줄마다 도메인 1개 추출 (도메인 집계는 행 순서가 필요 없음)
+EMAIL_DOMAIN_LINE_REGEX = re.compile(r'^[^@\n]*@([^@\n]*)', re.MULTILINE)
+
+
+def _suffix_pattern(suffixes: Iterable[str]) -> str:
+    return "(?:" + "|".join(re.escape(suffix) for suffix in suffixes) + ")$"
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> str:
+    return "|".join(re.escape(keyword) for keyword in keywords)
+
+
+# 도메인 분류 규칙 (categorize_email_domain과 같은 우선순위)
+DOMAIN_CATEGORY_RULES = [
+    ("정부/공공", _suffix_pattern(GOVERNMENT_EMAIL_SUFFIXES)),
+    ("교육기관", _suffix_pattern(EDUCATION_EMAIL_SUFFIXES)),
+    ("기업/조직", _suffix_pattern(BUSINESS_EMAIL_SUFFIXES)),
+    ("종교기관", _keyword_pattern(RELIGIOUS_EMAIL_KEYWORDS))
+]
+
+
+class ContactAnalytics:
+    """pandas 컬럼 연산 기반 연락처 통계 계산기"""
+
+    def __init__(self):
+        self.normalizer = get_phone_normalizer()
+
+    # ===== 로드 =====
+
+    @staticmethod
+    def load_organizations(db, columns: List[str] = None, active_only: bool = True) -> pd.DataFrame:
+        """
+        organizations 테이블을 COPY 1회로 DataFrame 로드 (모든 값 문자열, NULL은 빈 문자열)
+        db: ChurchCRMDatabase (get_connection 컨텍스트 매니저 제공)
+        """
+        columns = columns or ORGANIZATION_STATS_COLUMNS
+        where = " WHERE is_active = true" if active_only else ""
+        query = f"COPY (SELECT {', '.join(columns)} FROM organizations{where}) TO STDOUT WITH CSV HEADER"
+
+        buffer = io.StringIO()
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.copy_expert(query, buffer)
+            cursor.close()
+        buffer.seek(0)
+
+        return pd.read_csv(buffer, dtype=str, keep_default_na=False, na_filter=False)
+
+    @staticmethod
+    def frame_from_records(records: Iterable[Dict[str, Any]], columns: List[str]) -> pd.DataFrame:
+        """dict 레코드 목록을 문자열 DataFrame으로 변환 (없는 값은 빈 문자열)"""
+        frame = pd.DataFrame.from_records(list(records), columns=columns)
+        return frame.fillna("").astype(str)
+
+    # ===== 보유 현황 =====
+
+    @staticmethod
+    def filled(series: pd.Series, strip: bool = False) -> pd.Series:
+        """값 보유 여부 (SQL의 IS NOT NULL AND != '' 와 동일, strip=True면 공백만 있는 값도 제외)"""
+        values = series.fillna("") if series.hasnans else series
+        if strip:
+            values = values.astype(str).str.strip()
+        return pd.Series(values.to_numpy(dtype=object) != "", index=series.index)
+
+    def filled_columns(self, frame: pd.DataFrame, columns: List[str], strip: bool = False) -> pd.DataFrame:
+        return pd.DataFrame({column: self.filled(frame[column], strip) for column in columns}, index=frame.index)
+
+    @staticmethod
+    def count_by_group(flags: pd.DataFrame, groups: pd.Series) -> pd.DataFrame:
+        """그룹별 행 수(total) + 불리언 컬럼별 True 개수, total 내림차순"""
+        counts = flags.groupby(groups, sort=False, dropna=False).sum()
+        counts.insert(0, "total", groups.groupby(groups, sort=False, dropna=False).size())
+        return counts.sort_values("total", ascending=False, kind="stable")
+
+    @staticmethod
+    def rate(count: int, total: int) -> float:
+        """백분율 (소수 첫째 자리)"""
+        return round((count / total * 100), 1) if total > 0 else 0
+
+    # ===== 전화/팩스 =====
+
+    def phone_summary(self, series: pd.Series) -> Dict[str, Any]:
+        """
+        번호 컬럼 요약 (빈 값 제외)
+        count: 번호 보유 수, valid_count: 유효 번호 수, area_counts: 유효 번호 지역번호별 개수
+        """
+        values = series[self.filled(series)]
+        checked = self.normalizer.validate_many(values)
+        valid_areas = checked.loc[checked["is_valid"], "area_code"]
+        return {
+            "count": int(len(values)),
+            "valid_count": int(checked["is_valid"].sum()),
+            "area_counts": Counter({str(code): int(n) for code, n in valid_areas.value_counts().items()})
+        }
+
+    @staticmethod
+    def first_value(series: pd.Series, separator: str = ",") -> pd.Series:
+        """여러 값이 구분자로 이어진 경우 첫 번째 값만 (구분자가 있는 행만 분할 후 공백 제거)"""
+        values = series.fillna("").astype(str)
+        multiple = values.str.contains(separator, regex=False)
+        if multiple.any():
+            values = values.copy()
+            values[multiple] = values[multiple].str.split(separator, n=1).str[0].str.strip()
+        return values
+
+    # ===== 이메일 =====
+
+    @staticmethod
+    def email_domains(series: pd.Series) -> pd.Series:
+        """이메일 컬럼에서 소문자 도메인 추출 ('@' 없거나 도메인이 빈 값은 제외, 행 인덱스 유지)"""
+        domains = series.fillna("").astype(str).str.extract(EMAIL_DOMAIN_PATTERN, expand=False)
+        domains = domains[domains.notna()].str.strip().str.lower()
+        return domains[domains != ""]
+
+    def count_email_domains(self, series: pd.Series) -> Counter:
+        """
+        도메인별 이메일 수
+        컬럼을 개행으로 이어 붙여 정규식 1회로 추출하고, 소문자/공백 정리는 고유 도메인에만 적용
+        """
+        values = series[self.filled(series)].astype(str).tolist()
+        joined = "\n".join(values)
+        if joined.count("\n") != max(len(values) - 1, 0):
+            # 값 안에 개행이 있으면 행 단위 추출
+            return Counter(self.email_domains(series).tolist())
+
+        raw_counts = Counter(EMAIL_DOMAIN_LINE_REGEX.findall(joined))
+        counts = Counter()
+        for domain, count in raw_counts.items():
+            domain = domain.strip().lower()
+            if domain:
+                counts[domain] += count
+        return counts
+
+    @staticmethod
+    def categorize_domains(domains: pd.Series) -> pd.Series:
+        """도메인 → 카테고리 (포털/정부/공공/교육기관/기업/조직/종교기관/기타)"""
+        domains = domains.astype(str)
+        conditions = [domains.isin(PORTAL_EMAIL_DOMAINS).to_numpy()]
+        labels = ["포털"]
+        for label, pattern in DOMAIN_CATEGORY_RULES:
+            conditions.append(domains.str.contains(pattern, regex=True).to_numpy(dtype=bool))
+            labels.append(label)
+        return pd.Series(np.select(conditions, labels, default="기타"), index=domains.index)
+
+    def email_summary(self, series: pd.Series, category_top_n: Optional[int] = None) -> Dict[str, Counter]:
+        """
+        이메일 컬럼 요약
+        domain_counts: 도메인별 개수, category_counts: 상위 category_top_n개 도메인(None이면 전체)의 카테고리별 개수
+        """
+        domain_counts = self.count_email_domains(series)
+        ranked = pd.Series(dict(domain_counts.most_common(category_top_n)), dtype="int64")
+
+        categories = self.categorize_domains(pd.Series(ranked.index, index=ranked.index))
+        category_counts = ranked.groupby(categories, sort=False).sum()
+
+        return {
+            "domain_counts": domain_counts,
+            "category_counts": Counter({str(category): int(n) for category, n in category_counts.items()})
+        }
+
+
+_analytics_instance = None
+_analytics_lock = threading.Lock()
+
+
+def get_contact_analytics() -> ContactAnalytics:
+    """연락처 통계 백엔드 반환 (싱글톤)"""
+    global _analytics_instance
+    if _analytics_instance is None:
+        with _analytics_lock:
+            if _analytics_instance is None:
+                _analytics_instance = ContactAnalytics()
+    return _analytics_instance
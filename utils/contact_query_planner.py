@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연락처 검색 쿼리 플래너
+기관당 전화번호 검색 + 팩스번호 검색(구글 2회 이상)을 통합 쿼리 1회로 줄임
+- "{지역} {기관명} 전화 팩스" 한 번의 검색 결과에서 전화/팩스를 함께 추출·분류
+- 첫 결과로 결론이 나지 않은 항목만 전용 쿼리로 추가 검색
+- 쿼리별 분류 결과를 캐시하여 같은 기관 재검색 시 검색엔진 요청 없음
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.phone_normalizer import get_phone_normalizer
+from utils.settings import REGION_TO_AREA_CODE
+from utils.tracing import get_tracer
+
+# 국내 전화번호 (02-123-4567, (031) 1234-5678, 010.1234.5678 등)
+NUMBER_PATTERN = re.compile(r'(?<!\d)(0\d{1,2})[\s\-\.\)]{0,2}(\d{3,4})[\s\-\.]{0,2}(\d{4})(?!\d)')
+
+# 번호 바로 앞의 라벨로 전화/팩스 구분
+FAX_LABEL_PATTERN = re.compile(r'(팩스|팩|fax|\bf\s*[\.:)])', re.IGNORECASE)
+PHONE_LABEL_PATTERN = re.compile(r'(전화|연락처|대표번호|tel|phone|☎|\bt\s*[\.:)])', re.IGNORECASE)
+
+LABEL_WINDOW = 12  # 번호 앞에서 라벨을 찾을 글자 수
+NAME_WINDOW = 80   # 번호 앞뒤에서 기관명을 찾을 글자 수 (검색 결과 스니펫 1개 정도)
+
+_NAME_NOISE = re.compile(r'\([^)]*\)|\s+')
+
+
+def _name_key(text: str) -> str:
+    """기관명 비교용 키 (괄호 내용/공백 제거, 소문자)"""
+    return _NAME_NOISE.sub("", text or "").lower()
+
+
+@dataclass
+class ContactSearchResult:
+    """통합 검색 결과 (전화/팩스 후보는 신뢰도 순)"""
+    phones: List[str] = field(default_factory=list)
+    faxes: List[str] = field(default_factory=list)
+    queries: List[str] = field(default_factory=list)  # 실제로 검색엔진에 보낸 쿼리
+    cache_hits: int = 0
+    labeled: List[str] = field(default_factory=list)  # 전화/팩스 라벨이 붙어 있던 번호 (규칙 기반 신뢰도용)
+    named: List[str] = field(default_factory=list)    # 주변에 기관명이 있던 번호 (다른 기관 번호 오인 방지)
+
+    @property
+    def phone(self) -> Optional[str]:
+        return self.phones[0] if self.phones else None
+
+    @property
+    def fax(self) -> Optional[str]:
+        return self.faxes[0] if self.faxes else None
+
+
+class ContactQueryPlanner:
+    """전화/팩스 검색을 하나의 SERP 요청으로 합치는 쿼리 플래너 (스레드 안전)"""
+
+    def __init__(self, cache_size: int = 2000):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[List[str], List[str], List[str], List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "organizations": 0,
+            "serp_fetches": 0,
+            "followup_fetches": 0,
+            "cache_hits": 0,
+            "resolved_by_combined": 0
+        }
+
+    # ===== 쿼리 생성 =====
+
+    @staticmethod
+    def extract_region(address: str) -> Optional[str]:
+        """주소에서 지역명 추출 (REGION_TO_AREA_CODE 기준)"""
+        if not address:
+            return None
+        for region in REGION_TO_AREA_CODE.keys():
+            if region in address:
+                return region
+        return None
+
+    @staticmethod
+    def build_combined_query(org_name: str, region: Optional[str] = None) -> str:
+        """전화/팩스를 한 번에 찾는 통합 쿼리"""
+        prefix = f"{region} " if region else ""
+        return f"{prefix}{org_name} 전화 팩스"
+
+    @staticmethod
+    def build_followup_query(org_name: str, region: Optional[str], contact_type: str) -> str:
+        """통합 쿼리로 찾지 못한 항목 전용 쿼리"""
+        prefix = f"{region} " if region else ""
+        keyword = "팩스번호" if contact_type == "fax" else "전화번호"
+        return f"{prefix}{org_name} {keyword}"
+
+    # ===== 번호 분류 =====
+
+    @staticmethod
+    def normalize_number(digits: str) -> Optional[str]:
+        """숫자열을 지역번호 규칙에 맞춰 포맷팅 (유효하지 않거나 더미 번호면 None)"""
+        result = get_phone_normalizer().normalize(digits)
+        if not result.is_valid or result.is_dummy:
+            return None
+        return result.formatted
+
+    def classify_numbers(self, text: str) -> Tuple[List[str], List[str]]:
+        """
+        검색 결과 텍스트에서 전화/팩스 후보 추출
+        번호 앞 라벨 중 가장 가까운 것으로 분류, 라벨 없는 번호는 전화 후순위 후보
+        """
+        phones, faxes, _, _ = self.classify_numbers_with_labels(text)
+        return phones, faxes
+
+    def classify_numbers_with_labels(self, text: str, org_name: str = ""
+                                     ) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """classify_numbers + 라벨이 붙어 있던 번호 목록 + 앞뒤 NAME_WINDOW 안에 기관명이 있던 번호 목록"""
+        phones: List[str] = []
+        faxes: List[str] = []
+        unlabeled: List[str] = []
+        named: List[str] = []
+
+        if not text:
+            return phones, faxes, [], named
+
+        name_key = _name_key(org_name)
+        for match in NUMBER_PATTERN.finditer(text):
+            number = self.normalize_number("".join(match.groups()))
+            if not number:
+                continue
+
+            if name_key and number not in named:
+                around = text[max(0, match.start() - NAME_WINDOW):match.end() + NAME_WINDOW]
+                if name_key in _name_key(around):
+                    named.append(number)
+
+            context = text[max(0, match.start() - LABEL_WINDOW):match.start()]
+            fax_labels = [m.end() for m in FAX_LABEL_PATTERN.finditer(context)]
+            phone_labels = [m.end() for m in PHONE_LABEL_PATTERN.finditer(context)]
+
+            if fax_labels and (not phone_labels or fax_labels[-1] > phone_labels[-1]):
+                target = faxes
+            elif phone_labels:
+                target = phones
+            else:
+                target = unlabeled
+
+            if number not in target:
+                target.append(number)
+
+        labeled = phones + [fax for fax in faxes if fax not in phones]
+
+        # 라벨 없는 번호는 팩스로 분류된 번호를 제외하고 전화 후보 뒤에 추가
+        for number in unlabeled:
+            if number not in phones and number not in faxes:
+                phones.append(number)
+
+        return phones, faxes, labeled, named
+
+    # ===== 검색 =====
+
+    def _fetch_classified(self, fetch: Callable[[str], Optional[str]], query: str, org_name: str,
+                          result: ContactSearchResult, followup: bool = False
+                          ) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """캐시 우선으로 쿼리 결과를 분류 (검색 실패는 캐시하지 않음)"""
+        with get_tracer().span("search.query", {"search.query": query, "search.followup": followup}) as span:
+            with self._lock:
+                cached = self._cache.get(query)
+                if cached is not None:
+                    self._cache.move_to_end(query)
+                    self._stats["cache_hits"] += 1
+                    result.cache_hits += 1
+            if cached is not None:
+                span.set_attribute("cache.hit", True)
+                return cached
+            span.set_attribute("cache.hit", False)
+
+            text = fetch(query)
+            result.queries.append(query)
+            with self._lock:
+                self._stats["serp_fetches"] += 1
+                if followup:
+                    self._stats["followup_fetches"] += 1
+
+            if text is None:
+                return [], [], [], []
+
+            classified = self.classify_numbers_with_labels(text, org_name)
+            span.set_attribute("search.numbers", len(classified[0]) + len(classified[1]))
+            with self._lock:
+                self._cache[query] = classified
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return classified
+
+    def search(self, fetch: Callable[[str], Optional[str]], org_name: str, region: Optional[str] = None,
+               need_phone: bool = True, need_fax: bool = True) -> ContactSearchResult:
+        """
+        통합 쿼리 1회로 전화/팩스를 찾고, 없는 항목만 전용 쿼리로 한 번 더 검색
+        fetch: 쿼리를 받아 검색 결과 페이지 텍스트를 반환하는 함수 (실패 시 None)
+        """
+        result = ContactSearchResult()
+        if not org_name or not (need_phone or need_fax):
+            return result
+
+        with self._lock:
+            self._stats["organizations"] += 1
+
+        phones, faxes, labeled, named = self._fetch_classified(
+            fetch, self.build_combined_query(org_name, region), org_name, result
+        )
+        result.phones.extend(phones)
+        result.faxes.extend(faxes)
+        result.labeled.extend(labeled)
+        result.named.extend(named)
+
+        missing = []
+        if need_phone and not result.phones:
+            missing.append("phone")
+        if need_fax and not result.faxes:
+            missing.append("fax")
+
+        if not missing:
+            with self._lock:
+                self._stats["resolved_by_combined"] += 1
+
+        for contact_type in missing:
+            query = self.build_followup_query(org_name, region, contact_type)
+            phones, faxes, labeled, named = self._fetch_classified(fetch, query, org_name, result, followup=True)
+            result.labeled.extend(number for number in labeled if number not in result.labeled)
+            result.named.extend(number for number in named if number not in result.named)
+            if contact_type == "phone":
+                result.phones.extend(p for p in phones if p not in result.phones)
+            else:
+                result.faxes.extend(f for f in faxes if f not in result.faxes)
+
+        # 팩스로 확인된 번호는 전화 후보에서 제외
+        result.phones = [p for p in result.phones if p not in result.faxes] or result.phones
+        return result
+
+    def get_stats(self) -> Dict[str, float]:
+        """검색 요청 절감 통계 (organizations 대비 serp_fetches가 2 미만이면 절감)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached_queries"] = len(self._cache)
+        organizations = stats["organizations"]
+        stats["fetches_per_organization"] = round(stats["serp_fetches"] / organizations, 2) if organizations else 0.0
+        return stats
+
+
+def fetch_serp_text(driver, query: str) -> Optional[str]:
+    """차단 감지형 검색으로 결과 페이지를 로드하고 본문 텍스트 반환"""
+    from selenium.webdriver.common.by import By
+    from utils.search_client import get_search_guard
+
+    if not get_search_guard().search(driver, query):
+        return None
+    try:
+        return driver.find_element(By.TAG_NAME, "body").text
+    except Exception:
+        return None
+
+
+_planner_instance = None
+_planner_lock = threading.Lock()
+
+
+def get_contact_query_planner() -> ContactQueryPlanner:
+    """프로세스 공용 쿼리 플래너 반환 (싱글톤)"""
+    global _planner_instance
+    if _planner_instance is None:
+        with _planner_lock:
+            if _planner_instance is None:
+                _planner_instance = ContactQueryPlanner()
+    return _planner_instance
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+규칙 기반 연락처 추출 (신뢰도 점수)
+footer에 "TEL 02-xxx / FAX 02-xxx"처럼 라벨이 분명한 번호가 있으면 정규식만으로 결론이 나므로
+점수가 임계값(DETERMINISTIC_CONTACT_CONFIG["skip_ai_threshold"]) 이상이면 AI 추출/검증을 생략
+
+점수 규칙 (가중치는 설정):
+- 유효한 번호 (지역번호/길이 규칙 통과, 더미 아님)
+- 라벨 근접도: 라벨 바로 뒤 > 라벨이 앞쪽 창 안 > 라벨 없음, 전화/팩스 라벨이 모두 붙으면 감점
+- 지역번호가 주소 지역(REGION_TO_AREA_CODE)과 일치하면 가점, 불일치하면 감점
+- footer/연락처 영역에 있으면 가점
+- 팩스는 선택된 전화번호와 같은 번호면 제외
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.contact_query_planner import (
+    FAX_LABEL_PATTERN, LABEL_WINDOW, NUMBER_PATTERN, PHONE_LABEL_PATTERN, ContactQueryPlanner
+)
+from utils.metrics import get_metrics_registry
+from utils.phone_normalizer import get_phone_normalizer
+from utils.settings import DETERMINISTIC_CONTACT_CONFIG, EMAIL_PATTERN, REGION_TO_AREA_CODE, is_phone_fax_duplicate
+
+METRICS = get_metrics_registry()
+AI_STAGE_DECISIONS = METRICS.counter(
+    "ai_stage_decisions_total", "AI 단계 실행/생략 수 (규칙 기반 신뢰도 기준)", ["stage", "decision"]
+)
+AI_SKIP_RATE = METRICS.gauge("ai_stage_skip_rate", "AI 단계 생략 비율", ["stage"])
+DETERMINISTIC_CONFIDENCE = METRICS.histogram(
+    "deterministic_contact_confidence", "규칙 기반 연락처 신뢰도", ["kind"]
+)
+
+_EMAIL = re.compile(EMAIL_PATTERN)
+EMAIL_LABEL_PATTERN = re.compile(r'(이메일|메일|e-?mail)', re.IGNORECASE)
+_IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp')
+
+_WEIGHTS = DETERMINISTIC_CONTACT_CONFIG.get("weights", {})
+
+
+def skip_threshold() -> float:
+    return DETERMINISTIC_CONTACT_CONFIG.get("skip_ai_threshold", 0.8)
+
+
+@dataclass
+class ScoredContact:
+    """점수가 매겨진 연락처 후보"""
+    value: str
+    kind: str
+    confidence: float
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class DeterministicContacts:
+    """규칙 기반 추출 결과 (항목별 최고 점수 후보)"""
+    phone: Optional[ScoredContact] = None
+    fax: Optional[ScoredContact] = None
+    email: Optional[ScoredContact] = None
+
+    def confidence(self, kind: str) -> float:
+        contact = getattr(self, kind, None)
+        return contact.confidence if contact else 0.0
+
+    def is_conclusive(self, kinds: Iterable[str] = ("phone", "fax"), threshold: float = None) -> bool:
+        """지정 항목이 모두 임계값 이상인지"""
+        threshold = skip_threshold() if threshold is None else threshold
+        return all(self.confidence(kind) >= threshold for kind in kinds)
+
+    def to_contact_info(self) -> Dict[str, Optional[str]]:
+        """AI 연락처 추출 응답과 같은 형식"""
+        return {
+            "phone": self.phone.value if self.phone else None,
+            "fax": self.fax.value if self.fax else None,
+            "email": self.email.value if self.email else None,
+            "address": None,
+            "mobile": None
+        }
+
+
+# ===== 점수 =====
+
+def region_match(number: str, address: str) -> Optional[bool]:
+    """지역번호와 주소 지역 일치 여부 (주소/지역을 모르거나 휴대폰/인터넷전화면 None)"""
+    region = ContactQueryPlanner.extract_region(address)
+    if not region:
+        return None
+    area_code = get_phone_normalizer().normalize(number).area_code
+    if not area_code or area_code in ("010", "017", "070", "080"):
+        return None
+    return area_code in REGION_TO_AREA_CODE.get(region, [])
+
+
+def score_number(number: str, kind: str, address: str = "", label_distance: Optional[int] = None,
+                 in_contact_section: bool = False, occurrences: int = 1,
+                 conflicting: bool = False) -> ScoredContact:
+    """
+    번호 1개의 신뢰도
+    label_distance: 라벨 끝과 번호 사이 글자 수 (라벨 없으면 None)
+    """
+    normalized = get_phone_normalizer().normalize(number)
+    if not normalized.is_valid or normalized.is_dummy:
+        return ScoredContact(number, kind, 0.0, ["invalid_number"])
+
+    score, reasons = _WEIGHTS.get("valid_number", 0.3), ["valid_number"]
+
+    def add(reason: str):
+        nonlocal score
+        score += _WEIGHTS.get(reason, 0.0)
+        reasons.append(reason)
+
+    if label_distance is not None:
+        adjacent = label_distance <= DETERMINISTIC_CONTACT_CONFIG.get("label_adjacent_chars", 4)
+        add("label_adjacent" if adjacent else "label_near")
+    if conflicting:
+        add("conflicting_labels")
+
+    matched = region_match(normalized.formatted, address)
+    if matched is True:
+        add("region_match")
+    elif matched is False:
+        add("region_mismatch")
+
+    if in_contact_section:
+        add("contact_section")
+    if occurrences > 1:
+        add("repeated")
+
+    return ScoredContact(normalized.formatted, kind, round(min(1.0, max(0.0, score)), 3), reasons)
+
+
+# ===== 추출 =====
+
+def _nearest_label(context: str) -> Optional[tuple]:
+    """번호 앞 창에서 가장 가까운 라벨 (종류, 라벨 끝~번호 거리, 전화/팩스 라벨이 함께 있는지)"""
+    fax_ends = [m.end() for m in FAX_LABEL_PATTERN.finditer(context)]
+    phone_ends = [m.end() for m in PHONE_LABEL_PATTERN.finditer(context)]
+    both = bool(fax_ends and phone_ends)
+    if fax_ends and (not phone_ends or fax_ends[-1] > phone_ends[-1]):
+        return "fax", len(context) - fax_ends[-1], both
+    if phone_ends:
+        return "phone", len(context) - phone_ends[-1], both
+    return None
+
+
+def _section_numbers(document: Any) -> set:
+    if document is None:
+        return set()
+    # compact된 문서도 연락처 영역 텍스트는 유지됨
+    section = document.contact_text or ""
+    return {"".join(match.groups()) for match in NUMBER_PATTERN.finditer(section)}
+
+
+def _extract_email(text: str) -> Optional[ScoredContact]:
+    for match in _EMAIL.finditer(text):
+        email = match.group(0)
+        if email.lower().endswith(_IMAGE_SUFFIXES):
+            continue
+        context = text[max(0, match.start() - LABEL_WINDOW):match.start()]
+        labeled = EMAIL_LABEL_PATTERN.search(context) is not None
+        confidence = DETERMINISTIC_CONTACT_CONFIG.get("email_labeled" if labeled else "email_unlabeled", 0.7)
+        return ScoredContact(email, "email", confidence, ["labeled" if labeled else "unlabeled"])
+    return None
+
+
+def extract_contacts(text: str, address: str = "", document: Any = None) -> DeterministicContacts:
+    """
+    페이지 텍스트에서 전화/팩스/이메일을 규칙으로 추출하고 점수 계산
+    document: HtmlDocument (있으면 footer/연락처 영역 가점)
+    """
+    result = DeterministicContacts()
+    if not text:
+        return result
+
+    # 번호별 라벨 관측 (종류별 최소 거리, 등장 횟수)
+    observed: Dict[str, Dict[str, Any]] = {}
+    previous_end = 0
+    for match in NUMBER_PATTERN.finditer(text):
+        digits = "".join(match.groups())
+        entry = observed.setdefault(digits, {"labels": {}, "count": 0, "conflict": False})
+        entry["count"] += 1
+        # 라벨은 직전 번호 뒤에서만 찾음 ("TEL 02-.. FAX 02-.."에서 TEL이 팩스 번호에 붙지 않도록)
+        context = text[max(previous_end, match.start() - LABEL_WINDOW):match.start()]
+        previous_end = match.end()
+        label = _nearest_label(context)
+        if label:
+            kind, distance, both = label
+            entry["labels"][kind] = min(distance, entry["labels"].get(kind, distance))
+            # "전화/팩스 02-..."처럼 한 번호 앞에 두 라벨이 모두 있으면 어느 쪽인지 불확실
+            entry["conflict"] = entry["conflict"] or both
+
+    section_numbers = _section_numbers(document)
+    candidates: Dict[str, List[ScoredContact]] = {"phone": [], "fax": []}
+    for digits, entry in observed.items():
+        labels = entry["labels"]
+        conflicting = len(labels) > 1 or entry["conflict"]
+        kinds = list(labels) or ["phone"]  # 라벨 없는 번호는 전화 후보
+        for kind in kinds:
+            scored = score_number(
+                digits, kind, address,
+                label_distance=labels.get(kind),
+                in_contact_section=digits in section_numbers,
+                occurrences=entry["count"],
+                conflicting=conflicting
+            )
+            if scored.confidence > 0:
+                candidates[kind].append(scored)
+
+    for kind in candidates:
+        candidates[kind].sort(key=lambda contact: contact.confidence, reverse=True)
+
+    if candidates["phone"]:
+        result.phone = candidates["phone"][0]
+    # 팩스는 선택된 전화번호와 다른 번호만
+    phone_value = result.phone.value if result.phone else None
+    for fax in candidates["fax"]:
+        if not is_phone_fax_duplicate(fax.value, phone_value):
+            result.fax = fax
+            break
+
+    result.email = _extract_email(text)
+
+    for kind in ("phone", "fax", "email"):
+        contact = getattr(result, kind)
+        if contact:
+            DETERMINISTIC_CONFIDENCE.labels(kind).observe(contact.confidence)
+    return result
+
+
+# ===== AI 생략 기록 =====
+
+_decision_counts: Dict[str, List[int]] = {}
+_decision_lock = threading.Lock()
+
+
+def record_ai_decision(stage: str, skipped: bool):
+    """AI 단계 실행/생략 기록 (단계별 생략 비율 게이지 갱신)"""
+    AI_STAGE_DECISIONS.labels(stage, "skipped" if skipped else "called").inc()
+    with _decision_lock:
+        counts = _decision_counts.setdefault(stage, [0, 0])
+        counts[0 if skipped else 1] += 1
+        AI_SKIP_RATE.labels(stage).set(counts[0] / (counts[0] + counts[1]))
+
+
+def get_ai_skip_stats() -> Dict[str, Dict[str, float]]:
+    """단계별 AI 생략 통계"""
+    with _decision_lock:
+        return {
+            stage: {
+                "skipped": skipped,
+                "called": called,
+                "skip_rate": round(skipped / (skipped + called), 3) if skipped + called else 0.0
+            }
+            for stage, (skipped, called) in _decision_counts.items()
+        }
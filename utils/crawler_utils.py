@@ -7,28 +7,30 @@
 
 import time
 import random
-from typing import Optional, List, Dict
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from typing import TYPE_CHECKING, Optional, List, Dict
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from utils.politeness_scheduler import get_politeness_scheduler
+from utils.search_client import get_search_guard
+
+# Selenium은 드라이버를 실제로 쓰는 함수 안에서 import (import 시점 비용 제거)
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 class CrawlerUtils:
     """크롤링 관련 유틸리티 클래스 - 중복 제거"""
     
     @staticmethod
-    def setup_driver(headless: bool = True, timeout: int = 10) -> Optional[webdriver.Chrome]:
+    def setup_driver(headless: bool = True, timeout: int = 10) -> Optional["webdriver.Chrome"]:
         """
         Chrome 드라이버 설정 (통합)
         fax_crawler.py + naver_map_crawler.py + url_extractor.py 통합
         """
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            
             chrome_options = Options()
             
             if headless:
@@ -64,13 +66,25 @@ class CrawlerUtils:
             return None
     
     @staticmethod
-    def search_google(driver: webdriver.Chrome, query: str) -> bool:
+    def search_google(driver: "webdriver.Chrome", query: str) -> bool:
         """
         구글 검색 (통합)
         fax_crawler.py의 search_google() 기반
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        guard = get_search_guard()
+        if not guard.is_available("google"):
+            print(f"⏳ 구글 쿨다운 중 ({guard.cooldown_remaining('google'):.0f}초 남음): {query}")
+            return False
+        
         try:
-            search_url = f"https://www.google.com/search?q={query}"
+            search_url = guard.build_search_url("google", query)
+            CrawlerUtils.polite_delay(search_url)
+            guard.record_request("google")
             driver.get(search_url)
             
             # 페이지 로드 대기
@@ -78,24 +92,42 @@ class CrawlerUtils:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
+            # CAPTCHA / unusual traffic 페이지 확인
+            if guard.check_driver("google", driver):
+                return False
+            
+            guard.record_success("google")
             print(f"✅ 구글 검색 완료: {query}")
             return True
             
         except TimeoutException:
             print(f"⏰ 구글 검색 타임아웃: {query}")
+            guard.record_error("google")
             return False
         except Exception as e:
             print(f"❌ 구글 검색 실패: {query}, 오류: {e}")
             return False
     
     @staticmethod
-    def search_naver(driver: webdriver.Chrome, query: str) -> bool:
+    def search_naver(driver: "webdriver.Chrome", query: str) -> bool:
         """
         네이버 검색 (통합)
         url_extractor.py의 search_naver() 기반
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        guard = get_search_guard()
+        if not guard.is_available("naver"):
+            print(f"⏳ 네이버 쿨다운 중 ({guard.cooldown_remaining('naver'):.0f}초 남음): {query}")
+            return False
+        
         try:
-            search_url = f"https://search.naver.com/search.naver?query={query}"
+            search_url = guard.build_search_url("naver", query)
+            CrawlerUtils.polite_delay(search_url)
+            guard.record_request("naver")
             driver.get(search_url)
             
             # 페이지 로드 대기
@@ -103,10 +135,14 @@ class CrawlerUtils:
                 EC.presence_of_element_located((By.CLASS_NAME, "lst_total"))
             )
             
+            guard.record_success("naver")
             print(f"✅ 네이버 검색 완료: {query}")
             return True
             
         except TimeoutException:
+            # 결과 목록 대신 차단 페이지가 뜬 경우 타임아웃으로 나타남
+            if not guard.check_driver("naver", driver):
+                guard.record_error("naver")
             print(f"⏰ 네이버 검색 타임아웃: {query}")
             return False
         except Exception as e:
@@ -114,7 +150,15 @@ class CrawlerUtils:
             return False
     
     @staticmethod
-    def restart_driver(driver: Optional[webdriver.Chrome], headless: bool = True) -> Optional[webdriver.Chrome]:
+    def search_with_failover(driver: "webdriver.Chrome", query: str) -> Optional[str]:
+        """
+        차단 감지형 검색 (구글 -> 네이버 -> 다음 자동 전환)
+        결과 페이지를 로드한 검색엔진 이름 반환, 모두 차단/실패 시 None
+        """
+        return get_search_guard().search(driver, query)
+    
+    @staticmethod
+    def restart_driver(driver: Optional["webdriver.Chrome"], headless: bool = True) -> Optional["webdriver.Chrome"]:
         """
         드라이버 재시작 (통합)
         fax_crawler.py의 restart_driver() 기반
@@ -139,7 +183,7 @@ class CrawlerUtils:
             return None
     
     @staticmethod
-    def safe_close_driver(driver: Optional[webdriver.Chrome]):
+    def safe_close_driver(driver: Optional["webdriver.Chrome"]):
         """
         안전한 드라이버 종료 (통합)
         3개 크롤러의 close() 메서드 통합
@@ -153,10 +197,18 @@ class CrawlerUtils:
     
     @staticmethod
     def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
-        """랜덤 지연 (봇 탐지 방지)"""
+        """랜덤 지연 (봇 탐지 방지) - 대상 호스트를 알면 polite_delay() 사용 권장"""
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
     
+    @staticmethod
+    def polite_delay(target: str) -> float:
+        """
+        호스트별 요청 간격 대기 (봇 탐지 방지)
+        같은 호스트에 연속 요청할 때만 대기하고, 실제 대기 시간(초)을 반환
+        """
+        return get_politeness_scheduler().wait(target)
+    
     @staticmethod
     def setup_requests_session() -> requests.Session:
         """
@@ -185,8 +237,10 @@ class CrawlerUtils:
         return session
     
     @staticmethod
-    def extract_urls_from_page(driver: webdriver.Chrome) -> List[str]:
+    def extract_urls_from_page(driver: "webdriver.Chrome") -> List[str]:
         """페이지에서 URL 추출 (공통 기능)"""
+        from selenium.webdriver.common.by import By
+        
         try:
             links = driver.find_elements(By.TAG_NAME, "a")
             urls = []
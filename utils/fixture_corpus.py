@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 응답 기록/재생 코퍼스
+구글/네이버 검색과 실제 홈페이지 없이 크롤러 처리량을 측정하기 위해
+페이지/검색 결과 응답을 로컬 코퍼스에 저장하고 다시 꺼내 씀
+
+- kind: page (HTTP 본문), rendered (브라우저 렌더링 텍스트/HTML), serp (검색 결과 본문 텍스트)
+- 항목 1개 = JSON 파일 1개 (<dir>/<kind>/<sha1(key)>.json), 사람이 열어 보고 고칠 수 있음
+- FixtureFetcher: 크롤러 fetch 계층 아래에서 mode(off/record/replay)에 따라 기록하거나 재생
+  replay에서 server_url이 있으면 대역 서버(utils/fixture_server.py)를 거쳐 지연/실패 주입을 받음
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import requests
+
+from utils.settings import CRAWL_FIXTURE_CONFIG
+
+KINDS = ("page", "rendered", "serp")
+MODES = ("off", "record", "replay")
+
+logger = logging.getLogger(__name__)
+
+
+class FixtureMissing(LookupError):
+    """재생할 응답이 코퍼스에 없음"""
+
+
+class FixtureCorpus:
+    """디렉터리 기반 응답 코퍼스 (스레드 안전)"""
+
+    def __init__(self, root: str):
+        self.root = root
+        # 파일 쓰기 + FixtureFetcher 통계 갱신 공용 잠금
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key_hash(key: str) -> str:
+        return hashlib.sha1(key.strip().encode("utf-8")).hexdigest()
+
+    def path(self, kind: str, key: str) -> str:
+        if kind not in KINDS:
+            raise ValueError(f"지원하지 않는 fixture 종류: {kind}")
+        return os.path.join(self.root, kind, f"{self.key_hash(key)}.json")
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        path = self.path(kind, key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def put(self, kind: str, key: str, body: str, **meta) -> Dict[str, Any]:
+        entry = {
+            "kind": kind,
+            "key": key,
+            "body": body or "",
+            "recorded_at": datetime.now().isoformat(),
+            **meta
+        }
+        path = self.path(kind, key)
+        with self.lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, indent=2)
+        return entry
+
+    def entries(self, kind: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        for current in ([kind] if kind else KINDS):
+            directory = os.path.join(self.root, current)
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(".json"):
+                    with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                        yield json.load(f)
+
+    def count(self) -> Dict[str, int]:
+        return {
+            kind: len([name for name in os.listdir(os.path.join(self.root, kind)) if name.endswith(".json")])
+            if os.path.isdir(os.path.join(self.root, kind)) else 0
+            for kind in KINDS
+        }
+
+
+class FixtureFetcher:
+    """
+    크롤러 fetch 계층용 기록/재생기
+    off면 아무 것도 하지 않고, record면 record_*가 코퍼스에 저장, replay면 page/rendered/serp가 응답을 돌려줌
+    """
+
+    def __init__(self, mode: Optional[str] = None, directory: Optional[str] = None,
+                 server_url: Optional[str] = None, config: Optional[Dict] = None):
+        self.config = config or CRAWL_FIXTURE_CONFIG
+        self.mode = (mode or self.config.get("mode", "off")).lower()
+        if self.mode not in MODES:
+            raise ValueError(f"지원하지 않는 mode: {self.mode} (가능: {', '.join(MODES)})")
+        self.corpus = FixtureCorpus(directory or self.config.get("dir", "fixtures"))
+        self.server_url = (server_url if server_url is not None else self.config.get("server_url", "")).rstrip("/")
+        self.timeout = self.config.get("timeout", 10)
+        self._session = requests.Session() if self.server_url else None
+        self.stats = {"recorded": 0, "replayed": 0, "missing": 0}
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    # ===== 기록 =====
+
+    def _record(self, kind: str, key: str, body: Optional[str], **meta):
+        if not self.recording or body is None:
+            return
+        try:
+            self.corpus.put(kind, key, body, **meta)
+        except OSError as e:
+            logger.warning(f"⚠️ fixture 저장 실패 ({kind}: {key}): {e}")
+            return
+        self._count("recorded")
+
+    def _count(self, stat: str):
+        # 여러 워커 스레드가 같은 fetcher를 쓰므로 코퍼스 잠금 안에서 증가
+        with self.corpus.lock:
+            self.stats[stat] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.corpus.lock:
+            return dict(self.stats)
+
+    def record_page(self, url: str, body: str, final_url: str = "", status: int = 200):
+        self._record("page", url, body, url=final_url or url, status=status)
+
+    def record_rendered(self, url: str, text: str, html: str = ""):
+        self._record("rendered", url, text, url=url, html=html or "")
+
+    def record_serp(self, query: str, text: Optional[str]):
+        self._record("serp", query, text)
+
+    # ===== 재생 =====
+
+    def _load(self, kind: str, key: str) -> Dict[str, Any]:
+        if self._session is not None:
+            # 대역 서버 경유 (지연/실패 주입, 실패는 requests.HTTPError)
+            response = self._session.get(
+                f"{self.server_url}/fixture", params={"kind": kind, "key": key}, timeout=self.timeout
+            )
+            if response.status_code == 404:
+                entry = None
+            else:
+                response.raise_for_status()
+                entry = response.json()
+        else:
+            entry = self.corpus.get(kind, key)
+
+        if entry is None:
+            self._count("missing")
+            raise FixtureMissing(f"{kind} fixture 없음: {key}")
+        self._count("replayed")
+        return entry
+
+    def page(self, url: str) -> Tuple[str, str]:
+        """HTTP 페이지 (본문, 최종 URL)"""
+        entry = self._load("page", url)
+        return entry["body"], entry.get("url") or url
+
+    def rendered(self, url: str) -> Dict[str, Any]:
+        """브라우저 렌더링 결과 (HomepageParser.extract_page_content와 같은 키, 없으면 page 항목으로 대체)"""
+        try:
+            entry = self._load("rendered", url)
+            text, html = entry["body"], entry.get("html", "")
+        except FixtureMissing:
+            html, _ = self.page(url)
+            text = None
+
+        from utils.html_document import HtmlDocument
+        document = HtmlDocument(html, url) if html else None
+        if text is None:
+            text = document.text if document is not None else ""
+        return {
+            "url": url,
+            "accessible": bool(text),
+            "text_content": text,
+            "raw_html": "",
+            "document": document,
+            "status": "success" if text else "error"
+        }
+
+    def serp(self, query: str) -> Optional[str]:
+        """검색 결과 본문 텍스트 (없으면 None - 검색 실패와 같게 처리)"""
+        try:
+            return self._load("serp", query)["body"]
+        except FixtureMissing:
+            return None
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 fixture 대역 서버
+FixtureCorpus의 응답을 HTTP로 제공하여 재생 모드 크롤링이 실제 네트워크 I/O를 거치게 함
+- GET /fixture?kind=page|rendered|serp&key=... → 코퍼스 항목 JSON (없으면 404)
+- GET /health → 코퍼스 항목 수와 요청 통계
+- 요청마다 지연(latency_ms + 0~jitter_ms) 주입, failure_rate 확률로 503 응답
+- 데몬 스레드에서 ThreadingHTTPServer 실행 (포트 0이면 빈 포트 자동 선택)
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from utils.fixture_corpus import FixtureCorpus, KINDS
+from utils.settings import CRAWL_FIXTURE_CONFIG
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    server_version = "FixtureServer/1.0"
+
+    def log_message(self, format, *args):
+        # 요청마다 stderr에 찍지 않음 (벤치마크 출력 보호)
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        owner: "FixtureServer" = self.server.owner
+        parsed = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+
+        if parsed.path == "/health":
+            self._send_json(200, {"corpus": owner.corpus.count(), "stats": owner.get_stats()})
+            return
+        if parsed.path != "/fixture" or params.get("kind") not in KINDS or "key" not in params:
+            self._send_json(400, {"error": "kind/key 파라미터 필요"})
+            return
+
+        status = owner.inject()
+        if status:
+            self._send_json(status, {"error": "injected failure"})
+            return
+
+        entry = owner.corpus.get(params["kind"], params["key"])
+        if entry is None:
+            owner.count("missing")
+            self._send_json(404, {"error": "fixture 없음"})
+            return
+        owner.count("served")
+        self._send_json(200, entry)
+
+
+class FixtureServer:
+    """코퍼스 대역 서버 (with 문 또는 start/stop)"""
+
+    def __init__(self, corpus_dir: Optional[str] = None, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: Optional[float] = None, jitter_ms: Optional[float] = None,
+                 failure_rate: Optional[float] = None, seed: Optional[int] = None):
+        defaults = CRAWL_FIXTURE_CONFIG.get("server", {})
+        self.corpus = FixtureCorpus(corpus_dir or CRAWL_FIXTURE_CONFIG.get("dir", "fixtures"))
+        self.host = host
+        self.port = port
+        self.latency_ms = defaults.get("latency_ms", 0) if latency_ms is None else latency_ms
+        self.jitter_ms = defaults.get("jitter_ms", 0) if jitter_ms is None else jitter_ms
+        self.failure_rate = defaults.get("failure_rate", 0.0) if failure_rate is None else failure_rate
+        self._random = random.Random(defaults.get("seed") if seed is None else seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "served": 0, "missing": 0, "failed": 0}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._httpd is None:
+            return ""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def inject(self) -> Optional[int]:
+        """요청 1건에 지연 주입 후, 실패로 응답할 상태 코드 (정상이면 None)"""
+        with self._lock:
+            self._stats["requests"] += 1
+            delay = (self.latency_ms + self._random.uniform(0, self.jitter_ms)) / 1000.0
+            failed = self._random.random() < self.failure_rate
+            if failed:
+                self._stats["failed"] += 1
+        if delay > 0:
+            time.sleep(delay)
+        return 503 if failed else None
+
+    def count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self) -> str:
+        """서버 시작 후 기본 URL 반환"""
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), _FixtureHandler)
+            self._httpd.daemon_threads = True
+            self._httpd.owner = self
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="fixture-server", daemon=True)
+            self._thread.start()
+            print(f"📼 fixture 대역 서버 시작: {self.url} "
+                  f"(지연 {self.latency_ms}+{self.jitter_ms}ms, 실패율 {self.failure_rate:.0%})")
+        return self.url
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self) -> "FixtureServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gemini API 키 풀
+genai.configure(api_key=...)는 전역 설정이라 키마다 configure 후 모델을 만들어도
+모든 모델이 마지막 키를 쓰게 됨 → 키마다 독립 클라이언트를 만들어 모델에 직접 연결
+
+- 키별: 독립 클라이언트(동기/비동기), 분당 요청 예산(토큰 버킷), 연속 실패/회로 차단 상태
+- 요청은 여유(남은 예산 - 처리 중 요청)가 가장 큰 키로 보내고, 429/키 장애(인증·전송·5xx) 시 다른 키로 재시도
+- 요청 자체의 문제(InvalidArgument, ValueError, 안전 차단 등)는 키에 책임이 없으므로 벌점 없이 바로 전달
+- pool.model(...)이 돌려주는 PooledGenerativeModel은 generate_content(_async)를 가진 모델처럼 사용 가능
+  (AIModelManager, GeminiClient, HomepageParser, 센터 크롤러가 같은 풀을 공유)
+"""
+
+import asyncio
+import os
+import re
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.gemini_metrics import instrument_model, is_rate_limit_error
+from utils.metrics import get_metrics_registry
+from utils.settings import GEMINI_KEY_POOL_CONFIG
+
+METRICS = get_metrics_registry()
+KEY_REQUESTS = METRICS.counter("gemini_key_requests_total", "Gemini 키별 요청 결과", ["key", "outcome"])
+KEY_CIRCUIT_OPEN = METRICS.gauge("gemini_key_circuit_open", "Gemini 키 회로 열림 여부 (1=차단)", ["key"])
+KEY_HEADROOM = METRICS.gauge("gemini_key_headroom", "Gemini 키 남은 분당 요청 예산", ["key"])
+
+_RETRY_DELAY = re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+)')
+
+# 키 장애로 보는 오류 (google.api_core 미설치 환경도 고려해 이름으로 판별)
+_AUTH_ERRORS = ("Unauthenticated", "PermissionDenied", "Unauthorized", "Forbidden")
+_SERVER_ERRORS = ("InternalServerError", "ServiceUnavailable", "BadGateway", "GatewayTimeout",
+                  "DeadlineExceeded", "ServerError", "RetryError", "TransportError")
+
+
+def is_key_failure(error: Exception) -> bool:
+    """인증/전송/5xx 오류 여부 - 이 경우만 키 실패로 세고 다른 키로 재시도
+
+    InvalidArgument, ValueError, 안전 차단(BlockedPrompt/StopCandidate) 등 요청 자체의 문제는
+    어느 키로 보내도 같으므로 False
+    """
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    names = {cls.__name__ for cls in type(error).__mro__}
+    if names & set(_AUTH_ERRORS + _SERVER_ERRORS):
+        return True
+    code = getattr(error, "code", None)
+    return isinstance(code, int) and (code >= 500 or code in (401, 403))
+
+
+def _create_client(api_key: str) -> Any:
+    """키 전용 동기 클라이언트 (비동기 클라이언트는 이벤트 루프마다 지연 생성)"""
+    from google.ai import generativelanguage as glm
+    return glm.GenerativeServiceClient(client_options={"api_key": api_key})
+
+
+def _create_async_client(api_key: str) -> Any:
+    from google.ai import generativelanguage as glm
+    return glm.GenerativeServiceAsyncClient(client_options={"api_key": api_key})
+
+
+def load_api_keys() -> List[str]:
+    """환경 변수에서 키 목록 (중복 제거, 설정 순서 유지)"""
+    keys = [os.getenv(name) for name in GEMINI_KEY_POOL_CONFIG.get("key_env_vars", [])]
+    extra = os.getenv(GEMINI_KEY_POOL_CONFIG.get("keys_env_var", "GEMINI_API_KEYS"), "")
+    keys.extend(key.strip() for key in extra.split(","))
+    unique = []
+    for key in keys:
+        if key and key not in unique:
+            unique.append(key)
+    return unique
+
+
+class GeminiKey:
+    """키 1개의 클라이언트/예산/상태 (상태 변경은 풀 잠금 안에서만)"""
+
+    def __init__(self, index: int, api_key: str, requests_per_minute: int):
+        self.index = index
+        self.name = f"GEMINI_{index + 1}"
+        self.masked = api_key[:10] + "..."
+        self._api_key = api_key
+        self._client = _create_client(api_key)
+        self._models: Dict[Tuple, Any] = {}
+        # 비동기 클라이언트는 생성한 이벤트 루프에 묶이므로 루프별로 클라이언트와 모델 캐시
+        self._loop_models = weakref.WeakKeyDictionary()
+        self._loop_lock = threading.Lock()
+
+        # 토큰 버킷 (분당 요청 예산)
+        self.capacity = float(max(1, requests_per_minute))
+        self.refill_per_second = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+        # 상태
+        self.inflight = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.last_used = 0.0
+        self.stats = {"success": 0, "error": 0, "rate_limited": 0}
+
+        KEY_CIRCUIT_OPEN.labels(self.name).set(0)
+        KEY_HEADROOM.labels(self.name).set_function(lambda: self.tokens)
+
+    # ===== 예산/상태 =====
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def available_in(self, now: float) -> float:
+        """요청 가능까지 남은 시간 (0이면 즉시)"""
+        wait = max(0.0, self.open_until - now)
+        if self.tokens < 1.0:
+            wait = max(wait, (1.0 - self.tokens) / self.refill_per_second)
+        return wait
+
+    def headroom(self) -> float:
+        return self.tokens - self.inflight
+
+    @property
+    def circuit_open(self) -> bool:
+        return self.open_until > time.monotonic()
+
+    # ===== 모델 =====
+
+    def _build_model(self, model_name: str, source: str, model_kwargs: Dict[str, Any],
+                     async_client: Any = None) -> Any:
+        # google.generativeai는 첫 모델 생성 시 import (_create_client와 같이 지연 로드)
+        import google.generativeai as genai
+
+        raw_model = genai.GenerativeModel(model_name, **model_kwargs)
+        # 전역 configure 대신 키 전용 클라이언트 사용
+        raw_model._client = self._client
+        if async_client is not None:
+            raw_model._async_client = async_client
+        return instrument_model(raw_model, source)
+
+    def model(self, model_name: str, source: str, **model_kwargs) -> Any:
+        """이 키의 클라이언트에 연결된 모델 (이름/설정별 캐시)"""
+        cache_key = (model_name, source, repr(sorted(model_kwargs.items())))
+        model = self._models.get(cache_key)
+        if model is None:
+            model = self._build_model(model_name, source, model_kwargs)
+            self._models[cache_key] = model
+        return model
+
+    def async_model(self, model_name: str, source: str, **model_kwargs) -> Any:
+        """현재 이벤트 루프의 키 전용 비동기 클라이언트에 연결된 모델 (루프/이름/설정별 캐시)"""
+        loop = asyncio.get_running_loop()
+        with self._loop_lock:
+            entry = self._loop_models.get(loop)
+            if entry is None:
+                entry = (_create_async_client(self._api_key), {})
+                self._loop_models[loop] = entry
+        async_client, models = entry
+        cache_key = (model_name, source, repr(sorted(model_kwargs.items())))
+        model = models.get(cache_key)
+        if model is None:
+            model = self._build_model(model_name, source, model_kwargs, async_client)
+            models[cache_key] = model
+        return model
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "key": self.masked,
+            "headroom": round(self.tokens, 2),
+            "capacity": self.capacity,
+            "inflight": self.inflight,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_open": self.circuit_open,
+            **self.stats
+        }
+
+
+class GeminiKeyPool:
+    """여유가 가장 큰 키로 요청을 보내는 Gemini 키 풀"""
+
+    def __init__(self, api_keys: List[str] = None, requests_per_minute: int = None,
+                 failure_threshold: int = None, open_seconds: float = None, max_wait_seconds: float = None):
+        api_keys = load_api_keys() if api_keys is None else [key for key in api_keys if key]
+        requests_per_minute = requests_per_minute or GEMINI_KEY_POOL_CONFIG.get("requests_per_minute", 60)
+        self.failure_threshold = failure_threshold or GEMINI_KEY_POOL_CONFIG.get("failure_threshold", 3)
+        self.open_seconds = open_seconds or GEMINI_KEY_POOL_CONFIG.get("open_seconds", 60.0)
+        self.max_wait_seconds = max_wait_seconds or GEMINI_KEY_POOL_CONFIG.get("max_wait_seconds", 30.0)
+
+        self.keys = [GeminiKey(i, key, requests_per_minute) for i, key in enumerate(api_keys)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # ===== 키 선택 =====
+
+    def _try_acquire(self, exclude: set) -> Tuple[Optional[GeminiKey], float]:
+        """(선택된 키, 없으면 가장 빨리 사용 가능해지는 시간)"""
+        now = time.monotonic()
+        with self._lock:
+            best, wait = None, float("inf")
+            for key in self.keys:
+                if key.index in exclude:
+                    continue
+                key.refill(now)
+                key_wait = key.available_in(now)
+                if key_wait > 0:
+                    wait = min(wait, key_wait)
+                    continue
+                # 여유가 같으면 오래 쉰 키 우선
+                if best is None or (key.headroom(), -key.last_used) > (best.headroom(), -best.last_used):
+                    best = key
+            if best is not None:
+                best.tokens -= 1.0
+                best.inflight += 1
+                best.last_used = now
+                return best, 0.0
+            return None, wait
+
+    def _release(self, key: GeminiKey, error: Optional[BaseException]):
+        with self._lock:
+            key.inflight -= 1
+            if error is not None and not isinstance(error, Exception):
+                # 취소/인터럽트: 키 상태는 그대로
+                KEY_REQUESTS.labels(key.name, "cancelled").inc()
+                return
+            if error is not None and not is_rate_limit_error(error) and not is_key_failure(error):
+                # 요청 자체의 문제: 키 상태는 그대로 두고 결과만 기록
+                KEY_REQUESTS.labels(key.name, "client_error").inc()
+                return
+            if error is None:
+                key.consecutive_failures = 0
+                key.stats["success"] += 1
+                KEY_REQUESTS.labels(key.name, "success").inc()
+            elif is_rate_limit_error(error):
+                # 할당량 초과: 재시도 지연만큼 이 키는 쉬고 다른 키로
+                match = _RETRY_DELAY.search(str(error))
+                key.open_until = time.monotonic() + (float(match.group(1)) if match else self.open_seconds)
+                key.stats["rate_limited"] += 1
+                KEY_REQUESTS.labels(key.name, "rate_limited").inc()
+            else:
+                key.consecutive_failures += 1
+                key.stats["error"] += 1
+                KEY_REQUESTS.labels(key.name, "error").inc()
+                if key.consecutive_failures >= self.failure_threshold:
+                    # 회로 열림: open_seconds 후 1회 시험 요청으로 복구 확인 (half-open)
+                    key.open_until = time.monotonic() + self.open_seconds
+                    key.consecutive_failures = self.failure_threshold - 1
+            KEY_CIRCUIT_OPEN.labels(key.name).set(1 if key.open_until > time.monotonic() else 0)
+
+    def acquire(self, exclude: set = None) -> Optional[GeminiKey]:
+        """사용 가능한 키 선택 (없으면 max_wait_seconds까지 대기)"""
+        exclude = exclude or set()
+        deadline = time.monotonic() + self.max_wait_seconds
+        while True:
+            key, wait = self._try_acquire(exclude)
+            if key is not None or wait == float("inf"):
+                return key
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(wait, remaining))
+
+    async def acquire_async(self, exclude: set = None) -> Optional[GeminiKey]:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        exclude = exclude or set()
+        deadline = time.monotonic() + self.max_wait_seconds
+        while True:
+            key, wait = self._try_acquire(exclude)
+            if key is not None or wait == float("inf"):
+                return key
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(wait, remaining))
+
+    # ===== 호출 =====
+
+    def generate_content(self, model_name: str, source: str, model_kwargs: Dict[str, Any], *args, **kwargs):
+        """키를 골라 호출, 실패하면 아직 쓰지 않은 키로 재시도 (모든 키 실패 시 마지막 오류)"""
+        tried, last_error = set(), None
+        while len(tried) < len(self.keys):
+            key = self.acquire(tried)
+            if key is None:
+                break
+            tried.add(key.index)
+            try:
+                response = key.model(model_name, source, **model_kwargs).generate_content(*args, **kwargs)
+            except BaseException as e:
+                # KeyboardInterrupt 등도 처리 중 카운트는 되돌리고 벌점 없이 전파
+                self._release(key, e)
+                if not (is_rate_limit_error(e) or is_key_failure(e)):
+                    raise
+                last_error = e
+                continue
+            self._release(key, None)
+            return response
+        raise last_error or RuntimeError("사용 가능한 Gemini API 키가 없습니다.")
+
+    async def generate_content_async(self, model_name: str, source: str, model_kwargs: Dict[str, Any],
+                                     *args, **kwargs):
+        tried, last_error = set(), None
+        while len(tried) < len(self.keys):
+            key = await self.acquire_async(tried)
+            if key is None:
+                break
+            tried.add(key.index)
+            try:
+                model = key.async_model(model_name, source, **model_kwargs)
+                response = await model.generate_content_async(*args, **kwargs)
+            except BaseException as e:
+                # wait_for 타임아웃/작업 취소(CancelledError)도 처리 중 카운트는 되돌리고 벌점 없이 전파
+                self._release(key, e)
+                if not (is_rate_limit_error(e) or is_key_failure(e)):
+                    raise
+                last_error = e
+                continue
+            self._release(key, None)
+            return response
+        raise last_error or RuntimeError("사용 가능한 Gemini API 키가 없습니다.")
+
+    def model(self, model_name: str, source: str = "pool", **model_kwargs) -> "PooledGenerativeModel":
+        """풀을 통해 호출하는 모델 (GenerativeModel과 같은 방식으로 사용)"""
+        return PooledGenerativeModel(self, model_name, source, model_kwargs)
+
+    # ===== 상태 =====
+
+    def status(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            for key in self.keys:
+                key.refill(now)
+            return [key.status() for key in self.keys]
+
+
+class PooledGenerativeModel:
+    """키 풀을 거치는 모델 프록시 (호출마다 여유가 가장 큰 키 사용)"""
+
+    def __init__(self, pool: GeminiKeyPool, model_name: str, source: str, model_kwargs: Dict[str, Any]):
+        self.pool = pool
+        self.model_name = model_name
+        self.source = source
+        self.model_kwargs = model_kwargs
+
+    def generate_content(self, *args, **kwargs):
+        return self.pool.generate_content(self.model_name, self.source, self.model_kwargs, *args, **kwargs)
+
+    async def generate_content_async(self, *args, **kwargs):
+        return await self.pool.generate_content_async(self.model_name, self.source, self.model_kwargs,
+                                                      *args, **kwargs)
+
+
+_pool_instance = None
+_pool_lock = threading.Lock()
+
+
+def get_gemini_key_pool() -> GeminiKeyPool:
+    """프로세스 공용 Gemini 키 풀 (환경 변수의 모든 키)"""
+    global _pool_instance
+    if _pool_instance is None:
+        with _pool_lock:
+            if _pool_instance is None:
+                _pool_instance = GeminiKeyPool()
+    return _pool_instance
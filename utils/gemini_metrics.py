@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gemini 호출 메트릭
+genai.GenerativeModel을 감싸 generate_content 호출 수/시간, 토큰 사용량, 429(할당량 초과)를 기록
+호출 코드는 바꾸지 않고 모델 생성 지점에서 instrument_model()로 감싸기만 하면 됨
+동시 호출 수는 적응형 한도(gemini_calls)로 제한 (429는 차단으로 보고 한도 감소)
+"""
+
+import time
+from typing import Any
+
+from utils.concurrency_controller import get_adaptive_limit
+from utils.metrics import get_metrics_registry
+
+METRICS = get_metrics_registry()
+GEMINI_REQUESTS = METRICS.counter(
+    "gemini_requests_total", "Gemini generate_content 호출 수", ["source", "outcome"]
+)
+GEMINI_REQUEST_SECONDS = METRICS.histogram(
+    "gemini_request_seconds", "Gemini generate_content 응답 시간", ["source"]
+)
+GEMINI_TOKENS = METRICS.counter(
+    "gemini_tokens_total", "Gemini 토큰 사용량 (usage_metadata 기준)", ["source", "kind"]
+)
+GEMINI_RATE_LIMITED = METRICS.counter(
+    "gemini_rate_limited_total", "Gemini 429/할당량 초과 응답 수", ["source"]
+)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """429/ResourceExhausted 여부 (google.api_core 미설치 환경도 고려해 이름/메시지로 판별)"""
+    if type(error).__name__ in ("ResourceExhausted", "TooManyRequests"):
+        return True
+    message = str(error)
+    return "429" in message or "quota" in message.lower()
+
+
+def record_usage(response: Any, source: str):
+    """응답의 usage_metadata 토큰 수 기록 (없으면 무시)"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_token_count", 0) or 0
+    output_tokens = getattr(usage, "candidates_token_count", 0) or 0
+    if prompt_tokens:
+        GEMINI_TOKENS.labels(source, "prompt").inc(prompt_tokens)
+    if output_tokens:
+        GEMINI_TOKENS.labels(source, "output").inc(output_tokens)
+
+
+class InstrumentedGenerativeModel:
+    """generate_content(_async)를 계측하는 모델 프록시 (나머지 속성은 원본 모델로 위임)"""
+
+    def __init__(self, model: Any, source: str):
+        self._model = model
+        self._source = source
+        self._seconds = GEMINI_REQUEST_SECONDS.labels(source)
+        self._limit = get_adaptive_limit("gemini_calls")
+
+    def _record_error(self, error: Exception, slot):
+        if is_rate_limit_error(error):
+            GEMINI_RATE_LIMITED.labels(self._source).inc()
+            GEMINI_REQUESTS.labels(self._source, "rate_limited").inc()
+            slot.mark("block")
+        else:
+            GEMINI_REQUESTS.labels(self._source, "error").inc()
+            slot.mark("error")
+
+    def generate_content(self, *args, **kwargs):
+        with self._limit.slot() as slot:
+            start = time.perf_counter()
+            try:
+                response = self._model.generate_content(*args, **kwargs)
+            except Exception as e:
+                self._record_error(e, slot)
+                raise
+            finally:
+                self._seconds.observe(time.perf_counter() - start)
+        GEMINI_REQUESTS.labels(self._source, "success").inc()
+        record_usage(response, self._source)
+        return response
+
+    async def generate_content_async(self, *args, **kwargs):
+        async with self._limit.slot() as slot:
+            start = time.perf_counter()
+            try:
+                response = await self._model.generate_content_async(*args, **kwargs)
+            except Exception as e:
+                self._record_error(e, slot)
+                raise
+            finally:
+                self._seconds.observe(time.perf_counter() - start)
+        GEMINI_REQUESTS.labels(self._source, "success").inc()
+        record_usage(response, self._source)
+        return response
+
+    def __getattr__(self, name: str):
+        return getattr(self._model, name)
+
+
+def instrument_model(model: Any, source: str) -> Any:
+    """모델을 계측 프록시로 감싸기 (None이거나 이미 감싼 모델은 그대로)"""
+    if model is None or isinstance(model, InstrumentedGenerativeModel):
+        return model
+    return InstrumentedGenerativeModel(model, source)
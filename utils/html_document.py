@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한 번 파싱한 HTML 문서 모델
+같은 홈페이지를 단계마다 다시 BeautifulSoup으로 만들던 것을 없애기 위해
+문서를 1회 파싱하고 텍스트/메타/링크/푸터/연락처 영역은 처음 조회할 때 계산해 캐시
+
+- 파서: HTML_PARSE_CONFIG["parsers"] 순서로 설치된 것 사용 (lxml 우선, 없으면 html.parser)
+- 파싱 트리를 변경하지 않음 (script/style 제거 대신 텍스트 수집 시 건너뜀) → 모든 뷰가 같은 트리 공유
+- budget_text: 연락처/푸터 영역을 먼저 채우고 예산(글자 수)이 차면 즉시 중단 (전체 텍스트를 만들지 않음)
+- compact: 추출이 끝나면 원본 HTML과 파싱 트리를 해제하고 작은 뷰(title/meta/links)만 유지
+- 사용: HomepageParser.extract_page_content → page_data["document"], WebPageParser.parse_homepage,
+  crawler_main 홈페이지 분석 에이전트
+"""
+
+import re
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, CData, NavigableString
+from bs4.builder import builder_registry
+
+from utils.settings import HTML_PARSE_CONFIG
+
+# 텍스트로 취급하지 않는 태그
+NON_TEXT_TAGS = frozenset(["script", "style", "noscript", "template"])
+
+# 주요 콘텐츠 영역 선택자
+CONTENT_SELECTORS = [
+    'main', 'article', '.content', '#content', '.main-content',
+    '.container', '.wrapper', 'section', '.section',
+    '.page-content', '.post-content', '.entry-content',
+    '[role="main"]', '.main'
+]
+
+# 연락처 영역 선택자
+CONTACT_SELECTORS = [
+    '.contact', '#contact', '.contact-info', '.contact-us',
+    '.footer', '#footer', '.footer-info',
+    '.address', '.phone', '.tel', '.email',
+    '[class*="contact"]', '[id*="contact"]',
+    '[class*="footer"]', '[id*="footer"]',
+    'footer', 'address'
+]
+
+_WHITESPACE = re.compile(r'\s+')
+_FOOTER_CLASS = re.compile(r'footer|bottom', re.I)
+
+
+def _select_parser() -> str:
+    for name in HTML_PARSE_CONFIG.get("parsers", ["html.parser"]):
+        if builder_registry.lookup(name) is not None:
+            return name
+    return "html.parser"
+
+
+PARSER = _select_parser()
+
+
+def collapse_whitespace(text: str) -> str:
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+class _TextBudget:
+    """글자 수 예산 안에서 텍스트 조각 누적"""
+
+    __slots__ = ("parts", "length")
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.length = 0
+
+    def add(self, fragment: str, limit: int) -> bool:
+        """조각 추가 (limit에 도달하면 잘라 넣고 False)"""
+        fragment = collapse_whitespace(fragment)
+        if not fragment:
+            return self.length < limit
+        remaining = limit - self.length - (1 if self.parts else 0)
+        if remaining <= 0:
+            return False
+        if len(fragment) > remaining:
+            fragment = fragment[:remaining]
+        self.parts.append(fragment)
+        self.length += len(fragment) + (1 if len(self.parts) > 1 else 0)
+        return self.length < limit
+
+    def text(self) -> str:
+        return ' '.join(self.parts)
+
+
+class HtmlDocument:
+    """1회 파싱한 HTML 문서 (뷰는 처음 접근 시 계산 후 캐시)"""
+
+    def __init__(self, html: Union[str, bytes], url: str = "", parser: str = None):
+        self.html = html or ""
+        self.url = url or ""
+        self.parser = parser or PARSER
+        self.html_size = len(self.html)
+        self.compacted = False
+
+    @classmethod
+    def of(cls, source: Union["HtmlDocument", str, bytes, None], url: str = "") -> Optional["HtmlDocument"]:
+        """이미 만든 문서는 그대로, HTML 문자열이면 새 문서 (없으면 None)"""
+        if source is None or isinstance(source, HtmlDocument):
+            return source
+        return cls(source, url) if source else None
+
+    # ===== 파싱 =====
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """파싱 트리 (문서당 1회 생성, 읽기 전용으로 사용)"""
+        return BeautifulSoup(self.html, self.parser)
+
+    def _select(self, selector: str) -> list:
+        try:
+            return self.soup.select(selector)
+        except Exception:
+            # 파서/soupsieve가 지원하지 않는 선택자는 건너뜀
+            return []
+
+    def compact(self, keep_html: bool = False):
+        """
+        원본 HTML/파싱 트리/전체 텍스트 해제 (페이지 처리 후 메모리 회수)
+        title/meta/links와 연락처(없으면 footer) 영역 텍스트는 먼저 계산해 유지
+        (프롬프트 압축/규칙 기반 추출이 compact 이후에도 사용), 이후 트리가 필요한 새 뷰는 빈 값
+        """
+        for view in ("title", "meta", "links", "contact_text"):
+            getattr(self, view)
+        if not self.contact_text:
+            getattr(self, "footer_text")
+        for view in ("soup", "text", "main_text"):
+            self.__dict__.pop(view, None)
+        if not keep_html:
+            self.html = ""
+        self.compacted = True
+
+    # ===== 텍스트 =====
+
+    def iter_strings(self, element=None) -> Iterable[str]:
+        """요소(기본: 문서 전체)의 보이는 텍스트 조각 (script/style/주석 제외)"""
+        root = self.soup if element is None else element
+        for string in root.find_all(string=True):
+            # Comment/Doctype/Script 등 NavigableString 하위 타입은 본문 텍스트가 아님
+            if type(string) not in (NavigableString, CData):
+                continue
+            if string.parent is not None and string.parent.name in NON_TEXT_TAGS:
+                continue
+            if string.strip():
+                yield string
+
+    def element_text(self, element) -> str:
+        return collapse_whitespace(' '.join(self.iter_strings(element)))
+
+    @cached_property
+    def text(self) -> str:
+        """문서 전체 텍스트 (공백 정리)"""
+        return self.element_text(self.soup)
+
+    def select_text(self, selectors: Iterable[str], min_length: int = 0) -> List[str]:
+        """선택자별 요소 텍스트 목록 (min_length자 초과만)"""
+        texts = []
+        for selector in selectors:
+            for element in self._select(selector):
+                text = self.element_text(element)
+                if len(text) > min_length:
+                    texts.append(text)
+        return texts
+
+    def budget_text(self, max_chars: int = None, priority_selectors: Iterable[str] = CONTACT_SELECTORS,
+                    priority_share: float = None) -> str:
+        """
+        예산(max_chars) 안의 페이지 텍스트
+        연락처/푸터 영역으로 priority_share만큼 먼저 채우고 나머지는 문서 순서대로 채움
+        (예산이 차면 바로 중단, 이미 넣은 텍스트 조각은 다시 넣지 않음)
+        """
+        max_chars = max_chars or HTML_PARSE_CONFIG.get("text_budget", 10000)
+        if priority_share is None:
+            priority_share = HTML_PARSE_CONFIG.get("priority_share", 0.4)
+        priority_limit = int(max_chars * priority_share)
+
+        budget = _TextBudget()
+        emitted = set()
+
+        if priority_limit > 0:
+            for selector in priority_selectors:
+                for element in self._select(selector):
+                    for string in self.iter_strings(element):
+                        if id(string) in emitted:
+                            continue
+                        emitted.add(id(string))
+                        if not budget.add(string, priority_limit):
+                            break
+                    if budget.length >= priority_limit:
+                        break
+                if budget.length >= priority_limit:
+                    break
+
+        for string in self.iter_strings():
+            if id(string) in emitted:
+                continue
+            if not budget.add(string, max_chars):
+                break
+
+        return budget.text()
+
+    @cached_property
+    def main_text(self) -> str:
+        """주요 콘텐츠 영역 텍스트"""
+        return ' '.join(self.select_text(CONTENT_SELECTORS, 100))
+
+    @cached_property
+    def contact_text(self) -> str:
+        """연락처 영역 텍스트 (footer/contact/address 등)"""
+        return ' '.join(self.select_text(CONTACT_SELECTORS, 20))
+
+    @cached_property
+    def footer_text(self) -> str:
+        """footer 영역 텍스트 (없으면 본문 하단부)"""
+        texts = []
+        for element in self.soup.find_all(['footer', 'div']):
+            if element.name == 'footer' or _FOOTER_CLASS.search(' '.join(element.get('class') or [])) \
+                    or _FOOTER_CLASS.search(element.get('id') or ''):
+                text = self.element_text(element)
+                if len(text) > 10:
+                    texts.append(text)
+        if texts:
+            return '\n'.join(texts)
+        fallback = HTML_PARSE_CONFIG.get("footer_fallback_chars", 1000)
+        return self.text[-fallback:] if len(self.text) > fallback else ""
+
+    # ===== 메타/링크 =====
+
+    @cached_property
+    def title(self) -> str:
+        tag = self.soup.find('title')
+        return collapse_whitespace(tag.get_text()) if tag else ""
+
+    @cached_property
+    def meta(self) -> Dict[str, str]:
+        """메타 태그 (description/keywords/author/og:title/og:description)"""
+        meta_info = {
+            "title": self.title,
+            "description": "",
+            "keywords": "",
+            "author": "",
+            "og_title": "",
+            "og_description": ""
+        }
+        for tag in self.soup.find_all('meta'):
+            name = (tag.get('name') or '').lower()
+            property_name = (tag.get('property') or '').lower()
+            content = tag.get('content') or ''
+            if name in ("description", "keywords", "author"):
+                meta_info[name] = content
+            elif property_name == 'og:title':
+                meta_info["og_title"] = content
+            elif property_name == 'og:description':
+                meta_info["og_description"] = content
+        return meta_info
+
+    @cached_property
+    def links(self) -> List[Dict[str, str]]:
+        """문서의 링크 (절대 URL, 링크 텍스트)"""
+        links = []
+        for anchor in self.soup.find_all('a', href=True):
+            href = anchor.get('href', '').strip()
+            if not href or href.startswith(('javascript:', '#')):
+                continue
+            links.append({
+                'url': urljoin(self.url, href) if self.url else href,
+                'text': anchor.get_text(strip=True)
+            })
+        return links
+
+    def contact_page_links(self, keywords: Iterable[str], limit: int = None) -> List[Dict[str, Any]]:
+        """링크 텍스트에 연락처 키워드가 있는 링크 (문서 순서, 최대 limit개)"""
+        limit = limit or HTML_PARSE_CONFIG.get("contact_link_limit", 5)
+        keywords = [(keyword, keyword.lower()) for keyword in keywords]
+        contact_links = []
+        for link in self.links:
+            link_text = link['text'].lower()
+            for keyword, lowered in keywords:
+                if lowered in link_text:
+                    contact_links.append({**link, 'keyword': keyword})
+                    break
+            if len(contact_links) >= limit:
+                break
+        return contact_links
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+import 시간 프로파일 보고서
+새 인터프리터에서 `python -X importtime -c "import <모듈>"`을 실행해 진입점(crm_app, crawler_main, 서비스/워커)의
+콜드 스타트 비용과 가장 무거운 패키지를 보고
+
+사용 예:
+    python -m utils.import_profile crm_app crawler_main services.crawling_service
+    python -m utils.import_profile crawler_main --runs 5 --top 20 --output logs/import_profile.json
+
+- 모듈별: 실행 시간(인터프리터 기동 포함) 중앙값, import 누적 시간, 불러온 모듈 수
+- 최상위 패키지별 누적 시간 상위 N개 (selenium, google, pandas 등이 진입점에서 빠졌는지 확인용)
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:       430 |       8326 |   json.decoder"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """-X importtime 출력 → [{name, self_us, cumulative_us, depth}] (출력 순서 유지)"""
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append({
+            "name": name,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            # 들여쓰기 2칸 = 한 단계 (최상위 import는 1칸)
+            "depth": max(0, (len(indent) - 1) // 2)
+        })
+    return entries
+
+
+def summarize_packages(entries: List[Dict[str, Any]], top: int = 15) -> List[Dict[str, Any]]:
+    """최상위 패키지(첫 점 앞 이름)별 self 시간 합계, 큰 순"""
+    totals: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        package = entry["name"].split(".")[0]
+        total = totals.setdefault(package, {"package": package, "self_ms": 0.0, "modules": 0})
+        total["self_ms"] += entry["self_us"] / 1000
+        total["modules"] += 1
+    ranked = sorted(totals.values(), key=lambda item: item["self_ms"], reverse=True)
+    for item in ranked:
+        item["self_ms"] = round(item["self_ms"], 1)
+    return ranked[:top]
+
+
+def profile_import(module: str, runs: int = 3, python: str = sys.executable, top: int = 15) -> Dict[str, Any]:
+    """새 인터프리터에서 모듈 import를 runs번 측정 (마지막 실행의 importtime으로 패키지 분석)"""
+    wall_ms: List[float] = []
+    import_ms: List[float] = []
+    entries: List[Dict[str, Any]] = []
+    error = None
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+
+    for _ in range(max(1, runs)):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [python, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+        )
+        wall_ms.append((time.perf_counter() - started) * 1000)
+        entries = parse_importtime(completed.stderr)
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "import 실패"
+            break
+        target = [entry for entry in entries if entry["name"] == module]
+        import_ms.append(target[-1]["cumulative_us"] / 1000 if target else 0.0)
+
+    return {
+        "module": module,
+        "runs": len(wall_ms),
+        "wall_ms": round(statistics.median(wall_ms), 1),
+        "import_ms": round(statistics.median(import_ms), 1) if import_ms else None,
+        "modules_loaded": len(entries),
+        "packages": summarize_packages(entries, top),
+        "error": error
+    }
+
+
+def print_report(results: List[Dict[str, Any]], top: int = 15):
+    print("=" * 80)
+    print("🐢 import 시간 프로파일")
+    print("=" * 80)
+    for result in results:
+        if result["error"]:
+            print(f"\n❌ {result['module']}: {result['error']}")
+        else:
+            print(f"\n📦 {result['module']}: 실행 {result['wall_ms']:.0f}ms (중앙값, {result['runs']}회), "
+                  f"import {result['import_ms']:.0f}ms, 모듈 {result['modules_loaded']}개")
+        for item in result["packages"][:top]:
+            print(f"  - {item['package']:<28} {item['self_ms']:>8.1f}ms  ({item['modules']}개 모듈)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="진입점 모듈 import 시간 프로파일")
+    parser.add_argument("modules", nargs="*", default=["crm_app", "crawler_main", "services.crawling_service"],
+                        help="측정할 모듈 (기본: crm_app crawler_main services.crawling_service)")
+    parser.add_argument("--runs", type=int, default=3, help="모듈당 측정 횟수")
+    parser.add_argument("--top", type=int, default=15, help="패키지 상위 N개")
+    parser.add_argument("--output", help="JSON 보고서 저장 경로")
+    args = parser.parse_args()
+
+    results = [profile_import(module, runs=args.runs, top=args.top) for module in args.modules]
+    print_report(results, args.top)
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 보고서 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
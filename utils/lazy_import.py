@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지연 import 레지스트리
+crawler_main / 서비스 모듈이 import 시점에 Selenium, google.generativeai, cralwer/* 전체를 끌어오지 않도록
+무거운 모듈은 이름만 등록해 두고 처음 쓰는 시점에 import
+
+- LazyRegistry.register(key, module, attribute): 등록만 (import 없음)
+- load(key): 첫 호출에 import 후 캐시, 실패하면 None (실패도 캐시해 재시도 비용 없음)
+- module_available(name): import 없이 설치 여부만 확인 (importlib.util.find_spec)
+- get_stats(): 항목별 로드 여부/소요 시간 (import 프로파일 보고서와 같이 확인)
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+def module_available(name: str) -> bool:
+    """모듈을 import하지 않고 설치 여부만 확인"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class _Entry:
+    __slots__ = ("module", "attribute", "description", "loaded", "value", "error", "seconds")
+
+    def __init__(self, module: str, attribute: Optional[str], description: str):
+        self.module = module
+        self.attribute = attribute
+        self.description = description
+        self.loaded = False
+        self.value: Any = None
+        self.error: Optional[str] = None
+        self.seconds = 0.0
+
+
+class LazyRegistry:
+    """이름 → (모듈, 속성) 지연 로드 레지스트리 (스레드 안전)"""
+
+    def __init__(self, owner: str, verbose: bool = True):
+        self.owner = owner
+        self.verbose = verbose
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+
+    def register(self, key: str, module: str, attribute: Optional[str] = None, description: Optional[str] = None):
+        """로드할 대상 등록 (attribute가 없으면 모듈 자체를 반환)"""
+        with self._lock:
+            self._entries[key] = _Entry(module, attribute, description or module)
+
+    def load(self, key: str) -> Any:
+        """등록된 모듈/속성 반환 (첫 호출에 import, 실패 시 None)"""
+        entry = self._entries[key]
+        if entry.loaded:
+            return entry.value
+
+        with self._lock:
+            if entry.loaded:
+                return entry.value
+            started = time.perf_counter()
+            try:
+                value = importlib.import_module(entry.module)
+                if entry.attribute:
+                    value = getattr(value, entry.attribute)
+                entry.value = value
+                if self.verbose:
+                    print(f"✅ {entry.description} 모듈 로드 성공")
+            except (ImportError, AttributeError) as e:
+                entry.error = str(e)
+                if self.verbose:
+                    print(f"❌ {entry.description} 모듈 로드 실패: {e}")
+            entry.seconds = time.perf_counter() - started
+            entry.loaded = True
+        return entry.value
+
+    def available(self, key: str) -> bool:
+        """로드 가능 여부 (필요하면 이 시점에 import)"""
+        return self.load(key) is not None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                key: {
+                    "module": entry.module,
+                    "loaded": entry.loaded,
+                    "available": entry.value is not None if entry.loaded else None,
+                    "import_ms": round(entry.seconds * 1000, 1),
+                    "error": entry.error
+                }
+                for key, entry in self._entries.items()
+            }
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 배치 로그 파이프라인
+기관별 처리 루프(HomepageParser, GoogleContactCrawler, AI 에이전트) 안의 로그/print 비용을 처리 경로에서 분리
+
+- 로거에는 QueueHandler만 붙이고, 콘솔/파일 기록은 프로세스 공용 QueueListener 스레드가 일괄 처리
+- 큐가 가득 차면 기다리지 않고 버림 (버린 건수는 통계/메트릭에 기록)
+- 반복 메시지 제한: 로거+메시지(숫자 제외)별 구간당 burst건까지만 큐에 넣고, 다음 구간 첫 기록에 생략 건수 표시
+- JSON 출력 선택 (LOGGING_CONFIG["json"])
+- route_prints(): 처리 루프 안의 print()를 "print" 로거로 보내 로그와 같은 순서로 기록
+"""
+
+import atexit
+import json
+import logging
+import queue
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.metrics import get_metrics_registry
+from utils.settings import LOGGING_CONFIG, LOG_FORMAT
+
+METRICS = get_metrics_registry()
+LOG_RECORDS = METRICS.counter(
+    "log_records_total", "비동기 로그 파이프라인 기록 수", ("outcome",)
+)
+
+PRINT_LOGGER_NAME = "print"
+
+# 반복 메시지 판별용: 숫자를 지워 "[3/50] 처리 중" 같은 진행 메시지를 같은 메시지로 취급
+_DIGITS = re.compile(r"\d+")
+_KEY_LENGTH = 120
+
+
+def build_formatter(json_output: Optional[bool] = None) -> logging.Formatter:
+    """LOGGING_CONFIG 기준 포맷터 (JSON 또는 LOG_FORMAT)"""
+    if json_output is None:
+        json_output = LOGGING_CONFIG.get("json", False)
+    if json_output:
+        return JsonFormatter()
+    return logging.Formatter(LOG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 1건 = JSON 한 줄"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName
+        }
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            payload["suppressed"] = suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """로거+메시지별 구간당 burst건 제한 (max_level 초과 레벨은 항상 통과)"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        config = config or LOGGING_CONFIG.get("rate_limit", {})
+        self.window_seconds = config.get("window_seconds", 10.0)
+        self.burst = config.get("burst", 20)
+        self.max_level = logging.getLevelName(config.get("max_level", "INFO"))
+        self.max_keys = config.get("max_keys", 2048)
+        self._lock = threading.Lock()
+        # key → [구간 시작 시각, 구간 내 기록 수, 생략 수]
+        self._windows: Dict[Tuple[str, str], List[float]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+
+        key = (record.name, _DIGITS.sub("#", str(record.msg))[:_KEY_LENGTH])
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.window_seconds:
+                suppressed = int(window[2]) if window else 0
+                if window is None and len(self._windows) >= self.max_keys:
+                    self._windows.clear()
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                LOG_RECORDS.labels("suppressed").inc()
+                return False
+
+        if suppressed:
+            record.suppressed = suppressed
+            record.msg = f"{record.msg} (직전 {self.window_seconds:.0f}초간 같은 메시지 {suppressed}건 생략)"
+        return True
+
+
+class _PipelineQueueHandler(QueueHandler):
+    """대기 없이 큐에 넣는 핸들러 (레코드에 목적지 sink 이름을 붙임)"""
+
+    def __init__(self, pipeline: "LogPipeline", sink: str):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+        self.sink = sink
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 prepare는 호출 스레드에서 전체 포맷까지 수행 → 메시지 병합/예외 문자열만 하고 포맷은 리스너 스레드에서
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.log_sink = self.sink
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+            LOG_RECORDS.labels("queued").inc()
+        except queue.Full:
+            self.pipeline.count_dropped()
+
+
+class _SinkDispatcher(logging.Handler):
+    """리스너 스레드에서 레코드를 sink별 실제 핸들러로 전달"""
+
+    def __init__(self, pipeline: "LogPipeline"):
+        super().__init__()
+        self.pipeline = pipeline
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.pipeline.sink_handlers(getattr(record, "log_sink", record.name)):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord):
+        self.handle(record)
+
+
+class _PrintWriter:
+    """sys.stdout 대체 - 줄 단위로 "print" 로거에 기록 (스레드별 미완성 줄 버퍼)"""
+
+    def __init__(self, logger: logging.Logger, original):
+        self.logger = logger
+        self.original = original
+        self._local = threading.local()
+
+    @property
+    def encoding(self):
+        return getattr(self.original, "encoding", "utf-8")
+
+    def write(self, text: str) -> int:
+        pending = getattr(self._local, "pending", "") + text
+        *lines, pending = pending.split("\n")
+        self._local.pending = pending
+        for line in lines:
+            self.logger.info(line)
+        return len(text)
+
+    def flush(self):
+        pending = getattr(self._local, "pending", "")
+        if pending:
+            self._local.pending = ""
+            self.logger.info(pending)
+
+    def isatty(self) -> bool:
+        return False
+
+    def fileno(self) -> int:
+        return self.original.fileno()
+
+
+class LogPipeline:
+    """프로세스 공용 큐 + 백그라운드 기록 스레드"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or LOGGING_CONFIG
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(self.config.get("queue_size", 10000))
+        self.rate_limit_enabled = self.config.get("rate_limit", {}).get("enabled", True)
+        self._lock = threading.Lock()
+        self._sinks: Dict[str, List[logging.Handler]] = {}
+        self._listener: Optional[QueueListener] = None
+        self._stats = {"dropped": 0}
+        self._print_depth = 0
+
+    # ===== 로거 연결 =====
+
+    def attach(self, logger: logging.Logger, handlers: List[logging.Handler], rate_limit: bool = True):
+        """로거의 기존 핸들러를 QueueHandler 하나로 교체하고 실제 핸들러는 리스너 쪽 sink로 등록
+
+        rate_limit=False면 반복 메시지 제한 없이 모두 기록 (print 경로 등)
+        """
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+
+        with self._lock:
+            previous = self._sinks.get(logger.name, [])
+            self._sinks[logger.name] = list(handlers)
+        for handler in previous:
+            if handler not in handlers:
+                handler.close()
+
+        queue_handler = _PipelineQueueHandler(self, logger.name)
+        if rate_limit and self.rate_limit_enabled:
+            queue_handler.addFilter(RateLimitFilter(self.config.get("rate_limit")))
+        logger.addHandler(queue_handler)
+        self.start()
+
+    def sink_handlers(self, sink: str) -> List[logging.Handler]:
+        with self._lock:
+            return self._sinks.get(sink, [])
+
+    # ===== 리스너 =====
+
+    def start(self):
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = QueueListener(self.queue, _SinkDispatcher(self), respect_handler_level=False)
+            self._listener.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """남은 레코드를 모두 기록한 뒤 리스너 종료"""
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handlers in list(self._sinks.values()):
+                for handler in handlers:
+                    handler.flush()
+
+    def flush(self, timeout: float = 5.0):
+        """큐가 빌 때까지 대기 (테스트/종료 전 출력 확인용)"""
+        deadline = time.monotonic() + timeout
+        while not self.queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def count_dropped(self):
+        with self._lock:
+            self._stats["dropped"] += 1
+        LOG_RECORDS.labels("dropped").inc()
+
+    # ===== print 경로 =====
+
+    @contextmanager
+    def route_prints(self):
+        """with 블록 동안 sys.stdout 출력을 "print" 로거로 보냄 (중첩/다중 스레드 진입 가능)"""
+        with self._lock:
+            self._print_depth += 1
+            first = self._print_depth == 1
+        if first:
+            original = sys.stdout
+            logger = logging.getLogger(PRINT_LOGGER_NAME)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            console = logging.StreamHandler(original)
+            console.setFormatter(build_formatter() if self.config.get("json") else logging.Formatter("%(message)s"))
+            # 핸들러 연결 후 교체 (교체 직후 print가 핸들러 없는 로거로 가지 않도록)
+            # print 출력은 사용자가 보는 진행 표시이므로 반복 제한 없이 그대로 기록
+            self.attach(logger, [console], rate_limit=False)
+            sys.stdout = _PrintWriter(logger, original)
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._print_depth -= 1
+                restore = self._print_depth == 0
+            if restore:
+                current = sys.stdout
+                if isinstance(current, _PrintWriter):
+                    current.flush()
+                    sys.stdout = current.original
+                self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["sinks"] = len(self._sinks)
+            stats["running"] = self._listener is not None
+        stats["queued"] = self.queue.qsize()
+        stats["suppressed"] = int(LOG_RECORDS.labels("suppressed").value)
+        return stats
+
+
+_pipeline_instance = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline() -> LogPipeline:
+    """프로세스 공용 로그 파이프라인 반환 (싱글톤)"""
+    global _pipeline_instance
+    if _pipeline_instance is None:
+        with _pipeline_lock:
+            if _pipeline_instance is None:
+                _pipeline_instance = LogPipeline()
+    return _pipeline_instance
+
+
+def attach_handlers(logger: logging.Logger, handlers: List[logging.Handler]):
+    """비동기 모드면 파이프라인을 거쳐, 아니면 로거에 직접 핸들러 연결"""
+    if LOGGING_CONFIG.get("async", False):
+        get_log_pipeline().attach(logger, handlers)
+        return
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    for handler in handlers:
+        logger.addHandler(handler)
+
+
+@contextmanager
+def route_prints():
+    """크롤러 처리 루프용 print 경로 (비동기 모드 + route_prints 설정일 때만 동작)"""
+    if not (LOGGING_CONFIG.get("async", False) and LOGGING_CONFIG.get("route_prints", False)):
+        yield
+        return
+    with get_log_pipeline().route_prints():
+        yield
@@ -9,7 +9,8 @@ import logging
 import os
 from datetime import datetime
 from typing import Optional
-from utils.settings import LOGGER_NAMES, LOG_FORMAT, ENABLE_FILE_LOGGING, LOG_LEVEL
+from utils.settings import LOGGER_NAMES, ENABLE_FILE_LOGGING, LOG_LEVEL
+from utils.log_pipeline import attach_handlers, build_formatter
 
 class LoggerUtils:
     """로거 설정 관련 유틸리티 클래스 - 중복 제거"""
@@ -19,6 +20,7 @@ class LoggerUtils:
                 console: bool = True, file_logging: bool = None) -> logging.Logger:
         """
         통합 로거 설정 - 파일 로깅 기본 비활성화
+        LOGGING_CONFIG["async"]면 핸들러는 백그라운드 기록 스레드에서 동작 (utils/log_pipeline.py)
         """
         # 환경 변수에서 기본값 설정
         if level is None:
@@ -31,19 +33,16 @@ class LoggerUtils:
         logger = logging.getLogger(logger_name)
         logger.setLevel(level)
         
-        # 기존 핸들러 제거 (중복 방지)
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-        
-        # 포맷터 설정
-        formatter = logging.Formatter(LOG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+        # 포맷터 설정 (LOG_FORMAT 또는 JSON)
+        formatter = build_formatter()
+        handlers = []
         
         # 콘솔 핸들러 추가
         if console:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(level)
             console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # 파일 핸들러 추가 (명시적으로 요청한 경우에만)
         if file_logging and log_file:
@@ -54,8 +53,12 @@ class LoggerUtils:
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-            
+            handlers.append(file_handler)
+        
+        # 기존 핸들러 교체 (중복 방지)
+        attach_handlers(logger, handlers)
+        
+        if file_logging and log_file:
             logger.info(f"로그 파일 설정: {log_file}")
         
         logger.info(f"로거 '{logger_name}' 설정 완료 (파일 로깅: {'ON' if file_logging else 'OFF'})")
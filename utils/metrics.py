@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저비용 메트릭 코어
+크롤러/에이전트/API의 모든 요청, AI 호출, DB 쓰기를 감쌀 수 있도록 기록 비용을 최소화
+
+- Counter/Histogram: 스레드별 샤드에 잠금 없이 기록, 조회 시에만 합산
+  (종료된 스레드의 샤드는 조회/새 샤드 등록 시 기본값에 합쳐 제거 → 스레드가 바뀌어도 샤드 수가 늘지 않음)
+- Gauge: 단일 값 (set/inc/dec 모두 잠금 안에서 갱신)
+- Histogram: HDR 방식 로그 구간(유효 비트 고정)으로 메모리 상한이 고정된 p50/p95/p99
+- 최근 구간: slot_seconds 단위 슬롯 순환 버퍼 (기록 O(1), 조회는 슬롯 수에 비례하는 상수 시간)
+- 이름/라벨 체계는 Prometheus와 동일 (라벨별 자식 시계열)
+"""
+
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.settings import METRICS_CONFIG
+
+SIGNIFICANT_BITS = METRICS_CONFIG.get("significant_bits", 6)
+VALUE_SCALE = METRICS_CONFIG.get("value_scale", 1_000_000)
+
+_SUB_BUCKETS = 1 << SIGNIFICANT_BITS
+_HALF_BUCKETS = _SUB_BUCKETS >> 1
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def bucket_index(value: int) -> int:
+    """정수 값 → 로그 구간 번호 (SUB_BUCKETS 미만은 그대로, 이상은 2배마다 HALF_BUCKETS개 구간)"""
+    if value < _SUB_BUCKETS:
+        return value if value > 0 else 0
+    shift = value.bit_length() - SIGNIFICANT_BITS
+    return shift * _HALF_BUCKETS + (value >> shift)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """구간 번호 → [하한, 상한) 정수 값"""
+    if index < _SUB_BUCKETS:
+        return index, index + 1
+    shift = index // _HALF_BUCKETS - 1
+    mantissa = index - shift * _HALF_BUCKETS
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+def merge_counts(target: Dict[int, int], source: Dict[int, int]):
+    for index, count in source.items():
+        target[index] = target.get(index, 0) + count
+
+
+def quantiles_from_counts(counts: Dict[int, int], quantiles: Iterable[float],
+                          scale: float = VALUE_SCALE) -> Dict[float, float]:
+    """구간별 개수에서 분위수 계산 (구간 중앙값, 원래 단위)"""
+    quantiles = sorted(quantiles)
+    total = sum(counts.values())
+    if total == 0:
+        return {q: 0.0 for q in quantiles}
+
+    results = {}
+    items = sorted(counts.items())
+    position = 0
+    seen = 0
+    for q in quantiles:
+        rank = max(1, int(q * total + 0.5))
+        while seen + items[position][1] < rank:
+            seen += items[position][1]
+            position += 1
+        low, high = bucket_bounds(items[position][0])
+        results[q] = (low + high) / 2 / scale
+    return results
+
+
+class _Timer:
+    """히스토그램 기록용 컨텍스트 매니저 (sync/async 코드 모두 사용)"""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: "Histogram"):
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.observe(time.perf_counter() - self._start)
+        return False
+
+
+class _ShardOwner:
+    """스레드 로컬에 보관하는 샤드 소유자 (스레드 종료 시 해제되어 finalize 콜백 실행)"""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: Any):
+        self.shard = shard
+
+
+class _ThreadShards:
+    """
+    스레드별 샤드 목록
+    스레드가 끝나면 샤드를 종료 대기열로 옮기고, 잠금 안에서 fold(샤드)로 기본값에 합친 뒤 목록에서 제거
+    (finalize 콜백은 잠금을 잡지 않음 - GC가 어느 스레드에서 돌아도 교착 없음)
+    """
+
+    def __init__(self, factory: Callable[[], Any], fold: Callable[[Any], None]):
+        self._factory = factory
+        self._fold = fold
+        self._local = threading.local()
+        self._shards: List[Any] = []
+        self._dead: List[Any] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """현재 스레드의 샤드 (없으면 생성)"""
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            shard = self._factory()
+            owner = _ShardOwner(shard)
+            weakref.finalize(owner, self._dead.append, shard).atexit = False
+            with self._lock:
+                self._collect()
+                self._shards.append(shard)
+            self._local.owner = owner
+        return owner.shard
+
+    def _collect(self):
+        while self._dead:
+            shard = self._dead.pop()
+            self._shards.remove(shard)
+            self._fold(shard)
+
+    @contextmanager
+    def locked(self):
+        """종료된 스레드 샤드를 합친 뒤 살아있는 샤드 목록 (블록 동안 fold 없음)"""
+        with self._lock:
+            self._collect()
+            yield self._shards
+
+
+class Counter:
+    """단조 증가 카운터 (스레드별 셀에 잠금 없이 누적, 종료된 스레드 셀은 기본값에 합산)"""
+
+    def __init__(self):
+        self._base = 0.0
+        self._cells = _ThreadShards(lambda: [0.0], self._fold)
+
+    def _fold(self, cell: List[float]):
+        self._base += cell[0]
+
+    def inc(self, amount: float = 1.0):
+        self._cells.get()[0] += amount
+
+    @property
+    def value(self) -> float:
+        with self._cells.locked() as cells:
+            return self._base + sum(cell[0] for cell in cells)
+
+
+class Gauge:
+    """현재 값 게이지 (단일 값을 잠금 안에서 갱신, set_function은 조회 시 계산)"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        """조회 시점에 값을 계산 (큐 길이, 풀 사용량 등)"""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:
+                return float("nan")
+        return self._value
+
+
+class _HistogramShard:
+    """스레드별 히스토그램 상태 (해당 스레드만 기록)"""
+
+    __slots__ = ("counts", "count", "sum", "min", "max",
+                 "slot_ids", "slot_counts", "slot_totals", "slot_sums")
+
+    def __init__(self, window_slots: int):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.slot_ids = [-1] * window_slots
+        self.slot_counts: List[Dict[int, int]] = [{} for _ in range(window_slots)]
+        self.slot_totals = [0] * window_slots
+        self.slot_sums = [0.0] * window_slots
+
+    def merge(self, other: "_HistogramShard"):
+        """다른 샤드(종료된 스레드)의 기록을 합침 - 같은 위치 슬롯은 더 최근 구간만 유지"""
+        merge_counts(self.counts, other.counts)
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for position, slot_id in enumerate(other.slot_ids):
+            if slot_id < 0 or slot_id < self.slot_ids[position]:
+                continue
+            if slot_id > self.slot_ids[position]:
+                self.slot_ids[position] = slot_id
+                self.slot_counts[position] = {}
+                self.slot_totals[position] = 0
+                self.slot_sums[position] = 0.0
+            merge_counts(self.slot_counts[position], other.slot_counts[position])
+            self.slot_totals[position] += other.slot_totals[position]
+            self.slot_sums[position] += other.slot_sums[position]
+
+
+class Histogram:
+    """
+    로그 구간 히스토그램
+    값은 초 단위로 기록하고 내부적으로 value_scale(기본 마이크로초) 정수로 구간화
+    """
+
+    def __init__(self, slot_seconds: float = None, window_slots: int = None, scale: float = VALUE_SCALE):
+        self.slot_seconds = slot_seconds or METRICS_CONFIG.get("slot_seconds", 10)
+        self.window_slots = window_slots or METRICS_CONFIG.get("window_slots", 30)
+        self.scale = scale
+        # 종료된 스레드 샤드를 합쳐두는 기본 샤드
+        self._base = _HistogramShard(self.window_slots)
+        self._shards = _ThreadShards(lambda: _HistogramShard(self.window_slots), self._base.merge)
+
+    @contextmanager
+    def _all_shards(self):
+        """기본 샤드 + 살아있는 스레드 샤드 (조회 중에는 fold 없음)"""
+        with self._shards.locked() as shards:
+            yield [self._base] + shards
+
+    def observe(self, value: float):
+        """값 기록 (O(1), 잠금 없음)"""
+        shard = self._shards.get()
+        index = bucket_index(int(value * self.scale))
+
+        counts = shard.counts
+        counts[index] = counts.get(index, 0) + 1
+        shard.count += 1
+        shard.sum += value
+        if value > shard.max:
+            shard.max = value
+        if value < shard.min:
+            shard.min = value
+
+        slot_id = int(time.time() // self.slot_seconds)
+        position = slot_id % self.window_slots
+        if shard.slot_ids[position] != slot_id:
+            shard.slot_ids[position] = slot_id
+            shard.slot_counts[position] = {}
+            shard.slot_totals[position] = 0
+            shard.slot_sums[position] = 0.0
+        slot_counts = shard.slot_counts[position]
+        slot_counts[index] = slot_counts.get(index, 0) + 1
+        shard.slot_totals[position] += 1
+        shard.slot_sums[position] += value
+
+    def time(self) -> _Timer:
+        """with 블록 실행 시간 기록"""
+        return _Timer(self)
+
+    # ===== 조회 =====
+
+    def _merged(self, window_seconds: Optional[float]) -> Tuple[Dict[int, int], int, float]:
+        counts: Dict[int, int] = {}
+        total = 0
+        value_sum = 0.0
+
+        if window_seconds is None:
+            with self._all_shards() as shards:
+                for shard in shards:
+                    merge_counts(counts, dict(shard.counts))
+                    total += shard.count
+                    value_sum += shard.sum
+            return counts, total, value_sum
+
+        current = int(time.time() // self.slot_seconds)
+        oldest = current - min(self.window_slots, max(1, int(window_seconds // self.slot_seconds))) + 1
+        with self._all_shards() as shards:
+            for shard in shards:
+                for position, slot_id in enumerate(list(shard.slot_ids)):
+                    if oldest <= slot_id <= current:
+                        merge_counts(counts, dict(shard.slot_counts[position]))
+                        total += shard.slot_totals[position]
+                        value_sum += shard.slot_sums[position]
+        return counts, total, value_sum
+
+    def bucket_counts(self, window_seconds: Optional[float] = None) -> Dict[int, int]:
+        """구간별 개수 (여러 시계열 합산용)"""
+        return self._merged(window_seconds)[0]
+
+    def summary(self, window_seconds: Optional[float] = None,
+                quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """
+        count/sum/mean/p50/p95/p99 (+ 전체 구간이면 min/max)
+        window_seconds를 주면 최근 구간(최대 slot_seconds x window_slots)만 집계
+        """
+        counts, total, value_sum = self._merged(window_seconds)
+        return summarize(counts, total, value_sum, quantiles, self.scale,
+                         extremes=None if window_seconds is not None else self.extremes())
+
+    def extremes(self) -> Tuple[float, float]:
+        with self._all_shards() as shards:
+            shards = [shard for shard in shards if shard.count]
+        if not shards:
+            return 0.0, 0.0
+        return min(shard.min for shard in shards), max(shard.max for shard in shards)
+
+    def slot_series(self) -> List[Dict[str, Any]]:
+        """슬롯별 (시작 시각, 개수, 합계) 목록 (오래된 순)"""
+        current = int(time.time() // self.slot_seconds)
+        slots: Dict[int, List[float]] = {}
+        with self._all_shards() as shards:
+            for shard in shards:
+                for position, slot_id in enumerate(list(shard.slot_ids)):
+                    if current - self.window_slots < slot_id <= current:
+                        entry = slots.setdefault(slot_id, [0, 0.0])
+                        entry[0] += shard.slot_totals[position]
+                        entry[1] += shard.slot_sums[position]
+        return [
+            {"start": slot_id * self.slot_seconds, "count": int(entry[0]), "sum": entry[1]}
+            for slot_id, entry in sorted(slots.items())
+        ]
+
+    @property
+    def count(self) -> int:
+        with self._all_shards() as shards:
+            return sum(shard.count for shard in shards)
+
+    @property
+    def sum(self) -> float:
+        with self._all_shards() as shards:
+            return sum(shard.sum for shard in shards)
+
+
+def summarize(counts: Dict[int, int], total: int, value_sum: float,
+              quantiles: Iterable[float] = DEFAULT_QUANTILES, scale: float = VALUE_SCALE,
+              extremes: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+    """구간별 개수 → 요약 통계 딕셔너리"""
+    result = {
+        "count": total,
+        "sum": round(value_sum, 6),
+        "mean": round(value_sum / total, 6) if total else 0.0
+    }
+    for q, value in quantiles_from_counts(counts, quantiles, scale).items():
+        result[f"p{q * 100:g}"] = round(value, 6)
+    if extremes is not None:
+        result["min"], result["max"] = (round(extremes[0], 6), round(extremes[1], 6))
+    return result
+
+
+class MetricFamily:
+    """이름 + 라벨 이름이 같은 시계열 묶음"""
+
+    def __init__(self, kind: str, name: str, documentation: str,
+                 labelnames: Iterable[str] = (), factory: Callable[[], Any] = None):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values, **labels):
+        """라벨 값에 해당하는 시계열 (없으면 생성)"""
+        key = tuple(str(v) for v in values) if values else tuple(str(labels.get(n, "")) for n in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"라벨 개수 불일치: {self.name} {self.labelnames} <- {key}")
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._factory()
+                    self._children[key] = child
+        return child
+
+    def children(self) -> List[Tuple[Dict[str, str], Any]]:
+        return [(dict(zip(self.labelnames, key)), child) for key, child in list(self._children.items())]
+
+    def clear(self):
+        """모든 시계열 제거 (이후 기록은 새 시계열로 시작)"""
+        with self._lock:
+            self._children = {}
+
+    # 라벨 없는 메트릭은 패밀리에서 바로 기록
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        return self.labels().time()
+
+
+class MappingFamily(MetricFamily):
+    """
+    기존 통계 딕셔너리를 조회 시점에 게이지로 노출 (source() 반환값의 숫자 항목만)
+    기록 경로를 바꾸지 않고 크롤러/모니터의 ad-hoc 통계를 그대로 내보내기 위한 어댑터
+    """
+
+    def __init__(self, name: str, documentation: str, source: Callable[[], Dict[str, Any]],
+                 labelname: str = "field"):
+        super().__init__("gauge", name, documentation, (labelname,), Gauge)
+        self.source = source
+
+    def children(self) -> List[Tuple[Dict[str, str], Any]]:
+        try:
+            values = self.source() or {}
+        except Exception:
+            return []
+        result = []
+        for key, value in values.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            gauge = Gauge()
+            gauge.set(value)
+            result.append(({self.labelnames[0]: str(key)}, gauge))
+        return result
+
+
+class MetricsRegistry:
+    """프로세스 메트릭 레지스트리 (같은 이름으로 다시 등록하면 기존 패밀리 반환)"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, kind: str, name: str, documentation: str, labelnames, factory) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = MetricFamily(kind, name, documentation, labelnames, factory)
+                    self._families[name] = family
+        if family.kind != kind:
+            raise ValueError(f"메트릭 종류 충돌: {name} ({family.kind} != {kind})")
+        return family
+
+    def counter(self, name: str, documentation: str = "", labelnames: Iterable[str] = ()) -> MetricFamily:
+        return self._register("counter", name, documentation, labelnames, Counter)
+
+    def gauge(self, name: str, documentation: str = "", labelnames: Iterable[str] = ()) -> MetricFamily:
+        return self._register("gauge", name, documentation, labelnames, Gauge)
+
+    def histogram(self, name: str, documentation: str = "", labelnames: Iterable[str] = (),
+                  slot_seconds: float = None, window_slots: int = None,
+                  scale: float = VALUE_SCALE) -> MetricFamily:
+        return self._register("histogram", name, documentation, labelnames,
+                              lambda: Histogram(slot_seconds, window_slots, scale))
+
+    def mapping(self, name: str, documentation: str, source: Callable[[], Dict[str, Any]],
+                labelname: str = "field") -> MetricFamily:
+        """
+        통계 딕셔너리 게이지 등록 (같은 이름이면 source 교체)
+        인스턴스가 새로 만들어지는 크롤러/모니터는 마지막 인스턴스의 통계만 노출
+        """
+        with self._lock:
+            family = self._families.get(name)
+            if family is not None and not isinstance(family, MappingFamily):
+                raise ValueError(f"메트릭 종류 충돌: {name} ({family.kind} != mapping)")
+            family = MappingFamily(name, documentation, source, labelname)
+            self._families[name] = family
+        return family
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def families(self) -> List[MetricFamily]:
+        return list(self._families.values())
+
+    def snapshot(self, window_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """전체 메트릭 JSON 스냅샷 (대시보드/로그용)"""
+        result = {}
+        for family in self.families():
+            series = []
+            for labels, child in family.children():
+                if family.kind == "histogram":
+                    value = child.summary(window_seconds)
+                else:
+                    value = child.value
+                series.append({"labels": labels, "value": value})
+            result[family.name] = {"type": family.kind, "help": family.documentation, "series": series}
+        return result
+
+
+_registry_instance = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """프로세스 공용 메트릭 레지스트리 반환 (싱글톤)"""
+    global _registry_instance
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = MetricsRegistry()
+    return _registry_instance
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메트릭 Prometheus 내보내기
+- render_prometheus: 레지스트리 → 텍스트 포맷 0.0.4 (crm_app /metrics 와 단독 익스포터 공용)
+- start_metrics_server: FastAPI가 없는 워커 프로세스용 단독 HTTP 익스포터 (데몬 스레드)
+
+로그 구간 히스토그램은 METRICS_CONFIG["export_buckets"] 경계의 누적 le 구간으로 변환
+(구간 중앙값 기준 배정, 상대 오차는 유효 비트 정밀도와 동일)
+"""
+
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.metrics import MetricsRegistry, bucket_bounds, get_metrics_registry
+from utils.settings import METRICS_CONFIG
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+EXPORT_BUCKETS = tuple(sorted(METRICS_CONFIG.get(
+    "export_buckets", [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120]
+)))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str], extra: Tuple[str, str] = None) -> str:
+    items = list(labels.items())
+    if extra:
+        items.append(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in items) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def cumulative_buckets(counts: Dict[int, int], scale: float,
+                       boundaries: Iterable[float] = EXPORT_BUCKETS) -> List[Tuple[float, int]]:
+    """로그 구간별 개수 → [(le 경계, 누적 개수), ..., (+Inf, 전체)]"""
+    boundaries = list(boundaries)
+    per_boundary = [0] * (len(boundaries) + 1)
+    for index, count in counts.items():
+        low, high = bucket_bounds(index)
+        value = (low + high) / 2 / scale
+        position = len(boundaries)
+        for i, boundary in enumerate(boundaries):
+            if value <= boundary:
+                position = i
+                break
+        per_boundary[position] += count
+
+    result = []
+    running = 0
+    for boundary, count in zip(boundaries + [float("inf")], per_boundary):
+        running += count
+        result.append((boundary, running))
+    return result
+
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    """레지스트리 전체를 Prometheus 텍스트 포맷으로 변환"""
+    registry = registry or get_metrics_registry()
+    lines: List[str] = []
+
+    for family in sorted(registry.families(), key=lambda f: f.name):
+        children = family.children()
+        if family.documentation:
+            lines.append(f"# HELP {family.name} {_escape_help(family.documentation)}")
+        lines.append(f"# TYPE {family.name} {family.kind}")
+
+        for labels, child in children:
+            if family.kind == "histogram":
+                for boundary, count in cumulative_buckets(child.bucket_counts(), child.scale):
+                    le = "+Inf" if math.isinf(boundary) else _format_value(boundary)
+                    lines.append(f"{family.name}_bucket{_format_labels(labels, ('le', le))} {count}")
+                lines.append(f"{family.name}_sum{_format_labels(labels)} {_format_value(child.sum)}")
+                lines.append(f"{family.name}_count{_format_labels(labels)} {child.count}")
+            else:
+                lines.append(f"{family.name}{_format_labels(labels)} {_format_value(child.value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = None
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        try:
+            body = render_prometheus(self.registry).encode("utf-8")
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프마다 stderr 로그를 남기지 않음
+        pass
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0",
+                         registry: Optional[MetricsRegistry] = None) -> ThreadingHTTPServer:
+    """
+    단독 /metrics HTTP 서버를 데몬 스레드로 시작
+    프로세스 종료 시 함께 종료되며, 반환된 서버의 shutdown()으로 명시적으로 중지 가능
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry or get_metrics_registry()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name=f"metrics-exporter-{port}", daemon=True)
+    thread.start()
+    return server
+
+
+_worker_server = None
+_worker_lock = threading.Lock()
+
+
+def start_worker_exporter(worker_id: int = 0) -> Optional[ThreadingHTTPServer]:
+    """
+    워커 프로세스용 익스포터 시작 (METRICS_EXPORTER_PORT + worker_id, 프로세스당 1회)
+    포트가 설정되지 않았거나 사용 중이면 None
+    """
+    global _worker_server
+    base_port = METRICS_CONFIG.get("exporter_port", 0)
+    if not base_port:
+        return None
+
+    with _worker_lock:
+        if _worker_server is not None:
+            return _worker_server
+        try:
+            _worker_server = start_metrics_server(base_port + worker_id)
+            print(f"📈 워커 {worker_id}: 메트릭 익스포터 시작 (포트: {base_port + worker_id})")
+        except OSError as e:
+            print(f"⚠️ 워커 {worker_id}: 메트릭 익스포터 시작 실패: {e}")
+        return _worker_server
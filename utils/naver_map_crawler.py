@@ -3,8 +3,10 @@
 """
 네이버 지도 크롤러
 교회명을 키워드로 네이버 지도에서 연락처 정보를 크롤링합니다.
+기본은 장소 검색 API 직접 호출(utils/naver_place_client.py), 브라우저 자동화는 use_browser=True일 때만 사용
 """
 
+import asyncio
 import json
 import time
 import random
@@ -12,26 +14,43 @@ import re
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from bs4 import BeautifulSoup
 
+from utils.naver_place_client import NaverPlace, NaverPlaceClient
+from utils.settings import NAVER_PLACE_CONFIG
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
 class NaverMapCrawler:
-    def __init__(self):
-        """초기화"""
+    def __init__(self, use_browser: bool = False, mode: Optional[str] = None, fixture_dir: Optional[str] = None):
+        """
+        초기화
+        use_browser: True면 기존 Selenium 검색 사용 (장소 검색 API가 막혔을 때의 대체 경로)
+        mode/fixture_dir: 장소 검색 클라이언트 모드 (live/record/replay, NaverPlaceClient 참고)
+        """
         self.setup_logger()
         self.driver = None
         self.wait = None
-        self.setup_driver()
+        self.use_browser = use_browser
+        self.place_mode = mode
+        self.fixture_dir = fixture_dir
+        self.timeout = 15
+        if self.use_browser:
+            self.setup_driver()
         
         # 크롤링 설정 (블로그 포스트 주의사항 반영)
+        # 브라우저 경로만 사용, API 경로는 PolitenessScheduler의 naver.com 간격을 따름
         self.delay_range = (2, 5)  # 요청 간격 (초)
-        self.timeout = 15
         self.max_retries = 3
         
         # 통계
@@ -46,7 +65,7 @@ class NaverMapCrawler:
         # 네이버 지도 URL
         self.base_url = "https://map.naver.com/p/search"
         
-        print("🗺️ 네이버 지도 크롤러 초기화 완료")
+        print(f"🗺️ 네이버 지도 크롤러 초기화 완료 ({'브라우저' if self.use_browser else '장소 검색 API'})")
         print("⚠️ 크롤링 주의사항:")
         print("   - 적절한 딜레이로 서버 부하 최소화")
         print("   - 개인 연구/학습 목적으로만 사용")
@@ -73,6 +92,8 @@ class NaverMapCrawler:
     
     def setup_driver(self):
         """Selenium WebDriver 설정"""
+        if not SELENIUM_AVAILABLE:
+            raise ImportError("selenium이 설치되지 않아 브라우저 모드를 사용할 수 없습니다")
         try:
             print("🔧 Chrome WebDriver 설정 중...")
             
@@ -344,100 +365,189 @@ class NaverMapCrawler:
         
         return False
     
-    def process_single_church(self, church_data: Dict) -> Dict:
-        """단일 교회 처리"""
-        church_name = church_data.get('name', 'Unknown')
-        
-        print(f"\n🏢 처리 중: {church_name}")
-        self.logger.info(f"교회 처리 시작: {church_name}")
-        
-        result = church_data.copy()
-        self.stats['total_processed'] += 1
-        
-        # 네이버 지도 크롤링 결과 초기화
-        crawling_result = {
+    def place_to_contacts(self, place: NaverPlace) -> Dict[str, str]:
+        """장소 검색 결과 → 연락처 필드 (구조화 데이터에 팩스/우편번호는 없음)"""
+        contact_info = {
+            'phone': place.phone,
+            'fax': '',
+            'address': place.road_address or place.address,
+            'postal_code': '',
+            'homepage': place.homepage
+        }
+        if place.phone:
+            print(f"    📞 전화번호 발견: {place.phone}")
+        if contact_info['address']:
+            print(f"    🏠 주소 발견: {contact_info['address']}")
+        if place.homepage:
+            print(f"    🌐 홈페이지 발견: {place.homepage}")
+        if any(contact_info.values()):
+            self.stats['contacts_found'] += 1
+        return contact_info
+
+    def _new_crawling_result(self, church_name: str) -> Dict[str, Any]:
+        return {
             'search_keyword': church_name,
             'search_success': False,
+            'source': 'browser' if self.use_browser else 'place_api',
+            'place_id': '',
             'extracted_contacts': {},
             'updated_fields': [],
             'crawling_timestamp': datetime.now().isoformat(),
             'error_message': ''
         }
-        
+
+    def _apply_contacts(self, result: Dict, crawling_result: Dict, extracted_contacts: Dict[str, str]):
+        """기존 빈 값을 추출된 값으로 업데이트"""
+        crawling_result['extracted_contacts'] = extracted_contacts
+        updated_fields = []
+
+        for field in ['phone', 'fax', 'address', 'postal_code', 'homepage']:
+            extracted_value = extracted_contacts.get(field, '')
+            current_value = result.get(field, '')
+
+            # 현재 값이 비어있고 추출된 값이 있으면 업데이트
+            if not current_value and extracted_value:
+                result[field] = extracted_value
+                updated_fields.append(field)
+
+        crawling_result['updated_fields'] = updated_fields
+
+        if updated_fields:
+            print(f"  ✨ 업데이트된 필드: {', '.join(updated_fields)}")
+        else:
+            print(f"  📋 기존 값 유지 (새로운 정보 없음)")
+
+    def _process_with_browser(self, church_data: Dict) -> Dict:
+        """브라우저 검색으로 단일 교회 처리 (기존 방식)"""
+        church_name = church_data.get('name', 'Unknown')
+        result = church_data.copy()
+        crawling_result = self._new_crawling_result(church_name)
+
         try:
             # 네이버 지도에서 검색
             search_success = self.search_on_naver_map(church_name)
             crawling_result['search_success'] = search_success
-            
+
             if search_success:
                 self.stats['successful_searches'] += 1
-                
-                # 연락처 정보 추출
-                extracted_contacts = self.extract_contact_info(church_name)
-                crawling_result['extracted_contacts'] = extracted_contacts
-                
-                # 기존 빈 값을 추출된 값으로 업데이트
-                contact_fields = ['phone', 'fax', 'address', 'postal_code']
-                updated_fields = []
-                
-                for field in contact_fields:
-                    extracted_value = extracted_contacts.get(field, '')
-                    current_value = result.get(field, '')
-                    
-                    # 현재 값이 비어있고 추출된 값이 있으면 업데이트
-                    if not current_value and extracted_value:
-                        result[field] = extracted_value
-                        updated_fields.append(field)
-                
-                crawling_result['updated_fields'] = updated_fields
-                
-                if updated_fields:
-                    print(f"  ✨ 업데이트된 필드: {', '.join(updated_fields)}")
-                else:
-                    print(f"  📋 기존 값 유지 (새로운 정보 없음)")
-                
+                self._apply_contacts(result, crawling_result, self.extract_contact_info(church_name))
             else:
                 self.stats['failed_searches'] += 1
                 print(f"  ⚠️ 검색 실패: {church_name}")
-                
+
         except Exception as e:
             error_msg = str(e)
             crawling_result['error_message'] = error_msg
             self.stats['failed_searches'] += 1
             print(f"  ❌ 처리 오류: {error_msg}")
             self.logger.error(f"교회 처리 오류 ({church_name}): {e}")
-        
+
         # 크롤링 결과를 메타데이터로 추가
         result['naver_map_crawling'] = crawling_result
-        
         return result
-    
+
+    async def _process_with_client(self, client: NaverPlaceClient, church_data: Dict) -> Dict:
+        """장소 검색 API로 단일 교회 처리"""
+        church_name = church_data.get('name', 'Unknown')
+        result = church_data.copy()
+        crawling_result = self._new_crawling_result(church_name)
+
+        try:
+            place = await client.lookup(church_name, church_data.get('address', ''))
+            crawling_result['search_success'] = place is not None
+
+            if place:
+                self.stats['successful_searches'] += 1
+                crawling_result['place_id'] = place.id
+                self._apply_contacts(result, crawling_result, self.place_to_contacts(place))
+            else:
+                self.stats['failed_searches'] += 1
+                self.stats['no_results'] += 1
+                print(f"  ⚠️ 검색 결과 없음: {church_name}")
+
+        except Exception as e:
+            error_msg = str(e)
+            crawling_result['error_message'] = error_msg
+            self.stats['failed_searches'] += 1
+            print(f"  ❌ 처리 오류: {error_msg}")
+            self.logger.error(f"교회 처리 오류 ({church_name}): {e}")
+
+        result['naver_map_crawling'] = crawling_result
+        return result
+
+    def _new_client(self) -> NaverPlaceClient:
+        return NaverPlaceClient(mode=self.place_mode, fixture_dir=self.fixture_dir)
+
+    def process_single_church(self, church_data: Dict) -> Dict:
+        """단일 교회 처리"""
+        church_name = church_data.get('name', 'Unknown')
+
+        print(f"\n🏢 처리 중: {church_name}")
+        self.logger.info(f"교회 처리 시작: {church_name}")
+        self.stats['total_processed'] += 1
+
+        if self.use_browser:
+            return self._process_with_browser(church_data)
+
+        async def run():
+            async with self._new_client() as client:
+                return await self._process_with_client(client, church_data)
+
+        return asyncio.run(run())
+
+    async def _process_all_with_client(self, churches_data: List[Dict]) -> List[Dict]:
+        """장소 검색 API로 전체 처리 (동시 조회 수 제한, 요청 간격은 스케줄러가 관리)"""
+        results: List[Optional[Dict]] = [None] * len(churches_data)
+        semaphore = asyncio.Semaphore(NAVER_PLACE_CONFIG.get("concurrency", 4))
+        completed = 0
+
+        async with self._new_client() as client:
+            async def run(index: int, church: Dict):
+                nonlocal completed
+                async with semaphore:
+                    self.stats['total_processed'] += 1
+                    results[index] = await self._process_with_client(client, church)
+                completed += 1
+                print(f"📍 진행상황: {completed}/{len(churches_data)} - {church.get('name', 'Unknown')}")
+
+                # 중간 저장 (50개마다, 완료된 것만)
+                if completed % 50 == 0:
+                    self.save_intermediate_results([r for r in results if r is not None], completed)
+
+            await asyncio.gather(*(run(i, church) for i, church in enumerate(churches_data)))
+            self.logger.info(f"장소 검색 통계: {client.stats}")
+
+        return results
+
     def process_all_churches(self, churches_data: List[Dict]) -> List[Dict]:
         """모든 교회 처리"""
         print(f"\n🚀 총 {len(churches_data)}개 교회 네이버 지도 크롤링 시작")
         print("⚠️ 안전한 크롤링을 위해 적절한 딜레이를 적용합니다")
-        
+
+        if not self.use_browser:
+            return asyncio.run(self._process_all_with_client(churches_data))
+
         results = []
-        
+
         for i, church in enumerate(churches_data):
             print(f"\n📍 진행상황: {i+1}/{len(churches_data)}")
-            
+
             # 교회 처리
             result = self.process_single_church(church)
             results.append(result)
-            
+
             # 중간 저장 (50개마다)
             if (i + 1) % 50 == 0:
                 self.save_intermediate_results(results, i + 1)
-            
+
             # 요청 간격 조절 (서버 부하 방지)
             if i < len(churches_data) - 1:  # 마지막이 아닌 경우
                 delay = random.uniform(*self.delay_range)
                 print(f"  ⏳ {delay:.1f}초 대기 중...")
                 time.sleep(delay)
-        
+
         return results
-    
+
     def save_intermediate_results(self, results: List[Dict], count: int):
         """중간 결과 저장"""
         try:
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+네이버 지도 장소 검색 클라이언트
+브라우저로 map.naver.com을 열고 검색창에 입력하던 방식(조회당 7초 이상 고정 sleep) 대신
+지도 페이지가 내부적으로 호출하는 JSON 검색 API를 직접 호출하여 전화/주소/홈페이지를 구조화된 값으로 받음
+
+- httpx.AsyncClient 하나를 재사용 (keep-alive 연결 풀)
+- 요청 간격은 PolitenessScheduler의 naver.com 예산을 공유 (검색 크롤러와 같은 호스트 예산)
+- mode (NAVER_PLACE_CONFIG["mode"] / NAVER_PLACE_MODE 환경변수)
+  - live: 실제 요청
+  - record: 실제 요청 + 응답을 fixture_dir에 저장
+  - replay: 저장된 응답만 사용 (네트워크 없음, 테스트/벤치마크용)
+- AsyncClient는 이벤트 루프에 묶이므로 프로세스 싱글톤 대신 루프 안에서 생성/종료 (async with)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from utils.contact_query_planner import ContactQueryPlanner
+from utils.metrics import get_metrics_registry
+from utils.phone_normalizer import get_phone_normalizer
+from utils.politeness_scheduler import PolitenessScheduler, get_politeness_scheduler
+from utils.settings import NAVER_PLACE_CONFIG
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+METRICS = get_metrics_registry()
+NAVER_PLACE_SECONDS = METRICS.histogram("naver_place_seconds", "네이버 장소 검색 응답 시간")
+NAVER_PLACE_REQUESTS = METRICS.counter(
+    "naver_place_requests_total", "네이버 장소 검색 요청 수", ["outcome"]
+)
+
+MODES = ("live", "record", "replay")
+_NON_WORD = re.compile(r'[^0-9a-zA-Z가-힣]')
+
+
+@dataclass
+class NaverPlace:
+    """장소 검색 결과 1건"""
+    id: str = ""
+    name: str = ""
+    phone: str = ""
+    address: str = ""
+    road_address: str = ""
+    homepage: str = ""
+    category: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "NaverPlace":
+        """검색 API 응답 항목 → NaverPlace (응답 버전별 키 차이 흡수)"""
+        category = item.get("category") or []
+        if isinstance(category, str):
+            category = [part.strip() for part in category.split(",") if part.strip()]
+
+        phone = item.get("tel") or item.get("phone") or item.get("virtualTel") or ""
+        if phone:
+            normalized = get_phone_normalizer().normalize(phone)
+            phone = normalized.formatted if normalized.is_valid else phone
+
+        homepage = item.get("homePage") or item.get("homepage") or ""
+        if isinstance(homepage, list):
+            homepage = homepage[0] if homepage else ""
+
+        return cls(
+            id=str(item.get("id") or item.get("sid") or ""),
+            name=_strip_tags(item.get("name") or item.get("title") or ""),
+            phone=phone,
+            address=item.get("address") or item.get("jibunAddress") or "",
+            road_address=item.get("roadAddress") or "",
+            homepage=homepage,
+            category=list(category)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _strip_tags(text: str) -> str:
+    return re.sub(r'<[^>]+>', '', text or "")
+
+
+def _compact_name(name: str) -> str:
+    return _NON_WORD.sub('', name or "").lower()
+
+
+def parse_places(payload: Dict[str, Any]) -> List[NaverPlace]:
+    """검색 API 응답에서 장소 목록 추출 (result.place.list / place.list 모두 허용)"""
+    if not isinstance(payload, dict):
+        return []
+    result = payload.get("result", payload)
+    place = (result or {}).get("place") or {}
+    items = place.get("list") if isinstance(place, dict) else None
+    return [NaverPlace.from_item(item) for item in items or [] if isinstance(item, dict)]
+
+
+def match_score(place: NaverPlace, name: str, address: str = "") -> float:
+    """검색 결과가 찾는 기관인지 점수 (이름 일치 + 주소 지역 일치)"""
+    target, candidate = _compact_name(name), _compact_name(place.name)
+    if not target or not candidate:
+        return 0.0
+
+    if target == candidate:
+        score = 0.7
+    elif target in candidate or candidate in target:
+        score = 0.5
+    else:
+        return 0.0
+
+    region = ContactQueryPlanner.extract_region(address) if address else None
+    if region:
+        place_address = f"{place.road_address} {place.address}"
+        score += 0.3 if region in place_address else -0.3
+    return round(max(0.0, score), 3)
+
+
+class NaverPlaceClient:
+    """네이버 지도 장소 검색 클라이언트 (async with로 사용)"""
+
+    def __init__(self, mode: Optional[str] = None, fixture_dir: Optional[str] = None,
+                 scheduler: Optional[PolitenessScheduler] = None, config: Optional[Dict] = None):
+        self.config = config or NAVER_PLACE_CONFIG
+        self.mode = (mode or self.config.get("mode", "live")).lower()
+        if self.mode not in MODES:
+            raise ValueError(f"지원하지 않는 mode: {self.mode} (가능: {', '.join(MODES)})")
+        if self.mode != "replay" and not HTTPX_AVAILABLE:
+            raise ImportError("httpx가 설치되지 않아 live/record 모드를 사용할 수 없습니다 (pip install httpx)")
+
+        self.fixture_dir = fixture_dir or self.config.get("fixture_dir", "")
+        self.scheduler = scheduler or get_politeness_scheduler()
+        self.search_url = self.config["search_url"]
+        self._client = None
+        self.stats = {"requests": 0, "hits": 0, "misses": 0, "errors": 0, "replayed": 0, "recorded": 0}
+
+    # ===== 연결 =====
+
+    def _get_client(self):
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.config.get("max_connections", 10),
+                max_keepalive_connections=self.config.get("max_keepalive_connections", 5)
+            )
+            self._client = httpx.AsyncClient(
+                headers=self.config.get("headers", {}),
+                timeout=self.config.get("timeout", 5.0),
+                limits=limits,
+                follow_redirects=True
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "NaverPlaceClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    # ===== 픽스처 =====
+
+    def fixture_path(self, query: str) -> str:
+        digest = hashlib.sha1(query.strip().encode("utf-8")).hexdigest()
+        return os.path.join(self.fixture_dir, f"{digest}.json")
+
+    def _load_fixture(self, query: str) -> Optional[Dict[str, Any]]:
+        path = self.fixture_path(query)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("response")
+
+    def _save_fixture(self, query: str, payload: Dict[str, Any]):
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(self.fixture_path(query), "w", encoding="utf-8") as f:
+            json.dump({"query": query, "response": payload}, f, ensure_ascii=False, indent=2)
+
+    # ===== 검색 =====
+
+    async def _fetch(self, query: str) -> Optional[Dict[str, Any]]:
+        if self.mode == "replay":
+            payload = self._load_fixture(query)
+            if payload is not None:
+                self.stats["replayed"] += 1
+            return payload
+
+        await self.scheduler.wait_async(self.search_url)
+        params = {"query": query, "type": "all", "searchCoord": "", "boundary": ""}
+        response = await self._get_client().get(self.search_url, params=params)
+        response.raise_for_status()
+        payload = response.json()
+
+        if self.mode == "record":
+            self._save_fixture(query, payload)
+            self.stats["recorded"] += 1
+        return payload
+
+    async def search(self, query: str, limit: Optional[int] = None) -> List[NaverPlace]:
+        """키워드로 장소 검색 (오류 시 빈 목록)"""
+        limit = limit or self.config.get("result_limit", 5)
+        self.stats["requests"] += 1
+        start = time.perf_counter()
+        try:
+            payload = await self._fetch(query)
+        except Exception as e:
+            self.stats["errors"] += 1
+            NAVER_PLACE_REQUESTS.labels("error").inc()
+            print(f"  ❌ 네이버 장소 검색 오류 ({query}): {e}")
+            return []
+        finally:
+            NAVER_PLACE_SECONDS.observe(time.perf_counter() - start)
+
+        places = parse_places(payload or {})[:limit]
+        self.stats["hits" if places else "misses"] += 1
+        NAVER_PLACE_REQUESTS.labels("hit" if places else "miss").inc()
+        return places
+
+    async def lookup(self, name: str, address: str = "") -> Optional[NaverPlace]:
+        """기관명(+주소 지역)으로 가장 잘 맞는 장소 1건 (맞는 결과가 없으면 None)"""
+        region = ContactQueryPlanner.extract_region(address) if address else None
+        query = f"{region} {name}" if region else name
+        places = await self.search(query)
+        if not places and region:
+            places = await self.search(name)
+
+        scored = [(match_score(place, name, address), place) for place in places]
+        scored = [(score, place) for score, place in scored if score > 0]
+        if not scored:
+            return None
+        return max(scored, key=lambda pair: pair[0])[1]
+
+    async def lookup_many(self, organizations: List[Dict[str, Any]],
+                          concurrency: Optional[int] = None) -> List[Optional[NaverPlace]]:
+        """여러 기관 동시 조회 (동시 요청 수 제한, 결과는 입력 순서)"""
+        semaphore = asyncio.Semaphore(concurrency or self.config.get("concurrency", 4))
+
+        async def run(org: Dict[str, Any]) -> Optional[NaverPlace]:
+            async with semaphore:
+                return await self.lookup(org.get("name", ""), org.get("address", ""))
+
+        return await asyncio.gather(*(run(org) for org in organizations))
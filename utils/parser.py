@@ -7,11 +7,12 @@
 
 import re
 import logging
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import requests
 import urllib3
 
+from utils.html_document import HtmlDocument
+
 # settings.py에서 상수들 임포트 (수정)
 from utils.settings import (
     PHONE_EXTRACTION_PATTERNS,
@@ -22,6 +23,7 @@ from utils.settings import (
     KOREAN_AREA_CODES,
     AREA_CODE_LENGTH_RULES,
     LOGGER_NAMES,
+    HTML_PARSE_CONFIG,
     format_phone_number,
     extract_phone_area_code,
     is_valid_area_code
@@ -174,7 +176,10 @@ class WebPageParser:
     
     # HTML에서 footer 내용 추출
     def extract_footer_content(self, soup):
-        """HTML에서 footer 내용 추출"""
+        """HTML에서 footer 내용 추출 (HtmlDocument면 캐시된 footer 뷰 사용)"""
+        if isinstance(soup, HtmlDocument):
+            return soup.footer_text
+        
         footer_content = []
         
         try:
@@ -235,7 +240,7 @@ class WebPageParser:
 
     # 홈페이지 전체 파싱
     def parse_homepage(self, url, html_content=None):
-        """홈페이지 전체 파싱"""
+        """홈페이지 전체 파싱 (html_content에 이미 파싱한 HtmlDocument를 넘기면 다시 파싱하지 않음)"""
         result = {
             "url": url,
             "meta_info": {},
@@ -256,21 +261,24 @@ class WebPageParser:
                 response.encoding = response.apparent_encoding
                 html_content = response.text
             
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # 1회 파싱 (이후 단계는 같은 문서의 캐시된 뷰 사용)
+            document = HtmlDocument.of(html_content, url) or HtmlDocument("", url)
             
             # 메타 정보 추출
-            result["meta_info"] = self.extract_meta_info(soup)
+            result["meta_info"] = self.extract_meta_info(document.soup)
             
-            # 전체 텍스트 추출
-            all_text = soup.get_text()
+            # 전체 텍스트 추출 (예산 내, 연락처/푸터 영역 우선)
+            all_text = document.budget_text()
             result["all_text"] = all_text
             
             # 연락처 정보 추출
             result["contact_info"] = self.extract_contact_info(all_text)
             
             # Footer 내용 추출
-            result["footer_content"] = self.extract_footer_content(soup)
+            result["footer_content"] = self.extract_footer_content(document)
+            
+            # 원본 HTML/파싱 트리 해제
+            document.compact(keep_html=HTML_PARSE_CONFIG.get("capture_raw_html", False))
             
             self.logger.info(f"홈페이지 파싱 완료: {url}")
         
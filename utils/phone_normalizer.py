@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한국 전화번호 정규화기 (테이블 기반)
+PhoneUtils / ContactValidator / 통계 API / 크롤러별로 흩어져 있던 검증·포맷팅 로직을 하나로 통합
+
+- 숫자 추출 1회 (+82 국가번호 → 0 치환)
+- 지역번호 판별: 앞 3자리 → 지역번호 사전 계산 테이블 (AREA_CODE_PREFIX_TABLE, dict 조회 1회)
+- 지역번호별 길이 규칙 + 더미 번호 패턴 검사
+- 같은 번호 반복 입력은 LRU 캐시로 즉시 반환
+- normalize_many: pandas Series는 컬럼 단위 일괄 처리 (정규식 1회 + NumPy 비교), list / NumPy 배열은 고유값 단위 처리
+  (pandas/NumPy는 import하지 않음 - 호출자가 이미 불러온 경우에만 Series/배열 경로 사용)
+"""
+
+import re
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from utils.settings import (
+    AREA_CODE_PREFIX_TABLE,
+    DUMMY_PHONE_PATTERNS,
+    KOREAN_AREA_CODES,
+    get_length_rules
+)
+
+
+NON_DIGIT_PATTERN = re.compile(r'\D+')
+
+# 82 / 820 국가번호 접두 (뒤에 0이 아닌 숫자로 시작하는 8자리 이상이 남을 때만)
+COUNTRY_CODE_PATTERN = re.compile(r'^820?(?=[1-9]\d{7,}$)')
+
+# 더미 번호: settings.DUMMY_PHONE_PATTERNS + 가입자 번호(지역번호 뒤)가 한 숫자 반복인 경우
+# (포맷된 번호 기준, DUMMY_PHONE_PATTERNS의 역참조 그룹이 1번이라 반복 패턴은 2번 그룹 사용)
+DUMMY_PHONE_REGEX_SOURCE = "|".join(
+    [f"(?:{pattern})" for pattern in DUMMY_PHONE_PATTERNS] + [r"\d{2,3}-(\d)\2{2,3}-\2{4}$"]
+)
+DUMMY_PHONE_REGEX = re.compile(DUMMY_PHONE_REGEX_SOURCE)
+
+# 줄 단위 일괄 검사용 (개행으로 이어 붙인 포맷 번호에서 각 줄 시작만 매칭)
+DUMMY_PHONE_LINE_REGEX = re.compile(f"^(?:{DUMMY_PHONE_REGEX_SOURCE})", re.MULTILINE)
+
+# 일괄 숫자 추출 시 개행은 행 구분자로 남김
+NON_DIGIT_KEEP_NEWLINE_PATTERN = re.compile(r'[^\d\n]+')
+
+# 지역번호 → (최소 길이, 최대 길이)
+AREA_LENGTH_TABLE = {
+    code: (get_length_rules(code)["min_length"], get_length_rules(code)["max_length"])
+    for code in KOREAN_AREA_CODES
+}
+
+# 지역번호 판별 전 전체 길이 범위
+MIN_PHONE_LENGTH = 9
+MAX_PHONE_LENGTH = 11
+
+
+class NormalizedPhone(NamedTuple):
+    """정규화 결과 (불변 → LRU 캐시 공유 가능)"""
+    digits: str                    # 숫자만 (국가번호 치환 후)
+    area_code: Optional[str]       # 지역번호 (02, 031, 010 ...)
+    formatted: Optional[str]       # 하이픈 포맷 (유효한 번호만)
+    is_valid: bool                 # 지역번호 + 지역번호별 길이 규칙 통과
+    is_dummy: bool                 # 033-333-3333 같은 더미 번호 (유효한 번호만 판정)
+    reason: Optional[str]          # 무효 사유 (유효하면 None)
+
+    @property
+    def area_name(self) -> str:
+        return KOREAN_AREA_CODES.get(self.area_code, "알 수 없음")
+
+
+EMPTY_RESULT = NormalizedPhone("", None, None, False, False, "번호 없음")
+
+# normalize_many가 pandas Series 입력 시 반환하는 DataFrame 컬럼
+RESULT_COLUMNS = list(NormalizedPhone._fields)
+
+
+class PhoneNormalizer:
+    """테이블 기반 한국 전화번호 정규화기 (스레드 안전, 결과 LRU 캐시)"""
+
+    def __init__(self, cache_size: int = 65536):
+        self.cache_size = cache_size
+        self._normalize_cached = lru_cache(maxsize=cache_size)(self._normalize_digits)
+
+    # ===== 단건 =====
+
+    @staticmethod
+    def digits_of(phone: Any) -> str:
+        """숫자만 추출 (+82 국가번호는 국내 0 접두로 치환)"""
+        if phone is None:
+            return ""
+        digits = NON_DIGIT_PATTERN.sub("", str(phone))
+        if digits.startswith("82"):
+            digits = COUNTRY_CODE_PATTERN.sub("0", digits)
+        return digits
+
+    @staticmethod
+    def area_code_of(digits: str) -> Optional[str]:
+        """숫자열 앞 3자리로 지역번호 조회"""
+        return AREA_CODE_PREFIX_TABLE.get(digits[:3]) if digits else None
+
+    @staticmethod
+    def _normalize_digits(digits: str) -> NormalizedPhone:
+        if not digits:
+            return EMPTY_RESULT
+
+        length = len(digits)
+        area_code = AREA_CODE_PREFIX_TABLE.get(digits[:3])
+        if not MIN_PHONE_LENGTH <= length <= MAX_PHONE_LENGTH:
+            return NormalizedPhone(digits, area_code, None, False, False, "길이 오류")
+        if area_code is None:
+            return NormalizedPhone(digits, None, None, False, False, "지역코드 오류")
+
+        min_length, max_length = AREA_LENGTH_TABLE[area_code]
+        if not min_length <= length <= max_length:
+            return NormalizedPhone(digits, area_code, None, False, False, "길이 불일치")
+
+        # 유효 길이에서는 "지역번호-중간-끝 4자리"가 settings.format_phone_number와 동일
+        formatted = f"{area_code}-{digits[len(area_code):-4]}-{digits[-4:]}"
+        is_dummy = DUMMY_PHONE_REGEX.match(formatted) is not None
+        return NormalizedPhone(digits, area_code, formatted, True, is_dummy, None)
+
+    def normalize(self, phone: Any) -> NormalizedPhone:
+        """전화번호 1건 정규화 (숫자열 기준 캐시)"""
+        return self._normalize_cached(self.digits_of(phone))
+
+    def format(self, phone: Any) -> Optional[str]:
+        """유효한 번호만 하이픈 포맷으로 반환"""
+        return self.normalize(phone).formatted
+
+    def is_valid(self, phone: Any, allow_dummy: bool = True) -> bool:
+        result = self.normalize(phone)
+        return result.is_valid and (allow_dummy or not result.is_dummy)
+
+    # ===== 일괄 =====
+
+    def normalize_many(self, values: Iterable[Any]):
+        """
+        여러 번호 일괄 정규화
+        - pandas Series → 같은 인덱스의 DataFrame (RESULT_COLUMNS), 컬럼 단위 일괄 처리
+        - NumPy 배열 / 기타 iterable → NormalizedPhone 리스트 (고유값만 계산)
+        """
+        # 입력이 Series/배열이면 호출자가 이미 pandas/NumPy를 불러온 상태 → sys.modules만 확인
+        pd = sys.modules.get("pandas")
+        if pd is not None and isinstance(values, pd.Series):
+            return self._normalize_series(values)
+
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+
+        memo: Dict[Any, NormalizedPhone] = {}
+        results: List[NormalizedPhone] = []
+        for value in values:
+            result = memo.get(value)
+            if result is None:
+                result = EMPTY_RESULT if _is_missing(value) else self.normalize(value)
+                memo[value] = result
+            results.append(result)
+        return results
+
+    def validate_many(self, series: "pd.Series") -> "pd.DataFrame":
+        """
+        pandas Series 유효성만 일괄 검사 (포맷/더미 검사 생략, 통계용)
+        반환 컬럼: digits, area_code, is_valid, reason
+        """
+        import pandas as pd
+
+        columns = self._validate_columns(series)
+        return pd.DataFrame(
+            {name: columns[name] for name in ("digits", "area_code", "is_valid", "reason")},
+            index=series.index
+        )
+
+    @staticmethod
+    def _validate_columns(series: "pd.Series") -> Dict[str, Any]:
+        """
+        컬럼 단위 유효성 검사
+        전체 값을 개행으로 이어 붙여 숫자 추출을 정규식 1회로 처리하고,
+        지역번호·길이 규칙은 테이블 조회 + NumPy 비교로 계산 (결과는 normalize()와 동일)
+        """
+        import numpy as np
+
+        values = series.astype(object).where(series.notna(), "").astype(str).tolist()
+        joined = "\n".join(values)
+        if joined.count("\n") == len(values) - 1:
+            digits = NON_DIGIT_KEEP_NEWLINE_PATTERN.sub("", joined).split("\n") if values else []
+        else:
+            digits = [NON_DIGIT_PATTERN.sub("", value) for value in values]  # 값 안에 개행이 있는 경우
+        digits = [COUNTRY_CODE_PATTERN.sub("0", d) if d.startswith("82") else d for d in digits]
+
+        count = len(digits)
+        area_codes = [AREA_CODE_PREFIX_TABLE.get(d[:3]) for d in digits]
+        length = np.fromiter(map(len, digits), dtype=np.int16, count=count)
+        min_length = np.fromiter((AREA_LENGTH_TABLE[a][0] if a else 0 for a in area_codes), dtype=np.int16, count=count)
+        max_length = np.fromiter((AREA_LENGTH_TABLE[a][1] if a else -1 for a in area_codes), dtype=np.int16, count=count)
+        has_area = max_length >= 0
+
+        empty = length == 0
+        bad_length = ~empty & ((length < MIN_PHONE_LENGTH) | (length > MAX_PHONE_LENGTH))
+        bad_area = ~empty & ~bad_length & ~has_area
+        is_valid = has_area & (length >= min_length) & (length <= max_length)
+        rule_mismatch = ~empty & ~bad_length & has_area & ~is_valid
+
+        reason = np.full(count, None, dtype=object)
+        reason[empty] = EMPTY_RESULT.reason
+        reason[bad_length] = "길이 오류"
+        reason[bad_area] = "지역코드 오류"
+        reason[rule_mismatch] = "길이 불일치"
+
+        # 길이 오류 행도 normalize()와 같이 지역번호 유지 (빈 값만 None)
+        return {
+            "digits": digits,
+            "area_codes": area_codes,
+            "area_code": np.array(area_codes, dtype=object),
+            "is_valid": is_valid,
+            "reason": reason
+        }
+
+    def _normalize_series(self, series: "pd.Series") -> "pd.DataFrame":
+        """컬럼 단위 정규화 (유효성 검사 + 유효 번호 포맷/더미 검사)"""
+        import numpy as np
+        import pandas as pd
+
+        columns = self._validate_columns(series)
+        digits, area_codes, is_valid = columns["digits"], columns["area_codes"], columns["is_valid"]
+        count = len(digits)
+
+        valid_positions = np.flatnonzero(is_valid)
+        formatted_valid = [
+            f"{area_codes[i]}-{digits[i][len(area_codes[i]):-4]}-{digits[i][-4:]}"
+            for i in valid_positions.tolist()
+        ]
+        formatted = np.full(count, None, dtype=object)
+        formatted[valid_positions] = formatted_valid
+
+        # 더미 검사: 포맷 번호를 줄 단위로 이어 붙여 MULTILINE 정규식 1회, 매칭 위치 → 행 번호
+        is_dummy = np.zeros(count, dtype=bool)
+        if formatted_valid:
+            line_starts = np.zeros(len(formatted_valid), dtype=np.int64)
+            np.cumsum([len(f) + 1 for f in formatted_valid[:-1]], out=line_starts[1:])
+            match_starts = [m.start() for m in DUMMY_PHONE_LINE_REGEX.finditer("\n".join(formatted_valid))]
+            if match_starts:
+                lines = np.searchsorted(line_starts, match_starts)
+                is_dummy[valid_positions[lines]] = True
+
+        return pd.DataFrame({
+            "digits": digits,
+            "area_code": columns["area_code"],
+            "formatted": formatted,
+            "is_valid": is_valid,
+            "is_dummy": is_dummy,
+            "reason": columns["reason"]
+        }, index=series.index)
+
+    def cache_info(self) -> Dict[str, int]:
+        info = self._normalize_cached.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    return isinstance(value, float) and value != value  # NaN
+
+
+_normalizer_instance = None
+_normalizer_lock = threading.Lock()
+
+
+def get_phone_normalizer() -> PhoneNormalizer:
+    """프로세스 공용 전화번호 정규화기 반환 (싱글톤)"""
+    global _normalizer_instance
+    if _normalizer_instance is None:
+        with _normalizer_lock:
+            if _normalizer_instance is None:
+                _normalizer_instance = PhoneNormalizer()
+    return _normalizer_instance
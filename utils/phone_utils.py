@@ -45,7 +45,6 @@ try:
         extract_phone_area_code,
         format_phone_number as settings_format_phone_number
     )
-    print("✅ settings.py에서 전화번호 유틸리티 import 성공")
 except ImportError as e:
     print(f"Warning: settings.py import 실패 - {e}")
     # 기본값 사용...
@@ -104,6 +103,8 @@ except ImportError as e:
         re.IGNORECASE
     )
 
+from utils.phone_normalizer import get_phone_normalizer
+
 class PhoneUtils:
     """전화번호 관련 유틸리티 클래스 - 중복 제거"""
     
@@ -111,74 +112,23 @@ class PhoneUtils:
     def validate_korean_phone(phone: str) -> bool:
         """
         한국 전화번호 유효성 검증 (통합)
-        data_statistics.py + fax_crawler.py + parser.py + validator.py 통합
+        지역번호 테이블 + 지역번호별 길이 규칙 (utils.phone_normalizer)
         """
         if not phone:
             return False
         
-        # 숫자만 추출
-        digits_only = re.sub(r'[^\d]', '', phone)
-        
-        # 국가번호 제거 (+82, 82)
-        if digits_only.startswith('82'):
-            digits_only = '0' + digits_only[2:]
-        
-        # 길이 검증 (9-11자리)
-        if len(digits_only) < 9 or len(digits_only) > 11:
-            return False
-        
-        # 지역번호 검증
-        area_code = PhoneUtils.extract_area_code(digits_only)
-        if not area_code or not is_valid_area_code(area_code):
-            return False
-        
-        # 길이 규칙 검증 (AREA_CODE_LENGTH_RULES가 있을 때만)
-        if 'AREA_CODE_LENGTH_RULES' in globals():
-            length_rules = AREA_CODE_LENGTH_RULES.get(area_code, {})
-            min_length = length_rules.get('min_length', 9)
-            max_length = length_rules.get('max_length', 11)
-            
-            if not (min_length <= len(digits_only) <= max_length):
-                return False
-        
-        # 정규식 패턴 검증
-        formatted = PhoneUtils.format_phone_number(digits_only)
-        if not formatted:
-            return False
-        
-        return PHONE_VALIDATION_PATTERN.match(formatted) is not None
+        return get_phone_normalizer().normalize(phone).is_valid
     
     @staticmethod
     def format_phone_number(phone: str) -> Optional[str]:
         """
         전화번호 포맷팅 (통합)
-        4개 파일의 포맷팅 로직 통합
+        지역번호를 찾을 수 있는 9~11자리 번호만 포맷팅
         """
         if not phone:
             return None
         
-        # 숫자만 추출
-        digits_only = re.sub(r'[^\d]', '', phone)
-        
-        # 국가번호 제거
-        if digits_only.startswith('82'):
-            digits_only = '0' + digits_only[2:]
-        
-        # 길이 검증 (9-11자리)
-        if len(digits_only) < 9 or len(digits_only) > 11:
-            return None
-        
-        # 지역번호 추출
-        area_code = PhoneUtils.extract_area_code(digits_only)
-        if not area_code:
-            return None
-        
-        # settings.py의 포맷팅 함수 활용
-        try:
-            return settings_format_phone_number(digits_only, area_code)
-        except Exception as e:
-            # fallback 포맷팅
-            return PhoneUtils._fallback_format(digits_only, area_code)
+        return get_phone_normalizer().normalize(phone).formatted
     
     @staticmethod
     def _fallback_format(digits: str, area_code: str) -> str:
@@ -200,9 +150,11 @@ class PhoneUtils:
     def extract_area_code(phone: str) -> Optional[str]:
         """
         지역번호 추출 (통합)
-        settings.py 함수 활용
+        앞 3자리 지역번호 테이블 조회 (+82 국가번호 처리 포함)
         """
-        return extract_phone_area_code(phone)
+        if not phone:
+            return None
+        return get_phone_normalizer().normalize(phone).area_code
     
     @staticmethod
     def normalize_phone_number(phone: str) -> str:
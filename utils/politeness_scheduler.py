@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+도메인별 요청 간격 스케줄러
+크롤러마다 흩어져 있던 random sleep(봇 탐지 방지)을 호스트 단위 예약으로 통합
+- 호스트(google.com, naver.com, 각 홈페이지 도메인)별 다음 허용 시각 관리
+- 다른 호스트로 가는 요청은 기다리지 않음
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from utils.settings import POLITENESS_CONFIG
+
+
+class PolitenessScheduler:
+    """호스트별 다음 허용 시각을 관리하는 요청 간격 스케줄러 (스레드 안전)"""
+
+    def __init__(self, host_intervals: Optional[Dict[str, Tuple[float, float]]] = None,
+                 default_interval: Optional[Tuple[float, float]] = None):
+        config = POLITENESS_CONFIG
+        self.host_intervals = dict(config.get("host_intervals", {}))
+        if host_intervals:
+            self.host_intervals.update(host_intervals)
+        self.default_interval = default_interval or config.get("default_interval", (2.0, 4.0))
+        self.host_aliases = config.get("host_aliases", {})
+
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+        self._stats = {"reservations": 0, "waited": 0, "total_wait": 0.0}
+
+    def normalize_host(self, target: str) -> str:
+        """URL 또는 호스트명을 스케줄링 키로 변환"""
+        if not target:
+            return ""
+
+        host = target.strip().lower()
+        if "://" in host:
+            host = urlparse(host).netloc
+        else:
+            host = host.split("/", 1)[0]
+        host = host.split(":", 1)[0]
+        if host.startswith("www."):
+            host = host[4:]
+
+        # 검색엔진은 서브도메인과 무관하게 하나의 예산을 공유
+        for known_host in self.host_intervals:
+            if host == known_host or host.endswith("." + known_host):
+                return known_host
+        for alias, canonical in self.host_aliases.items():
+            if host == alias or host.endswith("." + alias):
+                return canonical
+
+        return host
+
+    def interval_for(self, host: str) -> float:
+        """호스트의 요청 간격 (범위 내 랜덤)"""
+        min_seconds, max_seconds = self.host_intervals.get(host, self.default_interval)
+        return random.uniform(min_seconds, max_seconds)
+
+    def ready_in(self, target: str) -> float:
+        """예약 없이 해당 호스트가 열리기까지 남은 시간 조회"""
+        host = self.normalize_host(target)
+        with self._lock:
+            return max(0.0, self._next_allowed.get(host, 0.0) - time.monotonic())
+
+    def reserve(self, target: str) -> float:
+        """다음 요청 슬롯을 예약하고 대기해야 할 시간을 반환"""
+        host = self.normalize_host(target)
+        with self._lock:
+            return self._reserve_locked(host)
+
+    def _reserve_locked(self, host: str) -> float:
+        now = time.monotonic()
+        slot = max(now, self._next_allowed.get(host, 0.0))
+        self._next_allowed[host] = slot + self.interval_for(host)
+
+        delay = slot - now
+        self._stats["reservations"] += 1
+        if delay > 0:
+            self._stats["waited"] += 1
+            self._stats["total_wait"] += delay
+        return delay
+
+    def wait(self, target: str) -> float:
+        """동기 코드용: 슬롯 예약 후 필요한 만큼만 대기"""
+        delay = self.reserve(target)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, target: str) -> float:
+        """비동기 코드용: 이벤트 루프를 막지 않고 대기"""
+        delay = self.reserve(target)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """스케줄러 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["tracked_hosts"] = len(self._next_allowed)
+        return stats
+
+
+_scheduler_instance = None
+_scheduler_lock = threading.Lock()
+
+
+def get_politeness_scheduler() -> PolitenessScheduler:
+    """프로세스 공용 스케줄러 인스턴스 반환 (싱글톤)"""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        with _scheduler_lock:
+            if _scheduler_instance is None:
+                _scheduler_instance = PolitenessScheduler()
+    return _scheduler_instance
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 프롬프트 압축
+Gemini에 페이지 텍스트 앞부분(수천~수만 자)을 그대로 보내던 것을 연락처 추출에 필요한 부분만 남겨
+기관당 토큰 사용량/응답 시간을 줄임
+
+- 페이지 앞부분 문맥(기관명/소개) 조금, footer/연락처 영역(HtmlDocument가 있으면),
+  연락처 키워드/전화번호/이메일 주변 창 순서로 예산을 채움
+- 같은 단어열이 반복되는 메뉴/내비게이션 텍스트는 첫 번째만 남김 (조각 사이 중복도 제거)
+  숫자/연락처 라벨이 들어간 단어열과 키워드/번호 주변 창은 제거하지 않음 (전화 031-123-4567 / 팩스 031-123-4568)
+- 예산 안에 들어가는 텍스트는 그대로 반환
+- 작업별 토큰 예산(PROMPT_COMPACTION_CONFIG["task_budgets"]) 안으로 자름
+- contact_recall: 원문에서 찾은 전화/팩스/이메일이 압축본에 남은 비율 (저장된 페이지로 정확도 확인용)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Set, Tuple
+
+from utils.metrics import get_metrics_registry
+from utils.settings import EMAIL_PATTERN, PROMPT_COMPACTION_CONFIG
+
+METRICS = get_metrics_registry()
+PROMPT_CHARS = METRICS.counter("prompt_chars_total", "AI 프롬프트 텍스트 글자 수 (압축 전/후)", ["task", "stage"])
+PROMPT_RATIO = METRICS.histogram("prompt_compaction_ratio", "압축 후/전 글자 수 비율", ["task"])
+PROMPT_RECALL = METRICS.histogram("prompt_contact_recall", "압축 후 남은 연락처 비율", ["task"])
+
+_NUMBER = re.compile(r'\(?\d{2,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{4}')
+_EMAIL = re.compile(EMAIL_PATTERN)
+_WHITESPACE = re.compile(r'\s+')
+_DIGIT = re.compile(r'\d')
+
+SEPARATOR = " … "
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern:
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+_KEYWORDS = _keyword_pattern(PROMPT_COMPACTION_CONFIG.get("keywords", ["전화", "팩스", "TEL", "FAX"]))
+
+
+@dataclass
+class CompactedText:
+    """압축 결과"""
+    text: str
+    original_chars: int
+    windows: int = 0
+
+    @property
+    def ratio(self) -> float:
+        return len(self.text) / self.original_chars if self.original_chars else 1.0
+
+    @property
+    def estimated_tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+
+def estimate_tokens(text: str) -> int:
+    return int(len(text) / PROMPT_COMPACTION_CONFIG.get("chars_per_token", 2.0)) + 1
+
+
+def task_budget_chars(task: str) -> int:
+    """작업별 토큰 예산 → 글자 수"""
+    budgets = PROMPT_COMPACTION_CONFIG.get("task_budgets", {})
+    tokens = budgets.get(task, budgets.get("default", 2000))
+    return int(tokens * PROMPT_COMPACTION_CONFIG.get("chars_per_token", 2.0))
+
+
+def contact_values(text: str) -> Set[str]:
+    """텍스트의 전화/팩스번호(숫자만)와 이메일"""
+    values = {re.sub(r'\D', '', match) for match in _NUMBER.findall(text)}
+    values.update(email.lower() for email in _EMAIL.findall(text))
+    return values
+
+
+def contact_recall(original: str, compacted: str) -> float:
+    """원문 연락처 중 압축본에 남은 비율 (원문에 연락처가 없으면 1.0)"""
+    expected = contact_values(original)
+    if not expected:
+        return 1.0
+    return len(expected & contact_values(compacted)) / len(expected)
+
+
+def _protected(word: str) -> bool:
+    """숫자나 연락처 라벨이 들어간 단어 (반복돼도 제거하면 안 되는 값)"""
+    return _DIGIT.search(word) is not None or _KEYWORDS.search(word) is not None
+
+
+def dedupe_repeated(text: str, ngram: int = None, seen: Set[tuple] = None) -> str:
+    """
+    같은 단어 ngram개 이상이 다시 나오면 두 번째부터 제거 (메뉴/내비게이션 반복)
+    숫자/연락처 라벨이 들어간 단어열은 반복돼도 남김 (같은 국번의 전화/팩스번호 보존)
+    seen: 여러 조각에 걸쳐 공유할 단어열 집합 (앞 조각에 나온 단어열은 뒤 조각에서 제거)
+    """
+    ngram = ngram or PROMPT_COMPACTION_CONFIG.get("dedupe_ngram", 4)
+    words = text.split()
+    if seen is None:
+        if len(words) < ngram * 2:
+            return ' '.join(words)
+        seen = set()
+
+    protected = [_protected(word) for word in words]
+    keep = [True] * len(words)
+    for i in range(len(words) - ngram + 1):
+        if any(protected[i:i + ngram]):
+            continue
+        gram = tuple(words[i:i + ngram])
+        if gram in seen:
+            for j in range(i, i + ngram):
+                keep[j] = False
+        else:
+            seen.add(gram)
+    return ' '.join(word for word, kept in zip(words, keep) if kept)
+
+
+def _anchor_windows(text: str, window: int) -> List[Tuple[int, int]]:
+    """키워드/전화번호/이메일 주변 구간 (겹치면 병합, 단어 경계에 맞춤)"""
+    spans = []
+    for pattern in (_KEYWORDS, _NUMBER, _EMAIL):
+        for match in pattern.finditer(text):
+            spans.append((max(0, match.start() - window), min(len(text), match.end() + window)))
+    spans.sort()
+
+    merged: List[Tuple[int, int]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    snapped = []
+    for start, end in merged:
+        if start > 0:
+            space = text.find(' ', start)
+            start = space + 1 if 0 <= space < start + 20 else start
+        if end < len(text):
+            space = text.rfind(' ', end - 20, end)
+            end = space if space > start else end
+        snapped.append((start, end))
+    return snapped
+
+
+class _Budget:
+    """글자 수 예산 안에서 조각 누적 (앞 조각에 이미 나온 단어열은 제거)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.parts: List[str] = []
+        self.length = 0
+        self._seen: Set[tuple] = set()
+
+    @property
+    def full(self) -> bool:
+        return self.length >= self.limit
+
+    def add(self, fragment: str, limit: int = None, dedupe: bool = True) -> bool:
+        limit = min(self.limit, limit or self.limit)
+        if dedupe:
+            fragment = dedupe_repeated(fragment, seen=self._seen)
+        if not fragment:
+            return False
+        remaining = limit - self.length - (len(SEPARATOR) if self.parts else 0)
+        if remaining <= 0:
+            return False
+        fragment = fragment[:remaining]
+        self.length += len(fragment) + (len(SEPARATOR) if self.parts else 0)
+        self.parts.append(fragment)
+        return True
+
+    def text(self) -> str:
+        return SEPARATOR.join(self.parts)
+
+
+def compact_for_prompt(text: str, task: str = "default", document: Any = None,
+                       max_chars: int = None) -> CompactedText:
+    """
+    연락처 추출용 프롬프트 텍스트 압축
+    document: HtmlDocument (있으면 footer/연락처 영역을 먼저 사용 - compact된 문서도 영역 텍스트는 유지됨)
+    """
+    text = text or ""
+    max_chars = max_chars or task_budget_chars(task)
+    original_chars = len(text)
+    cleaned = _WHITESPACE.sub(' ', text).strip()
+
+    if len(text) <= max_chars:
+        # 예산 안이면 원문 그대로 (중복 제거/창 선택 없음)
+        result = CompactedText(text, original_chars)
+    elif len(cleaned) <= max_chars:
+        result = CompactedText(cleaned, original_chars)
+    else:
+        budget = _Budget(max_chars)
+        windows = _anchor_windows(cleaned, PROMPT_COMPACTION_CONFIG.get("window_chars", 120))
+
+        # 1) 페이지 앞부분 문맥 (창이 없으면 예산만큼 앞부분)
+        head_chars = PROMPT_COMPACTION_CONFIG.get("head_chars", 200) if windows else max_chars
+        budget.add(cleaned[:head_chars])
+
+        # 2) footer/연락처 영역
+        if document is not None:
+            section_limit = budget.length + int(max_chars * PROMPT_COMPACTION_CONFIG.get("section_share", 0.4))
+            budget.add(document.contact_text or document.footer_text, section_limit)
+
+        # 3) 키워드/번호 주변 창 (창 안은 중복 제거하지 않음 - 같은 국번/라벨이 반복되는 구간)
+        for start, end in windows:
+            if budget.full:
+                break
+            budget.add(cleaned[start:end], dedupe=False)
+
+        result = CompactedText(budget.text(), original_chars, len(windows))
+
+    PROMPT_CHARS.labels(task, "original").inc(original_chars)
+    PROMPT_CHARS.labels(task, "compacted").inc(len(result.text))
+    PROMPT_RATIO.labels(task).observe(result.ratio)
+    return result
+
+
+def compact_text(text: str, task: str = "default", document: Any = None,
+                 max_chars: int = None, measure_recall: bool = True) -> str:
+    """compact_for_prompt의 텍스트만 반환 (연락처 보존율도 기록)"""
+    result = compact_for_prompt(text, task, document, max_chars)
+    if measure_recall:
+        PROMPT_RECALL.labels(task).observe(contact_recall(text or "", result.text))
+    return result.text
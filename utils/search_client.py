@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+차단 감지형 검색 클라이언트
+구글 CAPTCHA / "unusual traffic" 페이지를 감지하여 검색엔진별로 쿨다운을 걸고
+구글 -> 네이버 -> 다음 순으로 자동 전환
+- 연속 차단 시 지수 백오프 쿨다운 (성공 시 초기화)
+- 쿨다운 상태는 프로세스 단위 (= 해당 프로세스의 출구 IP 단위)
+- 검색엔진별 요청/차단/오류 수와 차단율 통계 제공
+- 본문 차단 표식은 검색 결과 영역이 없는 페이지에서만 검사 (결과 본문의 단어로 오탐 방지)
+"""
+
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote_plus
+
+from utils.settings import SEARCH_ENGINE_CONFIG
+from utils.politeness_scheduler import PolitenessScheduler, get_politeness_scheduler
+from utils.metrics import get_metrics_registry
+
+METRICS = get_metrics_registry()
+SEARCH_EVENTS = METRICS.counter(
+    "search_engine_events_total", "검색엔진별 요청/성공/오류/차단 수", ["engine", "event"]
+)
+SEARCH_FAILOVERS = METRICS.counter("search_engine_failovers_total", "검색엔진 전환 수")
+SEARCH_COOLDOWN_UNTIL = METRICS.gauge(
+    "search_engine_cooldown_until_timestamp_seconds", "검색엔진 쿨다운 해제 시각", ["engine"]
+)
+
+
+class SearchEngineGuard:
+    """검색엔진별 차단 감지, 쿨다운, 페일오버 관리 (스레드 안전)"""
+
+    def __init__(self, scheduler: Optional[PolitenessScheduler] = None, config: Optional[Dict] = None):
+        self.config = config or SEARCH_ENGINE_CONFIG
+        self.engines = self.config["engines"]
+        self.failover_order = list(self.config.get("failover_order", self.engines.keys()))
+        self.scheduler = scheduler or get_politeness_scheduler()
+
+        self._lock = threading.Lock()
+        self._cooldown_until: Dict[str, float] = {}
+        self._consecutive_blocks: Dict[str, int] = {}
+        self._stats = {
+            engine: {"requests": 0, "successes": 0, "blocks": 0, "errors": 0}
+            for engine in self.engines
+        }
+        self._failovers = 0
+
+        # 검색엔진별 결과 영역 id 속성 패턴 (있으면 정상 결과 페이지)
+        self._result_patterns = {
+            engine: re.compile(
+                r'\bid\s*=\s*["\']?(?:' + "|".join(map(re.escape, ids)) + r')["\'\s/>]', re.IGNORECASE
+            )
+            for engine, engine_config in self.engines.items()
+            if (ids := engine_config.get("result_container_ids"))
+        }
+
+    # ===== 차단 감지 =====
+
+    def detect_block(self, engine: str, page_source: str, current_url: str = "") -> Optional[str]:
+        """차단/CAPTCHA 페이지면 감지된 표식을, 정상 페이지면 None 반환"""
+        engine_config = self.engines.get(engine, {})
+
+        url = (current_url or "").lower()
+        for marker in engine_config.get("block_url_markers", []):
+            if marker in url:
+                return marker
+
+        # 결과 영역이 있으면 정상 페이지 - 본문 표식은 결과 영역이 없는 차단/CAPTCHA 페이지에서만 검사
+        result_pattern = self._result_patterns.get(engine)
+        if result_pattern and result_pattern.search(page_source or ""):
+            return None
+
+        text = (page_source or "").lower()
+        for marker in engine_config.get("block_text_markers", []):
+            if marker.lower() in text:
+                return marker
+
+        return None
+
+    def check_driver(self, engine: str, driver) -> Optional[str]:
+        """현재 드라이버 페이지의 차단 여부를 확인하고 결과를 기록"""
+        from selenium.common.exceptions import WebDriverException
+
+        try:
+            reason = self.detect_block(engine, driver.page_source, driver.current_url)
+        except WebDriverException:
+            return None
+
+        if reason:
+            self.record_block(engine, reason)
+        return reason
+
+    # ===== 쿨다운 상태 =====
+
+    def cooldown_remaining(self, engine: str) -> float:
+        """검색엔진 쿨다운 남은 시간 (초)"""
+        with self._lock:
+            return max(0.0, self._cooldown_until.get(engine, 0.0) - time.monotonic())
+
+    def is_available(self, engine: str) -> bool:
+        """쿨다운 중이 아니면 True"""
+        return self.cooldown_remaining(engine) <= 0
+
+    def available_engines(self, engines: Optional[List[str]] = None) -> List[str]:
+        """페일오버 순서대로 현재 사용 가능한 검색엔진 목록"""
+        candidates = engines or self.failover_order
+        return [engine for engine in candidates if engine in self.engines and self.is_available(engine)]
+
+    def next_available_in(self, engines: Optional[List[str]] = None) -> float:
+        """가장 빨리 쿨다운이 풀리는 검색엔진까지 남은 시간 (하나라도 가능하면 0)"""
+        candidates = engines or self.failover_order
+        return min((self.cooldown_remaining(engine) for engine in candidates), default=0.0)
+
+    def record_request(self, engine: str):
+        with self._lock:
+            self._stats[engine]["requests"] += 1
+        SEARCH_EVENTS.labels(engine, "request").inc()
+
+    def record_success(self, engine: str):
+        """정상 응답 기록 - 연속 차단 카운트 초기화"""
+        with self._lock:
+            self._stats[engine]["successes"] += 1
+            self._consecutive_blocks[engine] = 0
+        SEARCH_EVENTS.labels(engine, "success").inc()
+
+    def record_error(self, engine: str):
+        """타임아웃 등 차단이 아닌 실패 기록 (쿨다운 없음)"""
+        with self._lock:
+            self._stats[engine]["errors"] += 1
+        SEARCH_EVENTS.labels(engine, "error").inc()
+
+    def record_block(self, engine: str, reason: str = "") -> float:
+        """차단 기록 후 지수 백오프 쿨다운 적용, 적용된 쿨다운(초) 반환"""
+        base = self.config.get("base_cooldown", 60)
+        maximum = self.config.get("max_cooldown", 1800)
+        multiplier = self.config.get("backoff_multiplier", 2.0)
+        jitter = self.config.get("cooldown_jitter", 0.2)
+
+        with self._lock:
+            blocks = self._consecutive_blocks.get(engine, 0) + 1
+            self._consecutive_blocks[engine] = blocks
+            self._stats[engine]["blocks"] += 1
+
+            cooldown = min(maximum, base * (multiplier ** (blocks - 1)))
+            cooldown *= random.uniform(1 - jitter, 1 + jitter)
+            self._cooldown_until[engine] = time.monotonic() + cooldown
+
+        SEARCH_EVENTS.labels(engine, "block").inc()
+        SEARCH_COOLDOWN_UNTIL.labels(engine).set(time.time() + cooldown)
+        print(f"🚫 {engine} 차단 감지 ({reason}) - {cooldown:.0f}초 쿨다운 (연속 {blocks}회)")
+        return cooldown
+
+    # ===== 검색 =====
+
+    def build_search_url(self, engine: str, query: str) -> str:
+        return self.engines[engine]["search_url"].format(query=quote_plus(query))
+
+    def search(self, driver, query: str, engines: Optional[List[str]] = None, timeout: int = 10) -> Optional[str]:
+        """
+        사용 가능한 검색엔진으로 검색 결과 페이지를 드라이버에 로드
+        차단되면 다음 검색엔진으로 전환, 성공한 검색엔진 이름 반환 (모두 실패 시 None)
+        """
+        # Selenium은 드라이버 검색 경로에서만 import (HTTP 재생/파서 경로는 불러오지 않음)
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        candidates = self.available_engines(engines)
+        if not candidates:
+            print(f"⏳ 사용 가능한 검색엔진 없음 ({self.next_available_in(engines):.0f}초 후 재개): {query}")
+            return None
+
+        for position, engine in enumerate(candidates):
+            if position > 0:
+                with self._lock:
+                    self._failovers += 1
+                SEARCH_FAILOVERS.inc()
+                print(f"🔀 검색엔진 전환: {candidates[position - 1]} -> {engine}")
+
+            search_url = self.build_search_url(engine, query)
+            self.scheduler.wait(search_url)
+            self.record_request(engine)
+
+            try:
+                driver.get(search_url)
+                WebDriverWait(driver, timeout).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+            except (TimeoutException, WebDriverException) as e:
+                print(f"⏰ {engine} 검색 실패: {query}, 오류: {e}")
+                self.record_error(engine)
+                continue
+
+            if self.check_driver(engine, driver):
+                continue
+
+            self.record_success(engine)
+            return engine
+
+        return None
+
+    # ===== 통계 =====
+
+    def get_stats(self) -> Dict[str, Any]:
+        """검색엔진별 요청/차단 통계 및 차단율"""
+        now = time.monotonic()
+        with self._lock:
+            engines = {}
+            for engine, counts in self._stats.items():
+                requests_count = counts["requests"]
+                engines[engine] = {
+                    **counts,
+                    "block_rate": round(counts["blocks"] / requests_count, 4) if requests_count else 0.0,
+                    "consecutive_blocks": self._consecutive_blocks.get(engine, 0),
+                    "cooldown_remaining": round(max(0.0, self._cooldown_until.get(engine, 0.0) - now), 1)
+                }
+
+            total_requests = sum(counts["requests"] for counts in self._stats.values())
+            total_blocks = sum(counts["blocks"] for counts in self._stats.values())
+
+            return {
+                "engines": engines,
+                "total_requests": total_requests,
+                "total_blocks": total_blocks,
+                "block_rate": round(total_blocks / total_requests, 4) if total_requests else 0.0,
+                "failovers": self._failovers
+            }
+
+
+_guard_instance = None
+_guard_lock = threading.Lock()
+
+
+def get_search_guard() -> SearchEngineGuard:
+    """프로세스 공용 검색엔진 가드 반환 (싱글톤)"""
+    global _guard_instance
+    if _guard_instance is None:
+        with _guard_lock:
+            if _guard_instance is None:
+                _guard_instance = SearchEngineGuard()
+    return _guard_instance
@@ -50,6 +50,21 @@ TPM_LIMITS = {
     'max_wait_time': 30
 }
 
+# Gemini API 키 풀 (utils/gemini_key_pool.py - 키별 독립 클라이언트/요청 예산/회로 차단기)
+GEMINI_KEY_POOL_CONFIG = {
+    # 순서대로 읽을 키 환경 변수 (GEMINI_API_KEYS에 쉼표로 구분해 추가 키 지정 가능)
+    "key_env_vars": ["GEMINI_API_KEY", "GEMINI_API_KEY_2", "GEMINI_API_KEY_3", "GEMINI_API_KEY_4"],
+    "keys_env_var": "GEMINI_API_KEYS",
+    # 키별 분당 요청 예산
+    "requests_per_minute": int(os.getenv("GEMINI_KEY_RPM", "60")),
+    # 연속 실패 횟수가 이 값에 도달하면 회로 열림
+    "failure_threshold": 3,
+    # 회로 열림 유지 시간 (초) - 429는 응답의 retry_delay가 있으면 그 값 사용
+    "open_seconds": 60.0,
+    # 사용 가능한 키가 없을 때 최대 대기 시간 (초)
+    "max_wait_seconds": 30.0
+}
+
 # ===== 파일 패턴 관리 =====
 INPUT_FILE_PATTERNS = [
     "raw_data_*.json",
@@ -84,6 +99,290 @@ CRAWLING_CONFIG = {
     "async_timeout": 120
 }
 
+# 호스트별 요청 간격 (초, 최소~최대) - utils/politeness_scheduler.py에서 사용
+POLITENESS_CONFIG = {
+    "default_interval": (2.0, 4.0),
+    "host_intervals": {
+        "google.com": (5.0, 10.0),
+        "naver.com": (2.0, 5.0),
+        "daum.net": (2.0, 4.0)
+    },
+    # 같은 검색엔진으로 묶을 호스트 (search.naver.com, map.naver.com -> naver.com)
+    "host_aliases": {
+        "google.co.kr": "google.com",
+        "hanmail.net": "daum.net"
+    }
+}
+
+# 검색엔진 차단 감지 및 쿨다운 설정 - utils/search_client.py에서 사용
+# 본문 표식(block_text_markers)은 결과 영역(result_container_ids)이 없는 페이지에서만 검사
+# (검색 결과 본문/스크립트에 "captcha" 같은 단어가 있어도 차단으로 보지 않음)
+SEARCH_ENGINE_CONFIG = {
+    # 차단 시 이 순서로 다음 검색엔진을 시도
+    "failover_order": ["google", "naver", "daum"],
+    "engines": {
+        "google": {
+            "search_url": "https://www.google.com/search?q={query}",
+            "block_url_markers": ["/sorry/"],
+            "block_text_markers": [
+                "unusual traffic", "our systems have detected", "g-recaptcha",
+                "비정상적인 트래픽", "로봇이 아닙니다"
+            ],
+            "result_container_ids": ["search", "rso"]
+        },
+        "naver": {
+            "search_url": "https://search.naver.com/search.naver?query={query}",
+            "block_url_markers": ["nid.naver.com/login"],
+            "block_text_markers": ["자동입력 방지", "비정상적인 검색", "일시적으로 제한"],
+            "result_container_ids": ["main_pack"]
+        },
+        "daum": {
+            "search_url": "https://search.daum.net/search?q={query}",
+            "block_url_markers": [],
+            "block_text_markers": ["비정상적인 접근", "자동 검색", "captcha"],
+            "result_container_ids": ["mArticle", "daumContent"]
+        }
+    },
+    # 연속 차단 시 쿨다운 = base * multiplier^(연속차단-1), 최대 max (초)
+    "base_cooldown": 60,
+    "max_cooldown": 1800,
+    "backoff_multiplier": 2.0,
+    "cooldown_jitter": 0.2
+}
+
+# 네이버 지도 장소 검색 (utils/naver_place_client.py - 지도 페이지가 쓰는 JSON 검색 API 직접 호출)
+NAVER_PLACE_CONFIG = {
+    "search_url": "https://map.naver.com/p/api/search/allSearch",
+    "headers": {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Referer": "https://map.naver.com/",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "ko-KR,ko;q=0.9"
+    },
+    "timeout": 5.0,
+    # 연결 풀 (keep-alive 재사용)
+    "max_connections": 10,
+    "max_keepalive_connections": 5,
+    # 결과 수 / 동시 조회 수 (요청 간격은 POLITENESS_CONFIG의 naver.com 예산 공유)
+    "result_limit": 5,
+    "concurrency": 4,
+    # live: 실제 요청, record: 실제 요청 + 응답 저장, replay: 저장된 응답만 사용 (네트워크 없음)
+    "mode": os.getenv("NAVER_PLACE_MODE", "live"),
+    "fixture_dir": os.getenv("NAVER_PLACE_FIXTURE_DIR", os.path.join("test", "fixtures", "naver_place"))
+}
+
+# 크롤링 응답 기록/재생 (utils/fixture_corpus.py, utils/fixture_server.py, test/benchmark_crawler.py)
+CRAWL_FIXTURE_CONFIG = {
+    # off: 사용 안 함, record: 실제 응답을 코퍼스에 저장, replay: 코퍼스만 사용 (브라우저/네트워크 없음)
+    "mode": os.getenv("CRAWL_FIXTURE_MODE", "off"),
+    "dir": os.getenv("CRAWL_FIXTURE_DIR", os.path.join("test", "fixtures", "crawl")),
+    # replay 시 대역 서버 주소 (비우면 코퍼스 파일을 직접 읽음)
+    "server_url": os.getenv("CRAWL_FIXTURE_SERVER", ""),
+    "timeout": 10,
+    # 대역 서버 기본 지연/실패 주입
+    "server": {
+        "latency_ms": 80,
+        "jitter_ms": 40,
+        "failure_rate": 0.0,
+        "seed": 42
+    }
+}
+
+# 메트릭 수집 설정 - utils/metrics.py에서 사용
+METRICS_CONFIG = {
+    # 히스토그램 유효 비트 (6 → 구간 상대 오차 약 3%)
+    "significant_bits": 6,
+    # 히스토그램 기록 단위 (초 → 마이크로초)
+    "value_scale": 1_000_000,
+    # 최근 구간 통계: slot_seconds 단위 슬롯을 window_slots개 순환 (기본 10초 x 30 = 5분)
+    "slot_seconds": 10,
+    "window_slots": 30,
+    # Prometheus 내보내기 히스토그램 le 경계 (초)
+    "export_buckets": [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120],
+    # 워커 프로세스 단독 익스포터 기본 포트 (워커 번호만큼 더함, 0이면 비활성화)
+    "exporter_port": int(os.getenv("METRICS_EXPORTER_PORT", "0"))
+}
+
+# 단계별 트레이싱 - utils/tracing.py에서 사용 (기본 비활성화 = no-op)
+TRACING_CONFIG = {
+    "enabled": os.getenv("TRACING_ENABLED", "false").lower() == "true",
+    # none: 요약만 (결과에 단계별 시간 기록), console: 스팬마다 출력, file: JSON Lines 파일, otel: OpenTelemetry SDK로 전달
+    "exporter": os.getenv("TRACING_EXPORTER", "none"),
+    "file_path": os.getenv("TRACING_FILE", os.path.join("logs", "traces.jsonl")),
+    # 기관(루트 스팬) 단위 샘플링 비율 (0.0~1.0)
+    "sample_rate": float(os.getenv("TRACING_SAMPLE_RATE", "1.0")),
+    "service_name": "cradcrawl",
+    # 속성 문자열 최대 길이 (URL/쿼리 등)
+    "max_attribute_length": 200,
+    # 완료 전 트레이스 버퍼 최대 스팬 수 (트레이스당)
+    "max_spans_per_trace": 500
+}
+
+# 비동기 로그 파이프라인 - utils/log_pipeline.py에서 사용
+LOGGING_CONFIG = {
+    # True면 LoggerUtils 로거가 큐에만 넣고, 실제 콘솔/파일 기록은 백그라운드 스레드(QueueListener)가 담당
+    "async": os.getenv("LOG_ASYNC", "true").lower() == "true",
+    # 한 줄 JSON 출력 (수집기/검색용)
+    "json": os.getenv("LOG_JSON", "false").lower() == "true",
+    # 큐 최대 길이 (가득 차면 대기하지 않고 버림 → 통계에 기록)
+    "queue_size": int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+    # 반복 메시지 제한: 로거+메시지(숫자 제외)별 window_seconds 동안 burst건까지만 기록
+    "rate_limit": {
+        "enabled": os.getenv("LOG_RATE_LIMIT", "true").lower() == "true",
+        "window_seconds": 10.0,
+        "burst": 20,
+        # 이 레벨 이하만 제한 (WARNING 이상은 항상 기록)
+        "max_level": "INFO",
+        "max_keys": 2048
+    },
+    # 크롤러 처리 루프 안의 print() 출력을 "print" 로거로 보내 같은 큐에서 기록
+    # (sys.stdout을 프로세스 전체에서 교체하므로 기본 꺼짐 - LOG_ROUTE_PRINTS=true로 사용)
+    "route_prints": os.getenv("LOG_ROUTE_PRINTS", "false").lower() == "true"
+}
+
+# 시스템 리소스 백그라운드 샘플러 설정 - utils/system_sampler.py에서 사용
+SYSTEM_SAMPLER_CONFIG = {
+    # 샘플링 주기 (초)
+    "interval_seconds": 1.0,
+    # EWMA 반감기 (초) - 샘플 간격이 달라도 같은 시간 기준으로 평활
+    "ewma_halflife_seconds": 5.0,
+    # 디스크 사용률 측정 경로
+    "disk_path": "C:\\" if os.name == "nt" else "/"
+}
+
+# 적응형 동시성 제어 설정 - utils/concurrency_controller.py에서 사용
+CONCURRENCY_CONFIG = {
+    "defaults": {
+        "initial": 1,
+        "min": 1,
+        "max": 8,
+        # 판단 주기 (완료 수, 한도보다 작으면 한도 기준)
+        "window": 10,
+        # 과부하 시 한도 x backoff (곱셈 감소)
+        "backoff": 0.7,
+        # 단기 지연이 장기 지연의 몇 배를 넘으면 과부하로 볼지
+        "latency_tolerance": 1.5,
+        # 구간 오류율 상한 (차단은 1건이라도 감소)
+        "max_error_rate": 0.2,
+        # 메모리 여유(%) 하한 / CPU(%) 상한 (시스템 샘플러 EWMA 기준)
+        "min_memory_headroom": 15.0,
+        "max_cpu_percent": 90.0,
+        # 지연 EWMA 계수 (단기/장기)
+        "short_alpha": 0.3,
+        "long_alpha": 0.05
+    },
+    "limits": {
+        # crawler_main 동시 처리 기관 수
+        "crawler_organizations": {"initial": 2, "max": 6, "window": 6},
+        # Gemini 동시 호출 수 (429는 차단으로 취급)
+        "gemini_calls": {"initial": 4, "max": 16, "window": 20},
+        # centercrawling_improved 동시 브라우저(워커 프로세스) 수
+        "center_browsers": {"initial": 4, "max": 12, "window": 4},
+        # aiagent 통합 크롤러 동시 처리 기관 수
+        "integration_organizations": {"initial": 2, "max": 8},
+        # GCP 최적화 배치 크기
+        "gcp_batch": {"initial": 2, "max": 5},
+        # crm_app 상주 크롤러 런타임 동시 보강 요청 수 (services/crawler_runtime.py)
+        "crawler_runtime": {"initial": 2, "max": 4, "window": 6}
+    }
+}
+
+# crm_app 상주 크롤러 런타임 - services/crawler_runtime.py에서 사용
+CRAWLER_RUNTIME_CONFIG = {
+    # 앱 시작(lifespan) 시 백그라운드로 크롤러 생성 + 브라우저/검증기 모듈 초기화
+    # (Chrome을 띄울 수 없는 배포는 CRAWLER_RUNTIME_WARM=false로 끄면 첫 보강 요청 시 생성)
+    "warm_on_startup": os.getenv("CRAWLER_RUNTIME_WARM", "true").lower() == "true",
+    # 요청 1건 처리 제한 시간 (초, 0이면 제한 없음)
+    "submit_timeout": float(os.getenv("CRAWLER_RUNTIME_TIMEOUT", "300")),
+    # 종료 시 처리 중인 요청을 기다리는 최대 시간 (초)
+    "shutdown_timeout": float(os.getenv("CRAWLER_RUNTIME_SHUTDOWN_TIMEOUT", "30")),
+    # AIEnhancedModularUnifiedCrawler config_override (보강 서비스가 DB를 직접 갱신하므로 기관 결과 자동 저장은 끔)
+    "crawler_config": {"save_to_database": False}
+}
+
+# 크롤링 진행 상황 푸시 스트림 - services/progress_bus.py, /api/enrichment/crawling-stream(SSE) / crawling-ws(WebSocket)
+PROGRESS_STREAM_CONFIG = {
+    # 같은 기관/작업의 진행 이벤트를 이 간격(초) 동안 마지막 것 1건으로 병합해 전달
+    "coalesce_interval": float(os.getenv("PROGRESS_COALESCE_INTERVAL", "0.5")),
+    # 구독자별 대기 배치 수 (넘치면 오래된 배치부터 버림)
+    "subscriber_queue_size": 100,
+    # 토픽별로 보관할 최신 상태 수 (새 구독자에게 먼저 전송)
+    "snapshot_size": 50,
+    # SSE/WebSocket 연결 유지용 빈 메시지 간격 (초)
+    "heartbeat_seconds": 15.0,
+    # 중간 단계(PROCESSING) 진행 콜백도 crawling_results에 기록할지 (false면 완료/실패만 기록, 중간 단계는 스트림으로만)
+    "persist_steps": os.getenv("PROGRESS_PERSIST_STEPS", "false").lower() == "true",
+    # 여러 앱 워커 간 PostgreSQL LISTEN/NOTIFY 팬아웃
+    "notify": {
+        "enabled": os.getenv("PROGRESS_NOTIFY", "false").lower() == "true",
+        "channel": os.getenv("PROGRESS_NOTIFY_CHANNEL", "crawl_progress"),
+        # pg_notify 페이로드 한도 8000바이트 미만으로 분할
+        "max_payload_bytes": 7500,
+        # LISTEN 대기 select 주기 / 재연결 대기 (초)
+        "poll_interval": 5.0
+    }
+}
+
+# HTML 문서 파싱 설정 (utils/html_document.py - 페이지당 1회 파싱 후 단계 간 공유)
+HTML_PARSE_CONFIG = {
+    # 앞에서부터 설치된 파서 사용 (lxml이 html.parser보다 수 배 빠름)
+    "parsers": ["lxml", "html.parser"],
+    # footer 영역이 없을 때 하단부로 간주할 본문 끝 글자 수
+    "footer_fallback_chars": 1000,
+    # 연락처 페이지 링크 최대 개수
+    "contact_link_limit": 5,
+    # 페이지 텍스트 예산 (글자 수) - 예산이 차면 추출 중단
+    "text_budget": 10000,
+    # 예산 중 연락처/푸터 영역에 먼저 배정할 비율
+    "priority_share": 0.4,
+    # 디버그용 원본 HTML 보관 (기본: 추출 후 원본 HTML/파싱 트리 해제)
+    "capture_raw_html": os.getenv("CAPTURE_RAW_HTML", "false").lower() == "true"
+}
+
+# AI 프롬프트 압축 설정 (utils/prompt_compactor.py - 연락처 주변 텍스트만 Gemini로 전송)
+PROMPT_COMPACTION_CONFIG = {
+    # 창을 만들 연락처 키워드 (대소문자 무시)
+    "keywords": ["전화", "팩스", "TEL", "FAX", "주소", "이메일", "E-mail", "연락처", "대표번호"],
+    # 키워드 앞뒤로 남길 글자 수
+    "window_chars": 120,
+    # 같은 단어 n개 이상이 반복되면 메뉴/내비게이션으로 보고 두 번째부터 제거
+    "dedupe_ngram": 4,
+    # 페이지 앞부분 문맥 (기관명/소개) 글자 수
+    "head_chars": 200,
+    # 예산 중 footer/연락처 영역에 먼저 배정할 비율
+    "section_share": 0.4,
+    # 토큰 추정 (한글 위주 텍스트 기준 토큰당 글자 수)
+    "chars_per_token": 2.0,
+    # 작업별 텍스트 토큰 예산
+    "task_budgets": {
+        "fax": 750,
+        "contacts": 1500,
+        "default": 2000
+    }
+}
+
+# 규칙 기반 연락처 신뢰도 (utils/contact_rules.py - 신뢰도가 높으면 AI 추출/검증 생략)
+DETERMINISTIC_CONTACT_CONFIG = {
+    # 이 점수 이상이면 AI 단계 생략 (환경 변수 DETERMINISTIC_SKIP_THRESHOLD, 1 초과면 항상 AI 사용)
+    "skip_ai_threshold": float(os.getenv("DETERMINISTIC_SKIP_THRESHOLD", "0.8")),
+    # 라벨 바로 뒤로 보는 거리 (글자 수, "TEL 02-..." / "팩스: 02-...")
+    "label_adjacent_chars": 4,
+    # 점수 구성 (합계를 0~1로 자름)
+    "weights": {
+        "valid_number": 0.3,        # 지역번호/길이 규칙 통과, 더미 번호 아님
+        "label_adjacent": 0.4,      # 라벨 바로 뒤
+        "label_near": 0.3,          # 라벨이 앞쪽 창 안에 있음
+        "region_match": 0.2,        # 지역번호가 주소 지역과 일치
+        "region_mismatch": -0.4,    # 지역번호가 주소 지역과 불일치
+        "contact_section": 0.1,     # footer/연락처 영역에 있음
+        "repeated": 0.05,           # 같은 라벨로 여러 번 등장
+        "conflicting_labels": -0.3  # 전화/팩스 라벨이 모두 붙음
+    },
+    # 이메일 점수 (라벨 있음/없음)
+    "email_labeled": 0.9,
+    "email_unlabeled": 0.7
+}
+
 SELENIUM_CONFIG = {
     "implicit_wait": 10,
     "page_load_timeout": 30,
@@ -173,6 +472,13 @@ KOREAN_AREA_CODES = {
 # 유효한 지역번호 목록 (리스트 형태)
 VALID_AREA_CODES = list(KOREAN_AREA_CODES.keys())
 
+# 번호 앞 3자리 → 지역번호 조회 테이블 (2자리 지역번호 02는 "02"와 "020"~"029"로 펼침)
+AREA_CODE_PREFIX_TABLE = {
+    prefix: code
+    for code in KOREAN_AREA_CODES
+    for prefix in ([code] if len(code) == 3 else [code] + [code + digit for digit in "0123456789"])
+}
+
 # 지역번호별 전화번호 길이 규칙
 AREA_CODE_LENGTH_RULES = {
     "02": {"min_length": 9, "max_length": 10},       # 서울
@@ -576,15 +882,9 @@ def extract_phone_area_code(phone: str) -> str:
     if not phone:
         return None
     
-    # 숫자만 추출
+    # 숫자만 추출 후 앞 3자리로 테이블 조회
     digits = re.sub(r'[^\d]', '', phone)
-    
-    # 지역코드 매칭
-    for code in KOREAN_AREA_CODES.keys():
-        if digits.startswith(code):
-            return code
-    
-    return None
+    return AREA_CODE_PREFIX_TABLE.get(digits[:3])
 
 def ensure_directories():
     """필요한 디렉토리들을 생성"""
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시스템 리소스 백그라운드 샘플러
+psutil.cpu_percent(interval=...)처럼 호출자를 재우는 측정을 없애기 위해
+데몬 스레드가 고정 주기로 CPU/메모리/디스크/네트워크를 측정하고 불변 스냅샷을 게시
+
+- 읽기: 스냅샷 참조 1회 (O(1), 잠금 없음) - 워커 생성/배치 크기/일시 중지 판단에서 사용
+- CPU/메모리는 시간 기준 EWMA(반감기 고정)로 평활한 값과 원본 값을 함께 제공
+- I/O는 직전 샘플과의 차이로 초당 바이트 계산
+"""
+
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import psutil
+
+from utils.metrics import get_metrics_registry
+from utils.settings import SYSTEM_SAMPLER_CONFIG
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """샘플러가 게시하는 시스템 상태 (불변)"""
+    timestamp: float = 0.0
+    samples: int = 0
+    # 평활값 (판단용)
+    cpu_percent: float = 0.0
+    memory_percent: float = 0.0
+    # 원본값 (최근 샘플)
+    cpu_percent_raw: float = 0.0
+    memory_percent_raw: float = 0.0
+    memory_available_mb: float = 0.0
+    disk_percent: float = 0.0
+    # 초당 I/O
+    disk_read_bps: float = 0.0
+    disk_write_bps: float = 0.0
+    net_sent_bps: float = 0.0
+    net_recv_bps: float = 0.0
+    # 누적 네트워크 카운터
+    net_bytes_sent: int = 0
+    net_bytes_recv: int = 0
+    net_packets_sent: int = 0
+    net_packets_recv: int = 0
+    # 현재 프로세스
+    process_cpu_percent: float = 0.0
+    process_rss_mb: float = 0.0
+
+    @property
+    def age(self) -> float:
+        """스냅샷 경과 시간 (초)"""
+        return time.time() - self.timestamp if self.timestamp else float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SystemSampler:
+    """고정 주기 시스템 샘플러 (측정은 샘플러 스레드만, 조회는 어느 스레드든 O(1))"""
+
+    def __init__(self, interval: float = None, halflife: float = None, disk_path: str = None):
+        self.interval = interval or SYSTEM_SAMPLER_CONFIG.get("interval_seconds", 1.0)
+        self.halflife = halflife or SYSTEM_SAMPLER_CONFIG.get("ewma_halflife_seconds", 5.0)
+        self.disk_path = disk_path or SYSTEM_SAMPLER_CONFIG.get("disk_path", "/")
+
+        self._process = psutil.Process()
+        self._snapshot = SystemSnapshot()
+        self._previous_io: Optional[tuple] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # cpu_percent(interval=None)는 직전 호출 이후 사용률이라 첫 호출로 기준점만 잡음
+        self._process.cpu_percent(interval=None)
+
+    # ===== 조회 =====
+
+    def snapshot(self) -> SystemSnapshot:
+        """최근 스냅샷 (샘플러가 꺼져 있으면 시작)"""
+        if self._thread is None:
+            self.start()
+        return self._snapshot
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ===== 수명 주기 =====
+
+    def start(self):
+        """샘플러 스레드 시작 (이미 실행 중이면 무시, 첫 스냅샷은 즉시 게시)"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            # 첫 스냅샷만 짧게 측정해 EWMA 시작값이 의미 있도록 함 (프로세스당 1회)
+            self.sample(cpu_interval=0.1)
+            self._thread = threading.Thread(target=self._run, name="system-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop_event.set()
+            thread.join(timeout=timeout)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                # 일시적인 psutil 오류는 다음 주기에 다시 측정
+                continue
+
+    # ===== 측정 =====
+
+    def _smooth(self, previous: float, value: float, elapsed: float, samples: int) -> float:
+        if samples == 0:
+            return value
+        alpha = 1.0 - math.exp(-math.log(2) * elapsed / self.halflife)
+        return previous + alpha * (value - previous)
+
+    def _io_counters(self) -> tuple:
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        return (
+            disk.read_bytes if disk else 0,
+            disk.write_bytes if disk else 0,
+            net.bytes_sent if net else 0,
+            net.bytes_recv if net else 0,
+            net.packets_sent if net else 0,
+            net.packets_recv if net else 0
+        )
+
+    def sample(self, cpu_interval: Optional[float] = None) -> SystemSnapshot:
+        """1회 측정 후 스냅샷 게시 (샘플러 스레드 또는 start()에서만 호출)"""
+        now = time.time()
+        previous = self._snapshot
+        elapsed = now - previous.timestamp if previous.timestamp else self.interval
+
+        cpu = psutil.cpu_percent(interval=cpu_interval)
+        memory = psutil.virtual_memory()
+        try:
+            disk_percent = psutil.disk_usage(self.disk_path).percent
+        except Exception:
+            disk_percent = 0.0
+
+        io = self._io_counters()
+        rates = [0.0, 0.0, 0.0, 0.0]
+        if self._previous_io is not None and elapsed > 0:
+            rates = [max(0, current - last) / elapsed for current, last in zip(io[:4], self._previous_io[:4])]
+        self._previous_io = io
+
+        snapshot = SystemSnapshot(
+            timestamp=now,
+            samples=previous.samples + 1,
+            cpu_percent=self._smooth(previous.cpu_percent, cpu, elapsed, previous.samples),
+            memory_percent=self._smooth(previous.memory_percent, memory.percent, elapsed, previous.samples),
+            cpu_percent_raw=cpu,
+            memory_percent_raw=memory.percent,
+            memory_available_mb=memory.available / (1024 * 1024),
+            disk_percent=disk_percent,
+            disk_read_bps=rates[0],
+            disk_write_bps=rates[1],
+            net_sent_bps=rates[2],
+            net_recv_bps=rates[3],
+            net_bytes_sent=io[2],
+            net_bytes_recv=io[3],
+            net_packets_sent=io[4],
+            net_packets_recv=io[5],
+            process_cpu_percent=self._process.cpu_percent(interval=None),
+            process_rss_mb=self._process.memory_info().rss / (1024 * 1024)
+        )
+        # 참조 대입 1회로 게시 (읽는 쪽은 항상 완성된 스냅샷만 봄)
+        self._snapshot = snapshot
+        return snapshot
+
+
+_sampler_instance = None
+_sampler_lock = threading.Lock()
+
+
+def get_system_sampler() -> SystemSampler:
+    """프로세스 공용 시스템 샘플러 반환 (싱글톤, 첫 조회 시 시작)"""
+    global _sampler_instance
+    if _sampler_instance is None:
+        with _sampler_lock:
+            if _sampler_instance is None:
+                sampler = SystemSampler()
+                sampler.start()
+                get_metrics_registry().mapping(
+                    "system_sampler", "백그라운드 샘플러 시스템 지표 (EWMA 평활 포함)",
+                    lambda: sampler.snapshot().to_dict()
+                )
+                _sampler_instance = sampler
+    return _sampler_instance
+
+
+def get_system_snapshot() -> SystemSnapshot:
+    """최근 시스템 스냅샷 (O(1))"""
+    return get_system_sampler().snapshot()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 트레이싱 스팬
+기관 1건 처리(process_single_organization_with_ai) 안에서 에이전트 실행, 페이지/검색 fetch, AI 호출, DB 저장 중
+어디에 시간이 쓰이는지 보기 위한 구조화된 스팬 (OpenTelemetry와 같은 trace/span id 형식)
+
+- 기본 비활성화: TRACING_CONFIG["enabled"]가 False면 모든 span()이 같은 no-op 스팬을 반환 (비용 거의 없음)
+- 부모 스팬은 contextvars로 전달 (asyncio 태스크, asyncio.to_thread 스레드까지 이어짐)
+- 샘플링은 루트 스팬(기관 1건)에서 결정하고 자식 스팬은 따름
+- 내보내기: none(요약만) / console / file(JSON Lines) / otel(opentelemetry 설치 시 SDK 스팬으로 동시 기록)
+- trace_summary(): 이름별 횟수/합계/최대 시간 요약 (작업 결과에 저장)
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from utils.settings import TRACING_CONFIG
+
+try:
+    from opentelemetry import trace as otel_trace
+    OTEL_AVAILABLE = True
+except ImportError:
+    otel_trace = None
+    OTEL_AVAILABLE = False
+
+
+class NoopSpan:
+    """비활성화/샘플링 제외 시 쓰는 스팬 (모든 호출 무시)"""
+    trace_id = ""
+    span_id = ""
+    sampled = False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def record_exception(self, error: BaseException):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = NoopSpan()
+_current_span: ContextVar[Optional[Any]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """기록되는 스팬 (with 문으로 사용, 종료 시 Tracer에 보고)"""
+    sampled = True
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[str],
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = {}
+        self.status = "OK"
+        self.start_ns = 0
+        self.end_ns = 0
+        self._token = None
+        self._otel = None
+        if attributes:
+            self.set_attributes(attributes)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns or time.time_ns()
+        return (end - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any):
+        if value is None:
+            return
+        if not isinstance(value, (bool, int, float)):
+            value = str(value)[:self.tracer.max_attribute_length]
+        self.attributes[key] = value
+        if self._otel is not None:
+            self._otel.set_attribute(key, value)
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_exception(self, error: BaseException):
+        self.status = "ERROR"
+        self.set_attribute("exception.type", type(error).__name__)
+        self.set_attribute("exception.message", str(error))
+        if self._otel is not None:
+            self._otel.record_exception(error)
+
+    def __enter__(self):
+        self.start_ns = time.time_ns()
+        self._otel = self.tracer._start_otel(self)
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        if exc is not None:
+            self.record_exception(exc)
+        _current_span.reset(self._token)
+        if self._otel is not None:
+            self._otel.end(end_time=self.end_ns)
+        self.tracer._finish(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """OTLP JSON과 같은 필드 이름"""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": self.status
+        }
+
+
+class Tracer:
+    """스팬 생성/샘플링/내보내기 (스레드 안전)"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or TRACING_CONFIG
+        self.enabled = self.config.get("enabled", False)
+        self.exporter = self.config.get("exporter", "none")
+        self.sample_rate = self.config.get("sample_rate", 1.0)
+        self.max_attribute_length = self.config.get("max_attribute_length", 200)
+        self.max_spans_per_trace = self.config.get("max_spans_per_trace", 500)
+        self.file_path = self.config.get("file_path", "traces.jsonl")
+
+        self._lock = threading.Lock()
+        self._traces: Dict[str, List[Span]] = {}
+        self._stats = {"traces": 0, "spans": 0, "dropped": 0, "unsampled": 0}
+
+        self._otel_tracer = None
+        if self.enabled and self.exporter == "otel":
+            if OTEL_AVAILABLE:
+                self._otel_tracer = otel_trace.get_tracer(self.config.get("service_name", "cradcrawl"))
+            else:
+                print("⚠️ opentelemetry 미설치 - 트레이스는 요약만 기록합니다")
+
+    # ===== 스팬 생성 =====
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """현재 스팬의 자식 스팬 (없으면 새 트레이스의 루트 스팬, 샘플링 적용)"""
+        if not self.enabled:
+            return NOOP_SPAN
+
+        parent = _current_span.get()
+        if parent is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                with self._lock:
+                    self._stats["unsampled"] += 1
+                return _UnsampledRoot()
+            trace_id = os.urandom(16).hex()
+            with self._lock:
+                self._traces[trace_id] = []
+                self._stats["traces"] += 1
+            return Span(self, name, trace_id, None, attributes)
+
+        if not parent.sampled:
+            return NOOP_SPAN
+        return Span(self, name, parent.trace_id, parent.span_id, attributes)
+
+    def current_span(self):
+        return _current_span.get() or NOOP_SPAN
+
+    def _start_otel(self, span: Span):
+        if self._otel_tracer is None:
+            return None
+        parent = _current_span.get()
+        context = None
+        if isinstance(parent, Span) and parent._otel is not None:
+            context = otel_trace.set_span_in_context(parent._otel)
+        return self._otel_tracer.start_span(
+            span.name, context=context, attributes=dict(span.attributes), start_time=span.start_ns
+        )
+
+    # ===== 종료/내보내기 =====
+
+    def _finish(self, span: Span):
+        with self._lock:
+            self._stats["spans"] += 1
+            buffer = self._traces.get(span.trace_id)
+            if buffer is not None:
+                if len(buffer) < self.max_spans_per_trace:
+                    buffer.append(span)
+                else:
+                    self._stats["dropped"] += 1
+            if span.parent_id is None:
+                # 루트 종료 = 트레이스 종료
+                self._traces.pop(span.trace_id, None)
+
+        if self.exporter == "console":
+            print(f"🔭 [{span.trace_id[:8]}] {span.name} {span.duration_ms:.1f}ms "
+                  f"{'❌ ' if span.status == 'ERROR' else ''}{span.attributes}")
+        elif self.exporter == "file":
+            self._write(span)
+
+    def _write(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False)
+        try:
+            with self._lock:
+                directory = os.path.dirname(self.file_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            print(f"⚠️ 트레이스 파일 기록 실패: {e}")
+
+    # ===== 요약 =====
+
+    def trace_summary(self, trace_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        진행 중인 트레이스의 완료된 스팬 요약 (이름별 횟수/합계/최대 ms)
+        trace_id를 생략하면 현재 스팬의 트레이스, 비활성화/샘플링 제외면 빈 딕셔너리
+        """
+        trace_id = trace_id or self.current_span().trace_id
+        if not trace_id:
+            return {}
+        with self._lock:
+            spans = list(self._traces.get(trace_id, []))
+
+        by_name: Dict[str, Dict[str, float]] = {}
+        errors = 0
+        for span in spans:
+            entry = by_name.setdefault(span.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] = round(entry["total_ms"] + span.duration_ms, 3)
+            entry["max_ms"] = round(max(entry["max_ms"], span.duration_ms), 3)
+            errors += span.status == "ERROR"
+
+        current = self.current_span()
+        return {
+            "trace_id": trace_id,
+            "duration_ms": round(current.duration_ms, 3) if isinstance(current, Span) else None,
+            "span_count": len(spans),
+            "error_count": errors,
+            "spans": by_name
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["open_traces"] = len(self._traces)
+        stats.update(enabled=self.enabled, exporter=self.exporter, sample_rate=self.sample_rate)
+        return stats
+
+
+class _UnsampledRoot(NoopSpan):
+    """샘플링에서 제외된 루트 (자식 스팬도 no-op이 되도록 컨텍스트에 남김)"""
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        return False
+
+
+_tracer_instance = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """프로세스 공용 트레이서 반환 (싱글톤)"""
+    global _tracer_instance
+    if _tracer_instance is None:
+        with _tracer_lock:
+            if _tracer_instance is None:
+                _tracer_instance = Tracer()
+    return _tracer_instance
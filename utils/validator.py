@@ -5,9 +5,13 @@
 더미 데이터 제거, 중복 검증, 형식 검증 등을 수행
 """
 
+import os
 import re
 import logging
 
+from utils.phone_normalizer import get_phone_normalizer
+from utils.prompt_compactor import compact_text
+
 
 # .env 파일 로드
 try:
@@ -49,41 +53,8 @@ class ContactValidator:
             re.IGNORECASE
         )
         
-        # 더미 데이터 패턴들
-        self.dummy_patterns = [
-            r'033-333-3333',     # 033-333-3333
-            r'02-222-2222',      # 02-222-2222
-            r'031-111-1111',     # 031-111-1111
-            r'(\d)\1{2}-\1{3}-\1{4}',  # 같은 숫자 반복 (예: 111-1111-1111)
-            r'0\d{1,2}-000-0000',      # 끝자리가 모두 0
-            r'0\d{1,2}-123-4567',      # 순차적 숫자
-            r'0\d{1,2}-1234-5678',     # 순차적 숫자
-            r'000-000-0000',           # 모두 0
-            r'999-999-9999',           # 모두 9
-        ]
-        
-        # 유효한 지역번호 목록
-        self.valid_area_codes = [
-            '02',   # 서울
-            '031',  # 경기
-            '032',  # 인천
-            '033',  # 강원
-            '041',  # 충남
-            '042',  # 대전
-            '043',  # 충북
-            '044',  # 세종
-            '051',  # 부산
-            '052',  # 울산
-            '053',  # 대구
-            '054',  # 경북
-            '055',  # 경남
-            '061',  # 전남
-            '062',  # 광주
-            '063',  # 전북
-            '064',  # 제주
-            '070',  # 인터넷전화
-            '010',  # 휴대폰
-        ]
+        # 지역번호/길이 규칙/더미 패턴은 공용 정규화기(settings 기반 테이블)에서 판별
+        self.normalizer = get_phone_normalizer()
         
         self.logger = self._setup_logger()
     
@@ -111,49 +82,21 @@ class ContactValidator:
         if not phone:
             return ""
         
-        # 숫자만 추출
-        digits_only = re.sub(r'[^\d]', '', phone)
-        
-        # 국가번호 제거 (+82, 82)
-        if digits_only.startswith('82'):
-            digits_only = '0' + digits_only[2:]
-        
-        # 길이 검증 (10-11자리)
-        if len(digits_only) < 10 or len(digits_only) > 11:
-            return ""
-        
-        # 지역번호별 포맷팅
-        if digits_only.startswith('02'):
-            # 서울 (02-XXXX-XXXX 또는 02-XXX-XXXX)
-            if len(digits_only) == 10:
-                return f"{digits_only[:2]}-{digits_only[2:5]}-{digits_only[5:]}"
-            elif len(digits_only) == 9:
-                return f"{digits_only[:2]}-{digits_only[2:5]}-{digits_only[5:]}"
-        elif digits_only.startswith('0'):
-            # 기타 지역 (0XX-XXXX-XXXX 또는 0XX-XXX-XXXX)
-            if len(digits_only) == 11:
-                return f"{digits_only[:3]}-{digits_only[3:7]}-{digits_only[7:]}"
-            elif len(digits_only) == 10:
-                return f"{digits_only[:3]}-{digits_only[3:6]}-{digits_only[6:]}"
-        
-        return ""
+        return self.normalizer.format(phone) or ""
     
     def is_dummy_data(self, phone):
         """더미 데이터 여부 검증"""
         if not phone:
             return True
         
-        # 정규화된 번호로 검증
-        normalized = self.normalize_phone_number(phone)
-        if not normalized:
+        result = self.normalizer.normalize(phone)
+        if not result.is_valid:
             return True
         
-        # 더미 패턴 검사
-        for pattern in self.dummy_patterns:
-            if re.match(pattern, normalized):
-                self.logger.info(f"더미 데이터 감지: {normalized} (패턴: {pattern})")
-                print(f"🗑️ 더미 데이터 제거: {normalized}")
-                return True
+        if result.is_dummy:
+            self.logger.info(f"더미 데이터 감지: {result.formatted}")
+            print(f"🗑️ 더미 데이터 제거: {result.formatted}")
+            return True
         
         return False
     
@@ -162,19 +105,13 @@ class ContactValidator:
         if not phone:
             return False
         
-        normalized = self.normalize_phone_number(phone)
-        if not normalized:
-            return False
-        
-        # 지역번호 추출
-        area_code = normalized.split('-')[0]
-        
-        if area_code in self.valid_area_codes:
+        result = self.normalizer.normalize(phone)
+        if result.is_valid:
             return True
-        else:
-            self.logger.warning(f"유효하지 않은 지역번호: {area_code} in {normalized}")
-            print(f"⚠️ 유효하지 않은 지역번호: {normalized}")
-            return False
+        
+        self.logger.warning(f"유효하지 않은 지역번호: {result.area_code} in {phone} ({result.reason})")
+        print(f"⚠️ 유효하지 않은 지역번호: {phone}")
+        return False
     
     def validate_phone_number(self, phone):
         """전화번호 종합 검증"""
@@ -506,8 +443,8 @@ class AIValidator:
         try:
             prompt = self._get_contact_extraction_prompt()
             
-            # 내용 길이 제한
-            content = page_content[:5000] if len(page_content) > 5000 else page_content
+            # 연락처 주변 텍스트만 토큰 예산 안으로 압축
+            content = compact_text(page_content, "contacts")
             
             final_prompt = prompt.format(
                 organization_name=organization_name,